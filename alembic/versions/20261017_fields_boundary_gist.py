@@ -0,0 +1,35 @@
+"""fields.boundary GiST indeksi.
+
+Amaç: Tarla mekânsal sorgularında (bbox `&&`, ST_Intersects, ST_DWithin
+    önfiltresi) sıralı taramayı önlemek için boundary sütununa GiST indeksi eklemek.
+Sorumluluk: SqlAlchemyFieldRepository.search sorgularının indeks kullanması.
+Bağımlılıklar: 002 (fields tablosu, PostGIS) ve wbr001 migration'larının tamamlanmış olması.
+Notlar: İndeks adı geoalchemy2'nin spatial_index=True ile vereceği adla aynıdır;
+    002 tablo oluşturulurken indeks üretildiyse IF NOT EXISTS ile atlanır.
+
+Revision ID: gist001
+Revises: wbr001
+Create Date: 2026-10-17
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "gist001"
+down_revision: Union[str, None] = "wbr001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # -------------------------------------------------------------------------
+    # fields tablosu mekânsal indeksi
+    # -------------------------------------------------------------------------
+    op.execute("CREATE INDEX IF NOT EXISTS idx_fields_boundary ON fields USING GIST (boundary)")
+    op.execute("ANALYZE fields")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_fields_boundary")
@@ -11,7 +11,7 @@ from typing import Protocol
 class WeeklyPlanner(Protocol):
     """Port to compute and persist weekly schedule."""
 
-    async def plan_week(self, *, week_start: date, correlation_id: str) -> int: ...
+    async def plan_week(self, *, week_start: date, correlation_id: str, workers: int = 1) -> int: ...
 
 
 class AuditWriter(Protocol):
@@ -34,10 +34,12 @@ class WeeklyPlanningJob:
     audit_writer: AuditWriter
 
     # KR-015: weekly capacity/scheduling automation entry point.
-    async def run(self, *, week_start: date, correlation_id: str) -> int:
+    # workers > 1: il bazlı shard'lar paralel süreçlerde çözülür (ShardedWeeklyPlanner).
+    async def run(self, *, week_start: date, correlation_id: str, workers: int = 1) -> int:
         planned_count = await self.planner.plan_week(
             week_start=week_start,
             correlation_id=correlation_id,
+            workers=workers,
         )
 
         await self.audit_writer.append_job_log(
@@ -0,0 +1,180 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-016: Field boundary × flown footprint coverage is evaluated for whole batches in one call.  # noqa: RUF003
+"""
+Amaç: Binlerce (tarla sınırı, uçulan footprint) çiftinin kapsamını shapely 2 vektörel ufunc'larıyla tek çağrıda hesaplamak.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: Geometry / shapely geometri dizileri (çift başına hizalı). Çıktı: COVERAGE_DTYPE yapılı NumPy dizisi.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca geometri ve alan değerleri.
+Hata Modları (idempotency/retry/rate limit): Deterministik; dizi uzunluğu uyuşmazlığı BatchCoverageError. Boş/eksik footprint kapsam 0 sayılır.
+Observability (log fields/metrics/traces): Sınıf başına sayılar (class_counts) çağıran tarafta metrik olarak okunabilir.
+Testler: Unit (Geometry.coverage_ratio ve CoverageCalculator ile eşik sınıflandırması eşliği) + performance (mission başına döngüye karşı).
+Bağımlılıklar: shapely>=2, numpy; Geometry VO, CoverageCalculator.
+Notlar/SSOT: KR-016 eşikleri: >= 0.95 TAM, >= 0.80 KISMİ, < 0.80 TEKRAR UÇUŞ. Tarla alanı bölgesel Albers eşit alan projeksiyonuyla m²'dir.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Sequence
+from enum import IntEnum
+
+import numpy as np
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+from src.core.domain.services.coverage_calculator import CoverageCalculator, CoverageResult
+from src.core.domain.value_objects import equal_area
+from src.core.domain.value_objects.geometry import Geometry
+
+FULL_COVERAGE_RATIO = 0.95
+
+
+class BatchCoverageError(ValueError):
+    pass
+
+
+class CoverageClass(IntEnum):
+    """KR-016 kapsam sınıfı."""
+
+    REFLIGHT = 0  # < 0.80: tekrar uçuş veya itiraz
+    PARTIAL = 1  # >= 0.80: kısmi + opsiyonel inceleme
+    FULL = 2  # >= 0.95: tam ödeme
+
+
+COVERAGE_DTYPE = np.dtype(
+    [
+        ("field_area_m2", np.float64),
+        ("footprint_area_m2", np.float64),
+        ("intersection_area_m2", np.float64),
+        ("coverage_ratio", np.float64),
+        ("coverage_class", np.int8),
+        ("is_sufficient", np.bool_),
+    ]
+)
+
+GeometryLike = Geometry | BaseGeometry | None
+
+
+class BatchCoverageEvaluator:
+    """CoverageCalculator.evaluate_coverage'ın toplu, geometri girdili karşılığı.
+
+    Çiftler üç gruba ayrılır: footprint tarlayı tamamen örtüyorsa oran 1,
+    hiç kesişmiyorsa 0; yalnızca kalan (kısmi) çiftler için
+    shapely.intersection çalıştırılır. Tüm adımlar dizi üzerinde GEOS
+    çağrılarıdır; çift başına Python döngüsü yoktur.
+
+    Oran Geometry.coverage_ratio ile aynı tanımdır (kesişim / tarla alanı,
+    derece² üzerinden; alanı 0 olan tarla için 0). is_sufficient
+    CoverageCalculator'ın minimum kapsam eşiğiyle aynı kuraldır.
+    """
+
+    def __init__(self, minimum_coverage_ratio: float | None = None) -> None:
+        CoverageCalculator(minimum_coverage_ratio=minimum_coverage_ratio)  # Eşik doğrulaması domain kuralıyla aynı
+        self._min_coverage = (
+            minimum_coverage_ratio
+            if minimum_coverage_ratio is not None
+            else CoverageCalculator.DEFAULT_MINIMUM_COVERAGE_RATIO
+        )
+
+    @property
+    def minimum_coverage_ratio(self) -> float:
+        return self._min_coverage
+
+    def evaluate(self, fields: Sequence[GeometryLike], footprints: Sequence[GeometryLike]) -> np.ndarray:
+        """Hizalı (tarla, footprint) çiftlerini değerlendirir.
+
+        Args:
+            fields: Tarla sınırları (Geometry ya da shapely geometrisi).
+            footprints: Aynı sıradaki uçulan footprint'ler; None kapsam 0.
+
+        Returns:
+            len(fields) uzunluğunda COVERAGE_DTYPE dizisi.
+
+        Raises:
+            BatchCoverageError: Dizi uzunlukları farklıysa.
+        """
+        if len(fields) != len(footprints):
+            raise BatchCoverageError("fields_and_footprints_length_mismatch")
+        field_arr = as_geometry_array(fields)
+        footprint_arr = as_geometry_array(footprints)
+        out = np.zeros(len(field_arr), dtype=COVERAGE_DTYPE)
+        if len(out) == 0:
+            return out
+
+        field_area = np.nan_to_num(shapely.area(field_arr))
+        footprint_area = np.nan_to_num(shapely.area(footprint_arr))
+        intersection_area = np.zeros(len(field_arr), dtype=np.float64)
+
+        # Yalnızca burada hazırlananlar geri bırakılır; çağıranın hazırladığı geometriler korunur.
+        unprepared = footprint_arr[~shapely.is_prepared(footprint_arr)]
+        shapely.prepare(unprepared)
+        covered = shapely.covers(footprint_arr, field_arr)
+        partial = ~covered & shapely.intersects(footprint_arr, field_arr)
+        shapely.destroy_prepared(unprepared)
+        intersection_area[covered] = field_area[covered]
+        if partial.any():
+            intersection_area[partial] = shapely.area(shapely.intersection(field_arr[partial], footprint_arr[partial]))
+
+        ratio = np.divide(intersection_area, field_area, out=np.zeros_like(field_area), where=field_area > 0)
+        np.clip(ratio, 0.0, 1.0, out=ratio)
+
+        # Tarla alanı eşit alan projeksiyonunda kesin; footprint ve kesişim aynı m²/derece² oranıyla ölçeklenir.
+        field_m2 = equal_area.areas_m2(field_arr)
+        scale = np.divide(field_m2, field_area, out=np.zeros_like(field_area), where=field_area > 0)
+        out["field_area_m2"] = field_m2
+        out["footprint_area_m2"] = footprint_area * scale
+        out["intersection_area_m2"] = intersection_area * scale
+        out["coverage_ratio"] = ratio
+        out["coverage_class"] = classify(ratio, minimum_coverage_ratio=self._min_coverage)
+        out["is_sufficient"] = ratio >= self._min_coverage
+        return out
+
+    def to_results(
+        self,
+        evaluated: np.ndarray,
+        *,
+        mission_ids: Sequence[uuid.UUID],
+        field_ids: Sequence[uuid.UUID],
+    ) -> list[CoverageResult]:
+        """Yapılı diziyi domain CoverageResult listesine çevirir (tekil API ile uyum için)."""
+        if not len(evaluated) == len(mission_ids) == len(field_ids):
+            raise BatchCoverageError("ids_length_mismatch")
+        return [
+            CoverageResult(
+                mission_id=mission_id,
+                field_id=field_id,
+                field_area_m2=row[0],
+                footprint_area_m2=row[1],
+                intersection_area_m2=row[2],
+                coverage_ratio=row[3],
+                is_sufficient=row[5],
+                minimum_coverage_ratio=self._min_coverage,
+            )
+            for mission_id, field_id, row in zip(mission_ids, field_ids, evaluated.tolist(), strict=True)
+        ]
+
+
+def classify(
+    ratio: np.ndarray, *, minimum_coverage_ratio: float = CoverageCalculator.DEFAULT_MINIMUM_COVERAGE_RATIO
+) -> np.ndarray:
+    """Kapsam oranlarını KR-016 sınıflarına çevirir (int8, CoverageClass değerleri)."""
+    ratio = np.asarray(ratio, dtype=np.float64)
+    return np.where(
+        ratio >= FULL_COVERAGE_RATIO,
+        CoverageClass.FULL,
+        np.where(ratio >= minimum_coverage_ratio, CoverageClass.PARTIAL, CoverageClass.REFLIGHT),
+    ).astype(np.int8)
+
+
+def class_counts(evaluated: np.ndarray) -> dict[CoverageClass, int]:
+    """Sınıf başına çift sayısı."""
+    counts = np.bincount(evaluated["coverage_class"], minlength=len(CoverageClass))
+    return {cls: int(counts[cls]) for cls in CoverageClass}
+
+
+def as_geometry_array(items: Sequence[GeometryLike]) -> np.ndarray:
+    """Geometry VO / shapely / None karışık diziyi shapely nesne dizisine çevirir."""
+    arr = np.empty(len(items), dtype=object)
+    arr[:] = [item.shape if isinstance(item, Geometry) else item for item in items]
+    return arr
+
@@ -0,0 +1,252 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Fleet capacity is held as a dense pilots × days calendar for vectorized queries.  # noqa: RUF003
+"""
+Amaç: Filo kapasitesini pilot × gün NumPy matrisleri olarak tutup kullanım/boş kapasite sorgularını vektörel yapmak.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: Pilot / PilotSchedule / PilotSlot. Çıktı: NumPy dizileri (kullanım, ısı haritası, il özetleri).
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca pilot kimliği (UUID), il kodu ve kapasite sayıları.
+Hata Modları (idempotency/retry/rate limit): Takvim dışı tarih/pilot CapacityCalendarError; rezervasyonlar toplanır (idempotent değildir).
+Observability (log fields/metrics/traces): nbytes ile bellek izi; dashboard metrikleri çağıran tarafta.
+Testler: Unit (skaler döngü referansıyla eşdeğerlik) + performance (2.000 pilot, tam sezon).
+Bağımlılıklar: numpy; Pilot entity, PilotSchedule VO, PlanningEngine.PilotSlot.
+Notlar/SSOT: work_days 0=Pazartesi..6=Pazar (KR-015-1). Birim kaynağa bağlıdır: Pilot/PilotSchedule için dönüm, PilotSlot için görev sayısı.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+import numpy as np
+
+from src.core.domain.entities.pilot import Pilot
+from src.core.domain.services.planning_engine import PilotSlot
+from src.core.domain.value_objects.pilot_schedule import PilotSchedule
+
+
+class CapacityCalendarError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ProvinceRollup:
+    province_codes: tuple[str, ...]
+    capacity: np.ndarray  # il × gün, int64
+    booked: np.ndarray  # il × gün, int64
+    free: np.ndarray  # il × gün, int64
+
+
+class FleetCapacityCalendar:
+    """Pilot × gün yoğun kapasite takvimi.
+
+    - capacity: günlük kapasite (int32); çalışma günü olmayan hücreler 0.
+    - booked: rezerve edilen alan (int32).
+    - work_mask: Pilot.work_days'ten türetilen çalışma günü maskesi (bool).
+
+    Tüm sorgular satır/sütun bazlı dizi işlemleridir; pilot başına ya da
+    gün başına Python döngüsü yoktur.
+    """
+
+    def __init__(
+        self,
+        *,
+        start: date,
+        pilot_ids: Sequence[uuid.UUID],
+        province_codes: Sequence[str],
+        daily_capacity: np.ndarray,
+        work_days: Sequence[Iterable[int]],
+        days: int,
+    ) -> None:
+        if days <= 0:
+            raise CapacityCalendarError("days_must_be_positive")
+        if not (len(pilot_ids) == len(province_codes) == len(work_days) == len(daily_capacity)):
+            raise CapacityCalendarError("pilot_columns_length_mismatch")
+
+        self.start = start
+        self.days = days
+        self.pilot_ids = tuple(pilot_ids)
+        self.province_codes = tuple(province_codes)
+        self._row = {pid: i for i, pid in enumerate(self.pilot_ids)}
+        if len(self._row) != len(self.pilot_ids):
+            raise CapacityCalendarError("duplicate_pilot_id")
+
+        weekly = np.zeros((len(self.pilot_ids), 7), dtype=bool)
+        for i, wd in enumerate(work_days):
+            weekly[i, list(wd)] = True
+        weekday_of_day = (start.weekday() + np.arange(days)) % 7
+        self.work_mask = weekly[:, weekday_of_day]
+        self.capacity = np.where(
+            self.work_mask, np.asarray(daily_capacity, dtype=np.int32)[:, None], 0
+        ).astype(np.int32)
+        self.booked = np.zeros_like(self.capacity)
+
+    # ------------------------------------------------------------------
+    # Adaptörler
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_pilots(cls, pilots: Sequence[Pilot], *, start: date, days: int) -> FleetCapacityCalendar:
+        """Pilot entity'lerinden (daily_capacity_donum, work_days, province) takvim kurar."""
+        return cls(
+            start=start,
+            days=days,
+            pilot_ids=[p.pilot_id for p in pilots],
+            province_codes=[p.province for p in pilots],
+            daily_capacity=np.fromiter((p.daily_capacity_donum for p in pilots), dtype=np.int32, count=len(pilots)),
+            work_days=[p.work_days for p in pilots],
+        )
+
+    @classmethod
+    def from_schedules(
+        cls,
+        schedules: Mapping[uuid.UUID, PilotSchedule],
+        provinces: Mapping[uuid.UUID, str],
+        *,
+        start: date,
+        days: int,
+    ) -> FleetCapacityCalendar:
+        """PilotSchedule VO'larından takvim kurar; il kodu ayrı eşlemeden gelir."""
+        pilot_ids = list(schedules)
+        return cls(
+            start=start,
+            days=days,
+            pilot_ids=pilot_ids,
+            province_codes=[provinces[pid] for pid in pilot_ids],
+            daily_capacity=np.fromiter(
+                (schedules[pid].daily_capacity_donum for pid in pilot_ids), dtype=np.int32, count=len(pilot_ids)
+            ),
+            work_days=[schedules[pid].work_days for pid in pilot_ids],
+        )
+
+    @classmethod
+    def from_pilot_slots(cls, slots: Iterable[PilotSlot], *, start: date, days: int) -> FleetCapacityCalendar:
+        """PlanningEngine slotlarından takvim kurar (birim: görev sayısı).
+
+        Slot olan hücre çalışma günü sayılır; capacity = daily_capacity,
+        booked = daily_capacity - remaining_capacity. Pencere dışı slotlar
+        yok sayılır.
+        """
+        slots = list(slots)
+        pilot_ids = list(dict.fromkeys(s.pilot_id for s in slots))
+        province = {s.pilot_id: s.province_code for s in slots}
+        calendar = cls(
+            start=start,
+            days=days,
+            pilot_ids=pilot_ids,
+            province_codes=[province[pid] for pid in pilot_ids],
+            daily_capacity=np.zeros(len(pilot_ids), dtype=np.int32),
+            work_days=[()] * len(pilot_ids),
+        )
+        row = calendar._row
+        rows = np.fromiter((row[s.pilot_id] for s in slots), dtype=np.int64, count=len(slots))
+        cols = np.fromiter(((s.date - start).days for s in slots), dtype=np.int64, count=len(slots))
+        inside = (cols >= 0) & (cols < days)
+        rows, cols = rows[inside], cols[inside]
+        daily = np.fromiter((s.daily_capacity for s in slots), dtype=np.int32, count=len(slots))[inside]
+        remaining = np.fromiter((s.remaining_capacity for s in slots), dtype=np.int32, count=len(slots))[inside]
+        calendar.capacity[rows, cols] = daily
+        calendar.booked[rows, cols] = daily - remaining
+        calendar.work_mask[rows, cols] = True
+        return calendar
+
+    # ------------------------------------------------------------------
+    # Rezervasyon
+    # ------------------------------------------------------------------
+    def book(self, pilot_id: uuid.UUID, day: date, amount: int) -> None:
+        """Tek hücreye rezervasyon ekler (negatif değer iptal)."""
+        self.booked[self._row_of(pilot_id), self._col_of(day)] += amount
+
+    def book_many(
+        self,
+        pilot_ids: Sequence[uuid.UUID],
+        days: Sequence[date],
+        amounts: Sequence[int] | np.ndarray,
+    ) -> None:
+        """Toplu rezervasyon; aynı hücreye düşen tutarlar toplanır (np.add.at)."""
+        rows = np.fromiter((self._row_of(pid) for pid in pilot_ids), dtype=np.int64, count=len(pilot_ids))
+        cols = np.fromiter((self._col_of(d) for d in days), dtype=np.int64, count=len(days))
+        np.add.at(self.booked, (rows, cols), np.asarray(amounts, dtype=np.int32))
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    def free(self) -> np.ndarray:
+        """Boş kapasite ısı haritası (pilot × gün, int32, negatif değer yok)."""
+        return np.maximum(self.capacity - self.booked, 0)
+
+    def utilization(self, start: date | None = None, end: date | None = None) -> np.ndarray:
+        """Pilot bazında kullanım oranı (0.0 - 1.0); kapasitesiz pilot için 0.0.
+
+        Kullanılan = min(booked, capacity) yalnızca çalışma günlerinde
+        (CapacityManager.calculate_utilization ile aynı kural).
+        """
+        window = self._window(start, end)
+        capacity = self.capacity[:, window].sum(axis=1, dtype=np.int64)
+        used = np.minimum(self.booked[:, window], self.capacity[:, window]).sum(axis=1, dtype=np.int64)
+        return np.divide(used, capacity, out=np.zeros(len(capacity), dtype=np.float64), where=capacity > 0)
+
+    def fleet_utilization(self, start: date | None = None, end: date | None = None) -> float:
+        """Tüm filonun kullanım oranı."""
+        window = self._window(start, end)
+        capacity = int(self.capacity[:, window].sum(dtype=np.int64))
+        if capacity == 0:
+            return 0.0
+        used = int(np.minimum(self.booked[:, window], self.capacity[:, window]).sum(dtype=np.int64))
+        return used / capacity
+
+    def province_rollup(self) -> ProvinceRollup:
+        """İl × gün kapasite/rezervasyon/boş kapasite toplamları."""
+        codes, inverse = np.unique(np.asarray(self.province_codes, dtype=object), return_inverse=True)
+        shape = (len(codes), self.days)
+        capacity = np.zeros(shape, dtype=np.int64)
+        booked = np.zeros(shape, dtype=np.int64)
+        free = np.zeros(shape, dtype=np.int64)
+        np.add.at(capacity, inverse, self.capacity)
+        np.add.at(booked, inverse, self.booked)
+        np.add.at(free, inverse, self.free())
+        return ProvinceRollup(province_codes=tuple(codes), capacity=capacity, booked=booked, free=free)
+
+    def first_free_days(self, n: int, *, min_free: int = 1) -> np.ndarray:
+        """Her pilot için boş kapasitesi >= min_free olan ilk n günün indeksi.
+
+        Returns:
+            pilot × n int64 dizisi; gün indeksi start'tan itibaren, eksik
+            kalan konumlar -1.
+        """
+        if n <= 0:
+            raise CapacityCalendarError("n_must_be_positive")
+        available = self.free() >= min_free
+        # Kararlı sıralama: uygun günler (False anahtarı) kendi sıralarını korur.
+        order = np.argsort(~available, axis=1, kind="stable")[:, :n]
+        found = np.take_along_axis(available, order, axis=1)
+        result = np.where(found, order, -1)
+        if result.shape[1] < n:
+            result = np.pad(result, ((0, 0), (0, n - result.shape[1])), constant_values=-1)
+        return result
+
+    def day(self, index: int) -> date:
+        """Gün indeksini tarihe çevirir."""
+        return self.start + timedelta(days=index)
+
+    @property
+    def nbytes(self) -> int:
+        """Matrislerin toplam bellek izi (bayt)."""
+        return int(self.capacity.nbytes + self.booked.nbytes + self.work_mask.nbytes)
+
+    def _row_of(self, pilot_id: uuid.UUID) -> int:
+        try:
+            return self._row[pilot_id]
+        except KeyError as exc:
+            raise CapacityCalendarError(f"unknown_pilot:{pilot_id}") from exc
+
+    def _col_of(self, day: date) -> int:
+        col = (day - self.start).days
+        if not 0 <= col < self.days:
+            raise CapacityCalendarError(f"date_outside_calendar:{day.isoformat()}")
+        return col
+
+    def _window(self, start: date | None, end: date | None) -> slice:
+        lo = 0 if start is None else max(0, (start - self.start).days)
+        hi = self.days if end is None else min(self.days, (end - self.start).days + 1)
+        return slice(lo, max(lo, hi))
@@ -0,0 +1,441 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Expected scan demand is projected per province × ISO week against pilot capacity.  # noqa: RUF003
+"""
+Amaç: Aktif aboneliklerden il × ISO hafta tarama talebini öngörüp pilot kapasitesiyle karşılaştırmak (açık tablosu).
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: SubscriptionColumns + il başına haftalık pilot-gün + SeasonalScanPolicy. Çıktı: ShortfallTable (NumPy il × hafta dizileri; CSV/Parquet).
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca il kodu, bitki tipi, alan ve tarih aralıkları.
+Hata Modları (idempotency/retry/rate limit): Deterministik; geçersiz sezon penceresi/sütun uzunluğu ForecastError.
+Observability (log fields/metrics/traces): ShortfallTable.nbytes; açık veren il-hafta sayısı çağıran tarafta metrik olarak okunabilir.
+Testler: Unit (skaler döngü referansıyla eşdeğerlik, PlanningCapacityService ile pilot sayısı eşliği) + performance (81 il, tam sezon).
+Bağımlılıklar: numpy; SeasonalScanPolicy (seasonal_config.yaml), PlanningCapacityService; pyarrow yalnızca Parquet çıktısı için.
+Notlar/SSOT: KR-024 tarama periyodu; KR-015-1 pilot kapasitesi. Haftanın sezon dönemi Perşembe gününün ayıdır (ISO 8601).
+"""
+
+from __future__ import annotations
+
+import csv
+import sys
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import IO, Protocol
+
+import numpy as np
+
+from src.application.services.planning_capacity import PlanningCapacityService
+from src.application.services.season_schedule_generator import SeasonalScanPolicy
+
+_THURSDAY_OFFSET = 3
+TABLE_COLUMNS = (
+    "province_code",
+    "iso_week",
+    "week_start",
+    "expected_scans",
+    "demand_donum",
+    "capacity_donum",
+    "shortfall_donum",
+    "required_pilots",
+)
+
+
+class ForecastError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastSubscription:
+    province_code: str
+    crop_type: str
+    area_donum: float
+    interval_days: int
+    start_date: date
+    end_date: date
+
+
+@dataclass(frozen=True, slots=True)
+class SubscriptionColumns:
+    """Aktif aboneliklerin sütunsal görünümü (tarihler date.toordinal, int64)."""
+
+    province_codes: np.ndarray  # object
+    crop_types: np.ndarray  # object
+    area_donum: np.ndarray  # float64
+    interval_days: np.ndarray  # int64
+    start_ordinal: np.ndarray  # int64
+    end_ordinal: np.ndarray  # int64
+
+    def __post_init__(self) -> None:
+        lengths = {
+            len(self.province_codes),
+            len(self.crop_types),
+            len(self.area_donum),
+            len(self.interval_days),
+            len(self.start_ordinal),
+            len(self.end_ordinal),
+        }
+        if len(lengths) > 1:
+            raise ForecastError("subscription_columns_length_mismatch")
+
+    def __len__(self) -> int:
+        return len(self.area_donum)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[ForecastSubscription]) -> SubscriptionColumns:
+        rows = list(rows)
+        count = len(rows)
+        return cls(
+            province_codes=np.array([r.province_code for r in rows], dtype=object),
+            crop_types=np.array([r.crop_type for r in rows], dtype=object),
+            area_donum=np.fromiter((r.area_donum for r in rows), dtype=np.float64, count=count),
+            interval_days=np.fromiter((r.interval_days for r in rows), dtype=np.int64, count=count),
+            start_ordinal=np.fromiter((r.start_date.toordinal() for r in rows), dtype=np.int64, count=count),
+            end_ordinal=np.fromiter((r.end_date.toordinal() for r in rows), dtype=np.int64, count=count),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ShortfallTable:
+    """İl × hafta öngörü tablosu; tüm diziler (len(province_codes), weeks) biçimindedir."""
+
+    province_codes: tuple[str, ...]
+    week_starts: np.ndarray  # datetime64[D], ISO hafta Pazartesi
+    expected_scans: np.ndarray  # float64; beklenen analiz (uçuş) sayısı
+    demand_donum: np.ndarray  # float64; taranacak alan
+    capacity_donum: np.ndarray  # float64; pilot kapasitesi
+    shortfall_donum: np.ndarray  # float64; max(talep - kapasite, 0)
+    required_pilots: np.ndarray  # int64; talebi karşılayan pilot sayısı
+
+    @property
+    def weeks(self) -> int:
+        return len(self.week_starts)
+
+    @property
+    def nbytes(self) -> int:
+        """Dizilerin toplam bellek izi (bayt)."""
+        return int(
+            self.week_starts.nbytes
+            + self.expected_scans.nbytes
+            + self.demand_donum.nbytes
+            + self.capacity_donum.nbytes
+            + self.shortfall_donum.nbytes
+            + self.required_pilots.nbytes
+        )
+
+    def iso_weeks(self) -> list[str]:
+        """Hafta etiketleri (YYYY-WW)."""
+        labels = []
+        for day in self.week_starts.tolist():
+            year, week, _ = day.isocalendar()
+            labels.append(f"{year}-{week:02d}")
+        return labels
+
+    def shortfall_cells(self) -> list[tuple[str, str, float]]:
+        """Açık veren (il, hafta, açık dönüm) hücreleri; açık büyükten küçüğe."""
+        rows, cols = np.nonzero(self.shortfall_donum > 0)
+        order = np.argsort(-self.shortfall_donum[rows, cols], kind="stable")
+        labels = self.iso_weeks()
+        return [
+            (self.province_codes[r], labels[c], float(self.shortfall_donum[r, c]))
+            for r, c in zip(rows[order].tolist(), cols[order].tolist(), strict=True)
+        ]
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Uzun biçim (il, hafta) satırlarının sütunları; il-hafta sırasıyla düzleştirilir."""
+        provinces = len(self.province_codes)
+        return {
+            "province_code": np.repeat(np.asarray(self.province_codes, dtype=object), self.weeks),
+            "iso_week": np.tile(np.asarray(self.iso_weeks(), dtype=object), provinces),
+            "week_start": np.tile(self.week_starts, provinces),
+            "expected_scans": self.expected_scans.ravel(),
+            "demand_donum": self.demand_donum.ravel(),
+            "capacity_donum": self.capacity_donum.ravel(),
+            "shortfall_donum": self.shortfall_donum.ravel(),
+            "required_pilots": self.required_pilots.ravel(),
+        }
+
+    def rows(self) -> Iterator[tuple[object, ...]]:
+        """CSV satırları (sayılar 2 ondalığa yuvarlanır)."""
+        cols = self.columns()
+        yield from zip(
+            cols["province_code"].tolist(),
+            cols["iso_week"].tolist(),
+            [d.isoformat() for d in cols["week_start"].tolist()],
+            np.round(cols["expected_scans"], 2).tolist(),
+            np.round(cols["demand_donum"], 2).tolist(),
+            np.round(cols["capacity_donum"], 2).tolist(),
+            np.round(cols["shortfall_donum"], 2).tolist(),
+            cols["required_pilots"].tolist(),
+            strict=True,
+        )
+
+    def write_csv(self, stream: IO[str]) -> None:
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(TABLE_COLUMNS)
+        writer.writerows(self.rows())
+
+    def write_parquet(self, path: str) -> None:
+        """Parquet çıktısı; pyarrow opsiyoneldir.
+
+        Raises:
+            RuntimeError: pyarrow kurulu değilse.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise RuntimeError("pyarrow is required for parquet output") from exc
+
+        cols = self.columns()
+        cols["province_code"] = cols["province_code"].astype(str)
+        cols["iso_week"] = cols["iso_week"].astype(str)
+        pq.write_table(pa.table(cols), path)
+
+
+class DemandForecastEngine:
+    """Sezon boyu il × ISO hafta tarama talebi ve pilot açığı öngörüsü.
+
+    Abonelik s'nin w haftasındaki beklenen tarama sayısı
+    aktif_oran(s, w) × 7 / aralık × çarpan'dır:
+
+    - aralık/çarpan: haftanın sezon dönemindeki scanning_frequency_days ve
+      rate_multiplier; dönemde tarama yoksa (null) talep 0. Bitki ya da ay
+      politikada tanımsızsa aboneliğin kendi interval_days değeri, çarpan 1.
+    - aktif_oran: abonelik [start_date, end_date] aralığının haftaya düşen
+      gün oranı (0-1).
+
+    Abonelikler (il, bitki, aralık) sınıflarına indirgenir; aktif alan
+    sınıf × hafta fark dizileriyle (bincount + cumsum) toplanır ve sınıf
+    oranlarıyla çarpılır. Abonelik ya da hafta başına Python döngüsü yoktur.
+
+    Kapasite PlanningCapacityService parametreleriyle hesaplanır:
+    haftalık kapasite = pilot-gün × max_daily_effort_per_pilot / effort_per_donum;
+    gereken pilot, talebin work_days'e yayılmış günlük yükü için
+    PlanningCapacityService.calculate ile aynı kuraldır (talep yoksa 0).
+    """
+
+    def __init__(
+        self,
+        policy: SeasonalScanPolicy | None = None,
+        capacity_service: PlanningCapacityService | None = None,
+        *,
+        work_days: int = 6,
+    ) -> None:
+        if not 1 <= work_days <= 7:
+            raise ForecastError("work_days must be in range 1..7")
+        self._policy = policy
+        self._capacity = capacity_service or PlanningCapacityService()
+        self._work_days = work_days
+
+    def forecast(
+        self,
+        subscriptions: SubscriptionColumns | Iterable[ForecastSubscription],
+        *,
+        first_week: date,
+        weeks: int,
+        pilot_days: Mapping[str, float],
+        province_codes: Sequence[str] | None = None,
+    ) -> ShortfallTable:
+        """Öngörü tablosunu hesaplar.
+
+        Args:
+            subscriptions: Aktif abonelikler (sütunsal ya da satır iterable).
+            first_week: İlk ISO haftanın Pazartesi günü.
+            weeks: Hafta sayısı.
+            pilot_days: İl → haftalık pilot-gün (aktif pilot × çalışma günü).
+            province_codes: Tablo satırları; verilmezse abonelik ve pilot
+                illerinin sıralı birleşimi. Listede olmayan ildeki abonelikler yok sayılır.
+
+        Raises:
+            ForecastError: first_week Pazartesi değilse ya da weeks < 1 ise.
+        """
+        if first_week.weekday() != 0:
+            raise ForecastError("first_week must be a Monday")
+        if weeks < 1:
+            raise ForecastError("weeks must be >= 1")
+        if not isinstance(subscriptions, SubscriptionColumns):
+            subscriptions = SubscriptionColumns.from_rows(subscriptions)
+
+        if province_codes is None:
+            province_codes = sorted({*subscriptions.province_codes.tolist(), *pilot_days})
+        codes = tuple(province_codes)
+        week_ordinals = first_week.toordinal() + 7 * np.arange(weeks, dtype=np.int64)
+
+        scans, area = self._demand(subscriptions, codes, week_ordinals)
+        pilot_days_row = np.fromiter((float(pilot_days.get(c, 0.0)) for c in codes), dtype=np.float64, count=len(codes))
+        daily_donum = self._capacity.max_daily_effort_per_pilot / self._capacity.effort_per_donum
+        capacity = np.broadcast_to((pilot_days_row * daily_donum)[:, None], area.shape).copy()
+
+        daily_effort = area * self._capacity.effort_per_donum / self._work_days
+        required = np.where(
+            area > 0, np.maximum(1, np.ceil(daily_effort / self._capacity.max_daily_effort_per_pilot)), 0
+        ).astype(np.int64)
+
+        return ShortfallTable(
+            province_codes=codes,
+            week_starts=np.datetime64(first_week, "D") + 7 * np.arange(weeks),
+            expected_scans=scans,
+            demand_donum=area,
+            capacity_donum=capacity,
+            shortfall_donum=np.maximum(area - capacity, 0.0),
+            required_pilots=required,
+        )
+
+    def _demand(
+        self, subs: SubscriptionColumns, codes: tuple[str, ...], week_ordinals: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        provinces, weeks = len(codes), len(week_ordinals)
+        if len(subs) == 0 or provinces == 0:
+            empty = np.zeros((provinces, weeks), dtype=np.float64)
+            return empty, empty.copy()
+
+        row_of = {code: i for i, code in enumerate(codes)}
+        province_idx = np.fromiter((row_of.get(c, -1) for c in subs.province_codes.tolist()), dtype=np.int64)
+        first, last = int(week_ordinals[0]), int(week_ordinals[-1]) + 6
+        keep = (province_idx >= 0) & (subs.end_ordinal >= subs.start_ordinal)
+        keep &= (subs.start_ordinal <= last) & (subs.end_ordinal >= first)
+
+        province_idx = province_idx[keep]
+        area = subs.area_donum[keep]
+        start = np.maximum(subs.start_ordinal[keep], first)
+        end = np.minimum(subs.end_ordinal[keep], last)
+
+        # Rate sınıfı = (bitki, aralık); politika sınıf başına bir kez okunur.
+        crops, crop_idx = np.unique(subs.crop_types[keep].astype(str), return_inverse=True)
+        intervals = subs.interval_days[keep]
+        stride = int(intervals.max(initial=0)) + 1
+        class_keys, class_idx = np.unique(crop_idx * stride + intervals, return_inverse=True)
+        class_crop = crops[class_keys // stride]
+        class_interval = class_keys % stride
+        rates = self._class_rates(class_crop, class_interval, week_ordinals)
+        classes = len(class_keys)
+
+        a = (start - first) // 7
+        b = (end - first) // 7
+        frac_a = (np.minimum(end + 1, first + 7 * a + 7) - start) / 7.0
+        frac_b = (end + 1 - np.maximum(start, first + 7 * b)) / 7.0
+        bucket = (province_idx * classes + class_idx) * (weeks + 1)
+        size = provinces * classes * (weeks + 1)
+
+        def accumulate(weight: np.ndarray) -> np.ndarray:
+            # Fark dizisi: tam aktif haftalar [a, b] +1/-1 ile işaretlenir; kısmi ilk/son hafta
+            # cumsum sonrası gün oranına düzeltilir.
+            full = np.bincount(bucket + a, weights=weight, minlength=size)
+            full -= np.bincount(bucket + b + 1, weights=weight, minlength=size)
+            cells = np.cumsum(full.reshape(provinces * classes, weeks + 1), axis=1)
+            cells += np.bincount(bucket + a, weights=weight * (frac_a - 1.0), minlength=size).reshape(cells.shape)
+            edge = b != a
+            cells += np.bincount(
+                bucket[edge] + b[edge], weights=(weight * (frac_b - 1.0))[edge], minlength=size
+            ).reshape(cells.shape)
+            return cells[:, :weeks].reshape(provinces, classes, weeks)
+
+        scans = np.einsum("pkw,kw->pw", accumulate(np.ones(len(area))), rates)
+        donum = np.einsum("pkw,kw->pw", accumulate(area), rates)
+        return scans, donum
+
+    def _class_rates(self, crops: np.ndarray, intervals: np.ndarray, week_ordinals: np.ndarray) -> np.ndarray:
+        """Sınıf × hafta haftalık tarama oranı (7 / aralık × çarpan)."""
+        months = np.array(
+            [date.fromordinal(int(o) + _THURSDAY_OFFSET).month for o in week_ordinals], dtype=np.int64
+        )
+        rates = np.empty((len(crops), len(week_ordinals)), dtype=np.float64)
+        for k, (crop, interval) in enumerate(zip(crops.tolist(), intervals.tolist(), strict=True)):
+            by_month = np.zeros(13, dtype=np.float64)
+            for month in range(1, 13):
+                phase = self._policy.phase_for(crop, month) if self._policy is not None else None
+                if phase is None:
+                    by_month[month] = 7.0 / interval if interval > 0 else 0.0
+                elif phase.interval_days is not None:
+                    by_month[month] = 7.0 / phase.interval_days * phase.rate_multiplier
+            rates[k] = by_month[months]
+        return rates
+
+
+class ForecastInputSource(Protocol):
+    """Öngörü girdisi portu (infra: DemandForecastInputRepository)."""
+
+    def subscription_columns(self, first_day: date, last_day: date) -> SubscriptionColumns: ...
+
+    def pilot_days(self, max_work_days: int) -> Mapping[str, float]: ...
+
+
+def season_window(season: int) -> tuple[date, int]:
+    """ISO sezon yılının ilk Pazartesi'si ve hafta sayısı (52 ya da 53)."""
+    first = date.fromisocalendar(season, 1, 1)
+    return first, (date.fromisocalendar(season + 1, 1, 1) - first).days // 7
+
+
+def run(
+    *,
+    season: int,
+    from_week: str | None = None,
+    to_week: str | None = None,
+    output: str = "-",
+    fmt: str | None = None,
+    work_days: int = 6,
+    daily_capacity_donum: int = 2500,
+    config_path: str | None = None,
+    source: ForecastInputSource | None = None,
+) -> ShortfallTable:
+    """CLI giriş noktası (forecast-demand komutu).
+
+    Pencere varsayılan olarak sezon yılının tüm ISO haftalarıdır;
+    from_week/to_week (YYYY-WW) ile daraltılabilir. Pilot kapasitesi
+    PlanningCapacityService(effort_per_donum=1, max_daily_effort_per_pilot=
+    daily_capacity_donum) ile hesaplanır. fmt verilmezse output uzantısından
+    (.parquet) çıkarılır; '-' her zaman CSV olarak stdout'a yazar.
+
+    Raises:
+        ValueError: Hafta/format geçersizse.
+        RuntimeError: Veritabanı URL'i (DATABASE_URL/DB_URL) yoksa ya da
+            Parquet istenmiş ve pyarrow kurulu değilse.
+    """
+    from src.application.services.weekly_planner_service import parse_iso_week
+
+    season_start, season_weeks = season_window(season)
+    first_week = parse_iso_week(from_week) if from_week is not None else season_start
+    last_week = parse_iso_week(to_week) if to_week is not None else season_start + timedelta(weeks=season_weeks - 1)
+    if last_week < first_week:
+        raise ForecastError("to_week must not be before from_week")
+    weeks = (last_week - first_week).days // 7 + 1
+
+    fmt = fmt or ("parquet" if output.endswith(".parquet") else "csv")
+    if fmt not in ("csv", "parquet") or (fmt == "parquet" and output == "-"):
+        raise ForecastError("format must be csv, or parquet with a file output")
+
+    session = None
+    if source is None:
+        from src.infrastructure.persistence.repositories.forecast_input_repository import (
+            DemandForecastInputRepository,
+        )
+        from src.infrastructure.persistence.sqlalchemy.session import open_sync_session
+
+        session = open_sync_session()
+        source = DemandForecastInputRepository(session)
+
+    try:
+        from src.infrastructure.config.seasonal_config import load_seasonal_scan_policy
+
+        engine = DemandForecastEngine(
+            load_seasonal_scan_policy(config_path),
+            PlanningCapacityService(effort_per_donum=1.0, max_daily_effort_per_pilot=float(daily_capacity_donum)),
+            work_days=work_days,
+        )
+        table = engine.forecast(
+            source.subscription_columns(first_week, last_week + timedelta(days=6)),
+            first_week=first_week,
+            weeks=weeks,
+            pilot_days=source.pilot_days(work_days),
+        )
+    finally:
+        if session is not None:
+            session.close()
+
+    if fmt == "parquet":
+        table.write_parquet(output)
+    elif output == "-":
+        table.write_csv(sys.stdout)
+    else:
+        with open(output, "w", encoding="utf-8", newline="") as stream:
+            table.write_csv(stream)
+    return table
@@ -0,0 +1,171 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-016: Map responses ship zoom-appropriate field boundaries instead of full-resolution GeoJSON.
+"""
+Amaç: Tarla sınırlarının zoom seviyelerine göre sadeleştirilmiş (LOD) GeoJSON karşılıklarını önceden hesaplayıp harita yanıtlarında kullanmak.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: tarla kimlikleri + sınır geometrileri; sorguda bbox + zoom. Çıktı: GeoJSON FeatureCollection metni.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca tarla kimliği ve geometri. Kimlik doğrulaması endpoint'te; FieldMapLayer sonuçları sahip kapsamına göre filtreler (admin tüm tarlaları görür).
+Hata Modları (idempotency/retry/rate limit): Deterministik; geçersiz zoom/bbox FieldGeometryLodError. Aynı geometri tekrar eklenirse yeniden hesaplanmaz.
+Observability (log fields/metrics/traces): Önbellek girdi sayısı (len) ve metin boyutu (nbytes) çağıran tarafta metrik olarak okunabilir.
+Testler: Unit (seviye seçimi, topoloji korunumu, bbox filtresi) + performance (10k tarlalık bbox isteği, seviye başına yük ve gecikme).
+Bağımlılıklar: shapely>=2, numpy; Geometry VO, FieldSpatialIndex.
+Notlar/SSOT: Tolerans, Web Mercator karosunda (256 px) seviyenin yarım pikselidir; koordinatlar toleransın 1/10'una yuvarlanır.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Collection, Hashable, Sequence
+
+import numpy as np
+import shapely
+
+from src.application.services.batch_coverage import GeometryLike
+from src.application.services.field_spatial_index import FieldSpatialIndex
+from src.core.domain.value_objects.geometry import Geometry
+
+DEFAULT_LOD_ZOOMS: tuple[int, ...] = (8, 11, 14, 17)
+MAX_ZOOM = 22
+FULL_RESOLUTION_DECIMALS = 7  # ~1 cm
+MAP_ADMIN_ROLE = "admin"
+
+
+class FieldGeometryLodError(ValueError):
+    pass
+
+
+def zoom_tolerance(zoom: int) -> float:
+    """Zoom seviyesinde yarım pikselin derece karşılığı (ekvator, 256 px karo)."""
+    return 360.0 / (256 * 2**zoom) / 2.0
+
+
+def _decimals(tolerance: float) -> int:
+    return min(max(math.ceil(-math.log10(tolerance / 10.0)), 0), FULL_RESOLUTION_DECIMALS)
+
+
+class FieldGeometryLodCache:
+    """(geometri özeti, seviye) → GeoJSON geometri metni.
+
+    Seviyeler zooms sırasıyla 0..len(zooms)-1, tam çözünürlük len(zooms)'tur.
+    İstenen zoom için zoom'u karşılayan en kaba seviye seçilir; en büyük
+    LOD zoom'unun üstünde tam çözünürlük döner. Aynı WKB'ye sahip tarlalar
+    tek girdi paylaşır.
+    """
+
+    def __init__(self, zooms: Sequence[int] = DEFAULT_LOD_ZOOMS) -> None:
+        if not zooms or list(zooms) != sorted(set(zooms)) or zooms[0] < 0 or zooms[-1] > MAX_ZOOM:
+            raise FieldGeometryLodError("zooms must be strictly increasing within 0..22")
+        self._zooms = tuple(zooms)
+        self._entries: dict[tuple[bytes, int], str] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def zooms(self) -> tuple[int, ...]:
+        return self._zooms
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(text) for text in self._entries.values())
+
+    def level_for(self, zoom: int) -> int:
+        """Zoom'u karşılayan seviye (tolerans seviyenin yarım pikselini aşmaz)."""
+        if not 0 <= zoom <= MAX_ZOOM:
+            raise FieldGeometryLodError(f"zoom must be within 0..{MAX_ZOOM}")
+        for level, lod_zoom in enumerate(self._zooms):
+            if zoom <= lod_zoom:
+                return level
+        return len(self._zooms)
+
+    def store(self, geometries: Sequence[GeometryLike]) -> list[bytes]:
+        """Geometrileri tüm seviyelerde hazırlar; sırayla özetlerini döndürür."""
+        wrapped = [g if isinstance(g, Geometry) else Geometry.from_shapely(g) for g in geometries]
+        digests = [g.wkb_digest for g in wrapped]
+        new: dict[bytes, shapely.Geometry] = {}
+        for geometry, digest in zip(wrapped, digests, strict=True):
+            if (digest, 0) not in self._entries:
+                new.setdefault(digest, geometry.shape)
+        if new:
+            keys = list(new)
+            shapes = np.empty(len(keys), dtype=object)
+            shapes[:] = list(new.values())
+            # İnceden kabaya: her seviye bir öncekinin çıktısını sadeleştirir (köşe sayısı hızla düşer).
+            # Toplam sapma toleransların toplamıdır; varsayılan 3 zoom aralıkla seviye toleransının ~1.15 katı.
+            for level in range(len(self._zooms), -1, -1):
+                decimals = FULL_RESOLUTION_DECIMALS
+                if level < len(self._zooms):
+                    tolerance = zoom_tolerance(self._zooms[level])
+                    shapes = shapely.simplify(shapes, tolerance, preserve_topology=True)
+                    decimals = _decimals(tolerance)
+                rounded = shapely.transform(shapes, lambda coords, d=decimals: np.round(coords, d))
+                texts = shapely.to_geojson(rounded).tolist()
+                self._entries.update(zip(((key, level) for key in keys), texts, strict=True))
+        return digests
+
+    def get(self, digests: Sequence[bytes], zoom: int) -> list[str]:
+        """Özetlerin zoom'a uygun GeoJSON geometri metinleri."""
+        level = self.level_for(zoom)
+        try:
+            return [self._entries[(digest, level)] for digest in digests]
+        except KeyError:
+            raise FieldGeometryLodError("geometry_not_cached") from None
+
+
+class FieldMapLayer:
+    """Harita katmanı: bbox seçimi FieldSpatialIndex'ten, geometri metni LOD önbelleğinden.
+
+    Her tarla sahibinin subject'i ile eklenir; admin rolü olmayan çağıran
+    yalnızca kendi tarlalarını görür. Sahipsiz eklenen tarlaları yalnızca
+    admin görür.
+    """
+
+    def __init__(self, cache: FieldGeometryLodCache | None = None) -> None:
+        self._cache = cache or FieldGeometryLodCache()
+        self._index = FieldSpatialIndex()
+        self._digests: list[bytes] = []
+        self._owners: list[str | None] = []
+
+    def __len__(self) -> int:
+        return len(self._digests)
+
+    @property
+    def cache(self) -> FieldGeometryLodCache:
+        return self._cache
+
+    def add(
+        self,
+        field_ids: Sequence[Hashable],
+        geometries: Sequence[GeometryLike],
+        owners: Sequence[str | None] | None = None,
+    ) -> None:
+        if owners is not None and len(owners) != len(field_ids):
+            raise FieldGeometryLodError("owners must align with field_ids")
+        self._index.add(field_ids, geometries)
+        self._digests.extend(self._cache.store(geometries))
+        self._owners.extend(owners if owners is not None else [None] * len(field_ids))
+
+    def feature_collection(
+        self,
+        *,
+        bbox: tuple[float, float, float, float],
+        zoom: int,
+        subject: str,
+        roles: Collection[str] = (),
+    ) -> str:
+        """bbox'a değen ve çağıranın görebildiği tarlaların zoom'a uygun GeoJSON FeatureCollection metni."""
+        minx, miny, maxx, maxy = bbox
+        if not (minx < maxx and miny < maxy):
+            raise FieldGeometryLodError("bbox must be (minx, miny, maxx, maxy) with min < max")
+        hits = self._index.touching([shapely.box(minx, miny, maxx, maxy)])[1].tolist()
+        if MAP_ADMIN_ROLE not in roles:
+            owners = self._owners
+            hits = [i for i in hits if subject and owners[i] == subject]
+        ids = self._index.field_ids
+        texts = self._cache.get([self._digests[i] for i in hits], zoom)
+        features = ",".join(
+            f'{{"type":"Feature","id":{json.dumps(str(ids[i]))},"geometry":{text},"properties":{{}}}}'
+            for i, text in zip(hits, texts, strict=True)
+        )
+        return f'{{"type":"FeatureCollection","features":[{features}]}}'
@@ -0,0 +1,181 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-016: Field boundaries are looked up through an STRtree instead of linear polygon scans.
+"""
+Amaç: Tarla sınırları üzerinde bellek içi STRtree dizini; nokta → tarla, footprint → tarla ve çakışma sorgularını logaritmik yapmak.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: tarla kimlikleri + sınır geometrileri (Geometry / shapely). Çıktı: NumPy indeks çiftleri ve oranlar.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca tarla kimliği ve geometri.
+Hata Modları (idempotency/retry/rate limit): Deterministik; kimlik/geometri uzunluğu uyuşmazlığı FieldSpatialIndexError.
+Observability (log fields/metrics/traces): size, pending ve rebuilds sayaçları çağıran tarafta metrik olarak okunabilir.
+Testler: Unit (kaba kuvvet shapely taramasıyla eşdeğerlik, artımlı ekleme) + performance (500k tarla, sorgu gecikmesi).
+Bağımlılıklar: shapely>=2 (STRtree), numpy; Geometry VO.
+Notlar/SSOT: STRtree değişmezdir; eklenen tarlalar küçük bir bekleme ağacında toplanır ve eşik aşılınca ana ağaç tek seferde yeniden kurulur.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import shapely
+from shapely import STRtree
+
+from src.application.services.batch_coverage import GeometryLike, as_geometry_array
+
+
+class FieldSpatialIndexError(ValueError):
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class OverlapPairs:
+    """Çakışan tarla çiftleri (left < right, dizin sırası); ratio = kesişim / küçük tarlanın alanı."""
+
+    left: np.ndarray  # int64
+    right: np.ndarray  # int64
+    ratio: np.ndarray  # float64
+
+    def __len__(self) -> int:
+        return len(self.left)
+
+
+class FieldSpatialIndex:
+    """Tarla sınırları için STRtree dizini.
+
+    Tarlalar eklenme sırasıyla 0'dan numaralanır; sorgular bu numaraları
+    döndürür, field_ids ile kimliğe çevrilir. add() ana ağacı hemen yeniden
+    kurmaz: yeni tarlalar bekleme listesine girer ve sorgularda ayrı, küçük
+    bir STRtree ile taranır. Bekleyen sayı rebuild_threshold'u ya da ana
+    ağacın rebuild_ratio oranını aşınca tüm tarlalarla tek ağaç kurulur;
+    böylece tek tek eklemeler toplam O(n log n) kurulum maliyetinde kalır.
+    """
+
+    def __init__(
+        self,
+        field_ids: Sequence[Hashable] = (),
+        geometries: Sequence[GeometryLike] = (),
+        *,
+        rebuild_threshold: int = 4096,
+        rebuild_ratio: float = 0.1,
+    ) -> None:
+        if rebuild_threshold < 1:
+            raise FieldSpatialIndexError("rebuild_threshold must be >= 1")
+        self._rebuild_threshold = rebuild_threshold
+        self._rebuild_ratio = rebuild_ratio
+        self._ids: list[Hashable] = []
+        self._geoms = np.empty(0, dtype=object)  # Ana ağaçtaki tarlalar
+        self._tree = STRtree(self._geoms)
+        self._pending: list[shapely.Geometry] = []
+        self._pending_tree: STRtree | None = None
+        self.rebuilds = 0
+        if len(field_ids) or len(geometries):
+            self.add(field_ids, geometries)
+            self.rebuild()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def field_ids(self) -> list[Hashable]:
+        return self._ids
+
+    def geometry(self, index: int) -> shapely.Geometry:
+        indexed = len(self._geoms)
+        return self._geoms[index] if index < indexed else self._pending[index - indexed]
+
+    def add(self, field_ids: Sequence[Hashable], geometries: Sequence[GeometryLike]) -> None:
+        """Tarlaları ekler; gerekirse ana ağacı yeniden kurar."""
+        if len(field_ids) != len(geometries):
+            raise FieldSpatialIndexError("field_ids_and_geometries_length_mismatch")
+        self._ids.extend(field_ids)
+        self._pending.extend(as_geometry_array(geometries).tolist())
+        self._pending_tree = None
+        if self.pending >= max(self._rebuild_threshold, int(len(self._geoms) * self._rebuild_ratio)):
+            self.rebuild()
+
+    def rebuild(self) -> None:
+        """Bekleyen tarlaları ana ağaca katar."""
+        if self.pending == 0:
+            return
+        self._geoms = self._all_geometries()
+        self._tree = STRtree(self._geoms)
+        self._pending = []
+        self._pending_tree = None
+        self.rebuilds += 1
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    def query_points(self, lon: Sequence[float] | np.ndarray, lat: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Noktaları içeren tarlalar: (2, k) dizisi [nokta indeksi, tarla indeksi], nokta sırasıyla."""
+        points = shapely.points(np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64))
+        return self._query(np.atleast_1d(points), "intersects")
+
+    def locate_points(self, lon: Sequence[float] | np.ndarray, lat: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Nokta başına içeren ilk (en küçük indeksli) tarla; yoksa -1."""
+        pairs = self.query_points(lon, lat)
+        located = np.full(len(np.atleast_1d(lon)), -1, dtype=np.int64)
+        # Çiftler (nokta, tarla) sıralı; ters yazınca her noktada en küçük tarla kalır.
+        located[pairs[0][::-1]] = pairs[1][::-1]
+        return located
+
+    def touching(self, footprints: Sequence[GeometryLike]) -> np.ndarray:
+        """Footprint'lerin değdiği tarlalar: (2, k) dizisi [footprint indeksi, tarla indeksi]."""
+        return self._query(as_geometry_array(footprints), "intersects")
+
+    def fields_touching(self, footprint: GeometryLike) -> list[Hashable]:
+        """Tek footprint'in değdiği tarla kimlikleri (indeks sırasıyla)."""
+        return [self._ids[i] for i in self.touching([footprint])[1].tolist()]
+
+    def overlaps(self, *, min_ratio: float = 0.0) -> OverlapPairs:
+        """Alan olarak çakışan tarla çiftleri (yalnızca sınırda değenler hariç).
+
+        Args:
+            min_ratio: Kesişim / küçük tarla alanı bu değerden büyük olmalı.
+        """
+        geoms = self._all_geometries()
+        pairs = self._query(geoms, "intersects")
+        left, right = pairs[0], pairs[1]
+        keep = left < right
+        left, right = left[keep], right[keep]
+        if len(left) == 0:
+            return OverlapPairs(left=left, right=right, ratio=np.zeros(0, dtype=np.float64))
+        shared = shapely.area(shapely.intersection(geoms[left], geoms[right]))
+        smaller = np.minimum(shapely.area(geoms[left]), shapely.area(geoms[right]))
+        ratio = np.divide(shared, smaller, out=np.zeros_like(shared), where=smaller > 0)
+        keep = ratio > min_ratio
+        return OverlapPairs(left=left[keep], right=right[keep], ratio=ratio[keep])
+
+    def duplicates(self, *, min_ratio: float = 0.98) -> OverlapPairs:
+        """Aynı sınırı tekrar eden tarla çiftleri (kesişim / birleşim >= min_ratio)."""
+        candidates = self.overlaps(min_ratio=min_ratio)
+        if len(candidates) == 0:
+            return candidates
+        geoms = self._all_geometries()
+        left_area, right_area = shapely.area(geoms[candidates.left]), shapely.area(geoms[candidates.right])
+        shared = candidates.ratio * np.minimum(left_area, right_area)
+        union = left_area + right_area - shared
+        iou = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+        keep = iou >= min_ratio
+        return OverlapPairs(left=candidates.left[keep], right=candidates.right[keep], ratio=iou[keep])
+
+    def _query(self, geoms: np.ndarray, predicate: str) -> np.ndarray:
+        pairs = self._tree.query(geoms, predicate=predicate)
+        if self._pending:
+            if self._pending_tree is None:
+                self._pending_tree = STRtree(self._pending)
+            extra = self._pending_tree.query(geoms, predicate=predicate)
+            extra[1] += len(self._geoms)
+            pairs = np.concatenate([pairs, extra], axis=1)
+        order = np.lexsort((pairs[1], pairs[0]))
+        return pairs[:, order]
+
+    def _all_geometries(self) -> np.ndarray:
+        if not self._pending:
+            return self._geoms
+        return np.concatenate([self._geoms, as_geometry_array(self._pending)])
@@ -0,0 +1,161 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-016: Mission coverage is accumulated from streamed image footprints instead of one in-memory union.
+"""
+Amaç: Görüntü footprint'lerini geldikçe kademeli (cascaded) parça birleşimleriyle toplamak ve tarla kapsamını her an okunabilir kılmak.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: tarla sınırı + akan footprint'ler (Geometry / shapely). Çıktı: anlık kapsam oranı, birleşim geometrisi, CoverageResult.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca geometri ve alan değerleri.
+Hata Modları (idempotency/retry/rate limit): Deterministik; boş/alansız tarla ve geçersiz parametre FootprintUnionError. None/boş footprint yok sayılır.
+Observability (log fields/metrics/traces): image_count, retained_geometries ve retained_coordinates çağıran tarafta metrik olarak okunabilir.
+Testler: Unit (tek seferlik union_all ile eşdeğerlik, sınırlı parça sayısı) + performance (20k görüntülü mission, tek union_all'a karşı).
+Bağımlılıklar: shapely>=2, numpy; Geometry VO, CoverageCalculator, equal_area.
+Notlar/SSOT: Footprint'ler tarlaya kırpılarak tutulur; tarla dışında kalan uçuş alanı kapsamı etkilemediği için saklanmaz.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Iterable
+
+import numpy as np
+import shapely
+
+from src.application.services.batch_coverage import GeometryLike, as_geometry_array
+from src.core.domain.services.coverage_calculator import CoverageCalculator, CoverageResult
+from src.core.domain.value_objects import equal_area
+
+
+class FootprintUnionError(ValueError):
+    pass
+
+
+class FootprintUnionAccumulator:
+    """Tek tarla için akış halinde footprint birleşimi.
+
+    Kırpılmış footprint'ler chunk_size'lık tampona girer; tampon dolunca
+    shapely.union_all ile tek parça olur ve 0. seviyeye itilir. Bir seviyede
+    fan_in parça biriktiğinde bunlar birleştirilip bir üst seviyeye taşınır
+    (ikili sayaç gibi). Bellekte en çok chunk_size + fan_in × derinlik
+    geometri kalır; derinlik log_fan_in(görüntü / chunk_size)'dır.
+
+    Tarlayı tek başına örten bir footprint geldiğinde kapsam 1'dir ve
+    sonraki footprint'ler yalnızca sayılır.
+    """
+
+    def __init__(
+        self,
+        field: GeometryLike,
+        *,
+        chunk_size: int = 512,
+        fan_in: int = 8,
+        minimum_coverage_ratio: float | None = None,
+    ) -> None:
+        if chunk_size < 2 or fan_in < 2:
+            raise FootprintUnionError("chunk_size and fan_in must be >= 2")
+        shape = as_geometry_array([field])[0]
+        if shape is None or shape.is_empty or shape.area <= 0:
+            raise FootprintUnionError("field_must_be_a_non_empty_polygon")
+        self._calculator = CoverageCalculator(minimum_coverage_ratio=minimum_coverage_ratio)
+        self._field = shape
+        shapely.prepare(self._field)
+        self._field_area = float(shape.area)
+        self._chunk_size = chunk_size
+        self._fan_in = fan_in
+        self._buffer: list[shapely.Geometry] = []
+        self._levels: list[list[shapely.Geometry]] = []
+        self._union: shapely.Geometry | None = None  # Son birleşim; ekleme olunca geçersiz
+        self._saturated = False
+        self.image_count = 0
+
+    def add(self, footprint: GeometryLike) -> None:
+        """Tek footprint ekler."""
+        self.extend([footprint])
+
+    def extend(self, footprints: Iterable[GeometryLike]) -> None:
+        """Footprint grubunu ekler; kırpma ve örtme testleri grup üzerinde vektöreldir."""
+        arr = as_geometry_array(list(footprints))
+        self.image_count += len(arr)
+        if self._saturated or len(arr) == 0:
+            return
+        arr = arr[~shapely.is_missing(arr)]
+        arr = arr[shapely.intersects(self._field, arr)]
+        if len(arr) == 0:
+            return
+        if shapely.covers(arr, self._field).any():
+            self._saturate()
+            return
+        # Tarlanın içinde kalanlar kırpılmaz; yalnızca sınırı kesenler için kesişim hesaplanır.
+        crossing = ~shapely.contains_properly(self._field, arr)
+        if crossing.any():
+            arr[crossing] = shapely.intersection(arr[crossing], self._field)
+        self._buffer.extend(arr.tolist())
+        self._union = None
+        while len(self._buffer) >= self._chunk_size:
+            chunk = self._buffer[: self._chunk_size]
+            del self._buffer[: self._chunk_size]
+            self._push(shapely.union_all(chunk), 0)
+
+    def union(self) -> shapely.Geometry:
+        """Şu ana kadarki footprint'lerin tarla içindeki birleşimi.
+
+        Tüm parçalar tek geometride toplanır ve en üst seviyeye yazılır;
+        yeni ekleme olmadıkça tekrar çağrı hesap yapmaz.
+        """
+        if self._union is not None:
+            return self._union
+        pieces = self._buffer + [piece for level in self._levels for piece in level]
+        merged = shapely.union_all(pieces) if pieces else shapely.Polygon()
+        self._buffer = []
+        self._levels = [[] for _ in self._levels] or [[]]
+        self._levels[-1].append(merged)
+        self._union = merged
+        return merged
+
+    def coverage_ratio(self) -> float:
+        """Anlık kapsam oranı (birleşim alanı / tarla alanı, 0.0-1.0)."""
+        if self._saturated:
+            return 1.0
+        return min(float(self.union().area) / self._field_area, 1.0)
+
+    def evaluate(self, *, mission_id: uuid.UUID, field_id: uuid.UUID) -> CoverageResult:
+        """Anlık birleşimle CoverageCalculator değerlendirmesi.
+
+        footprint_area_m2 tarla içinde kalan uçuş alanıdır (kırpılmış birleşim).
+        """
+        field_m2 = float(equal_area.areas_m2(np.array([self._field], dtype=object))[0])
+        covered_m2 = self.coverage_ratio() * field_m2
+        return self._calculator.evaluate_coverage(
+            mission_id=mission_id,
+            field_id=field_id,
+            field_area_m2=field_m2,
+            footprint_area_m2=covered_m2,
+            intersection_area_m2=covered_m2,
+        )
+
+    @property
+    def retained_geometries(self) -> int:
+        """Bellekte tutulan footprint ve parça birleşim sayısı."""
+        return len(self._buffer) + sum(len(level) for level in self._levels)
+
+    @property
+    def retained_coordinates(self) -> int:
+        """Tutulan geometrilerin toplam köşe sayısı (bellek göstergesi)."""
+        pieces = self._buffer + [piece for level in self._levels for piece in level]
+        return int(shapely.get_num_coordinates(as_geometry_array(pieces)).sum())
+
+    def _push(self, piece: shapely.Geometry, level: int) -> None:
+        while True:
+            if level == len(self._levels):
+                self._levels.append([])
+            self._levels[level].append(piece)
+            if len(self._levels[level]) < self._fan_in:
+                return
+            piece = shapely.union_all(self._levels[level])
+            self._levels[level] = []
+            level += 1
+
+    def _saturate(self) -> None:
+        self._saturated = True
+        self._buffer = []
+        self._levels = [[self._field]]
+        self._union = self._field
@@ -0,0 +1,286 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Planning results are memoized by a canonical content hash of the engine inputs.
+"""
+Amaç: Aynı (ya da yalnızca sırası farklı) girdilerle tekrarlanan planlamada PlanningEngine'i yeniden çözdürmemek.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: MissionDemand/PilotSlot listeleri + motor parametreleri. Çıktı: ScheduleResult (önbellekten ya da çözülmüş).
+Güvenlik (RBAC/PII/Audit): PII taşımaz; disk girdileri yalnızca kimlik (UUID), il kodu, tarih ve sayılar içerir (JSON, pickle yok).
+Hata Modları (idempotency/retry/rate limit): Bozuk/okunamayan disk girdisi miss sayılıp silinir; kod sürümü değişince önbellek boşaltılır.
+Observability (log fields/metrics/traces): CacheStats (bellek/disk hit, miss, tahliye, geçersiz kılma sayaçları).
+Testler: Unit (sıra duyarsız hash, hit/miss, LRU sınırı, sürüm geçersiz kılma, disk kalıcılığı).
+Bağımlılıklar: PlanningEngine, SlotIndex, MinCostFlowMatcher (kod sürümü bunların kaynağından türetilir).
+Notlar/SSOT: Miss'te motor kanonik sıralı girdiyle çalıştırılır; aynı küme hangi sırayla gelirse gelsin aynı sonucu alır.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import uuid
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import astuple, dataclass
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+from src.core.domain.services import min_cost_flow, planning_engine, slot_index
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    ScheduledSlot,
+    ScheduleResult,
+)
+
+_VERSION_FILE = "CODE_VERSION"
+
+
+@lru_cache(maxsize=1)
+def planning_code_version() -> str:
+    """Planlama kodunun sürümü: motor modüllerinin kaynak özetinin ilk 16 hanesi."""
+    digest = hashlib.sha256()
+    for module in (planning_engine, slot_index, min_cost_flow):
+        digest.update(inspect.getsource(module).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+@dataclass(slots=True)
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    memory_evictions: int = 0
+    disk_evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+
+def canonical_key(
+    demands: Sequence[MissionDemand],
+    pilot_slots: Sequence[PilotSlot],
+    engine: PlanningEngine,
+    *,
+    code_version: str,
+) -> str:
+    """Girdi sırasından bağımsız SHA-256 içerik anahtarı.
+
+    Talepler demand_id'ye, slotlar (pilot_id, tarih)'e göre sıralanıp alan
+    alan kodlanır; motor stratejisi, süre bütçesi, maliyet ağırlıkları ve
+    kod sürümü de özete girer.
+    """
+    digest = hashlib.sha256()
+    weights = astuple(engine.cost_weights) if engine.cost_weights is not None else None
+    digest.update(f"v={code_version}|s={engine.strategy.value}|t={engine.time_budget_s!r}|w={weights!r}\n".encode())
+    for d in _canonical_demands(demands):
+        digest.update(
+            f"D|{d.demand_id.hex}|{d.field_id.hex}|{d.province_code}|{d.crop_type}|{d.area_m2!r}|{d.priority}|"
+            f"{d.earliest_date.isoformat()}|{d.latest_date.isoformat()}|{d.estimated_duration_minutes}\n".encode()
+        )
+    for s in _canonical_slots(pilot_slots):
+        digest.update(
+            f"S|{s.pilot_id.hex}|{s.date.isoformat()}|{s.province_code}|{s.remaining_capacity}|"
+            f"{s.daily_capacity}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+class PlanningResultCache:
+    """İki katmanlı sınırlı LRU: süreç içi OrderedDict + opsiyonel disk dizini.
+
+    Disk katmanında her sonuç <anahtar>.json dosyasıdır; LRU sırası dosya
+    değişiklik zamanıyla tutulur (hit'te güncellenir). Dizindeki
+    CODE_VERSION planning_code_version()'dan farklıysa açılışta dizin
+    boşaltılır; invalidate() aynı işi açıkça yapar.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        *,
+        max_memory_entries: int = 128,
+        max_disk_entries: int = 1024,
+        code_version: str | None = None,
+    ) -> None:
+        if max_memory_entries < 1 or max_disk_entries < 1:
+            raise ValueError("cache sizes must be >= 1")
+        self.code_version = code_version or planning_code_version()
+        self.stats = CacheStats()
+        self._max_memory = max_memory_entries
+        self._max_disk = max_disk_entries
+        self._memory: OrderedDict[str, ScheduleResult] = OrderedDict()
+        self._disk: OrderedDict[str, None] = OrderedDict()
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._open_directory()
+
+    def key_for(
+        self, demands: Sequence[MissionDemand], pilot_slots: Sequence[PilotSlot], engine: PlanningEngine
+    ) -> str:
+        return canonical_key(demands, pilot_slots, engine, code_version=self.code_version)
+
+    def get(self, key: str) -> ScheduleResult | None:
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return result
+        result = self._read_disk(key)
+        if result is not None:
+            self.stats.disk_hits += 1
+            self._remember(key, result)
+            return result
+        self.stats.misses += 1
+        return None
+
+    def put(self, key: str, result: ScheduleResult) -> None:
+        self._remember(key, result)
+        if self._directory is not None:
+            self._write_disk(key, result)
+
+    def invalidate(self) -> None:
+        """Tüm katmanları boşaltır (ör. planlama kodu sürümü değiştiğinde)."""
+        self._memory.clear()
+        if self._directory is not None:
+            for key in list(self._disk):
+                self._path(key).unlink(missing_ok=True)
+            self._disk.clear()
+            (self._directory / _VERSION_FILE).write_text(self.code_version, encoding="utf-8")
+        self.stats.invalidations += 1
+
+    # ------------------------------------------------------------------
+    # Bellek katmanı
+    # ------------------------------------------------------------------
+    def _remember(self, key: str, result: ScheduleResult) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory:
+            self._memory.popitem(last=False)
+            self.stats.memory_evictions += 1
+
+    # ------------------------------------------------------------------
+    # Disk katmanı
+    # ------------------------------------------------------------------
+    def _open_directory(self) -> None:
+        assert self._directory is not None
+        self._directory.mkdir(parents=True, exist_ok=True)
+        version_file = self._directory / _VERSION_FILE
+        stored = version_file.read_text(encoding="utf-8").strip() if version_file.exists() else None
+        entries = sorted(self._directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        if stored != self.code_version:
+            for path in entries:
+                path.unlink(missing_ok=True)
+            version_file.write_text(self.code_version, encoding="utf-8")
+            if stored is not None:
+                self.stats.invalidations += 1
+            return
+        for path in entries:
+            self._disk[path.stem] = None
+        self._evict_disk()
+
+    def _path(self, key: str) -> Path:
+        assert self._directory is not None
+        return self._directory / f"{key}.json"
+
+    def _read_disk(self, key: str) -> ScheduleResult | None:
+        if self._directory is None or key not in self._disk:
+            return None
+        path = self._path(key)
+        try:
+            result = _decode(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError):
+            self._disk.pop(key, None)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        self._disk.move_to_end(key)
+        return result
+
+    def _write_disk(self, key: str, result: ScheduleResult) -> None:
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(_encode(result), separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)  # Yarım yazılmış dosya okunmaz
+        self._disk[key] = None
+        self._disk.move_to_end(key)
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        while len(self._disk) > self._max_disk:
+            key, _ = self._disk.popitem(last=False)
+            self._path(key).unlink(missing_ok=True)
+            self.stats.disk_evictions += 1
+
+
+class CachedPlanningEngine:
+    """PlanningEngine.optimize_schedule'ın önbellekli karşılığı (aynı imza)."""
+
+    def __init__(self, engine: PlanningEngine, cache: PlanningResultCache) -> None:
+        self.engine = engine
+        self.cache = cache
+
+    def optimize_schedule(self, demands: list[MissionDemand], pilot_slots: list[PilotSlot]) -> ScheduleResult:
+        key = self.cache.key_for(demands, pilot_slots, self.engine)
+        result = self.cache.get(key)
+        if result is None:
+            result = self.engine.optimize_schedule(*canonical_inputs(demands, pilot_slots))
+            self.cache.put(key, result)
+        return result
+
+
+def canonical_inputs(
+    demands: Sequence[MissionDemand], pilot_slots: Sequence[PilotSlot]
+) -> tuple[list[MissionDemand], list[PilotSlot]]:
+    """Motorun miss'te çözdüğü kanonik sıralı girdiler (canonical_key ile aynı sıra)."""
+    return _canonical_demands(demands), _canonical_slots(pilot_slots)
+
+
+def _canonical_demands(demands: Sequence[MissionDemand]) -> list[MissionDemand]:
+    return sorted(demands, key=lambda d: d.demand_id)
+
+
+def _canonical_slots(pilot_slots: Sequence[PilotSlot]) -> list[PilotSlot]:
+    return sorted(pilot_slots, key=lambda s: (s.pilot_id, s.date))
+
+
+def _encode(result: ScheduleResult) -> dict[str, object]:
+    return {
+        "scheduled": [
+            [
+                s.demand_id.hex,
+                s.field_id.hex,
+                s.pilot_id.hex,
+                s.scheduled_date.isoformat(),
+                s.estimated_duration_minutes,
+                s.route_sequence,
+            ]
+            for s in result.scheduled
+        ],
+        "unscheduled": [d.hex for d in result.unscheduled],
+        "pilot_utilization": {pid.hex: value for pid, value in result.pilot_utilization.items()},
+        "warnings": list(result.warnings),
+    }
+
+
+def _decode(raw: dict[str, object]) -> ScheduleResult:
+    return ScheduleResult(
+        scheduled=tuple(
+            ScheduledSlot(
+                demand_id=uuid.UUID(demand_id),
+                field_id=uuid.UUID(field_id),
+                pilot_id=uuid.UUID(pilot_id),
+                scheduled_date=date.fromisoformat(day),
+                estimated_duration_minutes=int(minutes),
+                route_sequence=int(sequence),
+            )
+            for demand_id, field_id, pilot_id, day, minutes, sequence in raw["scheduled"]  # type: ignore[union-attr]
+        ),
+        unscheduled=tuple(uuid.UUID(d) for d in raw["unscheduled"]),  # type: ignore[union-attr]
+        pilot_utilization={uuid.UUID(pid): float(v) for pid, v in raw["pilot_utilization"].items()},  # type: ignore[union-attr]
+        warnings=tuple(raw["warnings"]),  # type: ignore[arg-type]
+    )
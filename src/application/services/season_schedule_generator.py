@@ -0,0 +1,222 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Season rollover regenerates every subscription schedule from shared date lattices.
+"""
+Amaç: Sezon devrinde tüm abonelik takvimlerini grup başına bir kez hesaplanan tarih kafesiyle toplu üretmek.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: SubscriptionConfig akışı + SeasonalScanPolicy (seasonal_config.yaml). Çıktı: SubscriptionSchedule parçaları (girdi sırasıyla).
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca abonelik/tarla kimliği, bitki tipi ve tarih.
+Hata Modları (idempotency/retry/rate limit): Deterministik; geçersiz yapılandırma SubscriptionPlanningError (on_error verilirse atlanır).
+Observability (log fields/metrics/traces): lattice_count (önbellekteki grup sayısı) ve lattice_evictions çağıran tarafta metrik olarak okunabilir.
+Testler: Unit (tekil SubscriptionPlanner.generate_schedule ile eşdeğerlik) + performance (200k abonelik).
+Bağımlılıklar: numpy; SubscriptionPlanner domain tipleri.
+Notlar/SSOT: KR-015-5; KR-024 tarama periyodu (scanning_frequency_days). Bellek max_lattices + parça boyu ile sınırlıdır.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, replace
+from datetime import date
+
+import numpy as np
+
+from src.core.domain.services.subscription_planner import (
+    ScheduledAnalysis,
+    SubscriptionConfig,
+    SubscriptionPlanner,
+    SubscriptionPlanningError,
+    SubscriptionSchedule,
+)
+
+_MS_PER_DAY = 86_400_000
+_EPOCH = date(1970, 1, 1)
+# seasonal_config.yaml bitki anahtarları İngilizce; CropType kodları Türkçe.
+_CROP_CONFIG_KEYS: dict[str, str] = {
+    "PAMUK": "COTTON",
+    "BUGDAY": "WHEAT",
+    "MISIR": "CORN",
+    "ANTEP_FISTIGI": "PISTACHIO",
+    "ZEYTIN": "OLIVE",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ScanPhase:
+    name: str
+    months: frozenset[int]
+    interval_days: int | None  # None: tarama yok (dinlenme dönemi)
+    rate_multiplier: float = 1.0  # Dönemin talep yoğunluğu çarpanı (rate_multiplier)
+
+
+@dataclass(frozen=True, slots=True)
+class SeasonalScanPolicy:
+    """Bitki × ay → tarama aralığı (seasonal_config.yaml crops.*.scanning_frequency_days)."""
+
+    crops: Mapping[str, tuple[ScanPhase, ...]]
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, object]) -> SeasonalScanPolicy:
+        """YAML'dan okunmuş sözlükten kurar; yalnızca 'crops' bölümü kullanılır."""
+        crops: dict[str, tuple[ScanPhase, ...]] = {}
+        for crop, phases in (raw.get("crops") or {}).items():  # type: ignore[union-attr]
+            crops[str(crop).upper()] = tuple(
+                ScanPhase(
+                    name=str(name),
+                    months=frozenset(int(m) for m in spec.get("months", ())),
+                    interval_days=(
+                        int(spec["scanning_frequency_days"])
+                        if spec.get("scanning_frequency_days") is not None
+                        else None
+                    ),
+                    rate_multiplier=float(spec.get("rate_multiplier", 1.0)),
+                )
+                for name, spec in phases.items()
+            )
+        return cls(crops=crops)
+
+    def phase_for(self, crop_type: str, month: int) -> ScanPhase | None:
+        """Bitkinin o aya düşen sezon dönemi; bitki ya da ay tanımsızsa None."""
+        code = crop_type.upper()
+        for phase in self.crops.get(_CROP_CONFIG_KEYS.get(code, code), ()):
+            if month in phase.months:
+                return phase
+        return None
+
+    def interval_for(self, crop_type: str, day: date) -> int | None:
+        """O gün için önerilen tarama aralığı; bitki/dönem yoksa ya da dinlenmedeyse None."""
+        phase = self.phase_for(crop_type, day.month)
+        return phase.interval_days if phase is not None else None
+
+
+def lattice_ts_ms(start_ts_ms: int, end_ts_ms: int, interval_days: int, limit: int | None = None) -> np.ndarray:
+    """start'tan interval adımlı, end dahil ms zaman damgası kafesi (int64)."""
+    step = int(interval_days) * _MS_PER_DAY
+    count = (int(end_ts_ms) - int(start_ts_ms)) // step + 1 if end_ts_ms >= start_ts_ms else 0
+    if limit is not None:
+        count = min(count, limit)
+    return int(start_ts_ms) + np.arange(max(count, 0), dtype=np.int64) * step
+
+
+class BulkScheduleGenerator:
+    """SubscriptionPlanner.generate_schedule'ın toplu karşılığı.
+
+    Abonelikler (başlangıç, aralık, analiz sayısı) anahtarıyla gruplanır;
+    her grubun analiz tarihleri ilk görüldüğünde ms zaman damgası kafesi
+    olarak bir kez vektörel hesaplanır ve aynı gruptaki tüm abonelikler aynı
+    (değişmez) ScheduledAnalysis demetini paylaşır. Bitki ve bitiş tarihi
+    anahtara girmez; böylece gün gün dağılan başlangıçlarda da grup sayısı
+    sezon günü × paket tipiyle sınırlı kalır. Girdi akış olarak tüketilir,
+    sonuçlar chunk_size'lık listeler halinde girdi sırasıyla verilir;
+    bellekte en çok max_lattices grup kafesi (LRU) ve tek parça tutulur.
+
+    policy verilirse aralık, başlangıç tarihinin düştüğü sezon döneminin
+    scanning_frequency_days değeridir; dönemde tarama yoksa (null) ya da
+    bitki tanımsızsa aboneliğin kendi interval_days değeri kullanılır.
+    Politika aralığı daha uzunsa analiz sayısı pencereye sığacak kadar kırpılır.
+    """
+
+    def __init__(
+        self,
+        policy: SeasonalScanPolicy | None = None,
+        *,
+        chunk_size: int = 10_000,
+        max_lattices: int = 4_096,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if max_lattices < 1:
+            raise ValueError("max_lattices must be >= 1")
+        self._policy = policy
+        self._chunk_size = chunk_size
+        self._max_lattices = max_lattices
+        self._planner = SubscriptionPlanner()
+        self._lattices: OrderedDict[tuple[date, int, int], tuple[ScheduledAnalysis, ...]] = OrderedDict()
+        self.lattice_evictions = 0
+
+    @property
+    def lattice_count(self) -> int:
+        return len(self._lattices)
+
+    def resolve(self, config: SubscriptionConfig) -> SubscriptionConfig:
+        """Politikadan gelen aralığı uygular (tekil yolla eşdeğerlik için de kullanılır).
+
+        Analiz sayısı, politika aralığıyla start..end penceresine sığan sayıya
+        indirilir; abonelik kendi aralığıyla geçerliyse politika onu geçersiz kılmaz.
+        """
+        if self._policy is None:
+            return config
+        interval = self._policy.interval_for(config.crop_type, config.start_date)
+        if interval is None or interval == config.interval_days:
+            return config
+        total = config.total_analyses
+        if interval > 0 and config.end_date >= config.start_date:
+            total = min(total, (config.end_date - config.start_date).days // interval + 1)
+        return replace(config, interval_days=interval, total_analyses=total)
+
+    def generate(
+        self,
+        configs: Iterable[SubscriptionConfig],
+        *,
+        on_error: Callable[[SubscriptionConfig, SubscriptionPlanningError], None] | None = None,
+    ) -> Iterator[list[SubscriptionSchedule]]:
+        """Takvimleri parça parça üretir.
+
+        Args:
+            configs: Abonelik yapılandırmaları (herhangi bir iterable/generator).
+            on_error: Verilirse geçersiz yapılandırma bu geri çağrıya iletilip atlanır.
+
+        Yields:
+            En çok chunk_size elemanlı SubscriptionSchedule listeleri.
+
+        Raises:
+            SubscriptionPlanningError: Geçersiz yapılandırma ve on_error verilmemişse.
+        """
+        chunk: list[SubscriptionSchedule] = []
+        for config in configs:
+            config = self.resolve(config)
+            try:
+                analyses = self._analyses(config)
+            except SubscriptionPlanningError as exc:
+                if on_error is None:
+                    raise
+                on_error(config, exc)
+                continue
+            chunk.append(
+                SubscriptionSchedule(
+                    subscription_id=config.subscription_id,
+                    analyses=analyses,
+                    remaining_reschedule_tokens=config.reschedule_tokens,
+                )
+            )
+            if len(chunk) >= self._chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _analyses(self, config: SubscriptionConfig) -> tuple[ScheduledAnalysis, ...]:
+        # Doğrulanmış yapılandırmada total_analyses pencereye sığar; tarihler
+        # yalnızca başlangıç, aralık ve sayıya bağlıdır (bitki/bitiş anahtara girmez).
+        self._planner.validate_config(config)
+        key = (config.start_date, config.interval_days, config.total_analyses)
+        analyses = self._lattices.get(key)
+        if analyses is not None:
+            self._lattices.move_to_end(key)
+        else:
+            stamps = lattice_ts_ms(
+                _to_ms(config.start_date), _to_ms(config.end_date), config.interval_days, config.total_analyses
+            )
+            days = stamps.astype("datetime64[ms]").astype("datetime64[D]").tolist()
+            analyses = tuple(
+                ScheduledAnalysis(sequence_number=seq, scheduled_date=day) for seq, day in enumerate(days, start=1)
+            )
+            self._lattices[key] = analyses
+            if len(self._lattices) > self._max_lattices:
+                self._lattices.popitem(last=False)
+                self.lattice_evictions += 1
+        return analyses
+
+
+def _to_ms(day: date) -> int:
+    return (day - _EPOCH).days * _MS_PER_DAY
@@ -0,0 +1,278 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Weekly planning is partitioned by province and solved in parallel shards.
+"""
+Amaç: Haftalık planlamayı il bazlı parçalara (shard) bölüp paralel çözmek.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: MissionDemand/PilotSlot listeleri. Çıktı: ScheduleResult + shard süreleri.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca kimlik (UUID), il kodu ve tarih içerir.
+Hata Modları (idempotency/retry/rate limit): Aynı girdi her zaman aynı birleşik sonucu üretir (deterministik merge).
+Observability (log fields/metrics/traces): Shard başına talep/slot sayısı ve süre (ShardTiming).
+Testler: Unit; tek ilde çalışan pilotlar için global greedy ile eşdeğerlik.
+Bağımlılıklar: PlanningEngine, CapacityManager, PlanningResultCache; concurrent.futures.ProcessPoolExecutor.
+Notlar/SSOT: İller arası yetkili pilotlar (KR-015) ikinci bir uzlaştırma turunda değerlendirilir.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import date
+
+from src.application.services.planning_result_cache import PlanningResultCache, canonical_inputs
+from src.core.domain.services.capacity_manager import CapacityManager, PilotCapacity
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    PlanningStrategy,
+    ScheduledSlot,
+    ScheduleResult,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ShardTiming:
+    province_code: str
+    demand_count: int
+    slot_count: int
+    elapsed_s: float
+
+
+@dataclass(frozen=True, slots=True)
+class ShardedPlanResult:
+    result: ScheduleResult
+    shard_timings: tuple[ShardTiming, ...]
+    reconciled: tuple[uuid.UUID, ...]  # İkinci turda il dışı pilota atanan demand_id'ler
+
+
+@dataclass(frozen=True, slots=True)
+class _ShardInput:
+    province_code: str
+    strategy: PlanningStrategy
+    time_budget_s: float | None
+    demands: tuple[MissionDemand, ...]
+    pilot_slots: tuple[PilotSlot, ...]
+
+
+def _solve_shard(shard: _ShardInput) -> tuple[str, ScheduleResult, float]:
+    """Tek ili çözer; ProcessPoolExecutor için modül seviyesinde tanımlıdır."""
+    started = time.perf_counter()
+    engine = PlanningEngine(shard.strategy, time_budget_s=shard.time_budget_s)
+    result = engine.optimize_schedule(list(shard.demands), list(shard.pilot_slots))
+    return shard.province_code, result, time.perf_counter() - started
+
+
+class ShardedWeeklyPlanner:
+    """İl bazlı paralel haftalık planlayıcı.
+
+    Talepler ve slotlar province_code'a göre bölünür, her il ayrı bir
+    süreçte PlanningEngine ile çözülür ve sonuçlar talep önceliği
+    sırasıyla (tamamlanma sırasından bağımsız) birleştirilir. Pilotları
+    tek ilde çalışan girdilerde sonuç, tek parça greedy ile aynıdır.
+
+    Shard'larda yerleşemeyen talepler, başka ilde boş kapasitesi kalan
+    ve CapacityManager.is_province_authorized ile o ile yetkili pilotlara
+    ikinci turda greedy kuralıyla (en az yüklü pilot, en erken tarih)
+    atanır.
+
+    cache verilirse her shard ana süreçte önbellekte aranır; yalnızca
+    miss olan shard'lar (kanonik sıralı girdiyle) süreçlere dağıtılır.
+    Önbellekten gelen shard'ın süresi 0 raporlanır.
+    """
+
+    def __init__(
+        self,
+        *,
+        workers: int = 1,
+        strategy: PlanningStrategy = PlanningStrategy.GREEDY_INDEXED,
+        time_budget_s: float | None = None,
+        capacity_manager: CapacityManager | None = None,
+        cache: PlanningResultCache | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self._workers = int(workers)
+        self._strategy = strategy
+        self._time_budget_s = time_budget_s
+        self._capacity_manager = capacity_manager or CapacityManager()
+        self._cache = cache
+
+    def plan(
+        self,
+        demands: Sequence[MissionDemand],
+        pilot_slots: Sequence[PilotSlot],
+        *,
+        pilot_capacities: Mapping[uuid.UUID, PilotCapacity] | None = None,
+    ) -> ShardedPlanResult:
+        demands_by_province: dict[str, list[MissionDemand]] = {}
+        for demand in demands:
+            demands_by_province.setdefault(demand.province_code, []).append(demand)
+        slots_by_province: dict[str, list[PilotSlot]] = {}
+        for slot in pilot_slots:
+            slots_by_province.setdefault(slot.province_code, []).append(slot)
+
+        shards = [
+            _ShardInput(
+                province_code=code,
+                strategy=self._strategy,
+                time_budget_s=self._time_budget_s,
+                demands=tuple(demands_by_province[code]),
+                pilot_slots=tuple(slots_by_province.get(code, ())),
+            )
+            for code in sorted(demands_by_province)
+        ]
+        # Büyük shard'lar önce kuyruğa girer; birleştirme sırası bundan etkilenmez.
+        shards.sort(key=lambda s: (-len(s.demands), s.province_code))
+        outputs = self._run_shards(shards)
+
+        placed: dict[uuid.UUID, ScheduledSlot] = {}
+        extra_warnings: list[str] = []
+        timings: list[ShardTiming] = []
+        for shard, (_, result, elapsed) in zip(shards, outputs, strict=True):
+            for item in result.scheduled:
+                placed[item.demand_id] = item
+            # Talep bazlı uyarılar birleşimde yeniden üretilir; shard'a özgü olanlar korunur.
+            per_demand = {PlanningEngine.unscheduled_warning(d) for d in shard.demands}
+            extra_warnings.extend(w for w in result.warnings if w not in per_demand)
+            timings.append(
+                ShardTiming(
+                    province_code=shard.province_code,
+                    demand_count=len(shard.demands),
+                    slot_count=len(shard.pilot_slots),
+                    elapsed_s=elapsed,
+                )
+            )
+
+        ordered = sorted(demands, key=lambda d: d.priority)
+        reconciled: list[uuid.UUID] = []
+        if pilot_capacities:
+            reconciled = self._reconcile(ordered, pilot_slots, placed, pilot_capacities)
+
+        scheduled: list[ScheduledSlot] = []
+        unscheduled: list[uuid.UUID] = []
+        warnings: list[str] = []
+        for demand in ordered:
+            item = placed.get(demand.demand_id)
+            if item is None:
+                unscheduled.append(demand.demand_id)
+                warnings.append(PlanningEngine.unscheduled_warning(demand))
+            else:
+                scheduled.append(item)
+
+        merged = ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(unscheduled),
+            pilot_utilization=_utilization(pilot_slots, scheduled),
+            warnings=(*warnings, *extra_warnings),
+        )
+        timings.sort(key=lambda t: t.province_code)
+        return ShardedPlanResult(result=merged, shard_timings=tuple(timings), reconciled=tuple(reconciled))
+
+    def _run_shards(self, shards: list[_ShardInput]) -> list[tuple[str, ScheduleResult, float]]:
+        if self._cache is None:
+            return self._solve_shards(shards)
+        engine = PlanningEngine(self._strategy, time_budget_s=self._time_budget_s)
+        outputs: dict[int, tuple[str, ScheduleResult, float]] = {}
+        misses: list[tuple[int, str, _ShardInput]] = []
+        for position, shard in enumerate(shards):
+            key = self._cache.key_for(shard.demands, shard.pilot_slots, engine)
+            cached = self._cache.get(key)
+            if cached is not None:
+                outputs[position] = (shard.province_code, cached, 0.0)
+                continue
+            demands, slots = canonical_inputs(shard.demands, shard.pilot_slots)
+            misses.append((position, key, replace(shard, demands=tuple(demands), pilot_slots=tuple(slots))))
+        solved = self._solve_shards([shard for _, _, shard in misses])
+        for (position, key, _), output in zip(misses, solved, strict=True):
+            self._cache.put(key, output[1])
+            outputs[position] = output
+        return [outputs[position] for position in range(len(shards))]
+
+    def _solve_shards(self, shards: list[_ShardInput]) -> list[tuple[str, ScheduleResult, float]]:
+        if self._workers == 1 or len(shards) <= 1:
+            return [_solve_shard(shard) for shard in shards]
+        with ProcessPoolExecutor(max_workers=min(self._workers, len(shards))) as pool:
+            return list(pool.map(_solve_shard, shards))
+
+    def _reconcile(
+        self,
+        ordered: list[MissionDemand],
+        pilot_slots: Sequence[PilotSlot],
+        placed: dict[uuid.UUID, ScheduledSlot],
+        pilot_capacities: Mapping[uuid.UUID, PilotCapacity],
+    ) -> list[uuid.UUID]:
+        """Yerleşemeyen talepleri il dışı yetkili pilotların boş kapasitesine atar."""
+        pending = [d for d in ordered if d.demand_id not in placed]
+        if not pending:
+            return []
+
+        remaining: dict[tuple[uuid.UUID, date], int] = {}
+        home: dict[tuple[uuid.UUID, date], str] = {}
+        for slot in pilot_slots:
+            key = (slot.pilot_id, slot.date)
+            remaining[key] = slot.remaining_capacity
+            home[key] = slot.province_code
+        load: dict[uuid.UUID, int] = {}
+        for item in placed.values():
+            key = (item.pilot_id, item.scheduled_date)
+            remaining[key] = remaining.get(key, 0) - 1
+            load[item.pilot_id] = load.get(item.pilot_id, 0) + 1
+
+        # Boş kapasiteli slotlar tarihe göre indekslenir; talep yalnızca penceresindeki günleri tarar.
+        by_date: dict[date, list[tuple[int, tuple[uuid.UUID, date]]]] = {}
+        for order, key in enumerate(remaining):
+            if remaining[key] > 0 and key[0] in pilot_capacities:
+                by_date.setdefault(key[1], []).append((order, key))
+        dates = sorted(by_date)
+        authorized: dict[tuple[uuid.UUID, str], bool] = {}
+
+        reconciled: list[uuid.UUID] = []
+        for demand in pending:
+            province_code = demand.province_code
+            best: tuple[int, date, int] | None = None
+            best_key: tuple[uuid.UUID, date] | None = None
+            start = bisect_left(dates, demand.earliest_date)
+            stop = bisect_right(dates, demand.latest_date)
+            for slot_date in dates[start:stop]:
+                for order, key in by_date[slot_date]:
+                    pilot_id = key[0]
+                    if remaining[key] <= 0 or home[key] == province_code:
+                        continue
+                    allowed = authorized.get((pilot_id, province_code))
+                    if allowed is None:
+                        allowed = authorized[(pilot_id, province_code)] = self._capacity_manager.is_province_authorized(
+                            pilot_capacities[pilot_id], province_code
+                        )
+                    if not allowed:
+                        continue
+                    rank = (load.get(pilot_id, 0), slot_date, order)
+                    if best is None or rank < best:
+                        best, best_key = rank, key
+            if best_key is None:
+                continue
+            pilot_id, slot_date = best_key
+            remaining[best_key] -= 1
+            load[pilot_id] = load.get(pilot_id, 0) + 1
+            placed[demand.demand_id] = ScheduledSlot(
+                demand_id=demand.demand_id,
+                field_id=demand.field_id,
+                pilot_id=pilot_id,
+                scheduled_date=slot_date,
+                estimated_duration_minutes=demand.estimated_duration_minutes,
+            )
+            reconciled.append(demand.demand_id)
+        return reconciled
+
+
+def _utilization(pilot_slots: Sequence[PilotSlot], scheduled: Sequence[ScheduledSlot]) -> dict[uuid.UUID, float]:
+    total: dict[uuid.UUID, int] = {}
+    for slot in pilot_slots:
+        total[slot.pilot_id] = total.get(slot.pilot_id, 0) + slot.daily_capacity
+    assigned: dict[uuid.UUID, int] = {}
+    for item in scheduled:
+        assigned[item.pilot_id] = assigned.get(item.pilot_id, 0) + 1
+    return {pid: assigned.get(pid, 0) / cap for pid, cap in total.items() if cap > 0}
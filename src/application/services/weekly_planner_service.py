@@ -0,0 +1,350 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Weekly planning runs in province batches and streams schedule entries in chunks.
+"""
+Amaç: WeeklyPlanner.plan_week portunu il grupları (batch) halinde planlayıp atamaları parça parça akıtmak.
+Sorumluluk: Use-case orkestrasyonu; domain service + ports birleşimi; policy enforcement.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: PlanningInputSource (il batch'i başına MissionDemand/PilotSlot). Çıktı: ScheduleEntrySink'e ScheduleEntryRow parçaları + WeeklyPlanSummary.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca kimlik (UUID), il kodu, tarih ve alan.
+Hata Modları (idempotency/retry/rate limit): Sink'e yazım parça bazlıdır; SQL sink aynı hafta/il için taslak girdileri yeniden yazar.
+Observability (log fields/metrics/traces): correlation_id, batch/talep/atama sayıları, süre ve shard süreleri (WeeklyPlanSummary).
+Testler: Unit (batch'li sonuç = tek parça plan, parça boyu, NDJSON) + performance (100k talepli hafta, tepe RSS/süre).
+Bağımlılıklar: PlanningEngine, ShardedWeeklyPlanner; SQL kaynak/sink infrastructure katmanında.
+Notlar/SSOT: Bellek en büyük il batch'i ile sınırlıdır; hafta büyüklüğünden bağımsızdır.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+import uuid
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import IO, Protocol
+
+from src.application.services.planning_result_cache import CachedPlanningEngine, PlanningResultCache
+from src.application.services.sharded_weekly_planner import ShardedWeeklyPlanner, ShardTiming
+from src.core.domain.services.capacity_manager import PilotCapacity
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    PlanningStrategy,
+    ScheduleResult,
+)
+
+_M2_PER_DONUM = 1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklyPlanningParams:
+    week_start: date  # Pazartesi
+    max_work_days: int = 6
+    daily_capacity_donum: int = 2500
+
+    @property
+    def week_end(self) -> date:
+        return self.week_start + timedelta(days=6)
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleEntryRow:
+    """schedule_entries satırı (migration 011); province weekly_schedules anahtarıdır."""
+
+    province_code: str
+    mission_id: uuid.UUID
+    pilot_id: uuid.UUID
+    scheduled_date: date
+    estimated_area_donum: float
+    slot_order: int  # Pilot-gün içindeki sıra (1..n)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "province": self.province_code,
+                "mission_id": str(self.mission_id),
+                "pilot_id": str(self.pilot_id),
+                "scheduled_date": self.scheduled_date.isoformat(),
+                "estimated_area_donum": round(self.estimated_area_donum, 2),
+                "slot_order": self.slot_order,
+            },
+            separators=(",", ":"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WeeklyPlanSummary:
+    week_start: date
+    correlation_id: str
+    planned: int
+    unscheduled: int
+    batches: int
+    elapsed_s: float
+    shard_timings: tuple[ShardTiming, ...]
+
+
+class PlanningInputSource(Protocol):
+    """Port: haftalık planlama girdisini il batch'leri halinde okur."""
+
+    def province_codes(self, params: WeeklyPlanningParams) -> Sequence[str]: ...
+
+    def load_batch(
+        self,
+        province_codes: Sequence[str],
+        params: WeeklyPlanningParams,
+    ) -> tuple[list[MissionDemand], list[PilotSlot]]: ...
+
+
+class PilotCapacitySource(Protocol):
+    """Opsiyonel: batch slotlarındaki pilotların kapasitesi ve il dışı yetkileri (Pilot.province_list)."""
+
+    def pilot_capacities(self, pilot_slots: Sequence[PilotSlot]) -> Mapping[uuid.UUID, PilotCapacity]: ...
+
+
+class ScheduleEntrySink(Protocol):
+    """Port: planlanan girdileri parça parça yazar."""
+
+    def write_many(self, rows: Sequence[ScheduleEntryRow], *, week_start: date) -> None: ...
+
+
+class NdjsonScheduleSink:
+    """Dry-run sink: her satırı tek satırlık JSON olarak akışa yazar."""
+
+    def __init__(self, stream: IO[str]) -> None:
+        self._stream = stream
+
+    def write_many(self, rows: Sequence[ScheduleEntryRow], *, week_start: date) -> None:
+        self._stream.write("".join(f"{row.to_json()}\n" for row in rows))
+        self._stream.flush()
+
+
+class WeeklyPlannerService:
+    """WeeklyPlanner portunun il batch'li, akış çıktılı uygulaması.
+
+    İller province_batch_size'lık gruplar halinde kaynaktan okunur, her
+    grup PlanningEngine (workers > 1 ise ShardedWeeklyPlanner) ile çözülür
+    ve atamalar chunk_size'lık parçalar halinde sink'e yazılır. Bir grubun
+    girdisi ve sonucu sonraki grup okunmadan bırakılır; tepe bellek
+    haftanın toplam talebiyle değil en büyük grupla orantılıdır.
+
+    Kaynak pilot_capacities sağlıyorsa (PilotCapacitySource), batch'te
+    yerleşemeyen talepler aynı batch'teki başka ilden, o ile yetkili
+    pilotların boş slotlarına ShardedWeeklyPlanner uzlaştırma turuyla
+    atanır. Batch'ler arası kapasite paylaşımı yoktur.
+    cache verilirse aynı girdili batch'ler (shard'lı yolda aynı girdili
+    iller) yeniden çözülmez; workers sayısı önbelleği devre dışı bırakmaz.
+    """
+
+    def __init__(
+        self,
+        source: PlanningInputSource,
+        sink: ScheduleEntrySink,
+        *,
+        max_work_days: int = 6,
+        daily_capacity_donum: int = 2500,
+        province_batch_size: int = 8,
+        chunk_size: int = 1000,
+        strategy: PlanningStrategy = PlanningStrategy.GREEDY_INDEXED,
+        cache: PlanningResultCache | None = None,
+    ) -> None:
+        if province_batch_size < 1:
+            raise ValueError("province_batch_size must be >= 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self._source = source
+        self._sink = sink
+        self._max_work_days = max_work_days
+        self._daily_capacity_donum = daily_capacity_donum
+        self._province_batch_size = province_batch_size
+        self._chunk_size = chunk_size
+        self._strategy = strategy
+        self._cache = cache
+
+    async def plan_week(self, *, week_start: date, correlation_id: str, workers: int = 1) -> int:
+        summary = await asyncio.to_thread(
+            self.plan, week_start=week_start, correlation_id=correlation_id, workers=workers
+        )
+        return summary.planned
+
+    def plan(self, *, week_start: date, correlation_id: str, workers: int = 1) -> WeeklyPlanSummary:
+        """Haftayı planlar ve girdileri sink'e akıtır.
+
+        Args:
+            week_start: Haftanın Pazartesi günü.
+            correlation_id: İzleme kimliği.
+            workers: workers > 1 ise batch içindeki iller paralel süreçlerde çözülür.
+
+        Returns:
+            WeeklyPlanSummary: Planlanan/planlanamayan sayıları, batch sayısı ve süreler.
+
+        Raises:
+            ValueError: week_start Pazartesi değilse ya da workers < 1 ise.
+        """
+        if week_start.weekday() != 0:
+            raise ValueError(f"week_start must be a Monday: {week_start.isoformat()}")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        started = time.perf_counter()
+        params = WeeklyPlanningParams(
+            week_start=week_start,
+            max_work_days=self._max_work_days,
+            daily_capacity_donum=self._daily_capacity_donum,
+        )
+        codes = sorted(self._source.province_codes(params))
+        planned = unscheduled = batches = 0
+        timings: list[ShardTiming] = []
+
+        for offset in range(0, len(codes), self._province_batch_size):
+            batch = codes[offset : offset + self._province_batch_size]
+            demands, slots = self._source.load_batch(batch, params)
+            capacities = self._pilot_capacities(slots)
+            result, batch_timings = self._solve(demands, slots, capacities, workers)
+            planned += self._stream(result, demands, week_start)
+            unscheduled += len(result.unscheduled)
+            timings.extend(batch_timings)
+            batches += 1
+            del demands, slots, capacities, result
+
+        return WeeklyPlanSummary(
+            week_start=week_start,
+            correlation_id=correlation_id,
+            planned=planned,
+            unscheduled=unscheduled,
+            batches=batches,
+            elapsed_s=time.perf_counter() - started,
+            shard_timings=tuple(timings),
+        )
+
+    def _pilot_capacities(self, slots: list[PilotSlot]) -> Mapping[uuid.UUID, PilotCapacity]:
+        pilot_capacities = getattr(self._source, "pilot_capacities", None)
+        return pilot_capacities(slots) if pilot_capacities is not None else {}
+
+    def _solve(
+        self,
+        demands: list[MissionDemand],
+        slots: list[PilotSlot],
+        capacities: Mapping[uuid.UUID, PilotCapacity],
+        workers: int,
+    ) -> tuple[ScheduleResult, tuple[ShardTiming, ...]]:
+        # İl dışı yetkili pilot varsa uzlaştırma turu için shard'lı planlayıcı gerekir.
+        cross_province = any(c.authorized_provinces - {c.province_code} for c in capacities.values())
+        if workers > 1 or cross_province:
+            sharded = ShardedWeeklyPlanner(workers=workers, strategy=self._strategy, cache=self._cache).plan(
+                demands, slots, pilot_capacities=capacities or None
+            )
+            return sharded.result, sharded.shard_timings
+        engine = PlanningEngine(self._strategy)
+        if self._cache is not None:
+            return CachedPlanningEngine(engine, self._cache).optimize_schedule(demands, slots), ()
+        return engine.optimize_schedule(demands, slots), ()
+
+    def _stream(self, result: ScheduleResult, demands: list[MissionDemand], week_start: date) -> int:
+        written = 0
+        chunk: list[ScheduleEntryRow] = []
+        for row in _entry_rows(result, demands):
+            chunk.append(row)
+            if len(chunk) >= self._chunk_size:
+                self._sink.write_many(chunk, week_start=week_start)
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            self._sink.write_many(chunk, week_start=week_start)
+            written += len(chunk)
+        return written
+
+
+def _entry_rows(result: ScheduleResult, demands: list[MissionDemand]) -> Iterator[ScheduleEntryRow]:
+    by_id = {d.demand_id: d for d in demands}
+    order: dict[tuple[uuid.UUID, date], int] = {}
+    for item in result.scheduled:
+        demand = by_id[item.demand_id]
+        key = (item.pilot_id, item.scheduled_date)
+        order[key] = order.get(key, 0) + 1
+        yield ScheduleEntryRow(
+            province_code=demand.province_code,
+            mission_id=item.demand_id,
+            pilot_id=item.pilot_id,
+            scheduled_date=item.scheduled_date,
+            estimated_area_donum=demand.area_m2 / _M2_PER_DONUM,
+            slot_order=item.route_sequence or order[key],
+        )
+
+
+def parse_iso_week(week: str) -> date:
+    """'YYYY-WW' ISO haftasını Pazartesi tarihine çevirir.
+
+    Raises:
+        ValueError: Biçim geçersizse ya da yıl o haftayı içermiyorsa (örn. 53. hafta).
+    """
+    year_text, sep, week_text = week.partition("-")
+    if not sep or len(year_text) != 4 or len(week_text) != 2 or not (year_text + week_text).isdigit():
+        raise ValueError(f"week must match YYYY-WW: {week!r}")
+    return date.fromisocalendar(int(year_text), int(week_text), 1)
+
+
+def run(
+    *,
+    week: str,
+    dry_run: bool,
+    corr_id: str,
+    max_work_days: int = 6,
+    daily_capacity_donum: int = 2500,
+    workers: int = 1,
+    output: str = "-",
+    cache_dir: str | None = None,
+    source: PlanningInputSource | None = None,
+    sink: ScheduleEntrySink | None = None,
+) -> WeeklyPlanSummary:
+    """CLI giriş noktası (weekly-planner komutu).
+
+    dry_run'da atamalar NDJSON olarak output'a ('-' = stdout) yazılır;
+    aksi halde schedule_entries tablosuna parça parça eklenir. cache_dir
+    verilirse batch sonuçları bu dizinde saklanır ve tekrar çalıştırmalarda
+    yeniden çözülmez.
+
+    Raises:
+        ValueError: Hafta geçersizse.
+        RuntimeError: Veritabanı URL'i (DATABASE_URL/DB_URL) yoksa.
+    """
+    week_start = parse_iso_week(week)
+    session = None
+    if source is None or (sink is None and not dry_run):
+        from src.infrastructure.persistence.sqlalchemy.session import open_sync_session
+
+        session = open_sync_session()
+        if source is None:
+            from src.infrastructure.persistence.repositories.planning_input_repository import (
+                PlanningInputRepository,
+            )
+
+            source = PlanningInputRepository(session)
+
+    stream: IO[str] | None = None
+    try:
+        if sink is None:
+            if dry_run:
+                stream = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")  # noqa: SIM115
+                sink = NdjsonScheduleSink(stream)
+            else:
+                from src.infrastructure.persistence.repositories.schedule_entry_repository import (
+                    ScheduleEntryRepository,
+                )
+
+                sink = ScheduleEntryRepository(session)
+        service = WeeklyPlannerService(
+            source,
+            sink,
+            max_work_days=max_work_days,
+            daily_capacity_donum=daily_capacity_donum,
+            cache=PlanningResultCache(cache_dir) if cache_dir else None,
+        )
+        return service.plan(week_start=week_start, correlation_id=corr_id, workers=workers)
+    finally:
+        if stream is not None and stream is not sys.stdout:
+            stream.close()
+        if session is not None:
+            session.close()
+
@@ -1,10 +1,5 @@
 # BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
 # KR-015: Queue worker retries replan tasks with ack/nack semantics.
-
-from __future__ import annotations
-
-import time
-# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
 """
 Amaç: Replan kuyruğundaki Mission'lar için alternatif slot/pilot arama.
 Sorumluluk: Queue worker; arka plan işleri tüketir ve idempotent şekilde işler.
@@ -15,10 +10,12 @@ Observability (log fields/metrics/traces): correlation_id, latency, error_code;
 Testler: Unit + integration; kritik akış için e2e (özellikle ödeme/planlama/kalibrasyon).
 Bağımlılıklar: Domain + ports + infra implementasyonları + event bus.
 Notlar/SSOT: Contract-first (KR-081) ve kritik kapılar (KR-018/KR-033/KR-015) application katmanında enforce edilir.
+Yüksek hacimli kuyruklar için birleştiren (coalescing) asyncio havuzu: replan_worker_pool.ReplanWorkerPool.
 """
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from typing import Protocol
 
@@ -29,6 +26,7 @@ class ReplanTask:
     mission_id: str
     reason: str
     correlation_id: str
+    province_code: str = ""  # Boşsa il bazlı birleştirme yapılmaz
 
 
 class QueueClient(Protocol):
@@ -65,6 +63,8 @@ class ReplanQueueWorker:
         while True:
             if not self.run_once():
                 time.sleep(float(poll_interval_s))
+
+
 class ReplanQueuePort(Protocol):
     def dequeue(self) -> dict[str, str] | None: ...
 
@@ -74,7 +74,9 @@ class ReplanServicePort(Protocol):
 
 
 @dataclass(slots=True)
-class ReplanQueueWorker:
+class MessageReplanQueueWorker:
+    """Sözlük mesajlı kuyruk portu için tek görevli worker."""
+
     queue_port: ReplanQueuePort
     replan_service: ReplanServicePort
 
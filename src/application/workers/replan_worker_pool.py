@@ -0,0 +1,252 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.  # noqa: RUF003
+# KR-015: Replan tasks are drained in batches and coalesced per mission/province before planning.
+"""
+Amaç: Replan kuyruğunu toplu boşaltıp aynı mission/il görevlerini tek planlama çağrısında birleştirmek.
+Sorumluluk: Queue worker; arka plan işleri tüketir ve idempotent şekilde işler.
+Girdi/Çıktı (Contract/DTO/Event): Girdi: ReplanTask kuyruğu. Çıktı: il başına ReplanBatch çağrısı + ack/nack + ReplanBatchMetrics.
+Güvenlik (RBAC/PII/Audit): PII taşımaz; yalnızca görev/mission kimliği, il kodu ve correlation_id.
+Hata Modları (idempotency/retry/rate limit): Başarısız batch'in tüm görevleri requeue ile nack edilir; replan idempotent kabul edilir. ack/nack hatası loglanır, batch başarısız sayılır.
+Observability (log fields/metrics/traces): Batch başına il, görev/mission sayısı, süre, sonuç; havuz sayaçları (ReplanPoolStats).
+Testler: Unit (birleştirme, eşzamanlılık sınırı, nack, kapanış) + performance (mevcut döngüye karşı throughput).
+Bağımlılıklar: asyncio; QueueClient / MissionReplanner portları (replan_queue_worker).
+Notlar/SSOT: Senkron portlar asyncio.to_thread ile çağrılır; aynı mission aynı anda iki batch'te bulunmaz.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from src.application.workers.replan_queue_worker import MissionReplanner, QueueClient, ReplanTask
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplanBatch:
+    """Tek planlama çağrısına giden birleştirilmiş görevler (il başına)."""
+
+    province_code: str
+    mission_ids: tuple[str, ...]  # Tekil; ilk görülme sırası
+    reasons: tuple[str, ...]  # mission_ids ile hizalı; en son görevin nedeni
+    correlation_ids: tuple[str, ...]  # mission_ids ile hizalı; en son görevin correlation_id'si
+    task_ids: tuple[str, ...]  # Birleştirilen tüm görevler (ack/nack için)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplanBatchMetrics:
+    province_code: str
+    task_count: int
+    mission_count: int
+    elapsed_s: float
+    succeeded: bool
+
+
+@dataclass(slots=True)
+class ReplanPoolStats:
+    tasks_received: int = 0
+    tasks_coalesced: int = 0  # Aynı mission'a düştüğü için ayrıca planlanmayan görevler
+    batches: int = 0
+    batches_failed: int = 0
+    cycles: int = 0
+    last_batches: list[ReplanBatchMetrics] = field(default_factory=list)
+
+
+class BatchQueueClient(Protocol):
+    """Opsiyonel: tek çağrıda birden çok görev veren kuyruk."""
+
+    def pop_many(self, queue_name: str, max_items: int) -> Sequence[ReplanTask]: ...
+
+
+class BatchMissionReplanner(Protocol):
+    """Opsiyonel: il bazlı toplu replan; yoksa MissionReplanner.replan mission başına çağrılır."""
+
+    def replan_batch(self, batch: ReplanBatch) -> None: ...
+
+
+class ReplanWorkerPool:
+    """Sınırlı eşzamanlılıklı, birleştiren asyncio replan havuzu.
+
+    Her döngüde kuyruktan drain_size'a kadar görev toplu alınır; ilk görev
+    geldikten sonra coalesce_window_s boyunca gelen görevler de aynı
+    döngüye eklenir. Görevler önce mission bazında tekilleştirilir (aynı
+    mission'ın N görevi tek mission'a iner), sonra ile göre gruplanır; bir
+    ilin mission'ları max_missions_per_batch'lik ReplanBatch'lere iner. Batch'ler en çok concurrency adet paralel
+    çalışır; bir döngünün tüm batch'leri bitmeden sonraki döngü başlamaz,
+    böylece aynı mission iki batch'te eşzamanlı planlanmaz.
+
+    request_stop() sonrası yeni görev alınmaz; elde olan batch'ler
+    tamamlanıp ack/nack edilir ve run() döner.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue: QueueClient,
+        replanner: MissionReplanner | BatchMissionReplanner,
+        queue_name: str = "replan",
+        concurrency: int = 4,
+        drain_size: int = 1000,
+        coalesce_window_s: float = 0.05,
+        max_missions_per_batch: int = 500,
+        poll_interval_s: float = 1.0,
+        on_batch: Callable[[ReplanBatchMetrics], None] | None = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        if drain_size < 1 or max_missions_per_batch < 1:
+            raise ValueError("drain_size and max_missions_per_batch must be >= 1")
+        self._queue = queue
+        self._replanner = replanner
+        self._queue_name = queue_name
+        self._concurrency = concurrency
+        self._drain_size = drain_size
+        self._window_s = max(0.0, float(coalesce_window_s))
+        self._max_missions = max_missions_per_batch
+        self._poll_interval_s = float(poll_interval_s)
+        self._on_batch = on_batch
+        self._stop = asyncio.Event()
+        self.stats = ReplanPoolStats()
+
+    def request_stop(self) -> None:
+        """Graceful shutdown; signal handler'dan (loop.add_signal_handler) çağrılabilir."""
+        self._stop.set()
+
+    async def run(self) -> ReplanPoolStats:
+        """request_stop() çağrılana kadar kuyruğu tüketir."""
+        while not self._stop.is_set():
+            if await self.run_cycle() == 0:
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self._poll_interval_s)
+                except TimeoutError:
+                    pass
+        return self.stats
+
+    async def run_until_idle(self) -> ReplanPoolStats:
+        """Kuyruk boşalana (ya da durdurulana) kadar döngü çalıştırır."""
+        while not self._stop.is_set() and await self.run_cycle() > 0:
+            pass
+        return self.stats
+
+    async def run_cycle(self) -> int:
+        """Tek döngü: topla, birleştir, batch'leri çalıştır. İşlenen görev sayısını döndürür."""
+        tasks = await self._collect()
+        if not tasks:
+            return 0
+        batches = self._coalesce(tasks)
+        semaphore = asyncio.Semaphore(self._concurrency)
+        metrics = await asyncio.gather(*(self._process(batch, semaphore) for batch in batches))
+
+        self.stats.cycles += 1
+        self.stats.tasks_received += len(tasks)
+        self.stats.tasks_coalesced += len(tasks) - sum(m.mission_count for m in metrics)
+        self.stats.batches += len(metrics)
+        self.stats.batches_failed += sum(1 for m in metrics if not m.succeeded)
+        self.stats.last_batches = list(metrics)
+        return len(tasks)
+
+    async def _collect(self) -> list[ReplanTask]:
+        tasks = list(await asyncio.to_thread(self._drain, self._drain_size))
+        if not tasks or len(tasks) >= self._drain_size or self._window_s == 0.0:
+            return tasks
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._window_s
+        while len(tasks) < self._drain_size and not self._stop.is_set():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, self._window_s / 4))
+            tasks.extend(await asyncio.to_thread(self._drain, self._drain_size - len(tasks)))
+        return tasks
+
+    def _drain(self, max_items: int) -> Sequence[ReplanTask]:
+        pop_many = getattr(self._queue, "pop_many", None)
+        if pop_many is not None:
+            return pop_many(self._queue_name, max_items)
+        tasks: list[ReplanTask] = []
+        while len(tasks) < max_items:
+            task = self._queue.pop(self._queue_name)
+            if task is None:
+                break
+            tasks.append(task)
+        return tasks
+
+    def _coalesce(self, tasks: Sequence[ReplanTask]) -> list[ReplanBatch]:
+        # mission → (son görev, görev id'leri, il); dict ekleme sırası ilk görülmeyi korur.
+        # Mission önce global tekilleştirilir: il bilgisi olan ve olmayan görevleri
+        # aynı mission'a düşen görevler eşzamanlı iki batch'e bölünmez.
+        missions: dict[str, tuple[ReplanTask, list[str], str]] = {}
+        for task in tasks:
+            entry = missions.get(task.mission_id)
+            if entry is None:
+                missions[task.mission_id] = (task, [task.task_id], task.province_code)
+            else:
+                entry[1].append(task.task_id)
+                missions[task.mission_id] = (task, entry[1], task.province_code or entry[2])
+
+        # il → mission girdileri; il bilgisi olmayan mission'lar tek başına bir batch olur.
+        groups: dict[str, tuple[str, list[tuple[ReplanTask, list[str]]]]] = {}
+        for mission_id, (task, task_ids, province_code) in missions.items():
+            key = province_code or f"mission:{mission_id}"
+            groups.setdefault(key, (province_code, []))[1].append((task, task_ids))
+
+        batches: list[ReplanBatch] = []
+        for province_code, entries in groups.values():
+            for offset in range(0, len(entries), self._max_missions):
+                part = entries[offset : offset + self._max_missions]
+                batches.append(
+                    ReplanBatch(
+                        province_code=province_code,
+                        mission_ids=tuple(task.mission_id for task, _ in part),
+                        reasons=tuple(task.reason for task, _ in part),
+                        correlation_ids=tuple(task.correlation_id for task, _ in part),
+                        task_ids=tuple(task_id for _, ids in part for task_id in ids),
+                    )
+                )
+        return batches
+
+    async def _process(self, batch: ReplanBatch, semaphore: asyncio.Semaphore) -> ReplanBatchMetrics:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                await asyncio.to_thread(self._replan, batch)
+                succeeded = True
+            except Exception:
+                succeeded = False
+            try:
+                await asyncio.to_thread(self._settle, batch, succeeded)
+            except Exception:
+                # ack/nack hatası döngüyü ve diğer batch'leri düşürmez; batch başarısız sayılır.
+                logger.exception("replan_batch_settle_failed province=%s tasks=%d", batch.province_code, len(batch.task_ids))
+                succeeded = False
+            metrics = ReplanBatchMetrics(
+                province_code=batch.province_code,
+                task_count=len(batch.task_ids),
+                mission_count=len(batch.mission_ids),
+                elapsed_s=time.perf_counter() - started,
+                succeeded=succeeded,
+            )
+        if self._on_batch is not None:
+            self._on_batch(metrics)
+        return metrics
+
+    def _replan(self, batch: ReplanBatch) -> None:
+        replan_batch = getattr(self._replanner, "replan_batch", None)
+        if replan_batch is not None:
+            replan_batch(batch)
+            return
+        for mission_id, reason, correlation_id in zip(
+            batch.mission_ids, batch.reasons, batch.correlation_ids, strict=True
+        ):
+            self._replanner.replan(mission_id=mission_id, reason=reason, correlation_id=correlation_id)
+
+    def _settle(self, batch: ReplanBatch, succeeded: bool) -> None:
+        for task_id in batch.task_ids:
+            if succeeded:
+                self._queue.ack(self._queue_name, task_id)
+            else:
+                self._queue.nack(self._queue_name, task_id, requeue=True)
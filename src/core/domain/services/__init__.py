@@ -35,6 +35,12 @@ from src.core.domain.services.expert_assignment_service import (
     ExpertAssignmentService,
     ExpertProfile,
 )
+from src.core.domain.services.incremental_planner import IncrementalPlanner, PlanningDelta
+from src.core.domain.services.min_cost_flow import (
+    FlowBudgetExceededError,
+    FlowCostWeights,
+    MinCostFlowMatcher,
+)
 from src.core.domain.services.mission_planner import (
     MissionPlanningError,
     MissionPlanResult,
@@ -43,11 +49,13 @@ from src.core.domain.services.mission_planner import (
     MissionRequest,
     PlannedMission,
 )
+from src.core.domain.services.pilot_load_index import PilotLoadIndex
 from src.core.domain.services.planning_engine import (
     MissionDemand,
     PilotSlot,
     PlanningEngine,
     PlanningEngineError,
+    PlanningStrategy,
     ScheduleResult,
     ScheduledSlot,
 )
@@ -69,6 +77,13 @@ from src.core.domain.services.qc_evaluator import (
 from src.core.domain.services.qc_evaluator import (
     RecommendedAction as QCRecommendedAction,
 )
+from src.core.domain.services.route_optimizer import (
+    DailyRoute,
+    DistanceMatrix,
+    RouteOptimizationError,
+    RouteOptimizer,
+    TimeWindow,
+)
 from src.core.domain.services.sla_monitor import (
     SLACheckpoint,
     SLADefinition,
@@ -78,6 +93,7 @@ from src.core.domain.services.sla_monitor import (
     SLAStageResult,
     SLAStatus,
 )
+from src.core.domain.services.slot_index import SlotIndex
 from src.core.domain.services.subscription_planner import (
     RescheduleResult,
     RescheduleType,
@@ -109,6 +125,7 @@ __all__: list[str] = [
     "PilotCapacity",
     "PilotAssignment",
     "AvailabilitySlot",
+    "PilotLoadIndex",
     # Confidence Evaluator (KR-019)
     "ConfidenceEvaluator",
     "ConfidenceEvaluationResult",
@@ -136,10 +153,22 @@ __all__: list[str] = [
     # Planning Engine (KR-015)
     "PlanningEngine",
     "PlanningEngineError",
+    "PlanningStrategy",
     "ScheduleResult",
     "ScheduledSlot",
     "MissionDemand",
     "PilotSlot",
+    "SlotIndex",
+    "MinCostFlowMatcher",
+    "FlowCostWeights",
+    "FlowBudgetExceededError",
+    "IncrementalPlanner",
+    "PlanningDelta",
+    "RouteOptimizer",
+    "RouteOptimizationError",
+    "DistanceMatrix",
+    "DailyRoute",
+    "TimeWindow",
     # Pricebook Calculator (KR-022)
     "PricebookCalculator",
     "PricebookError",
@@ -1,27 +1,41 @@
 """KR-015 — AutoDispatcher (rule-based, no AI).
 
 Amaç: Yaklaşan mission'ları pilotlara kural bazlı atamak.
+
+Her (bölge, tarih) için o gün çalışan pilotlardan bir öncelik heap'i
+kurulur; anahtar (kalan günlük dönüm kapasitesi ↓, güvenilirlik ↓,
+pilot id ↑). Mission'lar SLA payı (son tarih - planlanan tarih) en
+küçük olandan başlayarak işlenir; her atama heap tepesini günceller.
+Toplam maliyet O(M log P + P·D) (D: farklı planlama günü sayısı).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Protocol, Sequence
+import heapq
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Optional, Protocol, Sequence, Tuple
 
 from ..value_objects.assignment_policy import AssignmentPolicy, AssignmentSource, AssignmentReason
 
+_NO_DEADLINE_SLACK = 10**6
+
 
 class MissionLike(Protocol):
     id: str
     territory_id: str  # or region key
-    scheduled_date: str
+    scheduled_date: str  # ISO8601 date
     area_donum: int
+    # Opsiyonel: sla_deadline (ISO8601 date ya da date); yoksa SLA payı sınırsız kabul edilir.
 
 
 class PilotLike(Protocol):
     id: str
     territory_id: str
     reliability_score: float
+    # Opsiyonel (Pilot entity ile uyumlu): work_days (0=Pzt..6=Paz),
+    # daily_capacity_donum, max_capacity_with_emergency().
+    # Verilmezse ilgili kısıt uygulanmaz.
 
 
 @dataclass
@@ -29,37 +43,131 @@ class DispatchDecision:
     mission_id: str
     pilot_id: str
     policy: AssignmentPolicy
+    scheduled_date: str = ""
+    emergency: bool = False  # KR-015-1 %10 acil tolerans kullanıldı mı
+
+
+@dataclass
+class DispatchBatchResult:
+    decisions: List[DispatchDecision]
+    unassigned: List[str]  # mission_id'ler
+    booked_donum: Dict[Tuple[str, str], int] = field(default_factory=dict)  # (pilot_id, tarih) -> dönüm
 
 
 class AutoDispatcher:
+    """Kısıt farkındalıklı heap tabanlı dispatcher.
+
+    Kısıtlar:
+    - Pilot yalnızca kendi bölgesindeki ve çalışma günündeki mission'ı alır.
+    - Günlük dönüm kapasitesi aşılmaz; yalnızca SLA payı <= 0 olan
+      (bugün son günü ya da gecikmiş) mission'lar için
+      max_capacity_with_emergency sınırına kadar taşma yapılır.
+    - Eşitlik durumunda karar deterministiktir (pilot id, mission id).
+    """
+
     def __init__(self, lookahead_days: int = 7):
         self.lookahead_days = lookahead_days
 
     def dispatch(self, missions: Sequence[MissionLike], pilots: Sequence[PilotLike]) -> List[DispatchDecision]:
-        # TODO: Replace this naive heuristic with your real constraints:
-        # - work_days
-        # - daily_capacity
-        # - SLA priority
-        decisions: List[DispatchDecision] = []
-        pilots_by_territory: dict[str, list[PilotLike]] = {}
+        return self.dispatch_many(missions, pilots).decisions
+
+    def dispatch_many(
+        self,
+        missions: Iterable[MissionLike],
+        pilots: Sequence[PilotLike],
+        booked_donum: Optional[Mapping[Tuple[str, str], int]] = None,
+    ) -> DispatchBatchResult:
+        """Mission grubunu tek seferde dağıtır.
+
+        Args:
+            missions: Dağıtılacak mission'lar.
+            pilots: Aday pilotlar.
+            booked_donum: Önceden dolu kapasite, (pilot_id, ISO tarih) -> dönüm.
+                Ardışık batch'lerde bir önceki sonucun booked_donum'u verilebilir.
+
+        Returns:
+            DispatchBatchResult: Kararlar, atanamayan mission'lar ve güncel doluluk.
+        """
+        booked: Dict[Tuple[str, str], int] = dict(booked_donum or {})
+        pilots_by_territory: Dict[str, List[PilotLike]] = {}
         for p in pilots:
             pilots_by_territory.setdefault(p.territory_id, []).append(p)
 
-        for m in missions:
-            cand = pilots_by_territory.get(m.territory_id, [])
-            if not cand:
+        heaps: Dict[Tuple[str, str], List[Tuple[int, float, str, int]]] = {}
+        decisions: List[DispatchDecision] = []
+        unassigned: List[str] = []
+
+        for m in sorted(missions, key=_mission_order):
+            key = (m.territory_id, m.scheduled_date)
+            heap = heaps.get(key)
+            if heap is None:
+                heap = heaps[key] = _build_heap(pilots_by_territory.get(m.territory_id, []), m.scheduled_date, booked)
+            if not heap:
+                unassigned.append(m.id)
                 continue
-            # pick best reliability
-            cand_sorted = sorted(cand, key=lambda x: getattr(x, "reliability_score", 0.0), reverse=True)
-            chosen = cand_sorted[0]
+
+            neg_remaining, neg_reliability, pilot_id, idx = heap[0]
+            pilot = pilots_by_territory[m.territory_id][idx]
+            emergency = False
+            if m.area_donum > -neg_remaining:
+                overflow = _emergency_capacity(pilot) - _daily_capacity(pilot)
+                if _sla_slack(m) > 0 or m.area_donum > -neg_remaining + overflow:
+                    unassigned.append(m.id)
+                    continue
+                emergency = True
+
+            booked[(pilot_id, m.scheduled_date)] = booked.get((pilot_id, m.scheduled_date), 0) + m.area_donum
+            heapq.heapreplace(heap, (neg_remaining + m.area_donum, neg_reliability, pilot_id, idx))
             decisions.append(
                 DispatchDecision(
                     mission_id=m.id,
-                    pilot_id=chosen.id,
+                    pilot_id=pilot_id,
                     policy=AssignmentPolicy(
                         source=AssignmentSource.SYSTEM_SEED,
                         reason=AssignmentReason.AUTO_DISPATCH,
                     ),
+                    scheduled_date=m.scheduled_date,
+                    emergency=emergency,
                 )
             )
-        return decisions
+        return DispatchBatchResult(decisions=decisions, unassigned=unassigned, booked_donum=booked)
+
+
+def _build_heap(
+    candidates: Sequence[PilotLike],
+    scheduled_date: str,
+    booked: Mapping[Tuple[str, str], int],
+) -> List[Tuple[int, float, str, int]]:
+    weekday = date.fromisoformat(scheduled_date).weekday()
+    heap = []
+    for idx, p in enumerate(candidates):
+        work_days = getattr(p, "work_days", None)
+        if work_days is not None and weekday not in work_days:
+            continue
+        remaining = _daily_capacity(p) - booked.get((p.id, scheduled_date), 0)
+        heap.append((-remaining, -float(getattr(p, "reliability_score", 0.0)), p.id, idx))
+    heapq.heapify(heap)
+    return heap
+
+
+def _daily_capacity(pilot: PilotLike) -> int:
+    return int(getattr(pilot, "daily_capacity_donum", 10**9))
+
+
+def _emergency_capacity(pilot: PilotLike) -> int:
+    emergency = getattr(pilot, "max_capacity_with_emergency", None)
+    return int(emergency()) if emergency is not None else _daily_capacity(pilot)
+
+
+def _sla_slack(mission: MissionLike) -> int:
+    deadline = getattr(mission, "sla_deadline", None)
+    if not deadline:
+        return _NO_DEADLINE_SLACK
+    if not isinstance(deadline, date):
+        deadline = date.fromisoformat(deadline)
+    return (deadline - date.fromisoformat(mission.scheduled_date)).days
+
+
+def _mission_order(mission: MissionLike) -> Tuple[int, str, int, str]:
+    # En az SLA payı önce; aynı payda büyük alan önce (paketleme), sonra id.
+    return (_sla_slack(mission), mission.scheduled_date, -mission.area_donum, mission.id)
@@ -7,6 +7,8 @@ import uuid
 from dataclasses import dataclass
 from datetime import date, timedelta
 
+from src.core.domain.services.pilot_load_index import PilotLoadIndex
+
 
 class CapacityError(Exception):
     """Kapasite hesaplama domain invariant ihlali."""
@@ -20,6 +22,7 @@ class PilotCapacity:
     work_days: frozenset[int]  # 0=Pazartesi .. 6=Pazar (ISO weekday - 1)
     daily_capacity: int  # Günlük maksimum görev sayısı
     province_code: str  # Yetki bölgesi
+    authorized_provinces: frozenset[str] = frozenset()  # Ek yetkili iller (Pilot.province_list)
 
 
 @dataclass(frozen=True)
@@ -29,6 +32,7 @@ class PilotAssignment:
     pilot_id: uuid.UUID
     mission_id: uuid.UUID
     scheduled_date: date
+    area_donum: float = 0.0  # Rezerve edilen alan; kapasite görev sayısıyla ölçülür
 
 
 @dataclass(frozen=True)
@@ -63,20 +67,23 @@ class CapacityManager:
     - Pilot sadece çalışma günlerinde görev alabilir.
     - Pilot sadece yetki bölgesindeki görevleri alabilir.
     - daily_capacity > 0 olmalıdır.
+
+    Sorgular atama listesi ya da önceden kurulmuş PilotLoadIndex kabul eder;
+    çok sayıda sorguda indeks bir kez kurulup paylaşılmalıdır.
     """
 
     def check_availability(
         self,
         pilot: PilotCapacity,
         requested_date: date,
-        existing_assignments: list[PilotAssignment],
+        existing_assignments: list[PilotAssignment] | PilotLoadIndex,
     ) -> CapacityCheckResult:
         """Belirli bir tarihte pilotun müsaitliğini kontrol eder.
 
         Args:
             pilot: Pilot kapasite bilgisi.
             requested_date: Talep edilen tarih.
-            existing_assignments: Mevcut görev atamaları.
+            existing_assignments: Mevcut görev atamaları ya da yük indeksi.
 
         Returns:
             CapacityCheckResult: Müsaitlik sonucu.
@@ -100,11 +107,14 @@ class CapacityManager:
             )
 
         # O günkü mevcut yük hesabı
-        current_load = sum(
-            1
-            for a in existing_assignments
-            if a.pilot_id == pilot.pilot_id and a.scheduled_date == requested_date
-        )
+        if isinstance(existing_assignments, PilotLoadIndex):
+            current_load = existing_assignments.load(pilot.pilot_id, requested_date)
+        else:
+            current_load = sum(
+                1
+                for a in existing_assignments
+                if a.pilot_id == pilot.pilot_id and a.scheduled_date == requested_date
+            )
 
         remaining = pilot.daily_capacity - current_load
         is_available = remaining > 0
@@ -126,7 +136,7 @@ class CapacityManager:
         pilot: PilotCapacity,
         start_date: date,
         end_date: date,
-        existing_assignments: list[PilotAssignment],
+        existing_assignments: list[PilotAssignment] | PilotLoadIndex,
     ) -> list[AvailabilitySlot]:
         """Tarih aralığında pilotun müsait slotlarını bulur.
 
@@ -134,7 +144,7 @@ class CapacityManager:
             pilot: Pilot kapasite bilgisi.
             start_date: Başlangıç tarihi (dahil).
             end_date: Bitiş tarihi (dahil).
-            existing_assignments: Mevcut görev atamaları.
+            existing_assignments: Mevcut görev atamaları ya da yük indeksi.
 
         Returns:
             Müsait slotların listesi.
@@ -145,11 +155,12 @@ class CapacityManager:
         if start_date > end_date:
             raise CapacityError("start_date, end_date'den sonra olamaz.")
 
+        index = _as_index(existing_assignments)
         slots: list[AvailabilitySlot] = []
         current = start_date
 
         while current <= end_date:
-            result = self.check_availability(pilot, current, existing_assignments)
+            result = self.check_availability(pilot, current, index)
             if result.is_available:
                 slots.append(
                     AvailabilitySlot(
@@ -167,15 +178,18 @@ class CapacityManager:
         pilot: PilotCapacity,
         start_date: date,
         end_date: date,
-        existing_assignments: list[PilotAssignment],
+        existing_assignments: list[PilotAssignment] | PilotLoadIndex,
     ) -> float:
         """Tarih aralığında pilotun kullanım oranını hesaplar (0.0 - 1.0).
 
+        Yalnızca ataması olan günler gezilir; çalışma günü sayısı haftalık
+        periyottan hesaplanır.
+
         Args:
             pilot: Pilot kapasite bilgisi.
             start_date: Başlangıç tarihi (dahil).
             end_date: Bitiş tarihi (dahil).
-            existing_assignments: Mevcut görev atamaları.
+            existing_assignments: Mevcut görev atamaları ya da yük indeksi.
 
         Returns:
             Kullanım oranı (0.0 - 1.0).
@@ -183,21 +197,13 @@ class CapacityManager:
         if start_date > end_date:
             raise CapacityError("start_date, end_date'den sonra olamaz.")
 
-        total_capacity = 0
-        total_used = 0
-        current = start_date
-
-        while current <= end_date:
-            weekday = current.weekday()
-            if weekday in pilot.work_days:
-                total_capacity += pilot.daily_capacity
-                day_load = sum(
-                    1
-                    for a in existing_assignments
-                    if a.pilot_id == pilot.pilot_id and a.scheduled_date == current
-                )
-                total_used += min(day_load, pilot.daily_capacity)
-            current += timedelta(days=1)
+        index = _as_index(existing_assignments)
+        total_capacity = _count_work_days(pilot.work_days, start_date, end_date) * pilot.daily_capacity
+        total_used = sum(
+            min(day_load, pilot.daily_capacity)
+            for day, day_load in index.booked_days(pilot.pilot_id, start_date, end_date)
+            if day.weekday() in pilot.work_days
+        )
 
         if total_capacity == 0:
             return 0.0
@@ -218,4 +224,19 @@ class CapacityManager:
         Returns:
             Pilot bu ildeki görevleri alabilir mi.
         """
-        return pilot.province_code == field_province_code
+        return pilot.province_code == field_province_code or field_province_code in pilot.authorized_provinces
+
+
+def _as_index(existing_assignments: list[PilotAssignment] | PilotLoadIndex) -> PilotLoadIndex:
+    """Atama listesini tek seferlik indekse çevirir; indeksi olduğu gibi döner."""
+    if isinstance(existing_assignments, PilotLoadIndex):
+        return existing_assignments
+    return PilotLoadIndex.from_assignments(existing_assignments)
+
+
+def _count_work_days(work_days: frozenset[int], start_date: date, end_date: date) -> int:
+    """[start_date, end_date] aralığındaki çalışma günü sayısı (O(1))."""
+    total_days = (end_date - start_date).days + 1
+    full_weeks, rest = divmod(total_days, 7)
+    first = start_date.weekday()
+    return full_weeks * len(work_days) + sum(1 for offset in range(rest) if (first + offset) % 7 in work_days)
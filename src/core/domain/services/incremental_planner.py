@@ -0,0 +1,347 @@
+# PATH: src/core/domain/services/incremental_planner.py
+# DESC: İptal/hava engeli/yeniden planlama sonrası artımlı (warm-start) greedy planlama (KR-015).
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import uuid
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    PlanningEngineError,
+    PlanningStrategy,
+    ScheduledSlot,
+    ScheduleResult,
+)
+from src.core.domain.services.slot_index import SlotIndex
+
+_SortKey = tuple[int, int, uuid.UUID]  # (priority, giriş sırası, demand_id)
+
+
+@dataclass(frozen=True)
+class PlanningDelta:
+    """Önceki plana uygulanacak girdi değişiklikleri.
+
+    Slotlar (pilot_id, date) anahtarıyla tanımlanır; var olan anahtarla
+    gelen added_slots girdisi değişiklik olarak işlenir.
+    """
+
+    added_demands: tuple[MissionDemand, ...] = ()
+    removed_demand_ids: tuple[uuid.UUID, ...] = ()
+    changed_demands: tuple[MissionDemand, ...] = ()
+    added_slots: tuple[PilotSlot, ...] = ()
+    removed_slots: tuple[tuple[uuid.UUID, date], ...] = ()
+    changed_slots: tuple[PilotSlot, ...] = ()
+
+
+class IncrementalPlanner:
+    """Önceki ScheduleResult üzerinden yalnızca etkilenen atamaları yeniden planlar.
+
+    Greedy planlayıcı talepleri öncelik sırasıyla işler ve bir talebin
+    kararı yalnızca kendisinden önceki atamalara bağlıdır. Pilotlar ise
+    atama sayıları üzerinden yalnızca slotlarının bulunduğu illeri
+    birbirine bağlar. Bu nedenle bir delta uygulandığında:
+
+    - Etkilenen iller, pilot bağlantılarıyla genişletilerek bir bileşen
+      oluşturur; diğer illerin atamalarına dokunulmaz.
+    - Bileşen içinde ilk etkilenen öncelik konumundan önceki atamalar
+      korunur (SlotIndex.reserve), yalnızca sonrası yeniden oynatılır.
+
+    Sonuç, güncel girdilerle yapılan tam GREEDY planı ile birebir aynıdır
+    (yalnızca GREEDY/GREEDY_INDEXED için geçerlidir). İl-pilot bağlantıları
+    yalnızca büyür; kaldırılan slotların eski bağlantıları bileşeni
+    gereğinden geniş tutabilir ama sonucu değiştirmez.
+    """
+
+    def __init__(
+        self,
+        demands: Iterable[MissionDemand],
+        pilot_slots: Iterable[PilotSlot],
+        previous: ScheduleResult | None = None,
+    ) -> None:
+        self._seq = itertools.count()
+        self._demands: dict[uuid.UUID, MissionDemand] = {}
+        self._demand_seq: dict[uuid.UUID, int] = {}
+        self._order: dict[str, list[_SortKey]] = {}
+        self._sorted: list[_SortKey] = []
+        for demand in demands:
+            seq = next(self._seq)
+            key = (demand.priority, seq, demand.demand_id)
+            self._demands[demand.demand_id] = demand
+            self._demand_seq[demand.demand_id] = seq
+            self._order.setdefault(demand.province_code, []).append(key)
+            self._sorted.append(key)
+        for order in self._order.values():
+            order.sort()
+        self._sorted.sort()
+
+        self._slot_seq = itertools.count()
+        self._slots: dict[tuple[uuid.UUID, date], PilotSlot] = {}
+        self._slot_order: dict[tuple[uuid.UUID, date], int] = {}
+        self._province_slots: dict[str, set[tuple[uuid.UUID, date]]] = {}
+        self._province_pilots: dict[str, set[uuid.UUID]] = {}
+        self._pilot_provinces: dict[uuid.UUID, set[str]] = {}
+        self._pilot_total: dict[uuid.UUID, int] = {}
+        self._pilot_assigned: dict[uuid.UUID, int] = {}
+        self._utilization: dict[uuid.UUID, float] = {}
+        for slot in pilot_slots:
+            self._put_slot(slot)
+
+        if previous is None:
+            previous = PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(
+                self.demands, self.pilot_slots
+            )
+        # Sıcak yoldaki sözlükler UUID yerine giriş sırası (int) ile anahtarlanır.
+        self._assignment: dict[int, ScheduledSlot] = {self._demand_seq[s.demand_id]: s for s in previous.scheduled}
+        self._warnings: dict[int, str] = {}
+        for item in self._assignment.values():
+            self._pilot_assigned[item.pilot_id] = self._pilot_assigned.get(item.pilot_id, 0) + 1
+        for pilot_id in self._pilot_total:
+            self._refresh_pilot(pilot_id)
+        self.last_replanned = 0
+
+    @property
+    def demands(self) -> list[MissionDemand]:
+        """Güncel talepler (tam yeniden plan ile aynı giriş sırasında)."""
+        return list(self._demands.values())
+
+    @property
+    def pilot_slots(self) -> list[PilotSlot]:
+        """Güncel pilot slotları (tam yeniden plan ile aynı giriş sırasında)."""
+        return list(self._slots.values())
+
+    def apply(self, delta: PlanningDelta) -> ScheduleResult:
+        """Deltayı uygular, etkilenen bileşenleri yeniden planlar ve güncel sonucu döner.
+
+        Raises:
+            PlanningEngineError: Bilinmeyen demand/slot kaldırma veya değiştirme ya da
+                delta içinde tekrarlanan talep/slot anahtarı.
+        """
+        self._validate(delta)
+        start: dict[str, _SortKey] = {}
+
+        def touch(province_code: str, key: _SortKey) -> None:
+            current = start.get(province_code)
+            if current is None or key < current:
+                start[province_code] = key
+
+        for demand_id in delta.removed_demand_ids:
+            old = self._demands[demand_id]
+            touch(old.province_code, self._remove_demand(old))
+            seq = self._demand_seq.pop(demand_id)
+            del self._demands[demand_id]
+            self._unassign(seq)
+            self._warnings.pop(seq, None)
+
+        for demand in delta.changed_demands:
+            old = self._demands[demand.demand_id]
+            seq = self._demand_seq[demand.demand_id]
+            touch(old.province_code, self._remove_demand(old))
+            touch(demand.province_code, self._insert_demand(demand, seq))
+            self._warnings.pop(seq, None)
+
+        for demand in delta.added_demands:
+            touch(demand.province_code, self._insert_demand(demand, next(self._seq)))
+
+        slot_events: list[tuple[str, date]] = []
+        for key in delta.removed_slots:
+            old_slot = self._slots[key]
+            self._drop_slot(old_slot)
+            slot_events.append((old_slot.province_code, old_slot.date))
+        for slot in (*delta.changed_slots, *delta.added_slots):
+            old_slot = self._slots.get((slot.pilot_id, slot.date))
+            if old_slot is not None:
+                slot_events.append((old_slot.province_code, old_slot.date))
+            self._put_slot(slot)
+            slot_events.append((slot.province_code, slot.date))
+
+        for province_code, slot_date in slot_events:
+            first = self._first_covering(province_code, slot_date)
+            if first is not None:
+                touch(province_code, first)
+
+        replanned = 0
+        visited: set[str] = set()
+        for province_code in sorted(start):
+            if province_code in visited:
+                continue
+            component = self._component(province_code)
+            visited |= component
+            from_key = min(start[p] for p in component if p in start)
+            replanned += self._replay(component, from_key)
+        self.last_replanned = replanned
+        return self.result()
+
+    def result(self) -> ScheduleResult:
+        """Güncel planı ScheduleResult olarak döner."""
+        scheduled: list[ScheduledSlot] = []
+        unscheduled: list[uuid.UUID] = []
+        warnings: list[str] = []
+        assignment = self._assignment
+        for _, seq, demand_id in self._sorted:
+            item = assignment.get(seq)
+            if item is not None:
+                scheduled.append(item)
+                continue
+            unscheduled.append(demand_id)
+            warning = self._warnings.get(seq)
+            if warning is None:
+                warning = self._warnings[seq] = PlanningEngine.unscheduled_warning(self._demands[demand_id])
+            warnings.append(warning)
+        return ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(unscheduled),
+            pilot_utilization=dict(self._utilization),
+            warnings=tuple(warnings),
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _validate(self, delta: PlanningDelta) -> None:
+        """Delta uygulanmadan önce tüm referansları doğrular (kısmi güncelleme olmaz)."""
+        for label, ids in (
+            ("kaldırılan talep", delta.removed_demand_ids),
+            ("değişen talep", [d.demand_id for d in delta.changed_demands]),
+            ("eklenen talep", [d.demand_id for d in delta.added_demands]),
+            (
+                "slot",
+                [*delta.removed_slots, *((s.pilot_id, s.date) for s in (*delta.changed_slots, *delta.added_slots))],
+            ),
+        ):
+            duplicate = _first_duplicate(ids)
+            if duplicate is not None:
+                raise PlanningEngineError(f"Delta içinde tekrarlanan {label}: {duplicate}")
+        for demand_id in (*delta.removed_demand_ids, *(d.demand_id for d in delta.changed_demands)):
+            if demand_id not in self._demands:
+                raise PlanningEngineError(f"Bilinmeyen talep: {demand_id}")
+        removed = set(delta.removed_demand_ids)
+        if removed & {d.demand_id for d in delta.changed_demands}:
+            raise PlanningEngineError("Aynı talep hem kaldırılamaz hem değiştirilemez.")
+        for demand in delta.added_demands:
+            if demand.demand_id in self._demands:
+                raise PlanningEngineError(f"Talep zaten mevcut: {demand.demand_id}")
+        for key in (*delta.removed_slots, *((s.pilot_id, s.date) for s in delta.changed_slots)):
+            if key not in self._slots:
+                raise PlanningEngineError(f"Bilinmeyen slot: {key}")
+
+    def _insert_demand(self, demand: MissionDemand, seq: int) -> _SortKey:
+        key = (demand.priority, seq, demand.demand_id)
+        self._demands[demand.demand_id] = demand
+        self._demand_seq[demand.demand_id] = seq
+        insort(self._order.setdefault(demand.province_code, []), key)
+        insort(self._sorted, key)
+        return key
+
+    def _remove_demand(self, demand: MissionDemand) -> _SortKey:
+        key = (demand.priority, self._demand_seq[demand.demand_id], demand.demand_id)
+        order = self._order[demand.province_code]
+        del order[bisect_left(order, key)]
+        del self._sorted[bisect_left(self._sorted, key)]
+        return key
+
+    def _put_slot(self, slot: PilotSlot) -> None:
+        key = (slot.pilot_id, slot.date)
+        if key in self._slots:
+            self._drop_slot(self._slots[key], keep_position=True)
+        self._slots[key] = slot
+        self._slot_order.setdefault(key, next(self._slot_seq))
+        self._province_slots.setdefault(slot.province_code, set()).add(key)
+        self._province_pilots.setdefault(slot.province_code, set()).add(slot.pilot_id)
+        self._pilot_provinces.setdefault(slot.pilot_id, set()).add(slot.province_code)
+        self._pilot_total[slot.pilot_id] = self._pilot_total.get(slot.pilot_id, 0) + slot.daily_capacity
+        self._refresh_pilot(slot.pilot_id)
+
+    def _drop_slot(self, slot: PilotSlot, *, keep_position: bool = False) -> None:
+        key = (slot.pilot_id, slot.date)
+        self._province_slots[slot.province_code].discard(key)
+        self._pilot_total[slot.pilot_id] -= slot.daily_capacity
+        self._refresh_pilot(slot.pilot_id)
+        if not keep_position:
+            del self._slots[key]
+            del self._slot_order[key]
+
+    def _unassign(self, seq: int) -> None:
+        item = self._assignment.pop(seq, None)
+        if item is not None:
+            self._pilot_assigned[item.pilot_id] -= 1
+            self._refresh_pilot(item.pilot_id)
+
+    def _refresh_pilot(self, pilot_id: uuid.UUID) -> None:
+        """Pilotun kullanım oranını günceller (greedy ile aynı formül)."""
+        total = self._pilot_total.get(pilot_id, 0)
+        if total > 0:
+            self._utilization[pilot_id] = self._pilot_assigned.get(pilot_id, 0) / total
+        else:
+            self._utilization.pop(pilot_id, None)
+
+    def _first_covering(self, province_code: str, slot_date: date) -> _SortKey | None:
+        for key in self._order.get(province_code, ()):
+            demand = self._demands[key[2]]
+            if demand.earliest_date <= slot_date <= demand.latest_date:
+                return key
+        return None
+
+    def _component(self, province_code: str) -> set[str]:
+        """Pilot bağlantılarıyla birbirine bağlı iller kümesi."""
+        component = {province_code}
+        stack = [province_code]
+        while stack:
+            for pilot_id in self._province_pilots.get(stack.pop(), ()):
+                for other in self._pilot_provinces[pilot_id]:
+                    if other not in component:
+                        component.add(other)
+                        stack.append(other)
+        return component
+
+    def _replay(self, component: set[str], from_key: _SortKey) -> int:
+        """Bileşendeki talepleri from_key konumundan itibaren greedy ile yeniden yerleştirir."""
+        slot_keys = sorted(
+            (key for p in component for key in self._province_slots.get(p, ())),
+            key=self._slot_order.__getitem__,
+        )
+        index = SlotIndex(self._slots[key] for key in slot_keys)
+
+        orders = [self._order[p] for p in component if self._order.get(p)]
+        kept = heapq.merge(*(order[: bisect_left(order, from_key)] for order in orders))
+        for _, seq, _ in kept:
+            item = self._assignment.get(seq)
+            if item is not None:
+                index.reserve(item.pilot_id, item.scheduled_date)
+
+        replanned = 0
+        for _, seq, demand_id in heapq.merge(*(order[bisect_left(order, from_key) :] for order in orders)):
+            demand = self._demands[demand_id]
+            self._unassign(seq)
+            match = index.take(demand.province_code, demand.earliest_date, demand.latest_date)
+            replanned += 1
+            if match is None:
+                continue
+            pilot_id, sched_date = match
+            self._assignment[seq] = ScheduledSlot(
+                demand_id=demand_id,
+                field_id=demand.field_id,
+                pilot_id=pilot_id,
+                scheduled_date=sched_date,
+                estimated_duration_minutes=demand.estimated_duration_minutes,
+            )
+            self._pilot_assigned[pilot_id] = self._pilot_assigned.get(pilot_id, 0) + 1
+            self._refresh_pilot(pilot_id)
+        return replanned
+
+
+def _first_duplicate(items: Iterable[object]) -> object | None:
+    """Dizide ilk tekrar eden öğeyi döner; tekrar yoksa None."""
+    seen: set[object] = set()
+    for item in items:
+        if item in seen:
+            return item
+        seen.add(item)
+    return None
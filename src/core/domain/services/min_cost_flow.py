@@ -0,0 +1,229 @@
+# PATH: src/core/domain/services/min_cost_flow.py
+# DESC: PlanningEngine için kapasiteli min-cost-flow talep→gün eşleştirmesi (KR-015).
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.domain.services.planning_engine import MissionDemand, PilotSlot
+
+_INF = float("inf")
+
+
+class FlowBudgetExceededError(Exception):
+    """Min-cost-flow çözümü zaman bütçesini aştı."""
+
+
+@dataclass(frozen=True)
+class FlowCostWeights:
+    """Talep→gün kenar maliyeti ağırlıkları (tamsayı).
+
+    maliyet = priority * priority + slack_day * (tarih - earliest_date).days
+              - duration_minute * estimated_duration_minutes
+    """
+
+    priority: int = 10_000
+    slack_day: int = 100
+    duration_minute: int = 1
+
+
+class _Graph:
+    """Artık (residual) graf; kenarlar paralel listelerde tutulur."""
+
+    __slots__ = ("adj", "to", "cap", "cost")
+
+    def __init__(self, node_count: int) -> None:
+        self.adj: list[list[int]] = [[] for _ in range(node_count)]
+        self.to: list[int] = []
+        self.cap: list[int] = []
+        self.cost: list[int] = []
+
+    def add_edge(self, u: int, v: int, cap: int, cost: int) -> int:
+        edge = len(self.to)
+        self.to += (v, u)
+        self.cap += (cap, 0)
+        self.cost += (cost, -cost)
+        self.adj[u].append(edge)
+        self.adj[v].append(edge + 1)
+        return edge
+
+
+class MinCostFlowMatcher:
+    """Talepleri (il, gün) kapasite düğümlerine global olarak dağıtır.
+
+    Her il bağımsız bir ağ olarak çözülür: kaynak → talep (kap. 1) →
+    pencere içindeki gün düğümü → havuz (kap. = o gün ildeki toplam kalan
+    pilot kapasitesi). Aynı il/gündeki pilot slotları maliyet açısından
+    eşdeğer olduğu için tek düğümde toplanır; pilot dağıtımı çağıran
+    tarafa bırakılır.
+
+    Çözüm, potansiyelli ardışık en kısa yol (successive shortest paths,
+    Dijkstra + Johnson potansiyelleri) ile bulunur. Her atamaya eklenen
+    ödül, yerleştirilen talep sayısını önce maksimize eder; eşit sayıdaki
+    çözümler arasında FlowCostWeights maliyeti minimize edilir.
+    """
+
+    def __init__(self, weights: FlowCostWeights | None = None) -> None:
+        self.weights = weights or FlowCostWeights()
+
+    def edge_cost(self, demand: MissionDemand, slot_date: date) -> int:
+        """Talebin verilen güne atanmasının (ödül hariç) maliyeti."""
+        w = self.weights
+        slack_days = (slot_date - demand.earliest_date).days
+        return (
+            w.priority * demand.priority
+            + w.slack_day * slack_days
+            - w.duration_minute * demand.estimated_duration_minutes
+        )
+
+    def assign_dates(
+        self,
+        demands: Sequence[MissionDemand],
+        pilot_slots: Sequence[PilotSlot],
+        *,
+        deadline: float | None = None,
+    ) -> list[date | None]:
+        """Her talep için atanacak günü (ya da None) döner.
+
+        Args:
+            demands: Mission talepleri.
+            pilot_slots: Pilot slotları; (pilot_id, date) tekrarında son kayıt geçerlidir.
+            deadline: time.monotonic() cinsinden son an; None ise sınırsız.
+
+        Raises:
+            FlowBudgetExceededError: deadline aşıldığında.
+        """
+        capacity: dict[tuple[object, date], tuple[str, int]] = {}
+        for slot in pilot_slots:
+            capacity[(slot.pilot_id, slot.date)] = (slot.province_code, slot.remaining_capacity)
+
+        day_capacity: dict[str, dict[date, int]] = {}
+        for (_, slot_date), (province_code, remaining) in capacity.items():
+            if remaining > 0:
+                by_date = day_capacity.setdefault(province_code, {})
+                by_date[slot_date] = by_date.get(slot_date, 0) + remaining
+
+        by_province: dict[str, list[int]] = {}
+        for position, demand in enumerate(demands):
+            by_province.setdefault(demand.province_code, []).append(position)
+
+        assigned: list[date | None] = [None] * len(demands)
+        for province_code in sorted(by_province):
+            by_date = day_capacity.get(province_code)
+            if not by_date:
+                continue
+            positions = by_province[province_code]
+            dates = self._solve_province([demands[p] for p in positions], by_date, deadline)
+            for position, slot_date in zip(positions, dates, strict=True):
+                assigned[position] = slot_date
+        return assigned
+
+    def _solve_province(
+        self,
+        demands: list[MissionDemand],
+        day_capacity: dict[date, int],
+        deadline: float | None,
+    ) -> list[date | None]:
+        days = sorted(day_capacity)
+        day_node = {d: len(demands) + 1 + i for i, d in enumerate(days)}
+        source, sink = 0, len(demands) + len(days) + 1
+        graph = _Graph(sink + 1)
+
+        demand_edges: list[list[tuple[int, date]]] = []
+        raw: list[int] = []
+        for demand in demands:
+            edges: list[tuple[int, date]] = []
+            for slot_date in days:
+                if demand.earliest_date <= slot_date <= demand.latest_date:
+                    raw.append(self.edge_cost(demand, slot_date))
+                    edges.append((len(raw) - 1, slot_date))
+            demand_edges.append(edges)
+        if not raw:
+            return [None] * len(demands)
+
+        # Maliyetleri [0, span] aralığına kaydırıp sayıyı önceleyen ödülü ekle.
+        low = min(raw)
+        span = max(raw) - low
+        reward = (len(demands) + 1) * (span + 1)
+
+        potential: list[float] = [_INF] * (sink + 1)
+        potential[source] = 0
+        tracked: list[list[tuple[int, date]]] = []
+        for i, edges in enumerate(demand_edges):
+            node = i + 1
+            graph.add_edge(source, node, 1, 0)
+            potential[node] = 0
+            row: list[tuple[int, date]] = []
+            for cost_idx, slot_date in edges:
+                cost = raw[cost_idx] - low - reward
+                target = day_node[slot_date]
+                row.append((graph.add_edge(node, target, 1, cost), slot_date))
+                potential[target] = min(potential[target], cost)
+            tracked.append(row)
+        for slot_date in days:
+            node = day_node[slot_date]
+            graph.add_edge(node, sink, day_capacity[slot_date], 0)
+            potential[sink] = min(potential[sink], potential[node])
+
+        self._successive_shortest_paths(graph, potential, source, sink, deadline)
+
+        result: list[date | None] = []
+        for row in tracked:
+            chosen = next((slot_date for edge, slot_date in row if graph.cap[edge] == 0), None)
+            result.append(chosen)
+        return result
+
+    @staticmethod
+    def _successive_shortest_paths(
+        graph: _Graph,
+        potential: list[float],
+        source: int,
+        sink: int,
+        deadline: float | None,
+    ) -> None:
+        node_count = len(graph.adj)
+        adj, to, cap, cost = graph.adj, graph.to, graph.cap, graph.cost
+        while True:
+            if deadline is not None and time.monotonic() > deadline:
+                raise FlowBudgetExceededError("Min-cost-flow zaman bütçesi aşıldı.")
+
+            dist: list[float] = [_INF] * node_count
+            parent: list[int] = [-1] * node_count
+            dist[source] = 0
+            heap: list[tuple[float, int]] = [(0, source)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                pu = potential[u]
+                for edge in adj[u]:
+                    if cap[edge] <= 0:
+                        continue
+                    v = to[edge]
+                    nd = d + cost[edge] + pu - potential[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        parent[v] = edge
+                        heapq.heappush(heap, (nd, v))
+
+            if dist[sink] == _INF:
+                return
+            for v in range(node_count):
+                if dist[v] < _INF:
+                    potential[v] += dist[v]
+            # Yol maliyeti artık negatif değilse akış artırmak toplamı iyileştirmez.
+            if potential[sink] - potential[source] >= 0:
+                return
+
+            v = sink
+            while v != source:
+                edge = parent[v]
+                cap[edge] -= 1
+                cap[edge ^ 1] += 1
+                v = to[edge ^ 1]
@@ -0,0 +1,126 @@
+# PATH: src/core/domain/services/pilot_load_index.py
+# DESC: Pilot × gün yük indeksi; CapacityManager sorgularını atama listesinden bağımsızlaştırır (KR-015-1).
+
+from __future__ import annotations
+
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable, Iterator
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.domain.services.capacity_manager import PilotAssignment
+
+
+class PilotLoadIndex:
+    """Atamalardan bir kez kurulan (pilot_id, tarih) → yük/alan indeksi.
+
+    - (pilot_id, tarih) → görev sayısı ve rezerve alan (dönüm): O(1) nokta sorgusu.
+    - Pilot bazında sıralı tarih (ordinal) dizisi ve önek toplamları:
+      tarih penceresi toplamları O(log n).
+    - on_assignment_created / on_assignment_cancelled ile artımlı güncellenir;
+      önek toplamları ilk pencere sorgusunda tembel olarak yeniden kurulur.
+    """
+
+    def __init__(self) -> None:
+        self._load: dict[tuple[uuid.UUID, date], int] = {}
+        self._area: dict[tuple[uuid.UUID, date], float] = {}
+        self._dates: dict[uuid.UUID, list[int]] = {}
+        self._prefix: dict[uuid.UUID, tuple[list[int], list[float]]] = {}
+
+    @classmethod
+    def from_assignments(cls, assignments: Iterable[PilotAssignment]) -> PilotLoadIndex:
+        """Atama listesinden indeks kurar (O(n + pilot × gün log gün))."""
+        index = cls()
+        load, area = index._load, index._area
+        for a in assignments:
+            key = (a.pilot_id, a.scheduled_date)
+            load[key] = load.get(key, 0) + 1
+            area[key] = area.get(key, 0.0) + a.area_donum
+        for pilot_id, day in load:
+            index._dates.setdefault(pilot_id, []).append(day.toordinal())
+        for ordinals in index._dates.values():
+            ordinals.sort()
+        return index
+
+    # ------------------------------------------------------------------
+    # Nokta sorguları
+    # ------------------------------------------------------------------
+    def load(self, pilot_id: uuid.UUID, day: date) -> int:
+        """Pilotun o günkü görev sayısı."""
+        return self._load.get((pilot_id, day), 0)
+
+    def booked_area(self, pilot_id: uuid.UUID, day: date) -> float:
+        """Pilotun o gün rezerve edilmiş alanı (dönüm)."""
+        return self._area.get((pilot_id, day), 0.0)
+
+    # ------------------------------------------------------------------
+    # Pencere sorguları
+    # ------------------------------------------------------------------
+    def booked_days(self, pilot_id: uuid.UUID, start_date: date, end_date: date) -> Iterator[tuple[date, int]]:
+        """Pencere içinde ataması olan günler ve görev sayıları (tarih sırasıyla)."""
+        ordinals = self._dates.get(pilot_id, [])
+        lo = bisect_left(ordinals, start_date.toordinal())
+        hi = bisect_right(ordinals, end_date.toordinal())
+        for ordinal in ordinals[lo:hi]:
+            day = date.fromordinal(ordinal)
+            yield day, self._load[(pilot_id, day)]
+
+    def load_between(self, pilot_id: uuid.UUID, start_date: date, end_date: date) -> int:
+        """Tarih penceresindeki (dahil-dahil) toplam görev sayısı."""
+        lo, hi, (loads, _) = self._window(pilot_id, start_date, end_date)
+        return loads[hi] - loads[lo]
+
+    def booked_area_between(self, pilot_id: uuid.UUID, start_date: date, end_date: date) -> float:
+        """Tarih penceresindeki (dahil-dahil) toplam rezerve alan (dönüm)."""
+        lo, hi, (_, areas) = self._window(pilot_id, start_date, end_date)
+        return areas[hi] - areas[lo]
+
+    # ------------------------------------------------------------------
+    # Artımlı güncelleme
+    # ------------------------------------------------------------------
+    def on_assignment_created(self, assignment: PilotAssignment) -> None:
+        """Yeni atamayı indekse ekler."""
+        key = (assignment.pilot_id, assignment.scheduled_date)
+        current = self._load.get(key, 0)
+        if current == 0:
+            insort(self._dates.setdefault(assignment.pilot_id, []), assignment.scheduled_date.toordinal())
+        self._load[key] = current + 1
+        self._area[key] = self._area.get(key, 0.0) + assignment.area_donum
+        self._prefix.pop(assignment.pilot_id, None)
+
+    def on_assignment_cancelled(self, assignment: PilotAssignment) -> None:
+        """İptal edilen atamayı indeksten düşer; bilinmeyen atama sessizce yok sayılır."""
+        key = (assignment.pilot_id, assignment.scheduled_date)
+        current = self._load.get(key, 0)
+        if current == 0:
+            return
+        if current == 1:
+            del self._load[key]
+            del self._area[key]
+            ordinals = self._dates[assignment.pilot_id]
+            del ordinals[bisect_left(ordinals, assignment.scheduled_date.toordinal())]
+        else:
+            self._load[key] = current - 1
+            self._area[key] -= assignment.area_donum
+        self._prefix.pop(assignment.pilot_id, None)
+
+    def _window(
+        self,
+        pilot_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[int, int, tuple[list[int], list[float]]]:
+        ordinals = self._dates.get(pilot_id, [])
+        prefix = self._prefix.get(pilot_id)
+        if prefix is None:
+            loads, areas = [0], [0.0]
+            for ordinal in ordinals:
+                key = (pilot_id, date.fromordinal(ordinal))
+                loads.append(loads[-1] + self._load[key])
+                areas.append(areas[-1] + self._area[key])
+            prefix = self._prefix[pilot_id] = (loads, areas)
+        lo = bisect_left(ordinals, start_date.toordinal())
+        hi = max(lo, bisect_right(ordinals, end_date.toordinal()))
+        return lo, hi, prefix
@@ -1,12 +1,32 @@
 """KR-015 — PlanWindowSegmenter.
 
 Amaç: Büyük alanlarda (örn. 10.000 dönüm) aynı pencere içinde çoklu pilotla yürütme için segmentleme.
+
+İki mod vardır:
+- segment(total_area_donum): yalnızca aritmetik parçalama (şekilsiz).
+- segment_geometry(boundary): tarla sınırını uzun eksene dik kesimlerle
+  özyinelemeli olarak ikiye bölüp, paralel uçulabilecek kompakt ve
+  yaklaşık eşit alanlı alt poligonlar üretir.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
+
+from shapely import affinity
+from shapely.geometry import MultiPolygon, Polygon, box
+from shapely.geometry.base import BaseGeometry
+
+from ..value_objects.geometry import Geometry, GeometryError
+
+_M2_PER_DONUM = 1000.0
+# Yerel eşdikdörtgen projeksiyon katsayıları (m / derece).
+_M_PER_DEG_LAT = 110_574.0
+_M_PER_DEG_LON_EQUATOR = 111_320.0
+_CUT_MAX_ITERATIONS = 60
+_CUT_RELATIVE_TOLERANCE = 1e-6
 
 
 @dataclass(frozen=True)
@@ -14,6 +34,11 @@ class MissionSegment:
     segment_no: int
     area_donum: int
     assigned_pilot_id: str = ""  # optional at this stage
+    # Geometri modu alanları (aritmetik modda boş kalır)
+    geometry: Optional[Geometry] = None
+    area_m2: float = 0.0
+    centroid: Optional[Tuple[float, float]] = None  # (lon, lat)
+    bbox: Optional[Tuple[float, float, float, float]] = None  # (minx, miny, maxx, maxy)
 
 
 class PlanWindowSegmenter:
@@ -34,3 +59,111 @@ class PlanWindowSegmenter:
             remaining -= chunk
             no += 1
         return segs
+
+    def segment_geometry(self, boundary: Geometry) -> List[MissionSegment]:
+        """Tarla sınırını segment_size_donum altındaki alt poligonlara böler.
+
+        Sınır (lon, lat) koordinatında beklenir; hesaplar tarla merkezindeki
+        yerel metrik düzlemde yapılır. Parça sayısı n = ceil(alan / segment)
+        belirlenir ve poligon, uzun sınır kutusu eksenine dik bir kesimle
+        floor(n/2) : ceil(n/2) alan oranında ikiye bölünür; kesim konumu
+        alan üzerinde ikili arama ile bulunur. Böylece tüm parçalar
+        alan / n'e yakın olur ve toplam alan korunur.
+
+        Args:
+            boundary: Tarla sınırı (Polygon veya MultiPolygon, delikli olabilir).
+
+        Returns:
+            Segment listesi; her segment geometri, alan, merkez ve sınır kutusu taşır.
+
+        Raises:
+            GeometryError: Sınır poligon değilse.
+        """
+        shape = boundary.shape
+        if not isinstance(shape, (Polygon, MultiPolygon)):
+            raise GeometryError(f"Segmentleme için Polygon/MultiPolygon bekleniyor: {shape.geom_type}")
+
+        lat0 = shape.centroid.y
+        kx = _M_PER_DEG_LON_EQUATOR * math.cos(math.radians(lat0))
+        metric = affinity.scale(shape, xfact=kx, yfact=_M_PER_DEG_LAT, origin=(0.0, 0.0))
+        total_m2 = float(metric.area)
+        total_donum = total_m2 / _M2_PER_DONUM
+
+        if total_donum <= self.threshold_donum:
+            parts = [metric]
+        else:
+            parts = []
+            _bisect(metric, math.ceil(total_donum / self.segment_size_donum), parts)
+
+        segments: List[MissionSegment] = []
+        for no, part in enumerate(parts, start=1):
+            geographic = affinity.scale(part, xfact=1.0 / kx, yfact=1.0 / _M_PER_DEG_LAT, origin=(0.0, 0.0))
+            geometry = Geometry.from_shapely(geographic)
+            area_m2 = float(part.area)
+            segments.append(
+                MissionSegment(
+                    segment_no=no,
+                    area_donum=round(area_m2 / _M2_PER_DONUM),
+                    geometry=geometry,
+                    area_m2=area_m2,
+                    centroid=geometry.centroid,
+                    bbox=geometry.bounds,
+                )
+            )
+        return segments
+
+
+def _bisect(shape: BaseGeometry, pieces: int, out: List[BaseGeometry]) -> None:
+    """shape'i pieces adet eşit alanlı parçaya özyinelemeli böler (derinlik log2(pieces))."""
+    if pieces <= 1:
+        out.append(shape)
+        return
+    left_pieces = pieces // 2
+    left, right = _cut(shape, left_pieces / pieces)
+    _bisect(left, left_pieces, out)
+    _bisect(right, pieces - left_pieces, out)
+
+
+def _cut(shape: BaseGeometry, fraction: float) -> Tuple[BaseGeometry, BaseGeometry]:
+    """Uzun eksene dik kesimle alanın fraction kadarını sola/alta ayırır."""
+    minx, miny, maxx, maxy = shape.bounds
+    along_x = (maxx - minx) >= (maxy - miny)
+    lo, hi = (minx, maxx) if along_x else (miny, maxy)
+    target = float(shape.area) * fraction
+    tolerance = float(shape.area) * _CUT_RELATIVE_TOLERANCE
+
+    def first_part(position: float) -> BaseGeometry:
+        if along_x:
+            return shape.intersection(box(minx, miny, position, maxy))
+        return shape.intersection(box(minx, miny, maxx, position))
+
+    position = lo + (hi - lo) * fraction
+    part = first_part(position)
+    for _ in range(_CUT_MAX_ITERATIONS):
+        error = float(part.area) - target
+        if abs(error) <= tolerance:
+            break
+        if error > 0:
+            hi = position
+        else:
+            lo = position
+        position = (lo + hi) / 2.0
+        part = first_part(position)
+
+    rest = shape.intersection(box(position, miny, maxx, maxy)) if along_x else shape.intersection(
+        box(minx, position, maxx, maxy)
+    )
+    return _polygonal(part), _polygonal(rest)
+
+
+def _polygonal(shape: BaseGeometry) -> BaseGeometry:
+    """Kesişimden dönen GeometryCollection içindeki çizgi/nokta artıklarını atar."""
+    if isinstance(shape, (Polygon, MultiPolygon)):
+        return shape
+    polygons: List[Polygon] = []
+    for geom in getattr(shape, "geoms", []):
+        if isinstance(geom, Polygon):
+            polygons.append(geom)
+        elif isinstance(geom, MultiPolygon):
+            polygons.extend(geom.geoms)
+    return MultiPolygon(polygons)
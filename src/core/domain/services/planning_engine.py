@@ -3,15 +3,28 @@
 
 from __future__ import annotations
 
+import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import date, timedelta
+from enum import Enum
+
+from src.core.domain.services.min_cost_flow import FlowBudgetExceededError, FlowCostWeights, MinCostFlowMatcher
+from src.core.domain.services.slot_index import SlotIndex
 
 
 class PlanningEngineError(Exception):
     """Planlama motoru domain invariant ihlali."""
 
 
+class PlanningStrategy(str, Enum):
+    """Slot eşleştirme stratejisi."""
+
+    GREEDY = "GREEDY"  # Referans: her talepte tüm slotları tarar
+    GREEDY_INDEXED = "GREEDY_INDEXED"  # Aynı sonuç; (il, tarih) kovalı SlotIndex
+    MIN_COST_FLOW = "MIN_COST_FLOW"  # Global atama; bütçe aşılırsa greedy'ye döner
+
+
 @dataclass(frozen=True)
 class PilotSlot:
     """Pilot müsaitlik slotu."""
@@ -47,6 +60,7 @@ class ScheduledSlot:
     pilot_id: uuid.UUID
     scheduled_date: date
     estimated_duration_minutes: int
+    route_sequence: int = 0  # Günlük uçuş sırası (1..n); 0 = rota sıralaması yapılmadı
 
 
 @dataclass(frozen=True)
@@ -71,6 +85,17 @@ class PlanningEngine:
     - Yüksek öncelikli talepler önce planlanır.
     """
 
+    def __init__(
+        self,
+        strategy: PlanningStrategy = PlanningStrategy.GREEDY,
+        *,
+        time_budget_s: float | None = None,
+        cost_weights: FlowCostWeights | None = None,
+    ) -> None:
+        self.strategy = strategy
+        self.time_budget_s = time_budget_s
+        self.cost_weights = cost_weights
+
     def optimize_schedule(
         self,
         demands: list[MissionDemand],
@@ -79,7 +104,10 @@ class PlanningEngine:
         """Mission taleplerini pilot slotlarına optimize ederek yerleştirir.
 
         Greedy yaklaşım: önceliğe göre sıralı talepleri, bölge eşleşen
-        ve en az yüklü pilotlara atar.
+        ve en az yüklü pilotlara atar. GREEDY_INDEXED stratejisi aynı
+        sonucu SlotIndex üzerinden talep başına alt-doğrusal maliyetle üretir.
+        MIN_COST_FLOW stratejisi talepleri global olarak yerleştirir;
+        time_budget_s aşılırsa greedy sonucu uyarıyla döner.
 
         Args:
             demands: Planlanması gereken mission talepleri.
@@ -96,6 +124,11 @@ class PlanningEngine:
                 warnings=(),
             )
 
+        if self.strategy == PlanningStrategy.GREEDY_INDEXED:
+            return self._optimize_indexed(demands, pilot_slots)
+        if self.strategy == PlanningStrategy.MIN_COST_FLOW:
+            return self._optimize_min_cost_flow(demands, pilot_slots)
+
         # Önceliğe göre sırala
         sorted_demands = sorted(demands, key=lambda d: d.priority)
 
@@ -162,25 +195,132 @@ class PlanningEngine:
 
             if not assigned:
                 unscheduled.append(demand.demand_id)
-                warnings.append(
-                    f"Talep {demand.demand_id}: uygun pilot/tarih bulunamadı "
-                    f"(bölge: {demand.province_code}, "
-                    f"pencere: {demand.earliest_date} - {demand.latest_date})."
+                warnings.append(self.unscheduled_warning(demand))
+
+        return ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(unscheduled),
+            pilot_utilization=self._utilization(pilot_total_slots, pilot_assigned),
+            warnings=tuple(warnings),
+        )
+
+    def _optimize_indexed(
+        self,
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+    ) -> ScheduleResult:
+        """GREEDY ile aynı seçim sırasını SlotIndex üzerinden uygular."""
+        index = SlotIndex(pilot_slots)
+
+        pilot_total_slots: dict[uuid.UUID, int] = {}
+        for slot in pilot_slots:
+            pid = slot.pilot_id
+            pilot_total_slots[pid] = pilot_total_slots.get(pid, 0) + slot.daily_capacity
+
+        scheduled: list[ScheduledSlot] = []
+        unscheduled: list[uuid.UUID] = []
+        warnings: list[str] = []
+
+        for demand in sorted(demands, key=lambda d: d.priority):
+            match = index.take(demand.province_code, demand.earliest_date, demand.latest_date)
+            if match is None:
+                unscheduled.append(demand.demand_id)
+                warnings.append(self.unscheduled_warning(demand))
+                continue
+            pilot_id, sched_date = match
+            scheduled.append(
+                ScheduledSlot(
+                    demand_id=demand.demand_id,
+                    field_id=demand.field_id,
+                    pilot_id=pilot_id,
+                    scheduled_date=sched_date,
+                    estimated_duration_minutes=demand.estimated_duration_minutes,
                 )
+            )
 
-        # Kullanım oranı hesapla
-        utilization: dict[uuid.UUID, float] = {}
-        for pid, total in pilot_total_slots.items():
-            if total > 0:
-                utilization[pid] = pilot_assigned.get(pid, 0) / total
+        return ScheduleResult(
+            scheduled=tuple(scheduled),
+            unscheduled=tuple(unscheduled),
+            pilot_utilization=self._utilization(pilot_total_slots, index.pilot_assigned),
+            warnings=tuple(warnings),
+        )
+
+    def _optimize_min_cost_flow(
+        self,
+        demands: list[MissionDemand],
+        pilot_slots: list[PilotSlot],
+    ) -> ScheduleResult:
+        """Talep→gün atamasını min-cost-flow ile, pilot dağıtımını SlotIndex ile yapar."""
+        sorted_demands = sorted(demands, key=lambda d: d.priority)
+        deadline = None if self.time_budget_s is None else time.monotonic() + self.time_budget_s
+        try:
+            dates = MinCostFlowMatcher(self.cost_weights).assign_dates(
+                sorted_demands, pilot_slots, deadline=deadline
+            )
+        except FlowBudgetExceededError:
+            fallback = self._optimize_indexed(demands, pilot_slots)
+            return replace(
+                fallback,
+                warnings=(
+                    *fallback.warnings,
+                    f"MIN_COST_FLOW zaman bütçesi ({self.time_budget_s} sn) aşıldı; GREEDY sonucu kullanıldı.",
+                ),
+            )
+
+        index = SlotIndex(pilot_slots)
+        pilot_total_slots: dict[uuid.UUID, int] = {}
+        for slot in pilot_slots:
+            pid = slot.pilot_id
+            pilot_total_slots[pid] = pilot_total_slots.get(pid, 0) + slot.daily_capacity
+
+        scheduled: list[ScheduledSlot] = []
+        unscheduled: list[uuid.UUID] = []
+        warnings: list[str] = []
+
+        for demand, sched_date in zip(sorted_demands, dates, strict=True):
+            match = None if sched_date is None else index.take(demand.province_code, sched_date, sched_date)
+            if match is None:
+                unscheduled.append(demand.demand_id)
+                warnings.append(self.unscheduled_warning(demand))
+                continue
+            scheduled.append(
+                ScheduledSlot(
+                    demand_id=demand.demand_id,
+                    field_id=demand.field_id,
+                    pilot_id=match[0],
+                    scheduled_date=match[1],
+                    estimated_duration_minutes=demand.estimated_duration_minutes,
+                )
+            )
 
         return ScheduleResult(
             scheduled=tuple(scheduled),
             unscheduled=tuple(unscheduled),
-            pilot_utilization=utilization,
+            pilot_utilization=self._utilization(pilot_total_slots, index.pilot_assigned),
             warnings=tuple(warnings),
         )
 
+    @staticmethod
+    def unscheduled_warning(demand: MissionDemand) -> str:
+        """Planlanamayan talep için standart uyarı metni."""
+        return (
+            f"Talep {demand.demand_id}: uygun pilot/tarih bulunamadı "
+            f"(bölge: {demand.province_code}, "
+            f"pencere: {demand.earliest_date} - {demand.latest_date})."
+        )
+
+    @staticmethod
+    def _utilization(
+        pilot_total_slots: dict[uuid.UUID, int],
+        pilot_assigned: dict[uuid.UUID, int],
+    ) -> dict[uuid.UUID, float]:
+        """Kullanım oranı hesapla."""
+        utilization: dict[uuid.UUID, float] = {}
+        for pid, total in pilot_total_slots.items():
+            if total > 0:
+                utilization[pid] = pilot_assigned.get(pid, 0) / total
+        return utilization
+
     @staticmethod
     def generate_date_range(start: date, end: date) -> list[date]:
         """Tarih aralığı üretir (dahil-dahil).
@@ -0,0 +1,394 @@
+# PATH: src/core/domain/services/route_optimizer.py
+# DESC: Pilot günlük uçuş sırası optimizasyonu; PlanningEngine sonrası rota sıralama (KR-015).
+
+from __future__ import annotations
+
+import math
+import time
+import uuid
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from datetime import date
+from typing import TYPE_CHECKING
+
+from src.core.domain.services.planning_engine import ScheduledSlot, ScheduleResult
+from src.core.domain.value_objects.geometry import Geometry
+
+if TYPE_CHECKING:
+    from src.core.domain.entities.field import Field
+
+_EARTH_RADIUS_KM = 6371.0088
+_EPS = 1e-9
+
+LonLat = tuple[float, float]
+
+
+class RouteOptimizationError(Exception):
+    """Rota optimizasyonu domain invariant ihlali."""
+
+
+@dataclass(frozen=True)
+class TimeWindow:
+    """Mission zaman penceresi; iş günü başlangıcından itibaren dakika (dahil-dahil)."""
+
+    earliest_minute: float
+    latest_minute: float
+
+
+@dataclass(frozen=True)
+class RouteStop:
+    """Rotadaki tek durak."""
+
+    demand_id: uuid.UUID
+    field_id: uuid.UUID
+    sequence: int  # 1..n
+    start_minute: float  # Uçuşa başlama zamanı (iş günü başından dakika)
+    lateness_minutes: float  # Pencere bitişinden sonra başlama süresi (0 = zamanında)
+
+
+@dataclass(frozen=True)
+class DailyRoute:
+    """Pilotun bir günlük uçuş rotası."""
+
+    pilot_id: uuid.UUID
+    route_date: date
+    stops: tuple[RouteStop, ...]
+    distance_km: float
+    lateness_minutes: float
+    initial_distance_km: float  # En yakın komşu turunun mesafesi
+
+
+class DistanceMatrix:
+    """Haversine mesafelerini (km) çift bazında önbellekleyen, yeniden kullanılabilir matris.
+
+    Noktalar anahtar (ör. field_id) ile kaydedilir; aynı anahtar çifti
+    için mesafe bir kez hesaplanır ve pilotlar/günler arasında paylaşılır.
+    """
+
+    def __init__(self, points: Mapping[Hashable, LonLat] | None = None) -> None:
+        self._points: dict[Hashable, LonLat] = dict(points or {})
+        self._cache: dict[tuple[Hashable, Hashable], float] = {}
+
+    def add(self, key: Hashable, point: LonLat) -> None:
+        """Nokta ekler; konumu değişen anahtarın önbelleği geçersiz olur."""
+        if self._points.get(key) == point:
+            return
+        if key in self._points:
+            self._cache = {pair: km for pair, km in self._cache.items() if key not in pair}
+        self._points[key] = point
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._points
+
+    @property
+    def cached_pairs(self) -> int:
+        """Önbellekteki (yönsüz) çift sayısı."""
+        return len(self._cache)
+
+    def point(self, key: Hashable) -> LonLat:
+        try:
+            return self._points[key]
+        except KeyError as exc:
+            raise RouteOptimizationError(f"Konumu bilinmeyen nokta: {key}") from exc
+
+    def distance(self, a: Hashable, b: Hashable) -> float:
+        """İki kayıtlı nokta arası haversine mesafesi (km)."""
+        if a == b:
+            return 0.0
+        pair = (a, b) if hash(a) <= hash(b) else (b, a)
+        km = self._cache.get(pair)
+        if km is None:
+            km = self._cache[pair] = haversine_km(self.point(a), self.point(b))
+        return km
+
+    def matrix(self, keys: Sequence[Hashable]) -> list[list[float]]:
+        """keys sırasıyla kare mesafe matrisi."""
+        return [[self.distance(a, b) for b in keys] for a in keys]
+
+
+def haversine_km(a: LonLat, b: LonLat) -> float:
+    """(lon, lat) iki nokta arası büyük daire mesafesi (km)."""
+    lon1, lat1 = math.radians(a[0]), math.radians(a[1])
+    lon2, lat2 = math.radians(b[0]), math.radians(b[1])
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * _EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def field_centroids(fields: Iterable[Field]) -> dict[uuid.UUID, LonLat]:
+    """Geometrisi olan tarlaların ağırlık merkezleri (field_id -> (lon, lat))."""
+    return {f.field_id: Geometry.from_geojson(f.geometry).centroid for f in fields if f.geometry}
+
+
+class RouteOptimizer:
+    """Pilotun günlük görevlerini uçuş sırasına dizen servis (KR-015).
+
+    En yakın komşu turu ile başlar, zaman bütçesi içinde 2-opt ve
+    Or-opt (1-3 durak taşıma, ters çevirerek de) hamleleriyle iyileştirir. Açık yol
+    modellenir: pilot başlangıç noktasından (verilmişse) çıkar, dönüş
+    yoktur. Amaç sözlük sıralıdır: önce toplam pencere gecikmesi, sonra
+    toplam mesafe.
+
+    Args:
+        speed_kmh: Tarlalar arası ortalama yol hızı.
+        time_budget_s: Rota başına iyileştirme süresi üst sınırı.
+        distance_matrix: Paylaşılan mesafe önbelleği (verilmezse yeni oluşturulur).
+    """
+
+    def __init__(
+        self,
+        *,
+        speed_kmh: float = 60.0,
+        time_budget_s: float = 0.05,
+        distance_matrix: DistanceMatrix | None = None,
+    ) -> None:
+        if speed_kmh <= 0:
+            raise RouteOptimizationError("speed_kmh > 0 olmalıdır.")
+        self.speed_kmh = speed_kmh
+        self.time_budget_s = time_budget_s
+        self.distances = distance_matrix or DistanceMatrix()
+
+    def optimize_route(
+        self,
+        stops: Sequence[ScheduledSlot],
+        centroids: Mapping[uuid.UUID, LonLat],
+        *,
+        windows: Mapping[uuid.UUID, TimeWindow] | None = None,
+        start: LonLat | None = None,
+    ) -> DailyRoute:
+        """Tek pilotun tek günlük görevlerini sıralar.
+
+        Args:
+            stops: Aynı pilot ve güne ait planlanmış görevler.
+            centroids: field_id -> (lon, lat) tarla merkezi.
+            windows: demand_id -> zaman penceresi (opsiyonel).
+            start: Pilotun güne başladığı konum (opsiyonel).
+
+        Returns:
+            DailyRoute: Sıralı duraklar, mesafe ve gecikme.
+
+        Raises:
+            RouteOptimizationError: Duraklar farklı pilot/güne aitse ya da tarla konumu yoksa.
+        """
+        if not stops:
+            raise RouteOptimizationError("Rota için en az bir görev gerekir.")
+        if len({(s.pilot_id, s.scheduled_date) for s in stops}) != 1:
+            raise RouteOptimizationError("Rota tek pilot ve tek güne ait görevlerden oluşmalıdır.")
+
+        ordered = sorted(stops, key=lambda s: s.demand_id)
+        for s in ordered:
+            if s.field_id not in centroids:
+                raise RouteOptimizationError(f"Tarla konumu bilinmiyor: {s.field_id}")
+            self.distances.add(s.field_id, centroids[s.field_id])
+
+        windows = windows or {}
+        tour = _Tour(
+            dist=self.distances.matrix([s.field_id for s in ordered]),
+            from_start=[haversine_km(start, centroids[s.field_id]) if start else 0.0 for s in ordered],
+            service=[float(s.estimated_duration_minutes) for s in ordered],
+            windows=[windows.get(s.demand_id) for s in ordered],
+            km_per_minute=self.speed_kmh / 60.0,
+        )
+        order = tour.nearest_neighbour()
+        initial_km = tour.evaluate(order)[1]
+        order = tour.improve(order, deadline=time.monotonic() + self.time_budget_s)
+
+        lateness, distance_km, starts = tour.evaluate(order, with_starts=True)
+        first = ordered[0]
+        return DailyRoute(
+            pilot_id=first.pilot_id,
+            route_date=first.scheduled_date,
+            stops=tuple(
+                RouteStop(
+                    demand_id=ordered[i].demand_id,
+                    field_id=ordered[i].field_id,
+                    sequence=seq,
+                    start_minute=start_minute,
+                    lateness_minutes=late,
+                )
+                for seq, (i, (start_minute, late)) in enumerate(zip(order, starts, strict=True), start=1)
+            ),
+            distance_km=distance_km,
+            lateness_minutes=lateness,
+            initial_distance_km=initial_km,
+        )
+
+    def plan_routes(
+        self,
+        result: ScheduleResult,
+        centroids: Mapping[uuid.UUID, LonLat],
+        *,
+        windows: Mapping[uuid.UUID, TimeWindow] | None = None,
+        starts: Mapping[uuid.UUID, LonLat] | None = None,
+    ) -> tuple[DailyRoute, ...]:
+        """ScheduleResult içindeki her (pilot, gün) için rota üretir (ilk görülme sırasıyla)."""
+        groups: dict[tuple[uuid.UUID, date], list[ScheduledSlot]] = {}
+        for item in result.scheduled:
+            groups.setdefault((item.pilot_id, item.scheduled_date), []).append(item)
+        starts = starts or {}
+        return tuple(
+            self.optimize_route(items, centroids, windows=windows, start=starts.get(pilot_id))
+            for (pilot_id, _), items in groups.items()
+        )
+
+    def order_schedule(
+        self,
+        result: ScheduleResult,
+        centroids: Mapping[uuid.UUID, LonLat],
+        *,
+        windows: Mapping[uuid.UUID, TimeWindow] | None = None,
+        starts: Mapping[uuid.UUID, LonLat] | None = None,
+    ) -> ScheduleResult:
+        """PlanningEngine sonucuna rota sıralaması uygular (post-processing).
+
+        Atamalar değişmez; scheduled listesi (pilot, gün) grupları içinde
+        uçuş sırasına dizilir ve route_sequence doldurulur. Pencere dışı
+        kalan görevler için uyarı eklenir.
+        """
+        routes = self.plan_routes(result, centroids, windows=windows, starts=starts)
+        by_demand = {item.demand_id: item for item in result.scheduled}
+        scheduled: list[ScheduledSlot] = []
+        warnings = list(result.warnings)
+        for route in routes:
+            for stop in route.stops:
+                scheduled.append(replace(by_demand[stop.demand_id], route_sequence=stop.sequence))
+            late = sum(1 for stop in route.stops if stop.lateness_minutes > _EPS)
+            if late:
+                warnings.append(
+                    f"Pilot {route.pilot_id} {route.route_date.isoformat()}: {late} görev zaman penceresi "
+                    f"dışında (toplam gecikme {route.lateness_minutes:.0f} dk)."
+                )
+        return replace(result, scheduled=tuple(scheduled), warnings=tuple(warnings))
+
+
+class _Tour:
+    """Açık yol turu için değerlendirme ve yerel arama (indeks tabanlı)."""
+
+    def __init__(
+        self,
+        *,
+        dist: list[list[float]],
+        from_start: list[float],
+        service: list[float],
+        windows: list[TimeWindow | None],
+        km_per_minute: float,
+    ) -> None:
+        self.dist = dist
+        self.from_start = from_start
+        self.service = service
+        self.windows = windows
+        self.km_per_minute = km_per_minute
+        self.has_windows = any(w is not None for w in windows)
+
+    def leg(self, a: int | None, b: int) -> float:
+        return self.from_start[b] if a is None else self.dist[a][b]
+
+    def evaluate(
+        self, order: Sequence[int], *, with_starts: bool = False
+    ) -> tuple[float, float, list[tuple[float, float]]]:
+        """(toplam gecikme dk, toplam mesafe km, [(başlama dk, gecikme dk)])."""
+        clock = distance = lateness = 0.0
+        starts: list[tuple[float, float]] = []
+        prev: int | None = None
+        for i in order:
+            leg = self.leg(prev, i)
+            distance += leg
+            clock += leg / self.km_per_minute
+            late = 0.0
+            window = self.windows[i]
+            if window is not None:
+                clock = max(clock, window.earliest_minute)
+                late = max(0.0, clock - window.latest_minute)
+                lateness += late
+            if with_starts:
+                starts.append((clock, late))
+            clock += self.service[i]
+            prev = i
+        return lateness, distance, starts
+
+    def cost(self, order: Sequence[int]) -> tuple[float, float]:
+        lateness, distance, _ = self.evaluate(order)
+        return lateness, distance
+
+    def nearest_neighbour(self) -> list[int]:
+        n = len(self.service)
+        remaining = set(range(n))
+        # Başlangıç noktası yoksa ilk durak en erken kapanan pencere (yoksa en küçük indeks).
+        first = min(
+            remaining,
+            key=lambda i: (
+                self.from_start[i],
+                self.windows[i].latest_minute if self.windows[i] else math.inf,
+                i,
+            ),
+        )
+        order = [first]
+        remaining.discard(first)
+        while remaining:
+            last = order[-1]
+            nxt = min(remaining, key=lambda i: (self.dist[last][i], i))
+            order.append(nxt)
+            remaining.discard(nxt)
+        return order
+
+    def improve(self, order: list[int], *, deadline: float) -> list[int]:
+        best = list(order)
+        best_cost = self.cost(best)
+        improved = True
+        while improved and time.monotonic() < deadline:
+            improved = False
+            for delta, build in self._moves(best):
+                # Gecikme yokken yalnızca mesafeyi kısaltan hamleler değerlendirilir.
+                if delta >= -_EPS and not (self.has_windows and best_cost[0] > _EPS):
+                    continue
+                candidate = build()
+                cand_cost = self.cost(candidate) if self.has_windows else (0.0, best_cost[1] + delta)
+                if _better(cand_cost, best_cost):
+                    best, best_cost, improved = candidate, cand_cost, True
+                    break
+                if time.monotonic() >= deadline:
+                    break
+        return best
+
+    def _moves(self, order: list[int]) -> Iterable[tuple[float, Callable[[], list[int]]]]:
+        """2-opt ve Or-opt hamleleri; (mesafe farkı, aday turu üreten fonksiyon)."""
+        n = len(order)
+        dist = self.dist
+        # 2-opt: order[i..j] ters çevrilir.
+        for i in range(n - 1):
+            prev = order[i - 1] if i > 0 else None
+            for j in range(i + 1, n):
+                nxt = order[j + 1] if j + 1 < n else None
+                before = self.leg(prev, order[i]) + (dist[order[j]][nxt] if nxt is not None else 0.0)
+                after = self.leg(prev, order[j]) + (dist[order[i]][nxt] if nxt is not None else 0.0)
+                yield after - before, lambda i=i, j=j: order[:i] + order[i : j + 1][::-1] + order[j + 1 :]
+        # Or-opt: 1-3 duraklık segment (düz ya da ters) başka konuma taşınır.
+        for length in (1, 2, 3):
+            for i in range(n - length + 1):
+                segment = order[i : i + length]
+                rest = order[:i] + order[i + length :]
+                prev = order[i - 1] if i > 0 else None
+                nxt = order[i + length] if i + length < n else None
+                removal = (
+                    (self.leg(prev, nxt) if nxt is not None else 0.0)
+                    - self.leg(prev, segment[0])
+                    - (dist[segment[-1]][nxt] if nxt is not None else 0.0)
+                )
+                variants = (segment, segment[::-1]) if length > 1 else (segment,)
+                for k in range(len(rest) + 1):
+                    a = rest[k - 1] if k > 0 else None
+                    b = rest[k] if k < len(rest) else None
+                    for seg in variants:
+                        if k == i and seg is segment:
+                            continue
+                        insertion = (
+                            self.leg(a, seg[0])
+                            + (dist[seg[-1]][b] if b is not None else 0.0)
+                            - (self.leg(a, b) if b is not None else 0.0)
+                        )
+                        yield removal + insertion, lambda rest=rest, seg=seg, k=k: rest[:k] + seg + rest[k:]
+
+
+def _better(candidate: tuple[float, float], current: tuple[float, float]) -> bool:
+    if candidate[0] < current[0] - _EPS:
+        return True
+    return abs(candidate[0] - current[0]) <= _EPS and candidate[1] < current[1] - _EPS
@@ -0,0 +1,128 @@
+# PATH: src/core/domain/services/slot_index.py
+# DESC: PlanningEngine için (il, tarih) kovalı pilot slot indeksi (KR-015).
+
+from __future__ import annotations
+
+import heapq
+import uuid
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.core.domain.services.planning_engine import PilotSlot
+
+
+class SlotIndex:
+    """Pilot slotlarını (province_code, date) kovalarında tutan eşleştirme indeksi.
+
+    Greedy planlayıcının seçim sırasını birebir korur: uygun slotlar
+    (pilotun toplam atama sayısı, tarih, slotun ilk görülme sırası)
+    anahtarına göre en küçükten seçilir. Her kova bu anahtarın
+    (atama sayısı, sıra) kısmı için bir min-heap tutar; pilotun atama
+    sayısı yalnızca artabildiği için heap girdileri tembel (lazy) olarak
+    güncellenir.
+
+    Talep penceresi il bazlı sıralı tarih listesi üzerinde bisect ile
+    daraltılır; bir talebin maliyeti toplam slot sayısından bağımsız,
+    pencere gün sayısı × log(kova boyutu) mertebesindedir.
+    """
+
+    def __init__(self, pilot_slots: Iterable[PilotSlot]) -> None:
+        capacity: dict[tuple[uuid.UUID, date], int] = {}
+        province: dict[tuple[uuid.UUID, date], str] = {}
+        for slot in pilot_slots:
+            key = (slot.pilot_id, slot.date)
+            capacity[key] = slot.remaining_capacity
+            province[key] = slot.province_code
+
+        self._capacity = capacity
+        self._pilot_assigned: dict[uuid.UUID, int] = {}
+        self._buckets: dict[str, dict[date, list[tuple[int, int, uuid.UUID]]]] = {}
+
+        for order, ((pilot_id, slot_date), cap) in enumerate(capacity.items()):
+            if cap <= 0:
+                continue
+            by_date = self._buckets.setdefault(province[(pilot_id, slot_date)], {})
+            by_date.setdefault(slot_date, []).append((0, order, pilot_id))
+
+        self._dates: dict[str, list[date]] = {}
+        for province_code, by_date in self._buckets.items():
+            for heap in by_date.values():
+                heapq.heapify(heap)
+            self._dates[province_code] = sorted(by_date)
+
+    @property
+    def pilot_assigned(self) -> dict[uuid.UUID, int]:
+        """Pilot bazında yapılan atama sayıları."""
+        return self._pilot_assigned
+
+    def remaining(self, pilot_id: uuid.UUID, slot_date: date) -> int:
+        """Slotun kalan kapasitesi (bilinmeyen slot için 0)."""
+        return self._capacity.get((pilot_id, slot_date), 0)
+
+    def reserve(self, pilot_id: uuid.UUID, slot_date: date) -> None:
+        """Mevcut (sabitlenmiş) bir atamayı indekse işler.
+
+        Kapasiteden düşer ve pilot atama sayısını artırır; heap girdileri
+        bir sonraki take() çağrısında tembel olarak güncellenir.
+        """
+        self._capacity[(pilot_id, slot_date)] -= 1
+        self._pilot_assigned[pilot_id] = self._pilot_assigned.get(pilot_id, 0) + 1
+
+    def take(
+        self,
+        province_code: str,
+        earliest_date: date,
+        latest_date: date,
+    ) -> tuple[uuid.UUID, date] | None:
+        """Pencere içindeki en uygun slotu seçer ve kapasitesinden düşer.
+
+        Args:
+            province_code: Talebin il kodu.
+            earliest_date: Pencere başlangıcı (dahil).
+            latest_date: Pencere bitişi (dahil).
+
+        Returns:
+            (pilot_id, tarih) ya da uygun slot yoksa None.
+        """
+        dates = self._dates.get(province_code)
+        if not dates:
+            return None
+
+        by_date = self._buckets[province_code]
+        best: tuple[int, date, int, uuid.UUID] | None = None
+        for slot_date in dates[bisect_left(dates, earliest_date) : bisect_right(dates, latest_date)]:
+            top = self._peek(by_date[slot_date], slot_date)
+            if top is None:
+                continue
+            candidate = (top[0], slot_date, top[1], top[2])
+            if best is None or candidate < best:
+                best = candidate
+
+        if best is None:
+            return None
+
+        _, slot_date, _, pilot_id = best
+        self._capacity[(pilot_id, slot_date)] -= 1
+        self._pilot_assigned[pilot_id] = self._pilot_assigned.get(pilot_id, 0) + 1
+        return pilot_id, slot_date
+
+    def _peek(
+        self,
+        heap: list[tuple[int, int, uuid.UUID]],
+        slot_date: date,
+    ) -> tuple[int, int, uuid.UUID] | None:
+        """Kovanın güncel en iyi girdisini döner; dolu/eski girdileri temizler."""
+        while heap:
+            assigned, order, pilot_id = heap[0]
+            if self._capacity[(pilot_id, slot_date)] <= 0:
+                heapq.heappop(heap)
+                continue
+            current = self._pilot_assigned.get(pilot_id, 0)
+            if current != assigned:
+                heapq.heapreplace(heap, (current, order, pilot_id))
+                continue
+            return heap[0]
+        return None
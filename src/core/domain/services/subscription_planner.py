@@ -99,7 +99,7 @@ class SubscriptionPlanner:
         Raises:
             SubscriptionPlanningError: Geçersiz yapılandırma.
         """
-        self._validate_config(config)
+        self.validate_config(config)
 
         analyses: list[ScheduledAnalysis] = []
         current_date = config.start_date
@@ -232,8 +232,12 @@ class SubscriptionPlanner:
             return None
         return min(future, key=lambda a: a.scheduled_date)
 
-    def _validate_config(self, config: SubscriptionConfig) -> None:
-        """Abonelik yapılandırmasını doğrular."""
+    def validate_config(self, config: SubscriptionConfig) -> None:
+        """Abonelik yapılandırmasını doğrular.
+
+        Raises:
+            SubscriptionPlanningError: Geçersiz yapılandırma.
+        """
         if config.start_date > config.end_date:
             raise SubscriptionPlanningError(
                 "start_date, end_date'den sonra olamaz."
@@ -0,0 +1,116 @@
+# PATH: src/core/domain/value_objects/equal_area.py
+# DESC: WGS84 elipsoidal Albers eşit alan projeksiyonu; bölge başına önbellekli parametreler (KR-016).
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import shapely
+
+# WGS84
+_A = 6_378_137.0
+_E2 = 0.0066943799901413165
+_E = math.sqrt(_E2)
+
+# Bölge ızgarası: 6° boylam (UTM dilimleriyle hizalı) × 3° enlem bandı.
+ZONE_LON_DEG = 6.0
+ZONE_LAT_DEG = 3.0
+
+M2_PER_DONUM = 1000.0
+
+
+@dataclass(frozen=True, slots=True)
+class AlbersZone:
+    """Tek bölgenin Albers eşit alan parametreleri (Snyder 1987, 14-1..14-6).
+
+    Standart paralellerin bant kenarlarından bant genişliğinin 1/6'sı içeride
+    seçilmesi bölge içindeki uzunluk ölçek hatasını ~3e-4 altında tutar;
+    alan projeksiyonun tanımı gereği her yerde korunur.
+    """
+
+    lon0: float  # Merkez boylam (derece)
+    lat0: float  # Başlangıç enlemi (derece)
+    n: float
+    c: float
+    rho0: float
+
+    def project(self, lon: np.ndarray, lat: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Derece (lon, lat) → metre (x, y)."""
+        rho = _A * np.sqrt(self.c - self.n * _q(np.radians(lat))) / self.n
+        theta = self.n * np.radians(np.asarray(lon, dtype=np.float64) - self.lon0)
+        return rho * np.sin(theta), self.rho0 - rho * np.cos(theta)
+
+    def transform(self, coords: np.ndarray) -> np.ndarray:
+        """shapely.transform uyumlu (k, 2) koordinat dönüşümü."""
+        x, y = self.project(coords[:, 0], coords[:, 1])
+        return np.column_stack((x, y))
+
+
+def _q(phi: np.ndarray | float) -> np.ndarray:
+    sin_phi = np.sin(phi)
+    e_sin = _E * sin_phi
+    return (1.0 - _E2) * (sin_phi / (1.0 - e_sin * e_sin) - np.log((1.0 - e_sin) / (1.0 + e_sin)) / (2.0 * _E))
+
+
+def _m(phi: float) -> float:
+    return math.cos(phi) / math.sqrt(1.0 - _E2 * math.sin(phi) ** 2)
+
+
+@lru_cache(maxsize=512)
+def albers_zone(lon_index: int, lat_index: int) -> AlbersZone:
+    """Bölge indeksinin projeksiyonu; süreç boyunca bir kez hesaplanır."""
+    west, south = lon_index * ZONE_LON_DEG - 180.0, lat_index * ZONE_LAT_DEG - 90.0
+    inset = ZONE_LAT_DEG / 6.0
+    lat1 = math.radians(min(max(south + inset, -89.0), 89.0))
+    lat2 = math.radians(min(max(south + ZONE_LAT_DEG - inset, -89.0), 89.0))
+    lat0 = south + ZONE_LAT_DEG / 2.0
+    q1, q2, q0 = float(_q(lat1)), float(_q(lat2)), float(_q(math.radians(lat0)))
+    m1, m2 = _m(lat1), _m(lat2)
+    # Bantlar ekvatorda bölündüğünden paraleller simetrik olmaz; n sıfırdan farklıdır.
+    n = (m1 * m1 - m2 * m2) / (q2 - q1)
+    c = m1 * m1 + n * q1
+    return AlbersZone(
+        lon0=west + ZONE_LON_DEG / 2.0,
+        lat0=lat0,
+        n=n,
+        c=c,
+        rho0=_A * math.sqrt(c - n * q0) / n,
+    )
+
+
+def project_geometries(geometries: np.ndarray) -> np.ndarray:
+    """Geometri dizisini (derece) ağırlık merkezinin bölgesinde metreye projekte eder.
+
+    Aynı bölgedeki geometriler tek shapely.transform çağrısıyla dönüştürülür.
+    """
+    geometries = np.asarray(geometries, dtype=object)
+    projected = np.empty(len(geometries), dtype=object)
+    if len(geometries) == 0:
+        return projected
+    centroids = shapely.centroid(geometries)
+    lon, lat = np.nan_to_num(shapely.get_x(centroids)), np.nan_to_num(shapely.get_y(centroids))
+    lon_index = np.floor((lon + 180.0) / ZONE_LON_DEG).astype(np.int64) % int(360 / ZONE_LON_DEG)
+    lat_index = np.minimum(np.floor((lat + 90.0) / ZONE_LAT_DEG).astype(np.int64), int(180 / ZONE_LAT_DEG) - 1)
+    keys = lon_index * 1000 + lat_index
+    for key in np.unique(keys).tolist():
+        members = keys == key
+        projected[members] = shapely.transform(geometries[members], albers_zone(key // 1000, key % 1000).transform)
+    return projected
+
+
+def areas_m2(geometries: np.ndarray) -> np.ndarray:
+    """Geometri dizisinin elipsoid üzerindeki alanları (m²); None/boş için 0."""
+    return np.nan_to_num(shapely.area(project_geometries(geometries)))
+
+
+def lengths_m(geometries: np.ndarray) -> np.ndarray:
+    """Geometri dizisinin çevre/uzunlukları (m); bölge içi ölçek hatası ~3e-4."""
+    return np.nan_to_num(shapely.length(project_geometries(geometries)))
+
+
+def quadrangle_area_m2(west: float, south: float, east: float, north: float) -> float:
+    """Enlem/boylam dörtgeninin kesin elipsoid alanı (m²): a²/2 · Δλ · (q(φ2) - q(φ1))."""
+    return _A * _A / 2.0 * math.radians(east - west) * float(_q(math.radians(north)) - _q(math.radians(south)))
@@ -3,12 +3,32 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import weakref
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, cast
 
+import numpy as np
+import shapely
 from shapely.geometry import MultiPolygon, Point, Polygon
 from shapely.geometry import mapping as shapely_mapping
 from shapely.geometry import shape as shapely_shape
+from shapely.prepared import PreparedGeometry
+
+from src.core.domain.value_objects import equal_area
+
+# WKB özeti → hazırlanmış geometri. Değerler zayıf referanslıdır: girdi, onu
+# kullanan son Geometry örneği bellekten çıkınca kendiliğinden düşer.
+_PREPARED: weakref.WeakValueDictionary[bytes, PreparedGeometry] = weakref.WeakValueDictionary()
+_PREPARED_LOCK = threading.Lock()
+
+
+def prepared_geometry_count() -> int:
+    """Süreç genelindeki hazırlanmış geometri önbelleğinin canlı girdi sayısı."""
+    return len(_PREPARED)
 
 
 class GeometryError(Exception):
@@ -92,6 +112,16 @@ class Geometry:
         """
         return cls(_shape=Point(longitude, latitude))
 
+    @classmethod
+    def from_shapely(cls, shape: Polygon | MultiPolygon | Point) -> Geometry:
+        """Shapely geometri nesnesinden Geometry oluşturur (doğrulama __post_init__'te)."""
+        return cls(_shape=shape)
+
+    @property
+    def shape(self) -> Polygon | MultiPolygon | Point:
+        """Alttaki Shapely geometri (salt okunur; Shapely geometrileri değişmezdir)."""
+        return self._shape
+
     @property
     def geom_type(self) -> str:
         """Geometri tipi (Polygon, MultiPolygon, Point)."""
@@ -99,9 +129,34 @@ class Geometry:
 
     @property
     def area(self) -> float:
-        """Geometri alanı (derece kare; kesin hesap için projeksiyon gerekir)."""
+        """Geometri alanı (derece kare; metrik alan için area_m2)."""
         return float(self._shape.area)
 
+    @cached_property
+    def area_m2(self) -> float:
+        """WGS84 elipsoidi üzerindeki alan (m²); bölgesel Albers eşit alan projeksiyonuyla.
+
+        Değer nesnesi değişmez olduğundan ilk çağrıda hesaplanıp örnekte saklanır.
+        """
+        return float(equal_area.areas_m2(np.array([self._shape], dtype=object))[0])
+
+    @property
+    def area_donum(self) -> float:
+        """Alan (dönüm = 1.000 m²)."""
+        return self.area_m2 / equal_area.M2_PER_DONUM
+
+    @cached_property
+    def length_m(self) -> float:
+        """Çevre (Polygon) ya da uzunluk (m); bölgesel Albers projeksiyonunda."""
+        return float(equal_area.lengths_m(np.array([self._shape], dtype=object))[0])
+
+    @staticmethod
+    def areas_m2(geometries: Sequence[Geometry]) -> np.ndarray:
+        """Toplu metrik alan (m², float64); aynı bölgedeki geometriler tek çağrıda projekte edilir."""
+        shapes = np.empty(len(geometries), dtype=object)
+        shapes[:] = [g._shape for g in geometries]
+        return equal_area.areas_m2(shapes)
+
     @property
     def centroid(self) -> tuple[float, float]:
         """Ağırlık merkezi (longitude, latitude)."""
@@ -114,13 +169,41 @@ class Geometry:
         bounds = self._shape.bounds
         return (float(bounds[0]), float(bounds[1]), float(bounds[2]), float(bounds[3]))
 
+    @cached_property
+    def _wkb_key(self) -> bytes:
+        """Geometrinin WKB özeti (128 bit); örnek başına bir kez hesaplanır."""
+        return hashlib.blake2b(shapely.to_wkb(self._shape), digest_size=16).digest()
+
+    @property
+    def wkb_digest(self) -> bytes:
+        """Hash ve önbellek anahtarı olarak kullanılan WKB özeti."""
+        return self._wkb_key
+
+    @cached_property
+    def _prepared(self) -> PreparedGeometry:
+        """Aynı WKB'ye sahip tüm örneklerin paylaştığı hazırlanmış geometri.
+
+        Örnek referansı tuttuğu sürece önbellek girdisi canlı kalır.
+        """
+        key = self._wkb_key
+        with _PREPARED_LOCK:
+            prepared = _PREPARED.get(key)
+            if prepared is None:
+                prepared = PreparedGeometry(self._shape)
+                _PREPARED[key] = prepared
+        return prepared
+
     def contains(self, other: Geometry) -> bool:
         """Bu geometri diğer geometriyi içeriyor mu?"""
-        return bool(self._shape.contains(other._shape))
+        return bool(self._prepared.contains(other._shape))
+
+    def covers(self, other: Geometry) -> bool:
+        """Diğer geometrinin hiçbir noktası bu geometrinin dışında değil mi?"""
+        return bool(self._prepared.covers(other._shape))
 
     def intersects(self, other: Geometry) -> bool:
         """Bu geometri diğer geometriyle kesişiyor mu?"""
-        return bool(self._shape.intersects(other._shape))
+        return bool(self._prepared.intersects(other._shape))
 
     def intersection(self, other: Geometry) -> Geometry:
         """İki geometrinin kesişimini döner."""
@@ -137,8 +220,10 @@ class Geometry:
         - >= 0.80: KISMİ + opsiyonel inceleme
         - < 0.80: TEKRAR UÇUŞ veya itiraz
         """
-        if self._shape.area == 0:
+        if self._shape.area == 0 or not other._prepared.intersects(self._shape):
             return 0.0
+        if other._prepared.covers(self._shape):
+            return 1.0
         intersection_area = float(self._shape.intersection(other._shape).area)
         return intersection_area / float(self._shape.area)
 
@@ -152,11 +237,18 @@ class Geometry:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Geometry):
-            return bool(self._shape.equals(other._shape))
+            # Aynı WKB kesin eşittir; topolojik karşılaştırma yalnızca farklı kodlamalarda yapılır.
+            return self is other or self._wkb_key == other._wkb_key or bool(self._shape.equals(other._shape))
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self._shape.wkt)
+        return hash(self._wkb_key)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Hazırlanmış geometri pickle edilemez; açıldıktan sonra ilk predikatta _PREPARED'dan yeniden alınır.
+        state = dict(self.__dict__)
+        state.pop("_prepared", None)
+        return state
 
     def __repr__(self) -> str:
         return f"Geometry(type='{self.geom_type}', bounds={self.bounds})"
@@ -0,0 +1,28 @@
+# PATH: src/infrastructure/config/seasonal_config.py
+# DESC: seasonal_config.yaml okuyucusu; bitki bazlı tarama periyodu politikası (KR-024).
+"""
+seasonal_config.yaml → SeasonalScanPolicy.
+
+Dosya yolu TARLA_SEASONAL_CONFIG_PATH ile değiştirilebilir; varsayılan
+repo kökündeki seasonal_config.yaml'dır. Sonuç süreç boyunca önbelleğe alınır.
+"""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+from src.application.services.season_schedule_generator import SeasonalScanPolicy
+
+_DEFAULT_PATH = Path(__file__).resolve().parents[3] / "seasonal_config.yaml"
+
+
+@lru_cache
+def load_seasonal_scan_policy(path: str | None = None) -> SeasonalScanPolicy:
+    """seasonal_config.yaml'daki crops.*.scanning_frequency_days değerlerini yükler."""
+    config_path = Path(path or os.getenv("TARLA_SEASONAL_CONFIG_PATH") or _DEFAULT_PATH)
+    with config_path.open(encoding="utf-8") as handle:
+        raw = yaml.safe_load(handle) or {}
+    return SeasonalScanPolicy.from_mapping(raw)
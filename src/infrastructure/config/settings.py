@@ -150,12 +150,26 @@ class Settings(BaseSettings):
     sms_sender_id: str = "TARLAANLZ"
     sms_timeout_seconds: int = 15
 
+    # ------------------------------------------------------------------
+    # Outbound HTTP client havuzu (HttpClientRegistry)
+    # ------------------------------------------------------------------
+    http_max_connections_per_host: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False  # `h2` paketi kurulu değilse HTTP/1.1'e düşer
+
     # ------------------------------------------------------------------
     # TKGM / MEGSİS WFS
     # ------------------------------------------------------------------
     tkgm_wfs_base_url: str = ""
     tkgm_wfs_timeout_seconds: int = 30
     tkgm_cache_ttl_seconds: int = 86400  # 24 saat
+    tkgm_cache_stale_seconds: int = 3600  # TTL sonrası arka planda yenilenirken bayat değer sunulur
+    tkgm_cache_negative_ttl_seconds: int = 3600  # Bulunamayan parseller
+    tkgm_cache_max_bytes: int = 64 * 1024 * 1024  # Worker başına L1
+    tkgm_batch_max_url_length: int = 6000  # GetFeature URL üst sınırı (proxy limitlerinin altında)
+    tkgm_max_concurrency: int = 4
+    tkgm_requests_per_second: float = 8.0  # Host başına
 
     # ------------------------------------------------------------------
     # Weather API
@@ -4,6 +4,8 @@
 Port interface'leri core'da tanımlıdır; burada yalnızca implementasyonlar bulunur.
 """
 
+from src.infrastructure.external.http_clients import HttpClientRegistry, get_http_client_registry
+from src.infrastructure.external.parcel_geometry_cache import CacheStats, ParcelGeometryCache
 from src.infrastructure.external.payment_gateway_adapter import PaymentGatewayAdapter
 from src.infrastructure.external.sms_gateway_adapter import SMSGatewayAdapter
 from src.infrastructure.external.storage_adapter import S3StorageAdapter
@@ -11,10 +13,14 @@ from src.infrastructure.external.tkgm_megsis_wfs_adapter import TKGMMegsisWFSAda
 from src.infrastructure.external.weather_api_adapter import WeatherAPIAdapter, WeatherData
 
 __all__: list[str] = [
+    "CacheStats",
+    "HttpClientRegistry",
+    "ParcelGeometryCache",
     "PaymentGatewayAdapter",
     "SMSGatewayAdapter",
     "S3StorageAdapter",
     "TKGMMegsisWFSAdapter",
     "WeatherAPIAdapter",
     "WeatherData",
+    "get_http_client_registry",
 ]
@@ -0,0 +1,189 @@
+# PATH: src/infrastructure/external/http_clients.py
+# DESC: Dış servis adapter'larının paylaştığı havuzlu httpx client registry'si.
+"""
+HTTP client registry: adapter'lar istek başına client açmak yerine ödünç alır.
+
+Amaç: Dış servis çağrılarında TCP/TLS kurulumunu her istekte tekrarlamamak.
+  Her client yapılandırması (base_url, başlıklar, kimlik, timeout, limitler)
+  için tek bir httpx.AsyncClient açılır; keep-alive havuzu o yapılandırmayı
+  kullanan tüm adapter örneklerince paylaşılır.
+
+Sorumluluk: Client oluşturma, bağlantı limitleri (adapter/host başına),
+  opsiyonel HTTP/2, kapatma. FastAPI lifespan'ı çıkışta aclose() çağırır.
+  Client'ı kendisi kapatmak isteyen adapter acquire/release ile sahiplik
+  referansı tutar; client son referans bırakılınca kapanır.
+
+Güvenlik (RBAC/PII/Audit):
+  Başlık ve kimlik bilgileri repr/log'a yazılmaz.
+
+Hata Modları (idempotency/retry/rate limit):
+  HTTP/2 için `h2` paketi yoksa HTTP/1.1 ile devam edilir (uyarı loglanır).
+  Kapatılmış client ödünç alınırsa yeniden oluşturulur.
+
+Observability (log fields/metrics/traces):
+  http_client_created (name, http2, max_connections), http_clients_closed (count).
+
+Testler: Unit test (paylaşım, referans sayımlı bırakma, kapatma), performance (yerel TLS stub, çekirdek sayısına göre 200/500 rps).
+Bağımlılıklar: httpx, structlog; opsiyonel h2.
+Notlar/SSOT: Client'lar oluşturuldukları event loop'a bağlıdır; registry
+  uygulama ömrü boyunca tek loop'ta kullanılır.
+"""
+from __future__ import annotations
+
+import importlib.util
+import ssl
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Optional, Union
+
+import httpx
+import structlog
+
+from src.infrastructure.config.settings import Settings
+
+logger = structlog.get_logger(__name__)
+
+_H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HttpClientConfig:
+    """Tek bir paylaşılan client'ın yapılandırması; registry anahtarıdır."""
+
+    name: str
+    base_url: str
+    timeout_seconds: float
+    headers: tuple[tuple[str, str], ...] = field(default=(), repr=False)
+    auth: Optional[tuple[str, str]] = field(default=None, repr=False)
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = False
+    verify: Union[bool, ssl.SSLContext] = field(default=True, repr=False)  # Özel CA için SSLContext
+    transport: Optional[httpx.AsyncBaseTransport] = field(default=None, repr=False)
+
+
+def client_config(
+    settings: Settings,
+    *,
+    name: str,
+    base_url: str,
+    timeout_seconds: float,
+    headers: Optional[dict[str, str]] = None,
+    auth: Optional[tuple[str, str]] = None,
+    max_connections: Optional[int] = None,
+    verify: Union[bool, ssl.SSLContext] = True,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> HttpClientConfig:
+    """Ayarlardaki havuz varsayılanlarıyla adapter client yapılandırması."""
+    connections = max_connections or settings.http_max_connections_per_host
+    return HttpClientConfig(
+        name=name,
+        base_url=base_url,
+        timeout_seconds=timeout_seconds,
+        headers=tuple(sorted((headers or {}).items())),
+        auth=auth,
+        max_connections=connections,
+        max_keepalive_connections=min(settings.http_max_keepalive_connections, connections),
+        keepalive_expiry_seconds=settings.http_keepalive_expiry_seconds,
+        http2=settings.http2_enabled,
+        verify=verify,
+        transport=transport,
+    )
+
+
+class HttpClientRegistry:
+    """Yapılandırma başına tek httpx.AsyncClient.
+
+    Kullanım:
+        registry = HttpClientRegistry()
+        async with registry.borrow(config) as client:   # client kapatılmaz
+            response = await client.get("/current")
+        await registry.aclose()                          # lifespan çıkışı
+
+    Kendi kapanışını yöneten adapter:
+        registry.acquire(config)                         # __init__
+        await registry.release(config)                   # adapter.aclose()
+    """
+
+    def __init__(self) -> None:
+        self._clients: dict[HttpClientConfig, httpx.AsyncClient] = {}
+        self._owners: dict[HttpClientConfig, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def client(self, config: HttpClientConfig) -> httpx.AsyncClient:
+        """Yapılandırmanın paylaşılan client'ı; yoksa ya da kapatılmışsa oluşturur."""
+        client = self._clients.get(config)
+        if client is None or client.is_closed:
+            client = self._clients[config] = self._create(config)
+        return client
+
+    def borrow(self, config: HttpClientConfig) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """`async with` ile kullanılabilen, çıkışta client'ı kapatmayan ödünç alma."""
+        return self._borrow(self.client(config))
+
+    @staticmethod
+    @asynccontextmanager
+    async def _borrow(client: httpx.AsyncClient) -> AsyncIterator[httpx.AsyncClient]:
+        yield client
+
+    def acquire(self, config: HttpClientConfig) -> None:
+        """Yapılandırmanın client'ı için sahiplik referansı alır; release ile bırakılır."""
+        self._owners[config] = self._owners.get(config, 0) + 1
+
+    async def release(self, config: HttpClientConfig) -> None:
+        """Sahiplik referansını bırakır; son referansta client'ı kapatır ve registry'den çıkarır.
+
+        Başka sahibi olan client açık kalır; referansı hiç alınmamış
+        yapılandırmanın client'ı doğrudan kapatılır.
+        """
+        owners = self._owners.pop(config, 0) - 1
+        if owners > 0:
+            self._owners[config] = owners
+            return
+        client = self._clients.pop(config, None)
+        if client is not None:
+            await client.aclose()
+
+    async def aclose(self) -> None:
+        """Tüm client'ları kapatır (uygulama kapanışı)."""
+        clients, self._clients = list(self._clients.values()), {}
+        self._owners.clear()
+        for client in clients:
+            await client.aclose()
+        logger.info("http_clients_closed", count=len(clients))
+
+    @staticmethod
+    def _create(config: HttpClientConfig) -> httpx.AsyncClient:
+        http2 = config.http2 and _H2_AVAILABLE
+        if config.http2 and not http2:
+            logger.warning("http2_unavailable", name=config.name, reason="h2 package not installed")
+        logger.info("http_client_created", name=config.name, http2=http2, max_connections=config.max_connections)
+        return httpx.AsyncClient(
+            base_url=config.base_url,
+            timeout=httpx.Timeout(config.timeout_seconds),
+            headers=dict(config.headers),
+            auth=config.auth,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_seconds,
+            ),
+            http2=http2,
+            verify=config.verify,
+            transport=config.transport,
+        )
+
+
+_registry: Optional[HttpClientRegistry] = None
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Süreç genelindeki registry (adapter'lara registry verilmediğinde kullanılır)."""
+    global _registry
+    if _registry is None:
+        _registry = HttpClientRegistry()
+    return _registry
@@ -0,0 +1,300 @@
+# PATH: src/infrastructure/external/parcel_geometry_cache.py
+# DESC: TKGM parsel geometrileri için boyut sınırlı iki seviyeli (L1 LRU + L2 store) önbellek.
+"""
+Parsel geometri önbelleği: süreç içi LRU (L1) + paylaşılan store (L2).
+
+L1 değerleri serileştirilmiş byte olarak tutar; boyut hesabı gerçek bellek
+kullanımını izler ve max_bytes aşıldığında en eski kullanılan girdiler
+çıkarılır. L2 (Redis veya yerel SQLite) worker'lar arasında paylaşılır;
+L1'de olmayan anahtarlar önce L2'den okunur.
+
+Tazelik: yaş < ttl ise taze; ttl..ttl+stale aralığında bayat değer hemen
+döner ve arka planda yenilenir (stale-while-revalidate). Bulunamayan
+parseller negative_ttl süresince None olarak önbellekte kalır.
+
+Graceful degradation: L2 hataları ıskalama sayılır; yükleyici hatası bayat
+yenilemede bayat değeri korur, ıskalamada çağırana iletilir.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Optional
+
+import structlog
+
+from src.core.domain.value_objects.parcel_ref import ParcelRef
+from src.core.ports.external.parcel_geometry_provider import ParcelGeometry
+from src.infrastructure.persistence.redis.cache import CacheStore
+
+logger = structlog.get_logger(__name__)
+
+# Anahtar → cache'e yazılacak geometri; sonuçta olmayan parsel "bulunamadı" sayılır.
+ParcelLoader = Callable[[list[ParcelRef]], Awaitable[dict[str, ParcelGeometry]]]
+
+# L1 girdisi başına anahtar ve payload dışındaki Python nesne yükü (tuple, float, OrderedDict düğümü).
+_ENTRY_OVERHEAD = 264
+_STORED_AT = struct.Struct("<d")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Önbellek sayaçlarının anlık görüntüsü.
+
+    stale_hits ve negative_hits, l1_hits/l2_hits içinde de sayılır.
+    """
+
+    l1_hits: int
+    l2_hits: int
+    misses: int
+    stale_hits: int
+    negative_hits: int
+    evictions: int
+    refreshes: int
+    l2_errors: int
+    entries: int
+    bytes: int
+
+
+def _encode(geometry: Optional[ParcelGeometry]) -> bytes:
+    if geometry is None:
+        return b""
+    ref = geometry.parcel_ref
+    return json.dumps(
+        {
+            "parcel_ref": [ref.province, ref.district, ref.village, ref.ada, ref.parsel],
+            "geometry": geometry.geometry,
+            "area_m2": str(geometry.area_m2),
+            "coordinate_system": geometry.coordinate_system,
+        },
+        separators=(",", ":"),
+    ).encode()
+
+
+def _decode(payload: bytes) -> Optional[ParcelGeometry]:
+    if not payload:
+        return None
+    data = json.loads(payload)
+    province, district, village, ada, parsel = data["parcel_ref"]
+    return ParcelGeometry(
+        parcel_ref=ParcelRef(province=province, district=district, village=village, ada=ada, parsel=parsel),
+        geometry=data["geometry"],
+        area_m2=Decimal(data["area_m2"]),
+        coordinate_system=data["coordinate_system"],
+    )
+
+
+class ParcelGeometryCache:
+    """İki seviyeli parsel geometri önbelleği.
+
+    Kullanım:
+        cache = ParcelGeometryCache(max_bytes=64 * 2**20, store=RedisCacheStore(client, namespace="tkgm:parcel"))
+        found = await cache.get_many(refs, loader)  # {unique_hash: ParcelGeometry | None}
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 64 * 2**20,
+        ttl_seconds: int = 86400,
+        stale_seconds: int = 3600,
+        negative_ttl_seconds: int = 3600,
+        store: Optional[CacheStore] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes <= 0 or ttl_seconds <= 0 or stale_seconds < 0 or negative_ttl_seconds < 0:
+            raise ValueError("cache sizes and TTLs must be positive")
+        self._max_bytes = max_bytes
+        self._ttl = ttl_seconds
+        self._stale = stale_seconds
+        self._negative_ttl = negative_ttl_seconds
+        self._store = store
+        self._clock = clock
+        # anahtar → (stored_at, payload); payload boşsa negatif girdi.
+        self._l1: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._l1_hits = self._l2_hits = self._misses = self._stale_hits = 0
+        self._negative_hits = self._evictions = self._refreshes = self._l2_errors = 0
+
+    def __len__(self) -> int:
+        return len(self._l1)
+
+    @property
+    def nbytes(self) -> int:
+        """L1'in hesaplanan bellek kullanımı (byte)."""
+        return self._bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            l1_hits=self._l1_hits,
+            l2_hits=self._l2_hits,
+            misses=self._misses,
+            stale_hits=self._stale_hits,
+            negative_hits=self._negative_hits,
+            evictions=self._evictions,
+            refreshes=self._refreshes,
+            l2_errors=self._l2_errors,
+            entries=len(self._l1),
+            bytes=self._bytes,
+        )
+
+    def clear(self) -> None:
+        """L1'i boşaltır (L2'ye dokunmaz)."""
+        self._l1.clear()
+        self._bytes = 0
+
+    async def drain(self) -> None:
+        """Süren arka plan yenilemelerinin bitmesini bekler."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def get_many(
+        self,
+        parcel_refs: Sequence[ParcelRef],
+        loader: ParcelLoader,
+    ) -> dict[str, Optional[ParcelGeometry]]:
+        """Parselleri L1 → L2 → loader sırasıyla çözer; anahtar ParcelRef.unique_hash.
+
+        Bayat değerler hemen döner, yenilemeleri tek arka plan görevinde toplanır.
+        """
+        now = self._clock()
+        refs = {ref.unique_hash: ref for ref in parcel_refs}
+        result: dict[str, Optional[ParcelGeometry]] = {}
+        stale: list[ParcelRef] = []
+
+        pending: list[str] = []
+        for key in refs:
+            entry = self._l1.get(key)
+            if entry is None or not self._resolve(key, entry, now, result, stale, refs):
+                pending.append(key)
+                continue
+            self._l1.move_to_end(key)
+            self._l1_hits += 1
+
+        if pending and self._store is not None:
+            try:
+                found = await self._store.get_many(pending)
+            except Exception as exc:
+                self._l2_errors += 1
+                logger.warning("parcel_cache_l2_read_failed", error=str(exc))
+                found = {}
+            still_missing: list[str] = []
+            for key in pending:
+                raw = found.get(key)
+                if raw is None:
+                    still_missing.append(key)
+                    continue
+                entry = (_STORED_AT.unpack_from(raw)[0], raw[_STORED_AT.size :])
+                if self._resolve(key, entry, now, result, stale, refs):
+                    self._l2_hits += 1
+                    self._put(key, entry)
+                else:
+                    still_missing.append(key)
+            pending = still_missing
+
+        if pending:
+            self._misses += len(pending)
+            missing = [refs[key] for key in pending]
+            loaded = await loader(missing)
+            result.update(await self._write(missing, loaded))
+
+        if stale:
+            self._schedule_refresh(stale, loader)
+        return result
+
+    def _resolve(
+        self,
+        key: str,
+        entry: tuple[float, bytes],
+        now: float,
+        result: dict[str, Optional[ParcelGeometry]],
+        stale: list[ParcelRef],
+        refs: dict[str, ParcelRef],
+    ) -> bool:
+        """Girdi kullanılabilirse sonuca yazar; süresi dolmuşsa False."""
+        stored_at, payload = entry
+        age = now - stored_at
+        if not payload:
+            if age >= self._negative_ttl:
+                return False
+            self._negative_hits += 1
+            result[key] = None
+            return True
+        if age >= self._ttl + self._stale:
+            return False
+        if age >= self._ttl:
+            self._stale_hits += 1
+            stale.append(refs[key])
+        result[key] = _decode(payload)
+        return True
+
+    def _put(self, key: str, entry: tuple[float, bytes]) -> None:
+        size = len(key) + len(entry[1]) + _ENTRY_OVERHEAD
+        if size > self._max_bytes:
+            return
+        previous = self._l1.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(key) + len(previous[1]) + _ENTRY_OVERHEAD
+        self._l1[key] = entry
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            old_key, (_, old_payload) = self._l1.popitem(last=False)
+            self._bytes -= len(old_key) + len(old_payload) + _ENTRY_OVERHEAD
+            self._evictions += 1
+
+    async def _write(
+        self,
+        parcel_refs: list[ParcelRef],
+        loaded: dict[str, ParcelGeometry],
+    ) -> dict[str, Optional[ParcelGeometry]]:
+        """Yüklenen değerleri (bulunamayanlar negatif) L1 ve L2'ye yazar."""
+        stored_at = self._clock()
+        prefix = _STORED_AT.pack(stored_at)
+        written: dict[str, Optional[ParcelGeometry]] = {}
+        positive: dict[str, bytes] = {}
+        negative: dict[str, bytes] = {}
+        for ref in parcel_refs:
+            key = ref.unique_hash
+            geometry = loaded.get(key)
+            payload = _encode(geometry)
+            self._put(key, (stored_at, payload))
+            (positive if payload else negative)[key] = prefix + payload
+            written[key] = geometry
+        if self._store is not None:
+            try:
+                if positive:
+                    await self._store.set_many(positive, ttl_seconds=self._ttl + self._stale)
+                if negative and self._negative_ttl:
+                    await self._store.set_many(negative, ttl_seconds=self._negative_ttl)
+            except Exception as exc:
+                self._l2_errors += 1
+                logger.warning("parcel_cache_l2_write_failed", error=str(exc))
+        return written
+
+    def _schedule_refresh(self, parcel_refs: list[ParcelRef], loader: ParcelLoader) -> None:
+        refs = [ref for ref in parcel_refs if ref.unique_hash not in self._refreshing]
+        if not refs:
+            return
+        self._refreshing.update(ref.unique_hash for ref in refs)
+        task = asyncio.create_task(self._refresh(refs, loader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, parcel_refs: list[ParcelRef], loader: ParcelLoader) -> None:
+        try:
+            loaded = await loader(parcel_refs)
+            await self._write(parcel_refs, loaded)
+            self._refreshes += len(parcel_refs)
+        except Exception as exc:
+            logger.warning("parcel_cache_refresh_failed", parcels=len(parcel_refs), error=str(exc))
+        finally:
+            self._refreshing.difference_update(ref.unique_hash for ref in parcel_refs)
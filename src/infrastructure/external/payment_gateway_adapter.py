@@ -12,6 +12,7 @@ Desteklenen provider'lar: iyzico, param, stripe (provider config ile belirlenir)
 from __future__ import annotations
 
 import uuid
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Optional
 
 import httpx
@@ -25,6 +26,7 @@ from src.core.ports.external.payment_gateway import (
     RefundResult,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -43,23 +45,27 @@ class PaymentGatewayAdapter(PaymentGateway):
     Ödeme başlatma retry edilmez; doğrulama ve sorguda retry uygulanır.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, clients: Optional[HttpClientRegistry] = None) -> None:
         self._settings = settings
         self._base_url = settings.payment_api_url
-        self._timeout = httpx.Timeout(settings.payment_timeout_seconds)
         self._api_key = settings.payment_api_key.get_secret_value()
         self._secret_key = settings.payment_secret_key.get_secret_value()
-
-    def _get_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="payment",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.payment_timeout_seconds,
             headers={
                 "Authorization": f"Bearer {self._api_key}",
                 "Content-Type": "application/json",
             },
         )
 
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Registry'deki paylaşılan client'ı ödünç verir (çıkışta kapatılmaz)."""
+        return self._clients.borrow(self._client_config)
+
     async def initiate_payment(
         self,
         *,
@@ -0,0 +1,54 @@
+# PATH: src/infrastructure/external/single_flight.py
+# DESC: Eşzamanlı özdeş dış çağrıları tek uçuşta birleştiren async yardımcı (single-flight).
+"""
+Single-flight: aynı anahtarlı eşzamanlı çağrılar tek upstream isteği paylaşır.
+
+İlk çağıran işi ayrı bir görev olarak başlatır; aynı anahtarla gelen diğer
+çağıranlar o görevi bekler. Görev bitince anahtar silinir: sonuç
+saklanmaz, hata da saklanmaz (sonraki çağrı yeniden dener). Hata, o anda
+bekleyen tüm çağıranlara iletilir.
+
+Bir bekleyenin iptal edilmesi görevi iptal etmez; diğer bekleyenler
+sonucu almaya devam eder.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Anahtar başına en çok bir uçuşta çağrı.
+
+    Kullanım:
+        flight: SingleFlight[WeatherData] = SingleFlight()
+        weather = await flight.do(("current", lat, lon), lambda: fetch(lat, lon))
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Task[T]] = {}
+        self.coalesced = 0  # Uçuştaki bir çağrıya katılan istek sayısı
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """key için uçuştaki çağrıyı bekler; yoksa fn() ile başlatır."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[T]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Tüm bekleyenler iptal edildiyse hata "retrieved" sayılsın diye okunur.
+        if not task.cancelled():
+            task.exception()
@@ -5,15 +5,24 @@ TKGM/MEGSİS WFS adapter: kadastro parsel geometrisi sorgulama.
 
 WFS/WMS proxy üzerinden TKGM/MEGSİS'ten parsel geometrisi ve alan
 bilgisi sorgular. Cache destekli; parsel geometrisi nadiren değişir.
+Önbellek ParcelGeometryCache'tir: boyut sınırlı L1 + opsiyonel paylaşılan
+L2 (Redis), bayat değerler arka planda yenilenir, bulunamayanlar negatif
+önbelleğe alınır. Aynı parsel için eşzamanlı get_geometry çağrıları
+single-flight ile tek sorguda birleşir.
 
 Graceful degradation: TKGM erişilemezse None döner.
 Retry: Transient hatalarda exponential backoff.
+Toplu sorgu: Parsel anahtarları URL uzunluğu sınırına kadar OR'lanmış tek
+CQL_FILTER'da paketlenir; paketler tek paylaşılan client üzerinden semafor
+ve host başına istek hızı sınırıyla eşzamanlı gönderilir.
 """
 from __future__ import annotations
 
 import asyncio
+import time
 from decimal import Decimal
 from typing import Any, Optional
+from urllib.parse import quote_plus
 
 import httpx
 import structlog
@@ -26,6 +35,9 @@ from src.core.ports.external.parcel_geometry_provider import (
     ParcelValidationResult,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
+from src.infrastructure.external.parcel_geometry_cache import ParcelGeometryCache
+from src.infrastructure.external.single_flight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
@@ -36,104 +48,211 @@ _RETRY_DECORATOR = retry(
     reraise=True,
 )
 
+_GET_FEATURE_PARAMS: dict[str, str] = {
+    "service": "WFS",
+    "request": "GetFeature",
+    "typeName": "kadastro:parsel",
+    "outputFormat": "application/json",
+}
+_FILTER_FIELDS: tuple[tuple[str, str], ...] = (
+    ("il", "province"),
+    ("ilce", "district"),
+    ("mahalle", "village"),
+    ("ada", "ada"),
+    ("parsel", "parsel"),
+)
+_OR = " OR "
+
+
+def _cql_literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def parcel_filter(parcel_ref: ParcelRef) -> str:
+    """Tek parselin CQL eşitlik filtresi (il/ilçe/mahalle/ada/parsel)."""
+    return " AND ".join(f"{column}={_cql_literal(getattr(parcel_ref, attr))}" for column, attr in _FILTER_FIELDS)
+
+
+_NUMERIC_FIELDS = frozenset({"ada", "parsel"})
+
+
+def _key_part(attr: str, value: Any) -> str:
+    """Eşleme anahtarı parçası: kırpılmış, casefold; ada/parsel kanonik tam sayı biçiminde."""
+    text = str(value if value is not None else "").strip().casefold()
+    if attr in _NUMERIC_FIELDS and text.isdigit():
+        return str(int(text))
+    return text
+
+
+def _feature_key(properties: dict[str, Any]) -> tuple[str, ...]:
+    return tuple(_key_part(attr, properties.get(column)) for column, attr in _FILTER_FIELDS)
+
+
+def _ref_key(parcel_ref: ParcelRef) -> tuple[str, ...]:
+    return tuple(_key_part(attr, getattr(parcel_ref, attr)) for _, attr in _FILTER_FIELDS)
+
+
+def pack_parcel_filters(parcel_refs: list[ParcelRef], *, max_url_length: int, base_length: int) -> list[list[ParcelRef]]:
+    """Parselleri, kodlanmış GetFeature URL'i max_url_length'i aşmayacak paketlere böler.
+
+    URL kodlaması karakter bazında olduğundan birleşik filtrenin kodlanmış
+    uzunluğu parçaların kodlanmış uzunluklarının toplamıdır. Tek başına sınırı
+    aşan parsel kendi paketinde gönderilir.
+    """
+    separator = len(quote_plus(_OR))
+    budget = max_url_length - base_length - len("&CQL_FILTER=")
+    batches: list[list[ParcelRef]] = []
+    current: list[ParcelRef] = []
+    used = 0
+    for ref in parcel_refs:
+        size = len(quote_plus(f"({parcel_filter(ref)})"))
+        if current and used + separator + size > budget:
+            batches.append(current)
+            current, used = [], 0
+        used += size + (separator if current else 0)
+        current.append(ref)
+    if current:
+        batches.append(current)
+    return batches
+
+
+class _HostRateLimiter:
+    """Host başına istek aralığı sınırlayıcı (saniyede en çok `rate` istek başlangıcı).
+
+    Her çağrı bir sonraki boş zaman dilimini ayırır ve o ana kadar bekler;
+    ayırma senkron yapıldığından event loop içinde kilit gerekmez.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+
+    async def acquire(self) -> None:
+        if self._interval == 0.0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next)
+        self._next = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class TKGMMegsisWFSAdapter(ParcelGeometryProvider):
     """ParcelGeometryProvider port implementasyonu (TKGM/MEGSİS WFS).
 
-    httpx async HTTP client ile TKGM WFS proxy'ye bağlanır.
-    Bellek içi cache ile sık sorgulanan parseller cache'lenir.
+    httpx async HTTP client ile TKGM WFS proxy'ye bağlanır; client
+    HttpClientRegistry'den alınır ve tüm isteklerce paylaşılır. Adapter
+    client'ın sahiplik referansını tutar; aclose() yalnızca bu referansı
+    bırakır, client son sahip bırakınca (ya da lifespan kapanışında) kapanır.
+    Sorgulanan parseller ParcelGeometryCache'te tutulur; verilmezse
+    ayarlardan yalnızca L1 (süreç içi) önbellek kurulur.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        clients: Optional[HttpClientRegistry] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[ParcelGeometryCache] = None,
+    ) -> None:
         self._settings = settings
         self._base_url = settings.tkgm_wfs_base_url
-        self._timeout = httpx.Timeout(settings.tkgm_wfs_timeout_seconds)
-        self._cache_ttl = settings.tkgm_cache_ttl_seconds
-        self._cache: dict[str, tuple[float, ParcelGeometry]] = {}
-
-    def _get_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
+        self._cache = cache or ParcelGeometryCache(
+            max_bytes=settings.tkgm_cache_max_bytes,
+            ttl_seconds=settings.tkgm_cache_ttl_seconds,
+            stale_seconds=settings.tkgm_cache_stale_seconds,
+            negative_ttl_seconds=settings.tkgm_cache_negative_ttl_seconds,
+        )
+        self._max_url_length = settings.tkgm_batch_max_url_length
+        self._max_concurrency = max(settings.tkgm_max_concurrency, 1)
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="tkgm",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.tkgm_wfs_timeout_seconds,
             headers={"Accept": "application/json"},
+            max_connections=self._max_concurrency,
+            transport=transport,
         )
+        self._clients.acquire(self._client_config)
+        self._released = False
+        self._rate_limiters: dict[str, _HostRateLimiter] = {}
+        self._flight: SingleFlight[Optional[ParcelGeometry]] = SingleFlight()
 
-    def _cache_key(self, parcel_ref: ParcelRef) -> str:
-        return parcel_ref.unique_hash
+    def _get_client(self) -> httpx.AsyncClient:
+        return self._clients.client(self._client_config)
 
-    def _get_cached(self, parcel_ref: ParcelRef) -> Optional[ParcelGeometry]:
-        """Cache'ten parsel geometrisi döner (TTL kontrolü ile)."""
-        key = self._cache_key(parcel_ref)
-        entry = self._cache.get(key)
-        if entry is None:
-            return None
-        cached_at, geometry = entry
-        now = asyncio.get_event_loop().time()
-        if now - cached_at > self._cache_ttl:
-            del self._cache[key]
-            return None
-        return geometry
+    async def aclose(self) -> None:
+        """Client sahipliğini bırakır (idempotent); aynı client'ı kullanan diğer adapter'lar etkilenmez."""
+        if self._released:
+            return
+        self._released = True
+        await self._clients.release(self._client_config)
 
-    def _set_cached(self, parcel_ref: ParcelRef, geometry: ParcelGeometry) -> None:
-        """Parsel geometrisini cache'e yazar."""
-        key = self._cache_key(parcel_ref)
-        now = asyncio.get_event_loop().time()
-        self._cache[key] = (now, geometry)
+    def _rate_limiter(self) -> _HostRateLimiter:
+        host = self._get_client().base_url.host
+        limiter = self._rate_limiters.get(host)
+        if limiter is None:
+            limiter = self._rate_limiters[host] = _HostRateLimiter(self._settings.tkgm_requests_per_second)
+        return limiter
+
+    @property
+    def cache(self) -> ParcelGeometryCache:
+        return self._cache
 
-    @_RETRY_DECORATOR
     async def get_geometry(
         self,
         parcel_ref: ParcelRef,
     ) -> Optional[ParcelGeometry]:
         """Parsel geometrisini TKGM/MEGSİS'ten sorgula (cache destekli)."""
-        cached = self._get_cached(parcel_ref)
-        if cached is not None:
-            logger.debug("tkgm_cache_hit", parcel_ref=str(parcel_ref))
-            return cached
+        key = parcel_ref.unique_hash
+
+        async def lookup() -> Optional[ParcelGeometry]:
+            found = await self._cache.get_many([parcel_ref], self._load)
+            return found[key]
+
+        return await self._flight.do(key, lookup)
 
+    async def _load(self, parcel_refs: list[ParcelRef]) -> dict[str, ParcelGeometry]:
+        """Önbellek yükleyicisi: tek parsel tekil sorgu, birden fazlası paketli sorgu."""
+        if len(parcel_refs) == 1:
+            geometry = await self._fetch_one(parcel_refs[0])
+            return {} if geometry is None else {parcel_refs[0].unique_hash: geometry}
+        return await self._fetch_many(parcel_refs)
+
+    @_RETRY_DECORATOR
+    async def _fetch_one(self, parcel_ref: ParcelRef) -> Optional[ParcelGeometry]:
         logger.info("tkgm_geometry_request", parcel_ref=str(parcel_ref))
 
-        async with self._get_client() as client:
-            response = await client.get(
-                "/wfs",
-                params={
-                    "service": "WFS",
-                    "request": "GetFeature",
-                    "typeName": "kadastro:parsel",
-                    "outputFormat": "application/json",
-                    "CQL_FILTER": (
-                        f"il='{parcel_ref.province}' AND "
-                        f"ilce='{parcel_ref.district}' AND "
-                        f"mahalle='{parcel_ref.village}' AND "
-                        f"ada='{parcel_ref.ada}' AND "
-                        f"parsel='{parcel_ref.parsel}'"
-                    ),
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        await self._rate_limiter().acquire()
+        response = await self._get_client().get(
+            "/wfs",
+            params={**_GET_FEATURE_PARAMS, "CQL_FILTER": parcel_filter(parcel_ref)},
+        )
+        response.raise_for_status()
+        data = response.json()
 
         features = data.get("features", [])
         if not features:
             logger.info("tkgm_parcel_not_found", parcel_ref=str(parcel_ref))
             return None
 
-        feature = features[0]
-        geometry_data = feature.get("geometry", {})
-        properties = feature.get("properties", {})
-        area_m2 = Decimal(str(properties.get("alan", 0)))
+        result = self._to_parcel_geometry(parcel_ref, features[0], data)
+        logger.info("tkgm_geometry_success", parcel_ref=str(parcel_ref), area_m2=str(result.area_m2))
+        return result
 
-        result = ParcelGeometry(
+    @staticmethod
+    def _to_parcel_geometry(parcel_ref: ParcelRef, feature: dict[str, Any], data: dict[str, Any]) -> ParcelGeometry:
+        properties = feature.get("properties", {})
+        return ParcelGeometry(
             parcel_ref=parcel_ref,
-            geometry=geometry_data,
-            area_m2=area_m2,
+            geometry=feature.get("geometry", {}),
+            area_m2=Decimal(str(properties.get("alan", 0))),
             coordinate_system=data.get("crs", {}).get("properties", {}).get("name", "EPSG:4326"),
         )
 
-        self._set_cached(parcel_ref, result)
-        logger.info("tkgm_geometry_success", parcel_ref=str(parcel_ref), area_m2=str(area_m2))
-        return result
-
     @_RETRY_DECORATOR
     async def validate_parcel(
         self,
@@ -166,26 +285,86 @@ class TKGMMegsisWFSAdapter(ParcelGeometryProvider):
         self,
         parcel_refs: list[ParcelRef],
     ) -> list[ParcelGeometry]:
-        """Birden fazla parselin geometrisini toplu sorgula."""
-        results: list[ParcelGeometry] = []
-        for ref in parcel_refs:
-            geometry = await self.get_geometry(ref)
-            if geometry is not None:
-                results.append(geometry)
-        return results
+        """Birden fazla parselin geometrisini toplu sorgula.
+
+        Cache'te olmayan parseller URL uzunluğu sınırına göre paketlenir;
+        her paket tek GetFeature isteğidir. Paketler en çok
+        tkgm_max_concurrency eşzamanlı istekle ve host başına hız sınırıyla
+        gönderilir. Sonuç girdi sırasını korur; bulunamayan parseller atlanır.
+        """
+        found = await self._cache.get_many(parcel_refs, self._load)
+        return [geometry for geometry in (found[ref.unique_hash] for ref in parcel_refs) if geometry is not None]
+
+    async def _fetch_many(self, parcel_refs: list[ParcelRef]) -> dict[str, ParcelGeometry]:
+        base_length = len(str(self._get_client().base_url.join("/wfs"))) + len(
+            str(httpx.QueryParams(_GET_FEATURE_PARAMS))
+        ) + 1
+        batches = pack_parcel_filters(parcel_refs, max_url_length=self._max_url_length, base_length=base_length)
+        logger.info("tkgm_batch_request", parcels=len(parcel_refs), requests=len(batches))
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        found: dict[str, ParcelGeometry] = {}
+
+        async def fetch(batch: list[ParcelRef]) -> None:
+            async with semaphore:
+                results, orphans = await self._fetch_batch(batch)
+                found.update(results)
+                if not orphans:
+                    return
+                # Anahtarı eşlenemeyen özellik varsa eşlenmemiş parseller tekil sorguyla
+                # doğrulanır; aksi halde negatif önbelleğe yanlışlıkla yazılırlar.
+                for ref in batch:
+                    if ref.unique_hash not in found:
+                        geometry = await self._fetch_one(ref)
+                        if geometry is not None:
+                            found[ref.unique_hash] = geometry
+
+        await asyncio.gather(*(fetch(batch) for batch in batches))
+        return found
+
+    @_RETRY_DECORATOR
+    async def _fetch_batch(self, batch: list[ParcelRef]) -> tuple[dict[str, ParcelGeometry], int]:
+        """Tek GetFeature ile paketin parsellerini sorgular; özellikler normalize anahtarla eşlenir.
+
+        Returns:
+            (bulunan geometriler, hiçbir parsele eşlenemeyen özellik sayısı).
+        """
+        await self._rate_limiter().acquire()
+        cql = _OR.join(f"({parcel_filter(ref)})" for ref in batch)
+        response = await self._get_client().get("/wfs", params={**_GET_FEATURE_PARAMS, "CQL_FILTER": cql})
+        response.raise_for_status()
+        data = response.json()
+
+        # Farklı yazılmış ama aynı parseli gösteren referanslar (örn. ada '007' ve '7') aynı anahtara düşer.
+        refs: dict[tuple[str, ...], list[ParcelRef]] = {}
+        for ref in batch:
+            refs.setdefault(_ref_key(ref), []).append(ref)
+        results: dict[str, ParcelGeometry] = {}
+        orphans = 0
+        for feature in data.get("features", []):
+            matches = refs.get(_feature_key(feature.get("properties", {})))
+            if matches is None:
+                orphans += 1
+                continue
+            for ref in matches:
+                if ref.unique_hash not in results:
+                    results[ref.unique_hash] = self._to_parcel_geometry(ref, feature, data)
+        if orphans:
+            logger.warning("tkgm_batch_unmatched_features", count=orphans)
+        elif len(results) < len(batch):
+            logger.info("tkgm_parcel_not_found", count=len(batch) - len(results))
+        return results, orphans
 
     async def health_check(self) -> bool:
         """TKGM/MEGSİS servisinin erişilebilirliğini kontrol et."""
         try:
-            async with self._get_client() as client:
-                response = await client.get(
-                    "/wfs",
-                    params={
-                        "service": "WFS",
-                        "request": "GetCapabilities",
-                    },
-                )
-                return response.status_code == 200
+            response = await self._get_client().get(
+                "/wfs",
+                params={
+                    "service": "WFS",
+                    "request": "GetCapabilities",
+                },
+            )
+            return response.status_code == 200
         except (httpx.HTTPError, Exception):
             logger.warning("tkgm_health_check_failed")
             return False
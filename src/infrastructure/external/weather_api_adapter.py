@@ -7,9 +7,12 @@ Uçuş uygunluğu kontrolü için hava durumu verisi sorgular.
 KR-015-5: Hava durumu engeli, görev planlamasını etkiler.
 
 Retry: Transient hatalarda exponential backoff.
+Single-flight: Aynı konum/parametreli eşzamanlı sorgular tek upstream
+isteği paylaşır; dönen WeatherData nesnesi bekleyenler arasında ortaktır.
 """
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 from typing import Any, Optional
 
@@ -18,6 +21,8 @@ import structlog
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
+from src.infrastructure.external.single_flight import SingleFlight
 
 logger = structlog.get_logger(__name__)
 
@@ -78,20 +83,32 @@ class WeatherAPIAdapter:
     Tüm sorgularda retry uygulanır.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        clients: Optional[HttpClientRegistry] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         self._settings = settings
         self._base_url = settings.weather_api_url
-        self._timeout = httpx.Timeout(settings.weather_timeout_seconds)
         self._api_key = settings.weather_api_key.get_secret_value()
-
-    def _get_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="weather",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.weather_timeout_seconds,
             headers={"Accept": "application/json"},
+            transport=transport,
         )
+        self._current_flight: SingleFlight[WeatherData] = SingleFlight()
+        self._forecast_flight: SingleFlight[list[WeatherData]] = SingleFlight()
+
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Registry'deki paylaşılan client'ı ödünç verir (çıkışta kapatılmaz)."""
+        return self._clients.borrow(self._client_config)
 
-    @_RETRY_DECORATOR
     async def get_current_weather(
         self,
         *,
@@ -99,6 +116,18 @@ class WeatherAPIAdapter:
         longitude: float,
     ) -> WeatherData:
         """Belirtilen konum için güncel hava durumunu sorgula."""
+        return await self._current_flight.do(
+            (latitude, longitude),
+            lambda: self._fetch_current_weather(latitude=latitude, longitude=longitude),
+        )
+
+    @_RETRY_DECORATOR
+    async def _fetch_current_weather(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+    ) -> WeatherData:
         logger.info(
             "weather_request",
             latitude=latitude,
@@ -139,7 +168,6 @@ class WeatherAPIAdapter:
         )
         return weather
 
-    @_RETRY_DECORATOR
     async def get_forecast(
         self,
         *,
@@ -148,6 +176,20 @@ class WeatherAPIAdapter:
         hours_ahead: int = 24,
     ) -> list[WeatherData]:
         """Belirtilen konum için hava durumu tahminini sorgula."""
+        forecasts = await self._forecast_flight.do(
+            (latitude, longitude, hours_ahead),
+            lambda: self._fetch_forecast(latitude=latitude, longitude=longitude, hours_ahead=hours_ahead),
+        )
+        return list(forecasts)
+
+    @_RETRY_DECORATOR
+    async def _fetch_forecast(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        hours_ahead: int,
+    ) -> list[WeatherData]:
         logger.info(
             "weather_forecast_request",
             latitude=latitude,
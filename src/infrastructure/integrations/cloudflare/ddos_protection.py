@@ -30,6 +30,7 @@ Notlar/SSOT: Tek referans: tarlaanaliz_platform_tree v3.2.2 FINAL.
 """
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime
 from typing import Any, Optional, cast
 
@@ -50,6 +51,7 @@ from src.core.ports.external.ddos_protection import (
     ZoneAnalytics,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -92,24 +94,27 @@ class CloudflareDDoSAdapter(DDoSProtection):
     exponential backoff yeterlidir.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, clients: Optional[HttpClientRegistry] = None) -> None:
         self._settings = settings
         self._base_url = settings.cloudflare_api_url
-        self._timeout = httpx.Timeout(settings.cloudflare_timeout_seconds)
         self._api_token = settings.cloudflare_api_token.get_secret_value()
         self._default_zone_id = settings.cloudflare_zone_id
-
-    def _get_client(self) -> httpx.AsyncClient:
-        """Her istek için taze httpx client oluşturur."""
-        return httpx.AsyncClient(
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="cloudflare",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.cloudflare_timeout_seconds,
             headers={
                 "Authorization": f"Bearer {self._api_token}",
                 "Content-Type": "application/json",
             },
         )
 
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Registry'deki paylaşılan client'ı ödünç verir (çıkışta kapatılmaz)."""
+        return self._clients.borrow(self._client_config)
+
     def _resolve_zone_id(self, zone_id: str) -> str:
         """Zone ID boş ise default'u kullanır."""
         resolved = zone_id or self._default_zone_id
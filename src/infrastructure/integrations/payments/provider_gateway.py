@@ -38,6 +38,7 @@ import hashlib
 import hmac
 import json
 import uuid
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Optional
 
 import httpx
@@ -51,6 +52,7 @@ from src.core.ports.external.payment_gateway import (
     RefundResult,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -77,22 +79,25 @@ class ProviderPaymentGateway(PaymentGateway):
     API key ve secret, Settings üzerinden SecretStr ile yüklenir.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, clients: Optional[HttpClientRegistry] = None) -> None:
         self._settings = settings
         self._provider = settings.payment_provider
         self._base_url = settings.payment_api_url
-        self._timeout = httpx.Timeout(settings.payment_timeout_seconds)
         self._api_key = settings.payment_api_key.get_secret_value()
         self._secret_key = settings.payment_secret_key.get_secret_value()
-
-    def _get_client(self) -> httpx.AsyncClient:
-        """Her istek için taze httpx client oluşturur."""
-        return httpx.AsyncClient(
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="payment_provider",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.payment_timeout_seconds,
             headers=self._build_auth_headers(),
         )
 
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Registry'deki paylaşılan client'ı ödünç verir (çıkışta kapatılmaz)."""
+        return self._clients.borrow(self._client_config)
+
     def _build_auth_headers(self) -> dict[str, str]:
         """Provider'a özel auth header'ları oluşturur."""
         headers: dict[str, str] = {"Content-Type": "application/json"}
@@ -31,6 +31,7 @@ Notlar/SSOT: Tek referans: tarlaanaliz_platform_tree v3.2.2 FINAL.
 from __future__ import annotations
 
 import re
+from contextlib import AbstractAsyncContextManager
 from typing import Optional
 
 import httpx
@@ -44,6 +45,7 @@ from src.core.ports.external.sms_gateway import (
     SmsResult,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -107,24 +109,27 @@ class NetGSMAdapter(SMSGateway):
     tercih edilir.
     """
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, clients: Optional[HttpClientRegistry] = None) -> None:
         self._settings = settings
         self._base_url = settings.sms_api_url or "https://api.netgsm.com.tr"
-        self._timeout = httpx.Timeout(settings.sms_timeout_seconds)
         self._api_key = settings.sms_api_key.get_secret_value()
         self._sender_id = settings.sms_sender_id
-
-    def _get_client(self) -> httpx.AsyncClient:
-        """Her istek için taze httpx client oluşturur."""
-        return httpx.AsyncClient(
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="netgsm",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.sms_timeout_seconds,
             headers={
                 "Authorization": f"Basic {self._api_key}",
                 "Content-Type": "application/xml",
             },
         )
 
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Registry'deki paylaşılan client'ı ödünç verir (çıkışta kapatılmaz)."""
+        return self._clients.borrow(self._client_config)
+
     def _validate_phone(self, phone: str) -> None:
         """Telefon numarası formatını doğrular."""
         cleaned = phone.strip().replace(" ", "").replace("-", "")
@@ -30,6 +30,7 @@ Notlar/SSOT: Tek referans: tarlaanaliz_platform_tree v3.2.2 FINAL.
 from __future__ import annotations
 
 import re
+from contextlib import AbstractAsyncContextManager
 from typing import Optional
 
 import httpx
@@ -43,6 +44,7 @@ from src.core.ports.external.sms_gateway import (
     SmsResult,
 )
 from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config, get_http_client_registry
 
 logger = structlog.get_logger(__name__)
 
@@ -86,9 +88,8 @@ class TwilioSMSAdapter(SMSGateway):
     # Twilio API base URL
     _TWILIO_API_BASE = "https://api.twilio.com/2010-04-01"
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(self, settings: Settings, *, clients: Optional[HttpClientRegistry] = None) -> None:
         self._settings = settings
-        self._timeout = httpx.Timeout(settings.sms_timeout_seconds)
         # Twilio: sms_api_key = "account_sid:auth_token" formatında
         api_key = settings.sms_api_key.get_secret_value()
         if ":" in api_key:
@@ -101,15 +102,19 @@ class TwilioSMSAdapter(SMSGateway):
             settings.sms_api_url
             or f"{self._TWILIO_API_BASE}/Accounts/{self._account_sid}"
         )
-
-    def _get_client(self) -> httpx.AsyncClient:
-        """Her istek için taze httpx client oluşturur (Basic Auth)."""
-        return httpx.AsyncClient(
+        self._clients = clients or get_http_client_registry()
+        self._client_config = client_config(
+            settings,
+            name="twilio",
             base_url=self._base_url,
-            timeout=self._timeout,
+            timeout_seconds=settings.sms_timeout_seconds,
             auth=(self._account_sid, self._auth_token),
         )
 
+    def _get_client(self) -> AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Registry'deki paylaşılan client'ı ödünç verir (çıkışta kapatılmaz)."""
+        return self._clients.borrow(self._client_config)
+
     def _validate_phone(self, phone: str) -> None:
         """Telefon numarası formatını doğrular."""
         cleaned = phone.strip().replace(" ", "").replace("-", "")
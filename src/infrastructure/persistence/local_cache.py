@@ -0,0 +1,62 @@
+# PATH: src/infrastructure/persistence/local_cache.py
+# DESC: SQLite tabanlı yerel CacheStore (test ve tek makine geliştirme ortamı).
+"""
+Yerel cache store: Redis'in olmadığı ortamlarda L2 önbellek.
+
+Amaç: CacheStore sözleşmesini tek dosyalık SQLite ile sağlamak; testler ve
+  geliştirme ortamı Redis'e ihtiyaç duymadan iki seviyeli önbelleği çalıştırır.
+
+Sorumluluk: TTL'li byte değer okuma/yazma; süresi dolan satırlar okumada elenir.
+
+Hata Modları (idempotency/retry/rate limit):
+  Yazma INSERT OR REPLACE ile idempotenttir.
+
+Testler: Unit test (parsel geometri önbelleği, aynı dosyayı paylaşan iki süreç).
+Bağımlılıklar: Standart kütüphane (sqlite3).
+Notlar/SSOT: Sorgular kısa ve yereldir; event loop'u bloklama süresi ihmal edilir.
+"""
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Callable, Mapping, Sequence
+
+_MAX_PARAMS = 500  # Eski SQLite sürümlerinin 999 parametre sınırının altında
+
+
+class SQLiteCacheStore:
+    """CacheStore'un SQLite implementasyonu (path=":memory:" süreç içi)."""
+
+    def __init__(self, path: str = ":memory:", *, clock: Callable[[], float] = time.time) -> None:
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._clock = clock
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        now = self._clock()
+        for start in range(0, len(keys), _MAX_PARAMS):
+            chunk = keys[start : start + _MAX_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, value FROM cache_entries WHERE key IN ({placeholders}) AND expires_at > ?",  # noqa: S608
+                (*chunk, now),
+            )
+            found.update((key, bytes(value)) for key, value in rows)
+        return found
+
+    async def set_many(self, items: Mapping[str, bytes], *, ttl_seconds: int) -> None:
+        expires_at = self._clock() + ttl_seconds
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO cache_entries (key, value, expires_at) VALUES (?, ?, ?)",
+            [(key, value, expires_at) for key, value in items.items()],
+        )
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        self._conn.executemany("DELETE FROM cache_entries WHERE key = ?", [(key,) for key in keys])
+
+    def close(self) -> None:
+        self._conn.close()
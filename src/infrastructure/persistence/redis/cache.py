@@ -1,3 +1,71 @@
 # PATH: src/infrastructure/persistence/redis/cache.py
 # DESC: Redis cache adapter.
-# TODO: Implement this file.
+"""
+Redis cache adapter: süreçler arası paylaşılan anahtar/değer önbelleği.
+
+Amaç: Uvicorn worker'ları arasında paylaşılan ikinci seviye (L2) önbellek
+  sağlamak. Değerler opak byte dizileridir; serileştirme çağıran taraftadır.
+
+Sorumluluk: Toplu okuma (MGET), TTL'li toplu yazma (pipeline SET EX), silme.
+
+Güvenlik (RBAC/PII/Audit):
+  Anahtarlar namespace önekiyle ayrılır; değerlere PII yazılmamalıdır.
+
+Hata Modları (idempotency/retry/rate limit):
+  Redis hataları çağırana iletilir; önbellek katmanı bunları ıskalama sayar.
+
+Testler: Yerel karşılığı SQLiteCacheStore (persistence/local_cache.py).
+Bağımlılıklar: redis>=5 (redis.asyncio).
+Notlar/SSOT: Tek referans: tarlaanaliz_platform_tree v3.2.2 FINAL.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol
+
+
+class CacheStore(Protocol):
+    """İkinci seviye önbellek deposu sözleşmesi (byte değerler, anahtar başına TTL)."""
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        """Bulunan anahtarların değerleri; olmayanlar sonuçta yer almaz."""
+        ...
+
+    async def set_many(self, items: Mapping[str, bytes], *, ttl_seconds: int) -> None:
+        """Değerleri ttl_seconds süreyle yazar."""
+        ...
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        """Anahtarları siler."""
+        ...
+
+
+class RedisCacheStore:
+    """CacheStore'un Redis implementasyonu.
+
+    Kullanım:
+        client = redis.asyncio.from_url(settings.redis_url)
+        store = RedisCacheStore(client, namespace="tkgm:parcel")
+    """
+
+    def __init__(self, client: Any, *, namespace: str) -> None:
+        self._client = client
+        self._prefix = f"{namespace}:"
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, bytes]:
+        if not keys:
+            return {}
+        values = await self._client.mget([self._prefix + key for key in keys])
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def set_many(self, items: Mapping[str, bytes], *, ttl_seconds: int) -> None:
+        if not items:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(self._prefix + key, value, ex=ttl_seconds)
+            await pipe.execute()
+
+    async def delete(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self._client.delete(*(self._prefix + key for key in keys))
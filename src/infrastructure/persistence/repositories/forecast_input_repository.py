@@ -0,0 +1,65 @@
+"""KR-015 — seasonal demand forecast input reader (active subscriptions, pilot-days per province)."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from typing import TYPE_CHECKING, Dict
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.repositories.planning_input_repository import _work_weekdays
+
+if TYPE_CHECKING:
+    from src.application.services.demand_forecast import SubscriptionColumns
+
+_SUBSCRIPTIONS_SQL = text(
+    """
+    SELECT f.province, s.crop_type, f.area_donum, s.interval_days, s.start_date, s.end_date
+    FROM subscriptions s JOIN fields f ON f.field_id = s.field_id
+    WHERE s.status = 'ACTIVE' AND s.start_date <= :last_day AND s.end_date >= :first_day
+    """
+)
+
+_PILOTS_SQL = text(
+    """
+    SELECT province, work_days
+    FROM pilots
+    WHERE is_active
+    """
+)
+
+
+class DemandForecastInputRepository:
+    """ForecastInputSource: pencereyle kesişen ACTIVE abonelikleri sütunsal, pilotları il bazında okur."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def subscription_columns(self, first_day: date, last_day: date) -> SubscriptionColumns:
+        from src.application.services.demand_forecast import SubscriptionColumns
+
+        rows = self.session.execute(_SUBSCRIPTIONS_SQL, {"first_day": first_day, "last_day": last_day}).all()
+        count = len(rows)
+        return SubscriptionColumns(
+            province_codes=np.array([r[0] for r in rows], dtype=object),
+            crop_types=np.array([str(r[1]) for r in rows], dtype=object),
+            area_donum=np.fromiter((float(r[2]) for r in rows), dtype=np.float64, count=count),
+            interval_days=np.fromiter((int(r[3]) for r in rows), dtype=np.int64, count=count),
+            start_ordinal=np.fromiter((_as_date(r[4]).toordinal() for r in rows), dtype=np.int64, count=count),
+            end_ordinal=np.fromiter((_as_date(r[5]).toordinal() for r in rows), dtype=np.int64, count=count),
+        )
+
+    def pilot_days(self, max_work_days: int) -> Dict[str, float]:
+        """İl → haftalık pilot-gün (aktif pilot başına en çok max_work_days)."""
+        totals: Dict[str, float] = defaultdict(float)
+        for province, work_days in self.session.execute(_PILOTS_SQL):
+            totals[province] += len(_work_weekdays(work_days, max_work_days))
+        return dict(totals)
+
+
+def _as_date(value: object) -> date:
+    # SQLite Date sütunlarını metin döndürebilir.
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
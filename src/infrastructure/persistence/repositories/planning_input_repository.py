@@ -0,0 +1,156 @@
+"""KR-015 — weekly planning input reader (missions/fields/pilots, province batches)."""
+
+from __future__ import annotations
+
+import math
+import uuid
+from datetime import timedelta
+from typing import TYPE_CHECKING, Dict, List, Sequence, Set, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from src.core.domain.services.capacity_manager import PilotCapacity
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot
+
+if TYPE_CHECKING:
+    from src.application.services.weekly_planner_service import WeeklyPlanningParams
+
+_WORKDAY_MINUTES = 480
+_NO_DEADLINE_PRIORITY = 1000
+# pilots.work_days String(3) dizisi; sayısal (0=Pzt) ve TR/EN kısaltmalar kabul edilir.
+_WEEKDAY_CODES: Dict[str, int] = {
+    **{str(i): i for i in range(7)},
+    **{code: i for i, code in enumerate(("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN"))},
+    **{code: i for i, code in enumerate(("PZT", "SAL", "CAR", "PER", "CUM", "CMT", "PAZ"))},
+    "ÇAR": 2,
+}
+
+_PROVINCES_SQL = text(
+    """
+    SELECT DISTINCT f.province
+    FROM missions m JOIN fields f ON f.field_id = m.field_id
+    WHERE m.status = 'PLANNED' AND (m.due_at IS NULL OR m.due_at >= :week_start)
+    """
+)
+
+_DEMANDS_SQL = text(
+    """
+    SELECT m.mission_id, m.field_id, f.province, m.crop_type, f.area_m2, m.due_at
+    FROM missions m JOIN fields f ON f.field_id = m.field_id
+    WHERE m.status = 'PLANNED'
+      AND (m.due_at IS NULL OR m.due_at >= :week_start)
+      AND f.province IN :codes
+    """
+).bindparams(bindparam("codes", expanding=True))
+
+_PILOTS_SQL = text(
+    """
+    SELECT pilot_id, province, work_days, daily_capacity_donum
+    FROM pilots
+    WHERE is_active AND province IN :codes
+    """
+).bindparams(bindparam("codes", expanding=True))
+
+
+# KR-015: Pilot.province_list — pilotun ana ili dışında hizmet verdiği iller.
+_SERVICE_PROVINCES_SQL = text(
+    """
+    SELECT DISTINCT pilot_id, province
+    FROM pilot_service_areas
+    WHERE pilot_id IN :pilot_ids
+    """
+).bindparams(bindparam("pilot_ids", expanding=True))
+
+
+class PlanningInputRepository:
+    """PlanningInputSource: bir il batch'inin PLANNED mission'larını ve pilot slotlarını okur.
+
+    PlanningEngine kapasiteyi görev sayısıyla tutar; pilotun günlük dönüm
+    kapasitesi (KR-015-1, parametre ile üstten sınırlı) ildeki ortalama
+    görev alanına bölünerek günlük görev sayısına çevrilir.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def province_codes(self, params: WeeklyPlanningParams) -> Sequence[str]:
+        return list(self.session.execute(_PROVINCES_SQL, {"week_start": params.week_start}).scalars())
+
+    def load_batch(
+        self,
+        province_codes: Sequence[str],
+        params: WeeklyPlanningParams,
+    ) -> Tuple[List[MissionDemand], List[PilotSlot]]:
+        bind = {"codes": list(province_codes), "week_start": params.week_start}
+        demands: List[MissionDemand] = []
+        area_by_province: Dict[str, Tuple[float, int]] = {}
+        for mission_id, field_id, province, crop_type, area_m2, due_at in self.session.execute(_DEMANDS_SQL, bind):
+            area_m2 = float(area_m2)
+            due = due_at.date() if due_at is not None else None
+            latest = min(params.week_end, due) if due is not None else params.week_end
+            total, count = area_by_province.get(province, (0.0, 0))
+            area_by_province[province] = (total + area_m2, count + 1)
+            demands.append(
+                MissionDemand(
+                    demand_id=mission_id,
+                    field_id=field_id,
+                    province_code=province,
+                    crop_type=str(crop_type),
+                    area_m2=area_m2,
+                    priority=max(0, (due - params.week_start).days) if due is not None else _NO_DEADLINE_PRIORITY,
+                    earliest_date=params.week_start,
+                    latest_date=latest,
+                    estimated_duration_minutes=math.ceil(
+                        area_m2 / 1000.0 / params.daily_capacity_donum * _WORKDAY_MINUTES
+                    ),
+                )
+            )
+
+        slots: List[PilotSlot] = []
+        for pilot_id, province, work_days, capacity_donum in self.session.execute(_PILOTS_SQL, bind):
+            total, count = area_by_province.get(province, (0.0, 0))
+            if count == 0:
+                continue
+            average_donum = total / count / 1000.0
+            capacity = max(1, int(min(capacity_donum, params.daily_capacity_donum) // max(average_donum, 1.0)))
+            for weekday in _work_weekdays(work_days, params.max_work_days):
+                slots.append(
+                    PilotSlot(
+                        pilot_id=pilot_id,
+                        date=params.week_start + timedelta(days=weekday),
+                        province_code=province,
+                        remaining_capacity=capacity,
+                        daily_capacity=capacity,
+                    )
+                )
+        return demands, slots
+
+    def pilot_capacities(self, pilot_slots: Sequence[PilotSlot]) -> Dict[uuid.UUID, PilotCapacity]:
+        """Slotu olan pilotların kapasitesi; yetkili iller pilot_service_areas'tan okunur."""
+        first: Dict[uuid.UUID, PilotSlot] = {}
+        weekdays: Dict[uuid.UUID, Set[int]] = {}
+        for slot in pilot_slots:
+            first.setdefault(slot.pilot_id, slot)
+            weekdays.setdefault(slot.pilot_id, set()).add(slot.date.weekday())
+        if not first:
+            return {}
+        authorized: Dict[uuid.UUID, Set[str]] = {}
+        for pilot_id, province in self.session.execute(_SERVICE_PROVINCES_SQL, {"pilot_ids": list(first)}):
+            authorized.setdefault(pilot_id, set()).add(province)
+        return {
+            pilot_id: PilotCapacity(
+                pilot_id=pilot_id,
+                work_days=frozenset(weekdays[pilot_id]),
+                daily_capacity=slot.daily_capacity,
+                province_code=slot.province_code,
+                authorized_provinces=frozenset(authorized.get(pilot_id, ())),
+            )
+            for pilot_id, slot in first.items()
+        }
+
+
+def _work_weekdays(work_days: Sequence[str] | None, max_work_days: int) -> List[int]:
+    """Çalışma günlerini (0=Pzt) sıralı döndürür; boş liste Pzt-Cmt kabul edilir."""
+    days = sorted({_WEEKDAY_CODES[d.strip().upper()] for d in work_days or () if d.strip().upper() in _WEEKDAY_CODES})
+    return (days or list(range(6)))[:max_work_days]
@@ -0,0 +1,133 @@
+"""KR-015 — weekly_schedules / schedule_entries bulk writer (migration 011)."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple
+
+from sqlalchemy import Boolean, Column, Date, DateTime, Integer, MetaData, Numeric, String, Table, Uuid, select
+from sqlalchemy.orm import Session
+
+if TYPE_CHECKING:
+    from src.application.services.weekly_planner_service import ScheduleEntryRow
+
+_metadata = MetaData()
+
+weekly_schedules = Table(
+    "weekly_schedules",
+    _metadata,
+    Column("schedule_id", Uuid, primary_key=True),
+    Column("week_start_date", Date, nullable=False),
+    Column("week_end_date", Date, nullable=False),
+    Column("province", String(100), nullable=False),
+    Column("status", String(20), nullable=False),
+    Column("total_missions", Integer, nullable=False),
+    Column("total_area_donum", Numeric(12, 2), nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+schedule_entries = Table(
+    "schedule_entries",
+    _metadata,
+    Column("entry_id", Uuid, primary_key=True),
+    Column("schedule_id", Uuid, nullable=False),
+    Column("mission_id", Uuid, nullable=False),
+    Column("pilot_id", Uuid, nullable=False),
+    Column("scheduled_date", Date, nullable=False),
+    Column("estimated_area_donum", Numeric(10, 2), nullable=True),
+    Column("slot_order", Integer, nullable=False),
+    Column("is_confirmed", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+)
+
+
+class ScheduleEntryRepository:
+    """ScheduleEntrySink: her parçayı tek executemany INSERT + commit ile yazar.
+
+    (hafta, il) başına weekly_schedules satırı ilk parçada bulunur ya da
+    DRAFT olarak açılır; aynı çalıştırmada ilk kez dokunulan taslağın eski
+    girdileri silinir, böylece haftayı yeniden planlamak idempotenttir.
+    DRAFT dışındaki (yayınlanmış) çizelgelere yazım ValueError ile reddedilir.
+    Toplamlar (total_missions, total_area_donum) parça bazında artırılır.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._schedules: Dict[Tuple[date, str], uuid.UUID] = {}
+
+    def write_many(self, rows: Sequence[ScheduleEntryRow], *, week_start: date) -> None:
+        now = datetime.now(timezone.utc)
+        totals: Dict[uuid.UUID, Tuple[int, float]] = {}
+        values = []
+        for row in rows:
+            schedule_id = self._schedule_id(week_start, row.province_code, now)
+            count, area = totals.get(schedule_id, (0, 0.0))
+            totals[schedule_id] = (count + 1, area + row.estimated_area_donum)
+            values.append(
+                {
+                    "entry_id": uuid.uuid4(),
+                    "schedule_id": schedule_id,
+                    "mission_id": row.mission_id,
+                    "pilot_id": row.pilot_id,
+                    "scheduled_date": row.scheduled_date,
+                    "estimated_area_donum": round(row.estimated_area_donum, 2),
+                    "slot_order": row.slot_order,
+                    "is_confirmed": False,
+                    "created_at": now,
+                }
+            )
+        if values:
+            self.session.execute(schedule_entries.insert(), values)
+        for schedule_id, (count, area) in totals.items():
+            self.session.execute(
+                weekly_schedules.update()
+                .where(weekly_schedules.c.schedule_id == schedule_id)
+                .values(
+                    total_missions=weekly_schedules.c.total_missions + count,
+                    total_area_donum=weekly_schedules.c.total_area_donum + round(area, 2),
+                    updated_at=now,
+                )
+            )
+        self.session.commit()
+
+    def _schedule_id(self, week_start: date, province: str, now: datetime) -> uuid.UUID:
+        key = (week_start, province)
+        schedule_id = self._schedules.get(key)
+        if schedule_id is not None:
+            return schedule_id
+
+        existing = self.session.execute(
+            select(weekly_schedules.c.schedule_id, weekly_schedules.c.status).where(
+                weekly_schedules.c.week_start_date == week_start,
+                weekly_schedules.c.province == province,
+            )
+        ).one_or_none()
+        if existing is None:
+            schedule_id = uuid.uuid4()
+            self.session.execute(
+                weekly_schedules.insert().values(
+                    schedule_id=schedule_id,
+                    week_start_date=week_start,
+                    week_end_date=week_start + timedelta(days=6),
+                    province=province,
+                    status="DRAFT",
+                    total_missions=0,
+                    total_area_donum=0,
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+        else:
+            schedule_id, status = existing
+            if status != "DRAFT":
+                raise ValueError(f"weekly schedule is {status}, not DRAFT: {week_start.isoformat()} {province}")
+            self.session.execute(schedule_entries.delete().where(schedule_entries.c.schedule_id == schedule_id))
+            self.session.execute(
+                weekly_schedules.update()
+                .where(weekly_schedules.c.schedule_id == schedule_id)
+                .values(total_missions=0, total_area_donum=0, updated_at=now)
+            )
+        self._schedules[key] = schedule_id
+        return schedule_id
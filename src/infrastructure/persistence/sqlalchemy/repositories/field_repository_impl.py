@@ -1,3 +1,355 @@
 # PATH: src/infrastructure/persistence/sqlalchemy/repositories/field_repository_impl.py
 # DESC: FieldRepository portunun SQLAlchemy implementasyonu.
-# TODO: Implement this file.
+# SSOT: KR-013 (tarla yönetimi), KR-016 (eşleştirme), KR-080 (tekil kayıt)
+"""
+FieldRepository portunun async SQLAlchemy (PostGIS) implementasyonu.
+
+Sorumluluk: fields tablosuna (migration 002) erişim; mekânsal filtreleri
+  (bbox, kesişim, mesafe, alan aralığı) SQL'e iter, Python'da filtrelemez.
+
+Girdi/Çıktı (Contract/DTO/Event):
+  Girdi: Field entity, FieldSpatialQuery.
+  Çıktı: Field / FieldRecord (Field + Geometry VO), FieldPage (keyset imleçli).
+
+Güvenlik (RBAC/PII/Audit):
+  Parametreli sorgular; geometri WKB olarak bağlanır, metin birleştirme yoktur.
+
+Hata Modları (idempotency/retry/rate limit):
+  save() field_id üzerinde upsert'tür (idempotent); parsel tekilliği uq_fields_parcel
+  ile DB'de korunur (IntegrityError). delete() bulunamayan kayıtta KeyError.
+
+Observability (log fields/metrics/traces):
+  DB query time çağıran UoW / session katmanında ölçülür.
+
+Testler: tests/integration/test_field_repository_impl.py (derlenmiş SQL + SQLite UDF'li çalıştırma).
+Bağımlılıklar: sqlalchemy[asyncio], geoalchemy2, shapely; PostGIS (üretim), SpatiaLite adları (yerel).
+Notlar/SSOT:
+  - bbox önfiltresi PostgreSQL'de `&&` (GiST, migration gist001), diğer lehçelerde MbrIntersects olarak derlenir.
+  - Mesafe filtresi önce dereceye çevrilmiş zarfla `&&`, sonra geography üzerinde ST_DWithin (metre) uygular.
+  - Geometriler ST_AsBinary ile WKB döner ve shapely.from_wkb ile toplu çözülür.
+"""
+from __future__ import annotations
+
+import math
+import uuid
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import shapely
+from geoalchemy2 import Geometry as GeometryType
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    LargeBinary,
+    MetaData,
+    Numeric,
+    Select,
+    String,
+    Table,
+    Uuid,
+    delete,
+    func,
+    literal,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from src.core.domain.entities.field import Field, FieldStatus
+from src.core.domain.value_objects.geometry import Geometry
+from src.core.ports.repositories.field_repository import FieldRepository
+
+SRID = 4326
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
+# Metre → derece dönüşümü için ekvator katsayıları; zarf %1 genişletilir (önfiltre, kesin test ST_DWithin).
+_M_PER_DEG_LAT = 110_574.0
+_M_PER_DEG_LON_EQUATOR = 111_320.0
+_ENVELOPE_MARGIN = 1.01
+
+_metadata = MetaData()
+
+fields = Table(
+    "fields",
+    _metadata,
+    Column("field_id", Uuid, primary_key=True),
+    Column("user_id", Uuid, nullable=False),
+    Column("coop_id", Uuid, nullable=True),
+    Column("province", String(100), nullable=False),
+    Column("district", String(100), nullable=False),
+    Column("village", String(100), nullable=False),
+    Column("block_no", String(50), nullable=False),
+    Column("parcel_no", String(50), nullable=False),
+    Column("area_m2", Numeric(12, 2), nullable=False),
+    Column("area_donum", Numeric(10, 2), nullable=False),
+    Column("boundary", GeometryType("POLYGON", srid=SRID, spatial_index=False), nullable=True),
+    Column("is_active", Boolean, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+
+# ------------------------------------------------------------------
+# Lehçeye göre derlenen mekânsal ifadeler
+# ------------------------------------------------------------------
+class _BBoxOverlaps(ColumnElement[bool]):
+    """Sınır kutusu kesişimi: PostgreSQL'de GiST kullanan `&&` operatörü."""
+
+    inherit_cache = True
+    type = Boolean()
+    _traverse_internals = [("left", InternalTraversal.dp_clauseelement), ("right", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, left: Any, right: Any) -> None:
+        self.left = left
+        self.right = right
+
+
+class _WithinMeters(ColumnElement[bool]):
+    """Elipsoid üzerinde metre cinsinden mesafe testi."""
+
+    inherit_cache = True
+    type = Boolean()
+    _traverse_internals = [
+        ("left", InternalTraversal.dp_clauseelement),
+        ("right", InternalTraversal.dp_clauseelement),
+        ("meters", InternalTraversal.dp_clauseelement),
+    ]
+
+    def __init__(self, left: Any, right: Any, meters: float) -> None:
+        self.left = left
+        self.right = right
+        self.meters = literal(float(meters))
+
+
+@compiles(_BBoxOverlaps)
+def _bbox_overlaps_spatialite(element: _BBoxOverlaps, compiler: Any, **kw: Any) -> str:
+    return f"MbrIntersects({compiler.process(element.left, **kw)}, {compiler.process(element.right, **kw)})"
+
+
+@compiles(_BBoxOverlaps, "postgresql")
+def _bbox_overlaps_postgis(element: _BBoxOverlaps, compiler: Any, **kw: Any) -> str:
+    return f"({compiler.process(element.left, **kw)} && {compiler.process(element.right, **kw)})"
+
+
+@compiles(_WithinMeters)
+def _within_meters_spatialite(element: _WithinMeters, compiler: Any, **kw: Any) -> str:
+    left, right, meters = (compiler.process(e, **kw) for e in (element.left, element.right, element.meters))
+    return f"PtDistWithin({left}, {right}, {meters}, 1)"
+
+
+@compiles(_WithinMeters, "postgresql")
+def _within_meters_postgis(element: _WithinMeters, compiler: Any, **kw: Any) -> str:
+    left, right, meters = (compiler.process(e, **kw) for e in (element.left, element.right, element.meters))
+    return f"ST_DWithin(CAST({left} AS geography), CAST({right} AS geography), {meters})"
+
+
+# ------------------------------------------------------------------
+# Sorgu modeli
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class FieldSpatialQuery:
+    """Tarla araması; verilen tüm koşullar AND ile birleşir.
+
+    bbox: (minx, miny, maxx, maxy) derece; sınır kutusu kesişimi.
+    intersects: Sınırı bu geometriyle kesişen tarlalar.
+    near: (geometri, metre); sınırı geometriye en çok bu mesafede olan tarlalar.
+    min_area_m2 / max_area_m2: Kayıtlı alan aralığı (kapalı).
+    """
+
+    bbox: Optional[tuple[float, float, float, float]] = None
+    intersects: Optional[Geometry] = None
+    near: Optional[tuple[Geometry, float]] = None
+    min_area_m2: Optional[float] = None
+    max_area_m2: Optional[float] = None
+    user_id: Optional[uuid.UUID] = None
+    province: Optional[str] = None
+    active_only: bool = True
+
+
+@dataclass(frozen=True)
+class FieldRecord:
+    field: Field
+    boundary: Optional[Geometry]
+
+
+@dataclass(frozen=True)
+class FieldPage:
+    """Keyset sayfası; next_cursor None ise son sayfadır."""
+
+    items: List[FieldRecord]
+    next_cursor: Optional[uuid.UUID]
+
+
+def _wkb_param(geometry: Geometry) -> Any:
+    return func.ST_GeomFromWKB(literal(shapely.to_wkb(geometry.shape), LargeBinary), SRID)
+
+
+def _envelope(minx: float, miny: float, maxx: float, maxy: float) -> Any:
+    return func.ST_MakeEnvelope(float(minx), float(miny), float(maxx), float(maxy), SRID)
+
+
+def _distance_envelope(geometry: Geometry, meters: float) -> Any:
+    minx, miny, maxx, maxy = geometry.bounds
+    widest_lat = min(max(abs(miny), abs(maxy)), 89.0)
+    dlat = meters / _M_PER_DEG_LAT * _ENVELOPE_MARGIN
+    dlon = meters / (_M_PER_DEG_LON_EQUATOR * math.cos(math.radians(min(widest_lat + dlat, 89.0)))) * _ENVELOPE_MARGIN
+    return _envelope(minx - dlon, miny - dlat, maxx + dlon, maxy + dlat)
+
+
+def build_search_statement(
+    query: FieldSpatialQuery, *, limit: int = DEFAULT_PAGE_SIZE, after: Optional[uuid.UUID] = None
+) -> Select[Any]:
+    """Aramanın SELECT ifadesi (limit + 1 satır; fazlası sonraki sayfanın varlığını gösterir)."""
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be within 1..{MAX_PAGE_SIZE}")
+    boundary = fields.c.boundary
+    conditions: list[Any] = []
+    if query.bbox is not None:
+        minx, miny, maxx, maxy = query.bbox
+        if not (minx < maxx and miny < maxy):
+            raise ValueError("bbox must be (minx, miny, maxx, maxy) with min < max")
+        conditions.append(_BBoxOverlaps(boundary, _envelope(minx, miny, maxx, maxy)))
+    if query.intersects is not None:
+        target = _wkb_param(query.intersects)
+        conditions.append(_BBoxOverlaps(boundary, target))
+        conditions.append(func.ST_Intersects(boundary, target))
+    if query.near is not None:
+        geometry, meters = query.near
+        if meters < 0:
+            raise ValueError("distance must be >= 0")
+        conditions.append(_BBoxOverlaps(boundary, _distance_envelope(geometry, meters)))
+        conditions.append(_WithinMeters(boundary, _wkb_param(geometry), meters))
+    if query.min_area_m2 is not None:
+        conditions.append(fields.c.area_m2 >= query.min_area_m2)
+    if query.max_area_m2 is not None:
+        conditions.append(fields.c.area_m2 <= query.max_area_m2)
+    if query.user_id is not None:
+        conditions.append(fields.c.user_id == query.user_id)
+    if query.province is not None:
+        conditions.append(fields.c.province == query.province)
+    if query.active_only:
+        conditions.append(fields.c.is_active.is_(True))
+    if after is not None:
+        conditions.append(fields.c.field_id > after)
+    return _select_fields().where(*conditions).order_by(fields.c.field_id).limit(limit + 1)
+
+
+def _select_fields() -> Select[Any]:
+    columns = [c for c in fields.c if c.name != "boundary"]
+    return select(*columns, func.ST_AsBinary(fields.c.boundary).label("boundary_wkb"))
+
+
+def _decode(rows: Sequence[Any]) -> List[FieldRecord]:
+    wkbs = np.empty(len(rows), dtype=object)
+    wkbs[:] = [None if row.boundary_wkb is None else bytes(row.boundary_wkb) for row in rows]
+    shapes = shapely.from_wkb(wkbs)
+    records = []
+    for row, shape in zip(rows, shapes.tolist(), strict=True):
+        boundary = Geometry.from_shapely(shape) if shape is not None else None
+        field = Field(
+            field_id=row.field_id,
+            user_id=row.user_id,
+            province=row.province,
+            district=row.district,
+            village=row.village,
+            ada=row.block_no,
+            parsel=row.parcel_no,
+            area_m2=Decimal(row.area_m2),
+            status=FieldStatus.ACTIVE if row.is_active else FieldStatus.INACTIVE,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            geometry=boundary.to_geojson() if boundary is not None else None,
+        )
+        records.append(FieldRecord(field=field, boundary=boundary))
+    return records
+
+
+class SqlAlchemyFieldRepository(FieldRepository):
+    """FieldRepository'nin AsyncSession ile implementasyonu.
+
+    Commit çağıranın (unit of work) sorumluluğundadır. dialect_name upsert
+    ifadesinin lehçesini seçer; yerel testlerde "sqlite".
+    """
+
+    def __init__(self, session: Any, *, dialect_name: str = "postgresql") -> None:
+        self.session = session
+        self._insert = postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+
+    async def save(self, field: Field) -> None:
+        boundary = Geometry.from_geojson(field.geometry) if field.geometry is not None else None
+        values = {
+            "field_id": field.field_id,
+            "user_id": field.user_id,
+            "province": field.province,
+            "district": field.district,
+            "village": field.village,
+            "block_no": field.ada,
+            "parcel_no": field.parsel,
+            "area_m2": field.area_m2,
+            "area_donum": field.area_donum,
+            "boundary": _wkb_param(boundary) if boundary is not None else None,
+            "is_active": field.status == FieldStatus.ACTIVE,
+            "created_at": field.created_at,
+            "updated_at": field.updated_at,
+        }
+        stmt = self._insert(fields).values(**values)
+        updates = {k: stmt.excluded[k] for k in values if k not in ("field_id", "created_at")}
+        await self.session.execute(stmt.on_conflict_do_update(index_elements=[fields.c.field_id], set_=updates))
+
+    async def find_by_id(self, field_id: uuid.UUID) -> Optional[Field]:
+        records = await self._fetch(_select_fields().where(fields.c.field_id == field_id))
+        return records[0].field if records else None
+
+    async def find_by_parcel_ref(
+        self,
+        province: str,
+        district: str,
+        village: str,
+        ada: str,
+        parsel: str,
+    ) -> Optional[Field]:
+        stmt = _select_fields().where(
+            fields.c.province == province,
+            fields.c.district == district,
+            fields.c.village == village,
+            fields.c.block_no == ada,
+            fields.c.parcel_no == parsel,
+        )
+        records = await self._fetch(stmt)
+        return records[0].field if records else None
+
+    async def list_by_user_id(self, user_id: uuid.UUID) -> List[Field]:
+        stmt = _select_fields().where(fields.c.user_id == user_id).order_by(fields.c.field_id)
+        return [record.field for record in await self._fetch(stmt)]
+
+    async def list_by_province(self, province: str) -> List[Field]:
+        stmt = _select_fields().where(fields.c.province == province).order_by(fields.c.field_id)
+        return [record.field for record in await self._fetch(stmt)]
+
+    async def delete(self, field_id: uuid.UUID) -> None:
+        result = await self.session.execute(delete(fields).where(fields.c.field_id == field_id))
+        if result.rowcount == 0:
+            raise KeyError(str(field_id))
+
+    async def search(
+        self,
+        query: FieldSpatialQuery,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        after: Optional[uuid.UUID] = None,
+    ) -> FieldPage:
+        """Mekânsal arama; sayfalar field_id sırasıyla, imleç son field_id'dir."""
+        records = await self._fetch(build_search_statement(query, limit=limit, after=after))
+        if len(records) <= limit:
+            return FieldPage(items=records, next_cursor=None)
+        records = records[:limit]
+        return FieldPage(items=records, next_cursor=records[-1].field.field_id)
+
+    async def _fetch(self, stmt: Any) -> List[FieldRecord]:
+        result = await self.session.execute(stmt)
+        return _decode(result.all())
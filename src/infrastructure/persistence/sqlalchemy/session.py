@@ -1,3 +1,44 @@
 # PATH: src/infrastructure/persistence/sqlalchemy/session.py
 # DESC: DB engine ve request-scope Session üretimi.
-# TODO: Implement this file.
+"""
+Senkron SQLAlchemy Session üretimi (CLI ve batch işleri).
+
+Amaç: DATABASE_URL (uygulama için `postgresql+asyncpg://`) ile senkron
+  engine kuran CLI komutlarının (weekly-planner, demand-forecast) tek
+  giriş noktası olmak.
+
+Hata Modları (idempotency/retry/rate limit):
+  URL tanımlı değilse RuntimeError (kullanıcı girdisi değil, ortam/altyapı
+  hatası; CLI bunu doğrulama hatası olarak değil çalışma hatası olarak raporlar). Async sürücü adı, alembic/env.py'deki
+  gibi senkron sürücüye çevrilir.
+
+Bağımlılıklar: sqlalchemy.
+"""
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+_ASYNC_DRIVERS = {
+    "postgresql+asyncpg://": "postgresql://",
+    "sqlite+aiosqlite://": "sqlite://",
+}
+
+
+def sync_database_url(url: str) -> str:
+    """Async sürücülü URL'yi senkron sürücü karşılığına çevirir; diğerlerini aynen döner."""
+    for async_prefix, sync_prefix in _ASYNC_DRIVERS.items():
+        if url.startswith(async_prefix):
+            return sync_prefix + url[len(async_prefix) :]
+    return url
+
+
+def open_sync_session(url: Optional[str] = None) -> Session:
+    """DATABASE_URL/DB_URL (veya verilen url) için senkron Session açar; kapatmak çağıranın işidir."""
+    url = url or os.getenv("DATABASE_URL") or os.getenv("DB_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL/DB_URL is required")
+    return Session(create_engine(sync_database_url(url), pool_pre_ping=True))
@@ -12,6 +12,7 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
+from src.infrastructure.external.http_clients import get_http_client_registry
 from src.presentation.api.middleware.anomaly_detection_middleware import AnomalyDetectionMiddleware
 from src.presentation.api.middleware.cors_middleware import add_cors_middleware
 from src.presentation.api.middleware.jwt_middleware import JwtMiddleware
@@ -38,9 +39,18 @@ from src.presentation.api.v1 import (
 
 
 @asynccontextmanager
-async def _lifespan(_app: FastAPI):
-    """Lifecycle hooks for startup/shutdown tasks."""
-    yield
+async def _lifespan(app: FastAPI):
+    """Lifecycle hooks for startup/shutdown tasks.
+
+    Outbound adapters borrow pooled clients from the shared HTTP client
+    registry; the pools are closed when the app shuts down.
+    """
+    http_clients = get_http_client_registry()
+    app.state.http_clients = http_clients
+    try:
+        yield
+    finally:
+        await http_clients.aclose()
 
 
 async def _corr_id_middleware(request: Request, call_next):
@@ -3,10 +3,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from dataclasses import dataclass
 from typing import Protocol
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/fields", tags=["fields"])
@@ -48,6 +49,35 @@ def get_field_service() -> FieldService:
     return _InMemoryFieldService()
 
 
+BBox = tuple[float, float, float, float]
+
+
+class FieldMapService(Protocol):
+    def feature_collection(self, *, bbox: BBox, zoom: int, subject: str, roles: Collection[str]) -> str:
+        ...
+
+
+@dataclass(slots=True)
+class _EmptyFieldMapService:
+    def feature_collection(self, *, bbox: BBox, zoom: int, subject: str, roles: Collection[str]) -> str:
+        _ = (bbox, zoom, subject, roles)
+        return '{"type":"FeatureCollection","features":[]}'
+
+
+def get_field_map_service() -> FieldMapService:
+    return _EmptyFieldMapService()
+
+
+def _parse_bbox(raw: str) -> BBox:
+    try:
+        minx, miny, maxx, maxy = (float(part) for part in raw.split(","))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="bbox must be minx,miny,maxx,maxy") from None
+    if not (-180.0 <= minx < maxx <= 180.0 and -90.0 <= miny < maxy <= 90.0):
+        raise HTTPException(status_code=422, detail="bbox out of range")
+    return (minx, miny, maxx, maxy)
+
+
 def _require_authenticated_subject(request: Request) -> str:
     user = getattr(request.state, "user", None)
     if user is None:
@@ -70,3 +100,21 @@ def create_field(
 def list_fields(request: Request, service: FieldService = Depends(get_field_service)) -> list[FieldResponse]:
     subject = _require_authenticated_subject(request)
     return service.list_by_owner(owner_subject=subject)
+
+
+@router.get("/map", response_class=Response, responses={200: {"content": {"application/geo+json": {}}}})
+def get_field_map(
+    request: Request,
+    bbox: str = Query(min_length=7, max_length=128),
+    zoom: int = Query(default=12, ge=0, le=22),
+    service: FieldMapService = Depends(get_field_map_service),
+) -> Response:
+    # KR-016: boundaries are simplified to the requested zoom; full resolution only at high zoom.
+    # Non-admin callers only see their own fields; the service scopes by subject and roles.
+    subject = _require_authenticated_subject(request)
+    roles = frozenset(getattr(request.state, "roles", []))
+    try:
+        body = service.feature_collection(bbox=_parse_bbox(bbox), zoom=zoom, subject=subject, roles=roles)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return Response(content=body, media_type="application/geo+json")
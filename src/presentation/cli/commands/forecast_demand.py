@@ -0,0 +1,102 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""Seasonal demand forecast command."""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import re
+import sys
+from typing import Callable
+
+EXIT_SUCCESS = 0
+EXIT_ERROR = 1
+EXIT_VALIDATION = 2
+
+_WEEK_PATTERN = re.compile(r"^\d{4}-(0[1-9]|[1-4][0-9]|5[0-3])$")
+
+
+def _load_service() -> object:
+    try:
+        from src.application.services import demand_forecast
+    except (ImportError, ModuleNotFoundError, SyntaxError) as exc:
+        raise RuntimeError("TODO: src.application.services.demand_forecast is not available") from exc
+    return demand_forecast
+
+
+def register(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) -> argparse.ArgumentParser:
+    parser = subparsers.add_parser("forecast-demand", help="Forecast province x week scan demand vs pilot capacity")
+    parser.add_argument("--season", type=int, default=dt.date.today().isocalendar()[0], help="ISO season year")
+    parser.add_argument("--from-week", help="First ISO week YYYY-WW (default: season start)")
+    parser.add_argument("--to-week", help="Last ISO week YYYY-WW (default: season end)")
+    parser.add_argument("--output", default="-", help="CSV/Parquet target ('-' = CSV on stdout)")
+    parser.add_argument("--format", choices=("csv", "parquet"), help="Output format (default: from --output suffix)")
+    parser.add_argument("--max-work-days", type=int, default=6)
+    parser.add_argument("--daily-capacity", type=int, default=2500)
+    parser.add_argument("--config", help="seasonal_config.yaml path")
+    parser.set_defaults(handler=handle)
+    return parser
+
+
+def _validate(args: argparse.Namespace) -> str | None:
+    # KR-015
+    for flag, value in (("--from-week", args.from_week), ("--to-week", args.to_week)):
+        if value is not None and not _WEEK_PATTERN.match(value):
+            return f"{flag} must match YYYY-WW"
+    if args.max_work_days < 1 or args.max_work_days > 6:
+        return "--max-work-days must be in range 1..6"
+    if args.daily_capacity < 2500 or args.daily_capacity > 3000:
+        return "--daily-capacity must be in range 2500..3000"
+    return None
+
+
+def handle(args: argparse.Namespace) -> int:
+    error = _validate(args)
+    if error:
+        print(f"Validation error: {error}", file=sys.stderr)
+        return EXIT_VALIDATION
+
+    try:
+        service = _load_service()
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return EXIT_ERROR
+
+    runner: Callable[..., object] | None = getattr(service, "run", None)
+    if runner is None:
+        print("Error: demand_forecast.run is missing.", file=sys.stderr)
+        return EXIT_ERROR
+
+    try:
+        table = runner(
+            season=args.season,
+            from_week=args.from_week,
+            to_week=args.to_week,
+            output=args.output,
+            fmt=args.format,
+            work_days=args.max_work_days,
+            daily_capacity_donum=args.daily_capacity,
+            config_path=args.config,
+        )
+    except ValueError as exc:
+        print(f"Validation error: {exc}", file=sys.stderr)
+        return EXIT_VALIDATION
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return EXIT_ERROR
+    except Exception:
+        print("Demand forecast failed.", file=sys.stderr)
+        return EXIT_ERROR
+
+    # Tablo stdout'a akıyorsa özet stderr'e yazılır.
+    summary_stream = sys.stderr if args.output == "-" else sys.stdout
+    cells = table.shortfall_cells()  # type: ignore[attr-defined]
+    print(
+        f"forecast provinces={len(table.province_codes)} weeks={table.weeks} "  # type: ignore[attr-defined]
+        f"shortfall_cells={len(cells)}",
+        file=summary_stream,
+    )
+    return EXIT_SUCCESS
+
+
+__all__ = ["register", "handle"]
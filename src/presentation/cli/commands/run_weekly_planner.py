@@ -37,6 +37,9 @@ def register(subparsers: argparse._SubParsersAction[argparse.ArgumentParser]) ->
     parser.add_argument("--corr-id")
     parser.add_argument("--max-work-days", type=int, default=6)
     parser.add_argument("--daily-capacity", type=int, default=2500)
+    parser.add_argument("--workers", type=int, default=1, help="Parallel province shards (process count)")
+    parser.add_argument("--output", default="-", help="NDJSON target for --dry-run ('-' = stdout)")
+    parser.add_argument("--cache-dir", help="Planning result cache directory (reused across runs)")
     parser.set_defaults(handler=handle)
     return parser
 
@@ -49,9 +52,21 @@ def _validate(args: argparse.Namespace) -> str | None:
         return "--max-work-days must be in range 1..6"
     if args.daily_capacity < 2500 or args.daily_capacity > 3000:
         return "--daily-capacity must be in range 2500..3000"
+    if args.workers < 1:
+        return "--workers must be >= 1"
     return None
 
 
+def _report_shard_timings(result: object) -> None:
+    timings = getattr(result, "shard_timings", None) or ()
+    for timing in timings:
+        print(
+            f"shard province={timing.province_code} demands={timing.demand_count} "
+            f"slots={timing.slot_count} elapsed_s={timing.elapsed_s:.3f}",
+            file=sys.stderr,
+        )
+
+
 def handle(args: argparse.Namespace) -> int:
     error = _validate(args)
     if error:
@@ -78,18 +93,27 @@ def handle(args: argparse.Namespace) -> int:
             corr_id=corr_id,
             max_work_days=args.max_work_days,
             daily_capacity_donum=args.daily_capacity,
+            workers=args.workers,
+            output=args.output,
+            cache_dir=args.cache_dir,
         )
     except ValueError as exc:
         print(f"Validation error: {exc}", file=sys.stderr)
         return EXIT_VALIDATION
+    except RuntimeError as exc:
+        print(str(exc), file=sys.stderr)
+        return EXIT_ERROR
     except Exception:
         print("Weekly planner execution failed.", file=sys.stderr)
         return EXIT_ERROR
 
+    _report_shard_timings(result)
+    # Dry-run NDJSON stdout'a akıyorsa özet stderr'e yazılır; akış satır satır ayrıştırılabilir kalır.
+    summary_stream = sys.stderr if args.dry_run and args.output == "-" else sys.stdout
     if result is not None:
-        print(result)
+        print(result, file=summary_stream)
     else:
-        print(f"weekly planner executed (corr_id={corr_id})")
+        print(f"weekly planner executed (corr_id={corr_id})", file=summary_stream)
     return EXIT_SUCCESS
 
 
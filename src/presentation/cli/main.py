@@ -6,7 +6,14 @@ from __future__ import annotations
 import argparse
 import sys
 
-from src.presentation.cli.commands import expert_management, migrate, run_weekly_planner, seed, subscription_management
+from src.presentation.cli.commands import (
+    expert_management,
+    forecast_demand,
+    migrate,
+    run_weekly_planner,
+    seed,
+    subscription_management,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -14,6 +21,7 @@ def build_parser() -> argparse.ArgumentParser:
     subparsers = parser.add_subparsers(dest="command")
 
     expert_management.register(subparsers)
+    forecast_demand.register(subparsers)
     migrate.register(subparsers)
     run_weekly_planner.register(subparsers)
     seed.register(subparsers)
@@ -0,0 +1,105 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+# KR-016: Deterministic synthetic field boundaries and flight footprints for parity tests and benchmarks.
+
+from __future__ import annotations
+
+import numpy as np
+import shapely
+
+# Türkiye kapsayan kutu (lon, lat).
+TURKEY_BOUNDS = (26.0, 36.0, 45.0, 42.0)
+
+
+def make_field_rings(rng: np.random.Generator, count: int, *, bounds: tuple[float, ...] = TURKEY_BOUNDS) -> np.ndarray:
+    """Kare ızgara hücrelerine yerleşik, köşeleri oynatılmış dörtgen halkalar (count × 5 × 2).
+
+    Hücreler çakışmadığından tarlalar birbirine değmez; hücre boyu sayıya göre küçülür.
+    """
+    minx, miny, maxx, maxy = bounds
+    side = int(np.ceil(np.sqrt(count)))
+    cell_x, cell_y = (maxx - minx) / side, (maxy - miny) / side
+    cells = rng.permutation(side * side)[:count]
+    x0 = minx + (cells % side) * cell_x
+    y0 = miny + (cells // side) * cell_y
+    # Köşeler hücrenin iç %10-%90 bandında; saat yönünün tersine.
+    u = rng.uniform(0.1, 0.3, (count, 4))
+    v = rng.uniform(0.7, 0.9, (count, 4))
+    xs = np.stack([x0 + u[:, 0] * cell_x, x0 + v[:, 1] * cell_x, x0 + v[:, 2] * cell_x, x0 + u[:, 3] * cell_x], axis=1)
+    ys = np.stack([y0 + u[:, 0] * cell_y, y0 + u[:, 1] * cell_y, y0 + v[:, 2] * cell_y, y0 + v[:, 3] * cell_y], axis=1)
+    rings = np.stack([xs, ys], axis=2)
+    return np.concatenate([rings, rings[:, :1]], axis=1)
+
+
+def make_fields(rng: np.random.Generator, count: int, **kwargs: object) -> np.ndarray:
+    """shapely Polygon dizisi."""
+    return shapely.polygons(make_field_rings(rng, count, **kwargs))  # type: ignore[arg-type]
+
+
+def make_footprints(
+    rng: np.random.Generator, rings: np.ndarray, *, max_shift: float = 0.3, covered_share: float = 0.0
+) -> np.ndarray:
+    """Tarla halkalarını boyutlarının en çok max_shift oranı kadar kaydırıp %10'a kadar büyüten footprint'ler.
+
+    Kaydırma oranı 0'dan max_shift'e düzgün dağıldığından kapsam oranları
+    KR-016 eşiklerinin (0.80 / 0.95) iki yanına da düşer. covered_share
+    oranındaki footprint'ler kaydırılmadan 2 kat büyütülür (tarlayı tamamen
+    örten başarılı uçuş).
+    """
+    count = len(rings)
+    lo, hi = rings.min(axis=1), rings.max(axis=1)
+    size = hi - lo
+    center = (lo + hi) / 2
+    covered = rng.random(count) < covered_share
+    scale = np.where(covered[:, None, None], 2.0, rng.uniform(1.0, 1.1, (count, 1, 1)))
+    shift = rng.uniform(-max_shift, max_shift, (count, 1, 2)) * size[:, None, :] * ~covered[:, None, None]
+    moved = (rings - center[:, None, :]) * scale + center[:, None, :] + shift
+    return shapely.polygons(moved)
+
+
+def make_image_footprints(
+    rng: np.random.Generator,
+    bounds: tuple[float, float, float, float],
+    count: int,
+    *,
+    overlap: float = 0.7,
+    gap_share: float = 0.0,
+) -> np.ndarray:
+    """Kutu üzerinde ileri/yan bindirmeli serpantin uçuşun görüntü footprint'leri (count adet).
+
+    Görüntüler hafif döndürülmüş dörtgenlerdir; gap_share oranındaki kareler
+    atlanarak kapsam boşlukları oluşturulur.
+    """
+    minx, miny, maxx, maxy = bounds
+    side = int(np.ceil(np.sqrt(count / (1.0 - gap_share)))) + 1
+    step_x, step_y = (maxx - minx) / side, (maxy - miny) / side
+    half_w, half_h = step_x / (1.0 - overlap) / 2, step_y / (1.0 - overlap) / 2
+    index = np.arange(side * side)
+    row, col = index // side, index % side
+    col = np.where(row % 2 == 1, side - 1 - col, col)  # Serpantin hat
+    keep = rng.random(side * side) >= gap_share
+    cx = (minx + (col + 0.5) * step_x)[keep][:count]
+    cy = (miny + (row + 0.5) * step_y)[keep][:count]
+    angle = rng.normal(0.0, 0.05, len(cx))
+    corners = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0], [-1.0, -1.0]]) * (half_w, half_h)
+    cos, sin = np.cos(angle)[:, None], np.sin(angle)[:, None]
+    xs = cx[:, None] + corners[:, 0] * cos - corners[:, 1] * sin
+    ys = cy[:, None] + corners[:, 0] * sin + corners[:, 1] * cos
+    return shapely.polygons(np.stack([xs, ys], axis=2))
+
+
+def make_boundary_fields(
+    rng: np.random.Generator,
+    count: int,
+    *,
+    bounds: tuple[float, ...] = TURKEY_BOUNDS,
+    vertices_per_edge: int = 25,
+    noise_share: float = 0.002,
+) -> np.ndarray:
+    """Kadastro sınırı gibi çok köşeli tarlalar: kenarlar sıklaştırılıp köşeler hafifçe oynatılır."""
+    rings = make_field_rings(rng, count, bounds=bounds)
+    t = np.arange(vertices_per_edge)[None, None, :, None] / vertices_per_edge
+    edges = rings[:, :-1, None, :] + t * (rings[:, 1:, None, :] - rings[:, :-1, None, :])
+    points = edges.reshape(count, -1, 2)
+    size = (rings.max(axis=1) - rings.min(axis=1)).max(axis=1)
+    points = points + rng.normal(0.0, 1.0, points.shape) * (noise_share * size)[:, None, None]
+    return shapely.polygons(np.concatenate([points, points[:, :1]], axis=1))
@@ -0,0 +1,77 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+# KR-015: Deterministic synthetic planning inputs for equivalence tests and benchmarks.
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import date, timedelta
+
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot
+
+WEEK_START = date(2026, 4, 6)  # Pazartesi
+PROVINCE_CODES: tuple[str, ...] = tuple(f"{code:02d}" for code in range(1, 82))
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def make_pilot_slots(
+    rng: random.Random,
+    *,
+    pilots: int,
+    provinces: tuple[str, ...],
+    days: int = 7,
+    start: date = WEEK_START,
+    max_capacity: int = 4,
+) -> list[PilotSlot]:
+    """Her pilot için tek ilde, rastgele çalışma günlerinde slot üretir."""
+    slots: list[PilotSlot] = []
+    for _ in range(pilots):
+        pilot_id = _uuid(rng)
+        province_code = rng.choice(provinces)
+        daily_capacity = rng.randint(1, max_capacity)
+        for offset in range(days):
+            if rng.random() < 0.2:
+                continue
+            slots.append(
+                PilotSlot(
+                    pilot_id=pilot_id,
+                    date=start + timedelta(days=offset),
+                    province_code=province_code,
+                    remaining_capacity=rng.randint(0, daily_capacity),
+                    daily_capacity=daily_capacity,
+                )
+            )
+    return slots
+
+
+def make_demands(
+    rng: random.Random,
+    *,
+    count: int,
+    provinces: tuple[str, ...],
+    days: int = 7,
+    start: date = WEEK_START,
+    max_priority: int = 5,
+) -> list[MissionDemand]:
+    """Rastgele pencere ve öncelikli mission talepleri üretir."""
+    demands: list[MissionDemand] = []
+    for _ in range(count):
+        first = rng.randrange(days)
+        last = min(days - 1, first + rng.randrange(4))
+        demands.append(
+            MissionDemand(
+                demand_id=_uuid(rng),
+                field_id=_uuid(rng),
+                province_code=rng.choice(provinces),
+                crop_type=rng.choice(("WHEAT", "CORN", "COTTON", "SUNFLOWER")),
+                area_m2=float(rng.randint(50, 2500) * 1000),
+                priority=rng.randint(0, max_priority),
+                earliest_date=start + timedelta(days=first),
+                latest_date=start + timedelta(days=last),
+                estimated_duration_minutes=rng.randint(20, 240),
+            )
+        )
+    return demands
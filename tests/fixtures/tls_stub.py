@@ -0,0 +1,85 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+# KR-080: Local HTTPS stand-in for outbound adapter benchmarks (self-signed cert, separate uvicorn process).
+
+from __future__ import annotations
+
+import datetime
+import json
+import socket
+import ssl
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+_BODY = json.dumps({"main": {"temp": 21.5}, "wind": {"speed": 3.2}, "weather": [{"main": "Clear"}]}).encode()
+
+
+async def app(scope, receive, send) -> None:
+    """Sabit hava durumu yanıtı dönen ASGI uygulaması."""
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": _BODY})
+
+
+def make_self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    """localhost için kendinden imzalı sertifika ve anahtar (PEM)."""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "stub.crt", directory / "stub.key"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    return cert_path, key_path
+
+
+@contextmanager
+def tls_stub_server(directory: Path) -> Iterator[tuple[str, ssl.SSLContext]]:
+    """Ayrı süreçte HTTPS stub başlatır; (base_url, istemci SSLContext) verir."""
+    cert_path, key_path = make_self_signed_cert(directory)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    process = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable, "-m", "uvicorn", "tests.fixtures.tls_stub:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log",
+            "--ssl-certfile", str(cert_path), "--ssl-keyfile", str(key_path),
+        ],
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("TLS stub server did not start") from None
+                time.sleep(0.05)
+        yield f"https://localhost:{port}", ssl.create_default_context(cafile=str(cert_path))
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
@@ -0,0 +1,94 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+# KR-013: In-process TKGM/MEGSİS WFS stand-in (ASGI) for adapter integration tests and benchmarks.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs
+
+from src.core.domain.value_objects.parcel_ref import ParcelRef
+
+_CLAUSE = re.compile(
+    r"il='((?:[^']|'')*)' AND ilce='((?:[^']|'')*)' AND mahalle='((?:[^']|'')*)'"
+    r" AND ada='((?:[^']|'')*)' AND parsel='((?:[^']|'')*)'"
+)
+
+
+def make_parcel_refs(count: int, *, province: str = "Konya") -> list[ParcelRef]:
+    """Deterministik parsel referansları (ilçe/mahalle/ada/parsel sayaçtan türetilir)."""
+    return [
+        ParcelRef(
+            province=province,
+            district=f"Ilce{i % 31}",
+            village=f"Mahalle {i % 97}",
+            ada=str(100 + i // 50),
+            parsel=str(1 + i % 50),
+        )
+        for i in range(count)
+    ]
+
+
+@dataclass
+class StubWFS:
+    """Parselleri CQL_FILTER'daki eşitlik gruplarıyla arayan ASGI WFS.
+
+    known: stub'da kayıtlı parseller (diğerleri bulunamaz). latency_s her
+    isteğe eklenen sunucu süresidir. upper_names verilirse il/ilçe/mahalle
+    özellikleri (gerçek servis gibi) büyük harfle döner. requests, max_in_flight, url_lengths ve
+    started_at istemcinin ürettiği yükü ölçmek içindir.
+    """
+
+    known: list[ParcelRef]
+    latency_s: float = 0.0
+    upper_names: bool = False
+    requests: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    url_lengths: list[int] = field(default_factory=list)
+    started_at: list[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._index = {
+            (r.province, r.district, r.village, r.ada, r.parsel): i for i, r in enumerate(self.known)
+        }
+
+    def _feature(self, key: tuple[str, ...], i: int) -> dict:
+        x, y = 32.0 + (i % 100) * 0.01, 38.0 + (i // 100) * 0.01
+        ring = [[x, y], [x + 0.005, y], [x + 0.005, y + 0.005], [x, y + 0.005], [x, y]]
+        il, ilce, mahalle, ada, parsel = key
+        if self.upper_names:
+            il, ilce, mahalle = il.upper(), ilce.upper(), mahalle.upper()
+        return {
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [ring]},
+            # Gerçek servis gibi ada/parsel sayısal döner.
+            "properties": {"il": il, "ilce": ilce, "mahalle": mahalle, "ada": int(ada), "parsel": int(parsel), "alan": 1000 + i},
+        }
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.started_at.append(time.monotonic())
+        query = scope["query_string"].decode("ascii")
+        self.url_lengths.append(len(f"http://tkgm.test{scope['path']}?{query}"))
+        try:
+            if self.latency_s:
+                await asyncio.sleep(self.latency_s)
+            params = parse_qs(query)
+            features = []
+            for match in _CLAUSE.finditer(params.get("CQL_FILTER", [""])[0]):
+                key = tuple(value.replace("''", "'") for value in match.groups())
+                if key in self._index:
+                    features.append(self._feature(key, self._index[key]))
+            body = json.dumps({"type": "FeatureCollection", "features": features}).encode()
+        finally:
+            self.in_flight -= 1
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,72 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.tkgm_megsis_wfs_adapter import TKGMMegsisWFSAdapter
+from src.infrastructure.external.weather_api_adapter import WeatherAPIAdapter
+from tests.fixtures.wfs_stub import StubWFS, make_parcel_refs
+
+CALLERS = 1_000
+
+
+def test_simultaneous_parcel_lookups_make_one_upstream_call() -> None:
+    refs = make_parcel_refs(2)
+    stub = StubWFS(known=refs, latency_s=0.05)
+
+    async def run():
+        adapter = TKGMMegsisWFSAdapter(
+            Settings(tkgm_wfs_base_url="http://tkgm.test"), transport=httpx.ASGITransport(app=stub)
+        )
+        try:
+            return await asyncio.gather(*(adapter.get_geometry(refs[0]) for _ in range(CALLERS)))
+        finally:
+            await adapter.aclose()
+
+    results = asyncio.run(run())
+
+    assert stub.requests == 1
+    assert all(result is not None and result.parcel_ref == refs[0] for result in results)
+
+
+def test_simultaneous_forecast_lookups_make_one_upstream_call() -> None:
+    requests: list[str] = []
+
+    async def weather_api(scope, receive, send) -> None:
+        requests.append(scope["path"])
+        await asyncio.sleep(0.05)
+        body = {"list": [{"dt": 1_790_000_000 + 10_800 * i, "main": {"temp": 20.0 + i}, "wind": {"speed": 3.0}} for i in range(8)]}
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": json.dumps(body).encode()})
+
+    async def run():
+        adapter = WeatherAPIAdapter(
+            Settings(weather_api_url="http://weather.test"), transport=httpx.ASGITransport(app=weather_api)
+        )
+        same = await asyncio.gather(
+            *(adapter.get_forecast(latitude=37.87, longitude=32.48, hours_ahead=24) for _ in range(CALLERS))
+        )
+        other = await adapter.get_forecast(latitude=37.87, longitude=32.48, hours_ahead=48)
+        return same, other
+
+    same, other = asyncio.run(run())
+
+    assert requests == ["/forecast", "/forecast"]
+    assert all(len(forecast) == 8 for forecast in same) and len(other) == 8
+    assert same[0] is not same[1]  # Her çağırana ayrı liste
@@ -0,0 +1,210 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pytest
+import shapely
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.core.domain.entities.field import Field, FieldStatus
+from src.core.domain.value_objects.geometry import Geometry
+from src.infrastructure.persistence.sqlalchemy.repositories.field_repository_impl import (
+    FieldSpatialQuery,
+    SqlAlchemyFieldRepository,
+    build_search_statement,
+)
+from tests.fixtures.geometry_fixtures import make_field_rings
+
+NOW = datetime(2026, 4, 1, tzinfo=timezone.utc)
+BOUNDS = (32.0, 38.0, 32.2, 38.2)
+
+# PostGIS yerine: migration 002 şemasının SQLite karşılığı + SpatiaLite adlı Python UDF'leri.
+_DDL = """
+CREATE TABLE fields (
+    field_id CHAR(32) PRIMARY KEY, user_id CHAR(32) NOT NULL, coop_id CHAR(32),
+    province VARCHAR(100) NOT NULL, district VARCHAR(100) NOT NULL, village VARCHAR(100) NOT NULL,
+    block_no VARCHAR(50) NOT NULL, parcel_no VARCHAR(50) NOT NULL,
+    area_m2 NUMERIC(12, 2) NOT NULL, area_donum NUMERIC(10, 2) NOT NULL, boundary BLOB,
+    is_active BOOLEAN NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME NOT NULL,
+    CONSTRAINT uq_fields_parcel UNIQUE (province, district, village, block_no, parcel_no)
+)
+"""
+
+
+def _meters_apart(a: bytes, b: bytes) -> float:
+    left, right = shapely.from_wkb(a), shapely.from_wkb(b)
+    lat = math.radians(right.centroid.y)
+    scale = lambda coords: coords * (111_320.0 * math.cos(lat), 110_574.0)  # noqa: E731
+    return shapely.distance(shapely.transform(left, scale), shapely.transform(right, scale))
+
+
+def _register_udfs(dbapi_connection, _record) -> None:
+    wkb = shapely.from_wkb
+    dbapi_connection.create_function("AsBinary", 1, lambda g: g)
+    dbapi_connection.create_function("GeomFromWKB", 2, lambda g, _srid: g)
+    dbapi_connection.create_function(
+        "ST_MakeEnvelope", 5, lambda x0, y0, x1, y1, _srid: shapely.to_wkb(shapely.box(x0, y0, x1, y1))
+    )
+    dbapi_connection.create_function(
+        "MbrIntersects", 2, lambda a, b: int(shapely.box(*wkb(a).bounds).intersects(shapely.box(*wkb(b).bounds)))
+    )
+    dbapi_connection.create_function("ST_Intersects", 2, lambda a, b: int(wkb(a).intersects(wkb(b))))
+    dbapi_connection.create_function("PtDistWithin", 4, lambda a, b, d, _s: int(_meters_apart(a, b) <= d))
+
+
+class _AsyncSessionAdapter:
+    """AsyncSession arayüzünün repository'nin kullandığı kısmı; SQLite senkron oturumuna yönlendirir."""
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    async def execute(self, stmt):
+        return self._session.execute(stmt)
+
+
+@pytest.fixture()
+def repo():
+    engine = create_engine("sqlite://")
+    event.listen(engine, "connect", _register_udfs)
+    with Session(engine) as session:
+        session.execute(text(_DDL))
+        yield SqlAlchemyFieldRepository(_AsyncSessionAdapter(session), dialect_name="sqlite")
+
+
+def _fields(count: int) -> tuple[list[Field], np.ndarray]:
+    rng = np.random.default_rng(21)
+    shapes = shapely.polygons(make_field_rings(rng, count, bounds=BOUNDS))
+    user_ids = [uuid.uuid4(), uuid.uuid4()]
+    fields = [
+        Field(
+            field_id=uuid.uuid4(),
+            user_id=user_ids[i % 2],
+            province="Konya",
+            district="Karatay",
+            village=f"Köy{i // 50}",
+            ada=str(100 + i),
+            parsel=str(i),
+            area_m2=Decimal(str(round(Geometry.from_shapely(shape).area_m2, 2))),
+            status=FieldStatus.ACTIVE,
+            created_at=NOW,
+            updated_at=NOW,
+            geometry=Geometry.from_shapely(shape).to_geojson(),
+        )
+        for i, shape in enumerate(shapes)
+    ]
+    return fields, shapes
+
+
+def _save_all(repo, fields) -> None:
+    async def run():
+        for field in fields:
+            await repo.save(field)
+
+    asyncio.run(run())
+
+
+def _search_all(repo, query: FieldSpatialQuery, limit: int) -> list:
+    async def run():
+        items, after, pages = [], None, 0
+        while True:
+            page = await repo.search(query, limit=limit, after=after)
+            items.extend(page.items)
+            pages += 1
+            if page.next_cursor is None:
+                return items, pages
+            after = page.next_cursor
+
+    return asyncio.run(run())
+
+
+def test_postgis_statement_pushes_predicates_to_gist_and_keyset() -> None:
+    target = Geometry.from_shapely(shapely.box(32.0, 38.0, 32.1, 38.1))
+    query = FieldSpatialQuery(
+        bbox=BOUNDS, intersects=target, near=(Geometry.from_point(32.05, 38.05), 250.0), min_area_m2=1000
+    )
+
+    sql = str(build_search_statement(query, limit=100, after=uuid.uuid4()).compile(dialect=postgresql.dialect()))
+
+    assert sql.count("fields.boundary && ") == 3  # bbox, kesişim ve mesafe zarfı GiST ile
+    assert "ST_Intersects(fields.boundary, ST_GeomFromWKB(" in sql
+    assert "ST_DWithin(CAST(fields.boundary AS geography), CAST(ST_GeomFromWKB(" in sql
+    assert "fields.area_m2 >= " in sql and "fields.field_id > " in sql
+    assert "ST_AsBinary(fields.boundary) AS boundary_wkb" in sql
+    assert sql.rstrip().endswith("ORDER BY fields.field_id \n LIMIT %(param_4)s::INTEGER")
+    with pytest.raises(ValueError):
+        build_search_statement(FieldSpatialQuery(bbox=(1.0, 1.0, 0.0, 2.0)))
+
+
+def test_keyset_pages_match_bruteforce_filters(repo) -> None:
+    fields, shapes = _fields(300)
+    _save_all(repo, fields)
+    by_id = {field.field_id: shape for field, shape in zip(fields, shapes, strict=True)}
+    area = {field.field_id: float(field.area_m2) for field in fields}
+    window = shapely.box(32.05, 38.05, 32.12, 38.11)
+    point = shapely.Point(32.1, 38.1)
+
+    cases = [
+        (FieldSpatialQuery(bbox=window.bounds), lambda fid: by_id[fid].intersects(window)),
+        (FieldSpatialQuery(intersects=Geometry.from_shapely(window)), lambda fid: by_id[fid].intersects(window)),
+        (
+            FieldSpatialQuery(near=(Geometry.from_shapely(point), 800.0), min_area_m2=300_000, max_area_m2=500_000),
+            lambda fid: _meters_apart(shapely.to_wkb(by_id[fid]), shapely.to_wkb(point)) <= 800.0
+            and 300_000 <= area[fid] <= 500_000,
+        ),
+    ]
+    for query, keep in cases:
+        items, pages = _search_all(repo, query, limit=7)
+        expected = sorted((fid for fid in by_id if keep(fid)), key=lambda fid: fid.hex)
+        assert [item.field.field_id for item in items] == expected
+        assert len(expected) > 0 and pages == math.ceil(len(expected) / 7)
+        for item in items:
+            assert isinstance(item.boundary, Geometry)
+            assert item.boundary.shape.equals_exact(by_id[item.field.field_id], 0.0)
+
+
+def test_port_methods_roundtrip_upsert_and_delete(repo) -> None:
+    fields, _ = _fields(4)
+
+    async def run():
+        for field in fields:
+            await repo.save(field)
+        fields[0].status = FieldStatus.INACTIVE
+        await repo.save(fields[0])  # Upsert: aynı field_id güncellenir
+        loaded = await repo.find_by_id(fields[0].field_id)
+        by_parcel = await repo.find_by_parcel_ref("Konya", "Karatay", "Köy0", "101", "1")
+        mine = await repo.list_by_user_id(fields[0].user_id)
+        province = await repo.list_by_province("Konya")
+        inactive_hidden = await repo.search(FieldSpatialQuery(bbox=BOUNDS))
+        await repo.delete(fields[1].field_id)
+        with pytest.raises(KeyError):
+            await repo.delete(fields[1].field_id)
+        return loaded, by_parcel, mine, province, inactive_hidden, await repo.find_by_id(fields[1].field_id)
+
+    loaded, by_parcel, mine, province, inactive_hidden, deleted = asyncio.run(run())
+
+    assert loaded is not None and loaded.status == FieldStatus.INACTIVE
+    assert loaded.geometry == fields[0].geometry and loaded.area_m2 == fields[0].area_m2
+    assert by_parcel is not None and by_parcel.field_id == fields[1].field_id
+    assert {f.field_id for f in mine} == {fields[0].field_id, fields[2].field_id}
+    assert len(province) == 4 and deleted is None
+    assert fields[0].field_id not in {item.field.field_id for item in inactive_hidden.items}
@@ -0,0 +1,85 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import Session
+
+from src.infrastructure.persistence.repositories.schedule_entry_repository import (
+    ScheduleEntryRepository,
+    _metadata,
+    schedule_entries,
+    weekly_schedules,
+)
+
+WEEK_START = date(2026, 4, 6)
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    _metadata.create_all(engine)
+    with Session(engine) as db:
+        yield db
+
+
+def _rows(province: str, count: int) -> list[SimpleNamespace]:
+    pilot_id = uuid.uuid4()
+    return [
+        SimpleNamespace(
+            province_code=province,
+            mission_id=uuid.uuid4(),
+            pilot_id=pilot_id,
+            scheduled_date=WEEK_START + timedelta(days=i % 6),
+            estimated_area_donum=12.5,
+            slot_order=i // 6 + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def test_chunks_are_appended_and_schedule_totals_accumulate(session: Session) -> None:
+    repo = ScheduleEntryRepository(session)
+
+    repo.write_many(_rows("06", 5) + _rows("42", 2), week_start=WEEK_START)
+    repo.write_many(_rows("06", 3), week_start=WEEK_START)
+
+    totals = dict(
+        session.execute(select(weekly_schedules.c.province, weekly_schedules.c.total_missions)).all()
+    )
+    assert totals == {"06": 8, "42": 2}
+    assert session.execute(select(func.count()).select_from(schedule_entries)).scalar_one() == 10
+    assert session.execute(select(weekly_schedules.c.status).distinct()).scalars().all() == ["DRAFT"]
+
+
+def test_replanning_week_replaces_draft_entries(session: Session) -> None:
+    ScheduleEntryRepository(session).write_many(_rows("06", 6), week_start=WEEK_START)
+    ScheduleEntryRepository(session).write_many(_rows("06", 4), week_start=WEEK_START)
+
+    assert session.execute(select(func.count()).select_from(schedule_entries)).scalar_one() == 4
+    assert session.execute(select(weekly_schedules.c.total_missions)).scalar_one() == 4
+
+
+def test_published_schedule_is_not_overwritten(session: Session) -> None:
+    ScheduleEntryRepository(session).write_many(_rows("06", 2), week_start=WEEK_START)
+    session.execute(update(weekly_schedules).values(status="PUBLISHED"))
+    session.commit()
+
+    with pytest.raises(ValueError, match="PUBLISHED"):
+        ScheduleEntryRepository(session).write_many(_rows("06", 1), week_start=WEEK_START)
@@ -0,0 +1,109 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from src.core.domain.value_objects.parcel_ref import ParcelRef
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.tkgm_megsis_wfs_adapter import TKGMMegsisWFSAdapter
+from tests.fixtures.wfs_stub import StubWFS, make_parcel_refs
+
+
+def _adapter(stub: StubWFS, **overrides) -> TKGMMegsisWFSAdapter:
+    settings = Settings(tkgm_wfs_base_url="http://tkgm.test", **overrides)
+    return TKGMMegsisWFSAdapter(settings, transport=httpx.ASGITransport(app=stub))
+
+
+def test_batch_matches_single_lookups_and_respects_url_limit() -> None:
+    refs = make_parcel_refs(400)
+    refs.append(ParcelRef(province="Konya", district="Meram", village="Hacı'nın Köyü", ada="7", parsel="3"))
+    stub = StubWFS(known=refs[::2] + [refs[-1]])
+    query = refs[:300] + refs[:10] + [refs[-1]]  # Tekrarlar tek kez sorgulanır.
+
+    async def run():
+        adapter = _adapter(stub, tkgm_batch_max_url_length=2000, tkgm_requests_per_second=0)
+        try:
+            batch = await adapter.get_geometries_batch(query)
+            batch_requests = stub.requests
+            adapter._cache.clear()
+            singles = [await adapter.get_geometry(ref) for ref in query]
+            return batch, batch_requests, singles
+        finally:
+            await adapter.aclose()
+
+    batch, batch_requests, singles = asyncio.run(run())
+
+    assert [g.parcel_ref for g in batch] == [g.parcel_ref for g in singles if g is not None]
+    assert [g.area_m2 for g in batch] == [g.area_m2 for g in singles if g is not None]
+    assert len(batch) == 150 + 5 + 1
+    assert 1 < batch_requests <= 301 // 10
+    assert max(stub.url_lengths[:batch_requests]) <= 2000
+
+
+def test_batches_share_one_client_under_semaphore_and_rate_limit() -> None:
+    refs = make_parcel_refs(600)
+    stub = StubWFS(known=refs, latency_s=0.05)
+
+    async def run():
+        adapter = _adapter(stub, tkgm_batch_max_url_length=1500, tkgm_max_concurrency=3, tkgm_requests_per_second=40)
+        clients = set()
+        original = adapter._get_client
+
+        def tracking_client():
+            client = original()
+            clients.add(id(client))
+            return client
+
+        adapter._get_client = tracking_client
+        try:
+            result = await adapter.get_geometries_batch(refs)
+            cached = await adapter.get_geometries_batch(refs[:50])
+        finally:
+            await adapter.aclose()
+        return result, cached, clients
+
+    result, cached, clients = asyncio.run(run())
+
+    assert len(result) == 600 and len(cached) == 50
+    assert len(clients) == 1
+    assert stub.requests > 3  # İkinci çağrı tamamen cache'ten.
+    assert 1 < stub.max_in_flight <= 3
+    span = stub.started_at[-1] - stub.started_at[0]
+    assert (stub.requests - 1) / span <= 40 * 1.05
+
+
+def test_batch_matches_normalized_keys_and_falls_back_for_unmatched_features() -> None:
+    refs = make_parcel_refs(20)
+    refs.append(ParcelRef(province="Konya", district="Meram", village="Yaka", ada="007", parsel="03"))
+    # 'ı'.upper() == 'I' ve 'I'.casefold() == 'i': anahtar eşlenemez, tekil sorguya düşülür.
+    refs.append(ParcelRef(province="Konya", district="Meram", village="Hacılar", ada="9", parsel="1"))
+    missing = ParcelRef(province="Konya", district="Meram", village="Yok", ada="1", parsel="1")
+    stub = StubWFS(known=refs, upper_names=True)
+
+    async def run():
+        adapter = _adapter(stub, tkgm_requests_per_second=0)
+        try:
+            batch = await adapter.get_geometries_batch([*refs[:-1], missing, refs[-1]])
+            return batch, stub.requests, await adapter.get_geometry(refs[-1])
+        finally:
+            await adapter.aclose()
+
+    batch, requests, cached = asyncio.run(run())
+
+    assert [g.parcel_ref for g in batch] == refs
+    assert requests == 1 + 2  # Paket + eşlenmemiş iki parsel için tekil sorgu.
+    assert cached is not None and cached.parcel_ref == refs[-1]
@@ -0,0 +1,103 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Heap dispatcher ile eski bölge/güvenilirlik sezgiselinin yük dağılımı ve süresini yoğun yükte kıyaslamak.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+from src.core.domain.services.auto_dispatcher import AutoDispatcher
+from tests.fixtures.planning_fixtures import PROVINCE_CODES
+
+MONDAY = date(2026, 4, 6)
+
+
+@dataclass(frozen=True)
+class _Mission:
+    id: str
+    territory_id: str
+    scheduled_date: str
+    area_donum: int
+    sla_deadline: str | None = None
+
+
+@dataclass(frozen=True)
+class _Pilot:
+    id: str
+    territory_id: str
+    reliability_score: float
+    daily_capacity_donum: int
+    work_days: frozenset[int] = field(default_factory=lambda: frozenset(range(6)))
+
+    def max_capacity_with_emergency(self) -> int:
+        return int(self.daily_capacity_donum * 1.1)
+
+
+def _legacy_dispatch(missions: list[_Mission], pilots: list[_Pilot]) -> list[tuple[str, str]]:
+    """Önceki sezgisel: bölgedeki en güvenilir pilot, kısıt yok."""
+    by_territory: dict[str, list[_Pilot]] = {}
+    for p in pilots:
+        by_territory.setdefault(p.territory_id, []).append(p)
+    decisions = []
+    for m in missions:
+        candidates = by_territory.get(m.territory_id, [])
+        if candidates:
+            chosen = sorted(candidates, key=lambda x: x.reliability_score, reverse=True)[0]
+            decisions.append((m.id, chosen.id))
+    return decisions
+
+
+def test_heap_dispatcher_spreads_peak_load_across_fleet() -> None:
+    rng = random.Random(2026)
+    provinces = PROVINCE_CODES[:20]
+    pilots = [
+        _Pilot(
+            id=f"p{i:05d}",
+            territory_id=rng.choice(provinces),
+            reliability_score=round(rng.uniform(0.5, 1.0), 2),
+            daily_capacity_donum=rng.randint(2500, 3000),
+        )
+        for i in range(2_000)
+    ]
+    missions = [
+        _Mission(
+            id=f"m{i:06d}",
+            territory_id=rng.choice(provinces),
+            scheduled_date=(MONDAY + timedelta(days=rng.randrange(6))).isoformat(),
+            area_donum=rng.randint(100, 800),
+        )
+        for i in range(50_000)
+    ]
+
+    started = time.perf_counter()
+    legacy = _legacy_dispatch(missions, pilots)
+    legacy_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = AutoDispatcher().dispatch_many(missions, pilots)
+    heap_s = time.perf_counter() - started
+
+    legacy_load = Counter(pilot_id for _, pilot_id in legacy)
+    heap_load = Counter(d.pilot_id for d in result.decisions)
+    all_ids = [p.id for p in pilots]
+    legacy_counts = [legacy_load.get(pid, 0) for pid in all_ids]
+    heap_counts = [heap_load.get(pid, 0) for pid in all_ids]
+
+    assert max(heap_counts) * 10 < max(legacy_counts)
+    assert statistics.pstdev(heap_counts) * 5 < statistics.pstdev(legacy_counts)
+    assert sum(1 for c in heap_counts if c) > 10 * sum(1 for c in legacy_counts if c)
+    assert heap_s < max(2.0, legacy_s * 3)
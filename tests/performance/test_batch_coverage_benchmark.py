@@ -0,0 +1,92 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 5.000 (tarla, footprint) çiftinde toplu kapsam değerlendirmesini mission başına döngüyle karşılaştırmak.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+import uuid
+
+import numpy as np
+import pytest
+
+from src.core.domain.services.coverage_calculator import CoverageCalculator
+from src.core.domain.value_objects.geometry import Geometry
+from tests.fixtures.geometry_fixtures import make_field_rings, make_footprints
+
+PAIRS = 5_000
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.batch_coverage")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _per_mission_loop(fields: list[Geometry], footprints: list[Geometry]) -> list[bool]:
+    """Mevcut yol: her mission için Geometry kesişimi + CoverageCalculator.evaluate_coverage."""
+    calculator = CoverageCalculator()
+    sufficient = []
+    for field, footprint in zip(fields, footprints, strict=True):
+        ratio = min(field.coverage_ratio(footprint), 1.0)
+        field_area = field.area_m2
+        scale = field_area / field.area
+        result = calculator.evaluate_coverage(
+            mission_id=uuid.uuid4(),
+            field_id=uuid.uuid4(),
+            field_area_m2=field_area,
+            footprint_area_m2=footprint.area * scale,
+            intersection_area_m2=ratio * field_area,
+        )
+        sufficient.append(result.is_sufficient)
+    return sufficient
+
+
+def _timed(module, covered_share: float) -> tuple[float, float]:
+    rng = np.random.default_rng(2016)
+    rings = make_field_rings(rng, PAIRS)
+    fields = [Geometry.from_polygon_coords([ring.tolist()]) for ring in rings]
+    footprints = [Geometry.from_shapely(shape) for shape in make_footprints(rng, rings, covered_share=covered_share)]
+    evaluator = module.BatchCoverageEvaluator()
+
+    started = time.perf_counter()
+    loop_sufficient = _per_mission_loop(fields, footprints)
+    loop_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    evaluated = evaluator.evaluate(fields, footprints)
+    batch_s = time.perf_counter() - started
+
+    assert evaluated["is_sufficient"].tolist() == loop_sufficient
+    return loop_s, batch_s
+
+
+def test_batch_coverage_outpaces_per_mission_loop(record_property) -> None:
+    module = _load_module()
+
+    # Tipik teslim: uçuşların %85'i tarlayı tamamen örter; kesişim yalnızca kalanlar için hesaplanır.
+    loop_s, batch_s = _timed(module, covered_share=0.85)
+    # En kötü durum: her çift kısmi, her çiftte GEOS kesişimi gerekir.
+    worst_loop_s, worst_batch_s = _timed(module, covered_share=0.0)
+
+    record_property("batch_coverage_pairs", PAIRS)
+    record_property("batch_coverage_loop_s", round(loop_s, 4))
+    record_property("batch_coverage_batch_s", round(batch_s, 4))
+    record_property("batch_coverage_speedup", round(loop_s / batch_s, 1))
+    record_property("batch_coverage_all_partial_loop_s", round(worst_loop_s, 4))
+    record_property("batch_coverage_all_partial_batch_s", round(worst_batch_s, 4))
+
+    assert batch_s * 2 < loop_s
+    # Kısmi çiftlerde süre GEOS kesişimine bağlıdır; toplu yol en azından yavaş değildir.
+    assert worst_batch_s < 1.2 * worst_loop_s
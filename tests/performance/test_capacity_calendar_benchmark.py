@@ -0,0 +1,76 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 2.000 pilot × tam sezon kapasite takviminin bellek izi ve sorgu gecikmesini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+import time
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.domain.value_objects.pilot_schedule import PilotSchedule
+from tests.fixtures.planning_fixtures import PROVINCE_CODES
+
+SEASON_START = date(2026, 3, 2)
+SEASON_DAYS = 280  # Mart–Kasım
+
+
+def test_full_season_calendar_memory_and_latency() -> None:
+    try:
+        module = importlib.import_module("src.application.services.capacity_calendar")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+    rng = random.Random(2_000)
+    schedules = {
+        uuid.uuid4(): PilotSchedule(
+            work_days=frozenset(rng.sample(range(7), k=6)), daily_capacity_donum=rng.randint(2500, 3000)
+        )
+        for _ in range(2_000)
+    }
+    provinces = {pid: rng.choice(PROVINCE_CODES) for pid in schedules}
+    pilot_ids = list(schedules)
+    bookings = 300_000
+    booked_pilots = [rng.choice(pilot_ids) for _ in range(bookings)]
+    booked_days = [SEASON_START + timedelta(days=rng.randrange(SEASON_DAYS)) for _ in range(bookings)]
+    amounts = [rng.randint(100, 1500) for _ in range(bookings)]
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    calendar = module.FleetCapacityCalendar.from_schedules(
+        schedules, provinces, start=SEASON_START, days=SEASON_DAYS
+    )
+    calendar.book_many(booked_pilots, booked_days, amounts)
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    utilization = calendar.utilization()
+    heatmap = calendar.free()
+    rollup = calendar.province_rollup()
+    first = calendar.first_free_days(5, min_free=1000)
+    query_s = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert utilization.shape == (2_000,)
+    assert heatmap.shape == (2_000, SEASON_DAYS)
+    assert len(rollup.province_codes) <= len(PROVINCE_CODES)
+    assert first.shape == (2_000, 5)
+    assert calendar.nbytes < 6 * 1024 * 1024
+    assert peak < 64 * 1024 * 1024
+    assert build_s < 5.0
+    assert query_s < 1.0
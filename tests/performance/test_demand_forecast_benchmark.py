@@ -0,0 +1,75 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 81 il × tam sezon (53 ISO hafta) talep/açık öngörüsünün süresini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from tests.fixtures.planning_fixtures import PROVINCE_CODES
+
+SUBSCRIPTIONS = 300_000
+CROPS = np.array(["PAMUK", "BUGDAY", "MISIR", "ANTEP_FISTIGI", "ZEYTIN", "UZUM", "AYCICEGI"], dtype=object)
+SEASONAL_CONFIG = Path(__file__).resolve().parents[2] / "seasonal_config.yaml"
+
+
+def _load_modules():
+    try:
+        forecast = importlib.import_module("src.application.services.demand_forecast")
+        season = importlib.import_module("src.application.services.season_schedule_generator")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+    return forecast, season
+
+
+def _columns(module, first_week: date, count: int):
+    rng = np.random.default_rng(2026)
+    start = first_week.toordinal() - 30 + rng.integers(0, 360, count)
+    return module.SubscriptionColumns(
+        province_codes=np.asarray(PROVINCE_CODES, dtype=object)[rng.integers(0, len(PROVINCE_CODES), count)],
+        crop_types=CROPS[rng.integers(0, len(CROPS), count)],
+        area_donum=rng.uniform(5.0, 500.0, count),
+        interval_days=rng.choice(np.array([7, 10, 14, 21]), count),
+        start_ordinal=start,
+        end_ordinal=start + rng.integers(30, 240, count),
+    )
+
+
+def test_full_season_forecast_for_81_provinces_well_under_a_second(record_property) -> None:
+    module, season = _load_modules()
+    policy = season.SeasonalScanPolicy.from_mapping(yaml.safe_load(SEASONAL_CONFIG.read_text(encoding="utf-8")))
+    first_week, weeks = module.season_window(2026)
+    columns = _columns(module, first_week, SUBSCRIPTIONS)
+    pilot_days = {code: 6.0 * (1 + i % 5) for i, code in enumerate(PROVINCE_CODES)}
+    engine = module.DemandForecastEngine(policy)
+
+    started = time.perf_counter()
+    table = engine.forecast(
+        columns, first_week=first_week, weeks=weeks, pilot_days=pilot_days, province_codes=PROVINCE_CODES
+    )
+    elapsed = time.perf_counter() - started
+
+    record_property("demand_forecast_subscriptions", SUBSCRIPTIONS)
+    record_property("demand_forecast_wall_s", round(elapsed, 4))
+    record_property("demand_forecast_table_bytes", table.nbytes)
+    record_property("demand_forecast_shortfall_cells", int((table.shortfall_donum > 0).sum()))
+
+    assert table.demand_donum.shape == (81, 53)
+    assert table.demand_donum.sum() > 0
+    assert elapsed < 0.5
@@ -0,0 +1,66 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 10k tarlalık bbox harita isteğinde LOD seviyesi başına GeoJSON yük boyutunu ve yanıt gecikmesini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+
+import numpy as np
+import pytest
+import shapely
+
+from tests.fixtures.geometry_fixtures import make_boundary_fields
+
+FIELDS = 10_000
+BOUNDS = (32.0, 38.0, 33.0, 39.0)
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.field_geometry_lod")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def test_bbox_request_payload_and_latency_per_level(record_property) -> None:
+    module = _load_module()
+    fields = make_boundary_fields(np.random.default_rng(2020), FIELDS, bounds=BOUNDS)
+    layer = module.FieldMapLayer()
+
+    started = time.perf_counter()
+    layer.add(list(range(FIELDS)), list(fields))
+    record_property("field_lod_build_10k_s", round(time.perf_counter() - started, 3))
+
+    # Önceki yol: her istekte tam çözünürlüklü sınırlar serileştirilir.
+    started = time.perf_counter()
+    full_payload = sum(map(len, shapely.to_geojson(fields).tolist()))
+    full_s = time.perf_counter() - started
+    record_property("field_lod_uncached_full_bytes", full_payload)
+    record_property("field_lod_uncached_full_ms", round(full_s * 1000, 1))
+
+    payloads = {}
+    for zoom in (*layer.cache.zooms, 20):
+        started = time.perf_counter()
+        body = layer.feature_collection(bbox=BOUNDS, zoom=zoom, subject="u-admin", roles={"admin"})
+        elapsed = time.perf_counter() - started
+        payloads[zoom] = len(body)
+        record_property(f"field_lod_z{zoom}_bytes", len(body))
+        record_property(f"field_lod_z{zoom}_ms", round(elapsed * 1000, 1))
+        assert body.count('"type":"Feature"') == FIELDS
+        assert elapsed < full_s
+
+    sizes = list(payloads.values())
+    assert sizes == sorted(sizes)
+    # Bölge görünümünde (zoom <= 11) yük tam çözünürlüğün onda birinin altında kalır.
+    assert payloads[11] * 10 < full_payload
@@ -0,0 +1,105 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 500k tarlalık STRtree dizininde nokta ve footprint sorgu gecikmesinin logaritmik kaldığını ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+
+import numpy as np
+import pytest
+import shapely
+
+from tests.fixtures.geometry_fixtures import TURKEY_BOUNDS, make_field_rings, make_footprints
+
+QUERY_POINTS = 20_000
+QUERY_FOOTPRINTS = 2_000
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.field_spatial_index")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _measure(module, count: int) -> dict[str, float]:
+    rng = np.random.default_rng(500)
+    rings = make_field_rings(rng, count)
+    fields = shapely.polygons(rings)
+    # Footprint'ler tarla ölçeğinde; sonuç sayısı yoğunluktan bağımsız kalır.
+    footprints = list(make_footprints(rng, rings[rng.integers(0, count, QUERY_FOOTPRINTS)]))
+    minx, miny, maxx, maxy = TURKEY_BOUNDS
+    lon = rng.uniform(minx, maxx, QUERY_POINTS)
+    lat = rng.uniform(miny, maxy, QUERY_POINTS)
+
+    started = time.perf_counter()
+    index = module.FieldSpatialIndex(np.arange(count).tolist(), list(fields))
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    located = index.locate_points(lon, lat)
+    point_us = (time.perf_counter() - started) / QUERY_POINTS * 1e6
+
+    started = time.perf_counter()
+    pairs = index.touching(footprints)
+    footprint_us = (time.perf_counter() - started) / QUERY_FOOTPRINTS * 1e6
+
+    started = time.perf_counter()
+    linear_hits = int(shapely.intersects(fields, shapely.points(lon[0], lat[0])).sum())
+    linear_point_us = (time.perf_counter() - started) * 1e6
+
+    assert linear_hits == int(located[0] >= 0)
+    assert len(set(pairs[0].tolist())) == QUERY_FOOTPRINTS
+    return {
+        "build_s": build_s,
+        "point_us": point_us,
+        "footprint_us": footprint_us,
+        "linear_point_us": linear_point_us,
+    }
+
+
+def test_query_latency_stays_logarithmic_up_to_500k_fields(record_property) -> None:
+    module = _load_module()
+
+    small = _measure(module, 10_000)
+    large = _measure(module, 500_000)
+
+    for key in ("build_s", "point_us", "footprint_us", "linear_point_us"):
+        record_property(f"field_index_10k_{key}", round(small[key], 3))
+        record_property(f"field_index_500k_{key}", round(large[key], 3))
+
+    # 50 kat büyük dizinde sorgu süresi doğrusal (50x) değil, log ölçekli artar.
+    assert large["point_us"] < 5 * small["point_us"]
+    assert large["footprint_us"] < 5 * small["footprint_us"]
+    assert large["point_us"] * 100 < large["linear_point_us"]
+    assert large["build_s"] < 5.0
+
+
+def test_incremental_adds_do_not_rebuild_per_field(record_property) -> None:
+    module = _load_module()
+    rng = np.random.default_rng(501)
+    fields = shapely.polygons(make_field_rings(rng, 201_000))
+    index = module.FieldSpatialIndex(np.arange(200_000).tolist(), list(fields[:200_000]))
+
+    started = time.perf_counter()
+    for i in range(200_000, 201_000):
+        index.add([i], [fields[i]])
+    add_s = time.perf_counter() - started
+    centroids = shapely.centroid(fields[200_000:])
+    located = index.locate_points(shapely.get_x(centroids), shapely.get_y(centroids))
+
+    record_property("field_index_1k_single_adds_s", round(add_s, 4))
+    assert index.rebuilds == 1  # Yalnızca ilk kurulum; 1.000 ekleme bekleme ağacında
+    assert located.tolist() == list(range(200_000, 201_000))
+    assert add_s < 0.5
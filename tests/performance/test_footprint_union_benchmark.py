@@ -0,0 +1,72 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 20k görüntülü mission'da akış halinde footprint birleşiminin tek union_all'a göre süre ve tutulan geometri boyutunu ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+
+import numpy as np
+import pytest
+import shapely
+
+from tests.fixtures.geometry_fixtures import make_field_rings, make_image_footprints
+
+IMAGES = 20_000
+INGEST_BATCH = 100
+RATIO_EVERY = 1_000
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.footprint_union")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def test_streaming_union_of_20k_images_against_single_union_all(record_property) -> None:
+    module = _load_module()
+    rng = np.random.default_rng(2019)
+    bounds = (32.0, 38.0, 32.02, 38.02)
+    field = shapely.polygons(make_field_rings(rng, 1, bounds=bounds)[0])
+    footprints = make_image_footprints(rng, (32.0, 38.0, 32.02, 38.017), IMAGES, gap_share=0.02)
+    total_coordinates = int(shapely.get_num_coordinates(footprints).sum())
+
+    # Önceki yol: tüm footprint'ler bellekte, mission sonunda tek birleşim.
+    started = time.perf_counter()
+    single = shapely.intersection(shapely.union_all(footprints), field).area / field.area
+    single_s = time.perf_counter() - started
+
+    accumulator = module.FootprintUnionAccumulator(field)
+    peak_geometries = peak_coordinates = 0
+    started = time.perf_counter()
+    for start in range(0, IMAGES, INGEST_BATCH):
+        accumulator.extend(footprints[start : start + INGEST_BATCH])
+        peak_geometries = max(peak_geometries, accumulator.retained_geometries)
+        if (start + INGEST_BATCH) % RATIO_EVERY == 0:
+            accumulator.coverage_ratio()
+            peak_coordinates = max(peak_coordinates, accumulator.retained_coordinates)
+    streamed = accumulator.coverage_ratio()
+    streaming_s = time.perf_counter() - started
+
+    record_property("footprint_union_single_s", round(single_s, 3))
+    record_property("footprint_union_streaming_s", round(streaming_s, 3))
+    record_property("footprint_union_peak_geometries", peak_geometries)
+    record_property("footprint_union_peak_coordinates", peak_coordinates)
+    record_property("footprint_union_total_coordinates", total_coordinates)
+
+    assert streamed == pytest.approx(single, rel=1e-9)
+    # Ara kapsam sorguları dahil akış yolu tek birleşimden yavaş değildir; bellekte tam küme tutulmaz.
+    assert streaming_s < 1.5 * single_s
+    assert peak_geometries <= 512 + 8 * 2
+    assert peak_coordinates * 20 < total_coordinates
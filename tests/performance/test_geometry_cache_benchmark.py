@@ -0,0 +1,123 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Geometry VO'nun WKB hash ve hazırlanmış geometri önbelleğinin 10k-1M çağrıda sabit, düşük maliyetli kaldığını ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+import shapely
+
+from src.core.domain.value_objects.geometry import Geometry
+from tests.fixtures.geometry_fixtures import make_field_rings
+
+CALL_COUNTS = (10_000, 100_000, 1_000_000)
+BASELINE_CALLS = 2_000
+PROBES = 1_000
+
+
+def _per_call_us(body: Callable[[int], None], calls: int) -> float:
+    started = time.perf_counter()
+    body(calls)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+@pytest.fixture(scope="module")
+def workload() -> dict[str, object]:
+    rng = np.random.default_rng(18)
+    ring = make_field_rings(rng, 1, bounds=(32.0, 38.0, 32.05, 38.05))[0]
+    # Gerçek kadastro sınırları yüzlerce köşe taşır.
+    shape = shapely.segmentize(shapely.polygons(ring), 0.0005)
+    wkb = shapely.to_wkb(shape)
+    lo, hi = ring.min(axis=0), ring.max(axis=0)
+    probes = [Geometry.from_point(x, y) for x, y in rng.uniform(lo, hi, (PROBES, 2)).tolist()]
+    return {
+        "field": Geometry.from_shapely(shapely.from_wkb(wkb)),
+        "twin": Geometry.from_shapely(shapely.from_wkb(wkb)),
+        # Hazırlanmamış kopya: önceki yol (her çağrıda WKT / GEOS yapısı yeniden kurulur).
+        "raw": shapely.from_wkb(wkb),
+        "raw_twin": shapely.from_wkb(wkb),
+        "probes": probes,
+    }
+
+
+def _hash_cached(field: Geometry) -> Callable[[int], None]:
+    def body(calls: int) -> None:
+        for _ in range(calls):
+            hash(field)
+
+    return body
+
+
+def _equality_cached(field: Geometry, twin: Geometry) -> Callable[[int], None]:
+    def body(calls: int) -> None:
+        for _ in range(calls):
+            assert field == twin
+
+    return body
+
+
+def _contains_prepared(field: Geometry, probes: list[Geometry]) -> Callable[[int], None]:
+    def body(calls: int) -> None:
+        for i in range(calls):
+            field.contains(probes[i % PROBES])
+
+    return body
+
+
+def test_hash_and_equality_are_constant_time_after_first_call(workload, record_property) -> None:
+    field, twin, raw, raw_twin = workload["field"], workload["twin"], workload["raw"], workload["raw_twin"]
+
+    def hash_wkt(calls: int) -> None:
+        for _ in range(calls):
+            hash(raw.wkt)
+
+    def equals_raw(calls: int) -> None:
+        for _ in range(calls):
+            raw.equals(raw_twin)
+
+    hash_baseline = _per_call_us(hash_wkt, BASELINE_CALLS)
+    equality_baseline = _per_call_us(equals_raw, BASELINE_CALLS)
+    record_property("geometry_hash_wkt_us", round(hash_baseline, 3))
+    record_property("geometry_equals_raw_us", round(equality_baseline, 3))
+
+    for calls in CALL_COUNTS:
+        hash_us = _per_call_us(_hash_cached(field), calls)
+        equality_us = _per_call_us(_equality_cached(field, twin), calls)
+        record_property(f"geometry_hash_{calls}_us", round(hash_us, 3))
+        record_property(f"geometry_equality_{calls}_us", round(equality_us, 3))
+        assert hash_us * 50 < hash_baseline
+        assert equality_us * 5 < equality_baseline
+
+
+def test_prepared_predicates_beat_unprepared_checks(workload, record_property) -> None:
+    field, raw, probes = workload["field"], workload["raw"], workload["probes"]
+    raw_probes = [probe.shape for probe in probes]
+
+    def contains_raw(calls: int) -> None:
+        for i in range(calls):
+            raw.contains(raw_probes[i % PROBES])
+
+    baseline = _per_call_us(contains_raw, BASELINE_CALLS)
+    record_property("geometry_contains_raw_us", round(baseline, 3))
+    assert not shapely.is_prepared(raw)
+
+    per_call = {}
+    for calls in CALL_COUNTS:
+        per_call[calls] = _per_call_us(_contains_prepared(field, probes), calls)
+        record_property(f"geometry_contains_prepared_{calls}_us", round(per_call[calls], 3))
+        assert per_call[calls] * 2 < baseline
+    # Önbellek büyümez; 1M çağrıda çağrı başı maliyet 10k ile aynı düzeyde kalır.
+    assert per_call[1_000_000] < 3 * per_call[10_000]
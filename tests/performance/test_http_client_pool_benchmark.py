@@ -0,0 +1,97 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Yerel TLS stub'a sabit hızlı yükte (4+ çekirdekte 500 rps, altında 200 rps) istek başına client açmanın paylaşılan havuzlu client'a göre gecikme ve CPU maliyetini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import ssl
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+import numpy as np
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config
+from tests.fixtures.tls_stub import tls_stub_server
+
+# İstemci ve stub aynı makinede çalışır; 4 çekirdeğin altında 500 rps TLS yükü iki yolu da
+# doyurur ve yalnızca kuyruk beklemesi ölçülür. Küçük makinelerde hedef 200 rps'dir.
+RPS = 500 if (os.cpu_count() or 1) >= 4 else 200
+DURATION_S = 2.0
+
+
+async def _paced(call: Callable[[int], Awaitable[None]]) -> tuple[np.ndarray, float]:
+    """RPS hızında istek başlatır; istek gecikmeleri (s) ve istemci CPU süresi (s)."""
+    latencies = np.zeros(int(RPS * DURATION_S))
+
+    async def one(i: int) -> None:
+        started = time.perf_counter()
+        await call(i)
+        latencies[i] = time.perf_counter() - started
+
+    cpu = time.process_time()
+    t0 = time.perf_counter()
+    tasks = []
+    for i in range(len(latencies)):
+        delay = t0 + i / RPS - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(one(i)))
+    await asyncio.gather(*tasks)
+    return latencies, time.process_time() - cpu
+
+
+def test_pooled_clients_against_client_per_call_under_paced_load(tmp_path, record_property) -> None:
+    with tls_stub_server(tmp_path) as (base_url, _):
+        cafile = str(tmp_path / "stub.crt")
+
+        async def per_call(i: int) -> None:
+            # Önceki adapter davranışı: her çağrıda yeni client (varsayılan SSL bağlamı + TLS el sıkışması).
+            async with httpx.AsyncClient(
+                base_url=base_url, timeout=httpx.Timeout(15), verify=ssl.create_default_context(cafile=cafile)
+            ) as client:
+                (await client.get("/current", params={"lat": 37.0 + i * 1e-4})).raise_for_status()
+
+        registry = HttpClientRegistry()
+        config = client_config(
+            Settings(), name="weather", base_url=base_url, timeout_seconds=15,
+            verify=ssl.create_default_context(cafile=cafile),
+        )
+
+        async def pooled(i: int) -> None:
+            async with registry.borrow(config) as client:
+                (await client.get("/current", params={"lat": 37.0 + i * 1e-4})).raise_for_status()
+
+        async def run_pooled() -> tuple[np.ndarray, float]:
+            try:
+                await pooled(0)  # Havuzu ısıt
+                return await _paced(pooled)
+            finally:
+                await registry.aclose()
+
+        baseline, baseline_cpu = asyncio.run(_paced(per_call))
+        shared, shared_cpu = asyncio.run(run_pooled())
+
+    requests = len(baseline)
+    record_property("rps", RPS)
+    record_property("per_call_p50_ms", round(float(np.median(baseline)) * 1e3, 2))
+    record_property("per_call_p95_ms", round(float(np.percentile(baseline, 95)) * 1e3, 2))
+    record_property("pooled_p50_ms", round(float(np.median(shared)) * 1e3, 2))
+    record_property("pooled_p95_ms", round(float(np.percentile(shared, 95)) * 1e3, 2))
+    record_property("per_call_cpu_ms_per_request", round(baseline_cpu / requests * 1e3, 3))
+    record_property("pooled_cpu_ms_per_request", round(shared_cpu / requests * 1e3, 3))
+
+    # CPU oranı yük altındaki makinede oynaktır; yalnızca kaydedilir, gecikme karşılaştırması yeterlidir.
+    assert np.median(shared) < np.median(baseline)
@@ -0,0 +1,44 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 50k atamalı haftada tek mission iptalinin artımlı yeniden planlama süresini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+
+from src.core.domain.services.incremental_planner import IncrementalPlanner, PlanningDelta
+from src.core.domain.services.planning_engine import PlanningEngine, PlanningStrategy
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, make_demands, make_pilot_slots
+
+
+def test_single_mission_replan_takes_milliseconds_on_50k_assignment_week() -> None:
+    rng = random.Random(50_000)
+    slots = make_pilot_slots(rng, pilots=9_000, provinces=PROVINCE_CODES)
+    demands = make_demands(rng, count=60_000, provinces=PROVINCE_CODES)
+
+    started = time.perf_counter()
+    previous = PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(demands, slots)
+    full_replan_s = time.perf_counter() - started
+    assert len(previous.scheduled) >= 50_000
+
+    planner = IncrementalPlanner(demands, slots, previous)
+    samples: list[float] = []
+    for item in rng.sample(previous.scheduled, k=20):
+        started = time.perf_counter()
+        planner.apply(PlanningDelta(removed_demand_ids=(item.demand_id,)))
+        samples.append(time.perf_counter() - started)
+
+    median_s = statistics.median(samples)
+    assert median_s < 0.1
+    assert median_s < full_replan_s / 5
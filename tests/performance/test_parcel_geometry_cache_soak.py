@@ -0,0 +1,86 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 1M parsel sorgusunluk çalışmada iki seviyeli parsel önbelleğinin belleğinin sınırlı kaldığını ve isabet oranını ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from decimal import Decimal
+
+import numpy as np
+
+from src.core.domain.value_objects.parcel_ref import ParcelRef
+from src.core.ports.external.parcel_geometry_provider import ParcelGeometry
+from src.infrastructure.external.parcel_geometry_cache import ParcelGeometryCache
+from tests.fixtures.wfs_stub import make_parcel_refs
+
+LOOKUPS = 1_000_000
+UNIVERSE = 200_000
+REQUEST_SIZE = 500
+MAX_BYTES = 8 * 2**20
+RING = [[32.0 + i * 1e-4, 38.0 + (i % 7) * 1e-4] for i in range(24)] + [[32.0, 38.0]]
+
+
+async def _loader(refs: list[ParcelRef]) -> dict[str, ParcelGeometry]:
+    # Parsellerin %5'i kadastroda yok (negatif önbellek).
+    return {
+        ref.unique_hash: ParcelGeometry(
+            parcel_ref=ref, geometry={"type": "Polygon", "coordinates": [RING]}, area_m2=Decimal("1234.5")
+        )
+        for ref in refs
+        if not ref.parsel.endswith("7")
+    }
+
+
+def _measured_l1_bytes(cache: ParcelGeometryCache) -> int:
+    # OrderedDict düğümü anahtar başına ~100 byte; geri kalanı gerçek nesne boyutları.
+    return sum(
+        sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(entry[0]) + sys.getsizeof(entry[1]) + 100
+        for key, entry in cache._l1.items()
+    )
+
+
+def test_one_million_lookups_keep_l1_within_budget(record_property) -> None:
+    rng = np.random.default_rng(2023)
+    universe = make_parcel_refs(UNIVERSE)
+    # Zipf benzeri erişim: az sayıda parsel çok sık sorgulanır, uzun kuyruk önbelleği zorlar.
+    picks = np.minimum(rng.zipf(1.3, LOOKUPS) - 1, UNIVERSE - 1)
+    cache = ParcelGeometryCache(max_bytes=MAX_BYTES)
+
+    async def run() -> tuple[int, float]:
+        peak = 0
+        started = time.perf_counter()
+        for start in range(0, LOOKUPS, REQUEST_SIZE):
+            await cache.get_many([universe[i] for i in picks[start : start + REQUEST_SIZE]], _loader)
+            peak = max(peak, cache.nbytes)
+        return peak, time.perf_counter() - started
+
+    peak, elapsed = asyncio.run(run())
+    stats = cache.stats
+    hits = stats.l1_hits
+    lookups = hits + stats.misses
+    measured = _measured_l1_bytes(cache)
+
+    record_property("lookups_per_s", round(LOOKUPS / elapsed))
+    record_property("deduplicated_lookups", lookups)
+    record_property("l1_hit_ratio", round(hits / lookups, 3))
+    record_property("evictions", stats.evictions)
+    record_property("l1_entries", stats.entries)
+    record_property("accounted_bytes", stats.bytes)
+    record_property("measured_bytes", measured)
+
+    assert peak <= MAX_BYTES
+    assert stats.evictions > 0
+    assert measured <= MAX_BYTES * 1.05
+    assert hits / lookups > 0.5
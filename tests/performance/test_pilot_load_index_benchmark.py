@@ -0,0 +1,71 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 1.000 pilot × 90 gün × 100k atamada filo müsaitlik taramasının indeksli süresini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from datetime import date, timedelta
+
+from src.core.domain.services.capacity_manager import CapacityManager, PilotAssignment, PilotCapacity
+from src.core.domain.services.pilot_load_index import PilotLoadIndex
+
+START = date(2026, 4, 6)
+DAYS = 90
+
+
+def test_fleet_availability_sweep_with_load_index() -> None:
+    rng = random.Random(1_000)
+    pilots = [
+        PilotCapacity(
+            pilot_id=uuid.uuid4(),
+            work_days=frozenset({0, 1, 2, 3, 4, 5}),
+            daily_capacity=3,
+            province_code="42",
+        )
+        for _ in range(1_000)
+    ]
+    booked = [
+        PilotAssignment(
+            pilot_id=rng.choice(pilots).pilot_id,
+            mission_id=uuid.uuid4(),
+            scheduled_date=START + timedelta(days=rng.randrange(DAYS)),
+            area_donum=float(rng.randint(10, 500)),
+        )
+        for _ in range(100_000)
+    ]
+    end = START + timedelta(days=DAYS - 1)
+    manager = CapacityManager()
+
+    started = time.perf_counter()
+    index = PilotLoadIndex.from_assignments(booked)
+    build_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    free_days = sum(len(manager.find_available_slots(p, START, end, index)) for p in pilots)
+    utilization = [manager.calculate_utilization(p, START, end, index) for p in pilots]
+    sweep_s = time.perf_counter() - started
+
+    # Liste tabanlı yol pilot başına tüm atamaları gün sayısı kadar tarar; örneklem üzerinden kıyaslanır.
+    sample = pilots[:3]
+    started = time.perf_counter()
+    for p in sample:
+        manager.calculate_utilization(p, START, end, booked)
+    list_per_pilot_s = (time.perf_counter() - started) / len(sample)
+
+    assert free_days > 0
+    assert all(0.0 <= u <= 1.0 for u in utilization)
+    assert build_s < 2.0
+    assert sweep_s < 5.0
+    assert sweep_s / len(pilots) < list_per_pilot_s
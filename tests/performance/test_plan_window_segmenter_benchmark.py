@@ -0,0 +1,65 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 50.000 dönümlük delikli sentetik poligonlarda geometri segmentlemesinin süresi ve alan korunumu.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import statistics
+import time
+
+from shapely import affinity
+from shapely.geometry import Point, Polygon
+
+from src.core.domain.services.plan_window_segmenter import PlanWindowSegmenter
+from src.core.domain.value_objects.geometry import Geometry
+
+LAT0 = 38.0
+M_PER_DEG_LON = 111_320.0 * math.cos(math.radians(LAT0))
+M_PER_DEG_LAT = 110_574.0
+TARGET_M2 = 50_000 * 1000.0
+
+
+def _synthetic_field(rng: random.Random) -> tuple[Geometry, float]:
+    """Düzensiz (yıldızımsı) dış sınır + 5-10 dairesel delik; metrik alanla birlikte döner."""
+    vertices = 240
+    radii = [1.0 + 0.25 * math.sin(3 * i * 2 * math.pi / vertices) + rng.uniform(-0.03, 0.03) for i in range(vertices)]
+    angles = [2 * math.pi * i / vertices for i in range(vertices)]
+    shell = Polygon([(r * math.cos(a), r * math.sin(a)) for r, a in zip(radii, angles, strict=True)])
+    shell = affinity.scale(shell, xfact=math.sqrt(TARGET_M2 / shell.area), yfact=math.sqrt(TARGET_M2 / shell.area))
+    metric = shell
+    for _ in range(rng.randint(5, 10)):
+        center = Point(rng.uniform(-2_000, 2_000), rng.uniform(-2_000, 2_000))
+        metric = metric.difference(center.buffer(rng.uniform(50, 250), 32))
+    geographic = affinity.scale(metric, xfact=1 / M_PER_DEG_LON, yfact=1 / M_PER_DEG_LAT, origin=(0.0, 0.0))
+    geographic = affinity.translate(geographic, xoff=32.5, yoff=LAT0)
+    return Geometry.from_shapely(geographic), float(metric.area)
+
+
+def test_geometry_segmentation_of_50k_donum_fields_with_holes() -> None:
+    rng = random.Random(50_000)
+    segmenter = PlanWindowSegmenter()
+    fields = [_synthetic_field(rng) for _ in range(10)]
+
+    timings: list[float] = []
+    for field, metric_area in fields:
+        started = time.perf_counter()
+        segments = segmenter.segment_geometry(field)
+        timings.append(time.perf_counter() - started)
+
+        total = sum(s.area_m2 for s in segments)
+        assert abs(total - metric_area) / metric_area < 1e-3
+        assert max(s.area_donum for s in segments) <= segmenter.segment_size_donum
+        assert len(segments) == math.ceil(metric_area / 1000 / segmenter.segment_size_donum)
+
+    assert statistics.median(timings) < 1.0
@@ -0,0 +1,69 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: GREEDY ve MIN_COST_FLOW stratejilerini sentetik 81 illik haftalarda karşılaştırmak.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+Çalıştırma: python -m tests.performance.test_planning_min_cost_flow_benchmark [talep_sayısı]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+
+from src.core.domain.services.planning_engine import PlanningEngine, PlanningStrategy
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, make_demands, make_pilot_slots
+
+
+@dataclass(frozen=True)
+class StrategyRun:
+    strategy: PlanningStrategy
+    assigned_area_m2: float
+    unassigned: int
+    runtime_s: float
+
+
+def run_comparison(*, demands: int, pilots: int, seed: int = 81) -> list[StrategyRun]:
+    """Aynı sentetik hafta üzerinde her stratejiyi çalıştırır."""
+    rng = random.Random(seed)
+    slots = make_pilot_slots(rng, pilots=pilots, provinces=PROVINCE_CODES, max_capacity=2)
+    week = make_demands(rng, count=demands, provinces=PROVINCE_CODES)
+    area = {d.demand_id: d.area_m2 for d in week}
+
+    runs: list[StrategyRun] = []
+    for strategy in (PlanningStrategy.GREEDY_INDEXED, PlanningStrategy.MIN_COST_FLOW):
+        started = time.perf_counter()
+        result = PlanningEngine(strategy).optimize_schedule(week, slots)
+        runs.append(
+            StrategyRun(
+                strategy=strategy,
+                assigned_area_m2=sum(area[s.demand_id] for s in result.scheduled),
+                unassigned=len(result.unscheduled),
+                runtime_s=time.perf_counter() - started,
+            )
+        )
+    return runs
+
+
+def test_min_cost_flow_places_at_least_as_many_demands_as_greedy_under_tight_capacity() -> None:
+    greedy, flow = run_comparison(demands=3_000, pilots=300)
+
+    assert flow.unassigned <= greedy.unassigned
+    assert flow.runtime_s < 30.0
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    for run in run_comparison(demands=count, pilots=max(81, count // 8)):
+        sys.stdout.write(
+            f"{run.strategy.value:<16} area_m2={run.assigned_area_m2:>16,.0f} "
+            f"unassigned={run.unassigned:>7} runtime_s={run.runtime_s:.3f}\n"
+        )
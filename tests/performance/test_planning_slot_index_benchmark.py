@@ -0,0 +1,58 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: SlotIndex eşleştirmesinin talep başı maliyetinin slot sayısıyla doğrusal büyümediğini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from src.core.domain.services.planning_engine import PlanningEngine, PlanningStrategy
+from src.core.domain.services.slot_index import SlotIndex
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, make_demands, make_pilot_slots
+
+_DEMANDS = 1_000
+
+
+def _per_demand_seconds(pilots: int) -> float:
+    """İndeks kurulumu hariç, talep başına eşleştirme süresi (3 turun en iyisi)."""
+    rng = random.Random(pilots)
+    slots = make_pilot_slots(rng, pilots=pilots, provinces=PROVINCE_CODES[:10], max_capacity=2)
+    demands = make_demands(rng, count=_DEMANDS, provinces=PROVINCE_CODES[:10])
+
+    best = float("inf")
+    for _ in range(3):
+        index = SlotIndex(slots)
+        started = time.perf_counter()
+        for demand in demands:
+            index.take(demand.province_code, demand.earliest_date, demand.latest_date)
+        best = min(best, time.perf_counter() - started)
+    return best / _DEMANDS
+
+
+def test_slot_index_per_demand_cost_is_sublinear_in_slot_count() -> None:
+    small = _per_demand_seconds(pilots=1_000)
+    large = _per_demand_seconds(pilots=10_000)
+
+    # 10x slot artışında doğrusal tarama ~10x yavaşlar; indeks log(S) mertebesinde kalır.
+    assert large < small * 3
+
+
+def test_slot_index_matches_greedy_on_national_week_sample() -> None:
+    rng = random.Random(81)
+    slots = make_pilot_slots(rng, pilots=800, provinces=PROVINCE_CODES)
+    demands = make_demands(rng, count=3_000, provinces=PROVINCE_CODES)
+
+    greedy = PlanningEngine().optimize_schedule(demands, slots)
+    indexed = PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(demands, slots)
+
+    assert indexed == greedy
@@ -0,0 +1,104 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: İl çapında hava blokajı sonrası replan kuyruğunda havuz ile mevcut tek görevli döngünün throughput karşılaştırması.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import random
+import threading
+import time
+from collections import deque
+
+import pytest
+
+TASKS = 2_000
+MISSIONS = 600
+PROVINCES = 12
+CALL_OVERHEAD_S = 0.0005  # Planlama çağrısı başına sabit maliyet (slot okuma, kilit, commit)
+
+
+class _Queue:
+    def __init__(self, tasks) -> None:
+        self.pending = deque(tasks)
+        self.acked = 0
+        self._lock = threading.Lock()
+
+    def pop(self, queue_name: str):
+        with self._lock:
+            return self.pending.popleft() if self.pending else None
+
+    def ack(self, queue_name: str, task_id: str) -> None:
+        self.acked += 1
+
+    def nack(self, queue_name: str, task_id: str, *, requeue: bool) -> None:
+        raise AssertionError("unexpected nack")
+
+
+class _Replanner:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.missions: set[str] = set()
+
+    def replan(self, *, mission_id: str, reason: str, correlation_id: str) -> None:
+        time.sleep(CALL_OVERHEAD_S)
+        self.calls += 1
+        self.missions.add(mission_id)
+
+
+class _BatchReplanner(_Replanner):
+    def replan_batch(self, batch) -> None:
+        time.sleep(CALL_OVERHEAD_S)
+        self.calls += 1
+        self.missions.update(batch.mission_ids)
+
+
+def test_pool_outperforms_single_task_loop_on_weather_block_backlog() -> None:
+    try:
+        worker_module = importlib.import_module("src.application.workers.replan_queue_worker")
+        pool_module = importlib.import_module("src.application.workers.replan_worker_pool")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+    rng = random.Random(11)
+    tasks = []
+    for i in range(TASKS):
+        mission = rng.randrange(MISSIONS)
+        tasks.append(
+            worker_module.ReplanTask(
+                task_id=f"t-{i}",
+                mission_id=f"m-{mission}",
+                reason="WEATHER_BLOCK",
+                correlation_id=f"c-{i}",
+                province_code=f"{mission % PROVINCES + 1:02d}",
+            )
+        )
+
+    queue, replanner = _Queue(tasks), _Replanner()
+    worker = worker_module.ReplanQueueWorker(queue=queue, replanner=replanner)
+    started = time.perf_counter()
+    while worker.run_once():
+        pass
+    loop_s = time.perf_counter() - started
+    assert queue.acked == replanner.calls == TASKS
+
+    queue, batch_replanner = _Queue(tasks), _BatchReplanner()
+    pool = pool_module.ReplanWorkerPool(queue=queue, replanner=batch_replanner, concurrency=4, drain_size=1_000)
+    started = time.perf_counter()
+    stats = asyncio.run(pool.run_until_idle())
+    pool_s = time.perf_counter() - started
+
+    assert queue.acked == TASKS
+    assert batch_replanner.missions == replanner.missions
+    assert stats.batches == batch_replanner.calls <= 2 * PROVINCES
+    assert pool_s * 5 < loop_s
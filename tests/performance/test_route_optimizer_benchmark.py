@@ -0,0 +1,80 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: 5-60 duraklı günlük rotalarda tur kalitesi (NN ve rastgele sıraya göre) ve çalışma süresini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import time
+import uuid
+from datetime import date
+
+import pytest
+
+from src.core.domain.services.planning_engine import ScheduledSlot
+from src.core.domain.services.route_optimizer import DistanceMatrix, RouteOptimizer, haversine_km
+
+DAY = date(2026, 4, 6)
+START = (32.4, 37.7)
+TIME_BUDGET_S = 0.2
+
+
+def _day(rng: random.Random, n: int):
+    pilot_id = uuid.UUID(int=rng.getrandbits(128))
+    stops = [
+        ScheduledSlot(
+            demand_id=uuid.UUID(int=rng.getrandbits(128)),
+            field_id=uuid.UUID(int=rng.getrandbits(128)),
+            pilot_id=pilot_id,
+            scheduled_date=DAY,
+            estimated_duration_minutes=20,
+        )
+        for _ in range(n)
+    ]
+    centroids = {s.field_id: (32.5 + rng.uniform(0, 0.6), 37.8 + rng.uniform(0, 0.6)) for s in stops}
+    return stops, centroids
+
+
+def _path_km(points: list[tuple[float, float]]) -> float:
+    total, prev = 0.0, START
+    for p in points:
+        total += haversine_km(prev, p)
+        prev = p
+    return total
+
+
+@pytest.mark.parametrize("stops_per_day", [5, 10, 20, 40, 60])
+def test_route_quality_and_runtime(stops_per_day: int) -> None:
+    rng = random.Random(stops_per_day)
+    optimizer = RouteOptimizer(time_budget_s=TIME_BUDGET_S, distance_matrix=DistanceMatrix())
+
+    ratios_vs_nn: list[float] = []
+    ratios_vs_random: list[float] = []
+    timings: list[float] = []
+    for _ in range(5):
+        stops, centroids = _day(rng, stops_per_day)
+        started = time.perf_counter()
+        route = optimizer.optimize_route(stops, centroids, start=START)
+        timings.append(time.perf_counter() - started)
+
+        shuffled = list(centroids.values())
+        rng.shuffle(shuffled)
+        ratios_vs_nn.append(route.distance_km / route.initial_distance_km)
+        ratios_vs_random.append(route.distance_km / _path_km(shuffled))
+
+    assert max(ratios_vs_nn) <= 1.0 + 1e-9
+    if stops_per_day >= 20:
+        assert statistics.mean(ratios_vs_nn) < 0.97
+        assert statistics.mean(ratios_vs_random) < 0.35
+    # Bütçe + tur kurulumu/mesafe matrisi payı.
+    assert max(timings) < TIME_BUDGET_S + 0.15
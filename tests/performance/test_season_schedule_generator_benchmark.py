@@ -0,0 +1,98 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Sezon devrinde 200k abonelik takviminin toplu üretim süresini ve bellek düzlüğünü ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+import time
+import tracemalloc
+import uuid
+from collections.abc import Iterator
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.domain.services.subscription_planner import SubscriptionConfig, SubscriptionPlanner
+
+CROPS = ("PAMUK", "BUGDAY", "MISIR", "ANTEP_FISTIGI", "ZEYTIN", "UZUM")
+SEASON_START = date(2026, 3, 2)
+START_SPREAD_DAYS = 120
+MAX_LATTICES = 4_096
+
+
+def _subscriptions(count: int, seed: int = 200) -> Iterator[SubscriptionConfig]:
+    """Sezon devri girdisi: başlangıçlar sezonun ilk 120 gününe gün gün dağılır, 4 paket tipi."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        interval, total = rng.choice(((7, 20), (10, 16), (14, 12), (21, 8)))
+        start = SEASON_START + timedelta(days=rng.randrange(START_SPREAD_DAYS))
+        yield SubscriptionConfig(
+            subscription_id=uuid.UUID(int=rng.getrandbits(128)),
+            field_id=uuid.UUID(int=rng.getrandbits(128)),
+            crop_type=rng.choice(CROPS),
+            start_date=start,
+            end_date=start + timedelta(days=(total - 1) * interval + rng.randrange(15)),
+            interval_days=interval,
+            total_analyses=total,
+            reschedule_tokens=2,
+        )
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.season_schedule_generator")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def test_bulk_generator_200k_subscriptions_in_seconds() -> None:
+    module = _load_module()
+
+    subscriptions = list(_subscriptions(200_000))
+    planner = SubscriptionPlanner()
+    started = time.perf_counter()
+    for config in subscriptions[:20_000]:
+        planner.generate_schedule(config)
+    per_item_s = time.perf_counter() - started
+
+    generator = module.BulkScheduleGenerator(chunk_size=10_000, max_lattices=MAX_LATTICES)
+    started = time.perf_counter()
+    produced = sum(len(chunk) for chunk in generator.generate(subscriptions))
+    bulk_s = time.perf_counter() - started
+
+    assert produced == 200_000
+    # Gün düzeyinde dağılımda grup sayısı başlangıç günü × paket tipiyle sınırlıdır.
+    assert generator.lattice_count <= min(START_SPREAD_DAYS * 4, MAX_LATTICES)
+    assert bulk_s < 5.0
+    # Toplu yol abonelik başına tekil yoldan en az 4 kat hızlı.
+    assert bulk_s / 200_000 * 4 < per_item_s / 20_000
+
+
+def _traced_peak(module, count: int) -> int:
+    generator = module.BulkScheduleGenerator(chunk_size=5_000, max_lattices=MAX_LATTICES)
+    tracemalloc.start()
+    for _ in generator.generate(_subscriptions(count)):
+        pass
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def test_bulk_generator_memory_is_flat_in_subscription_count() -> None:
+    module = _load_module()
+
+    small_peak = _traced_peak(module, 10_000)
+    large_peak = _traced_peak(module, 40_000)
+
+    assert large_peak < 1.3 * small_peak
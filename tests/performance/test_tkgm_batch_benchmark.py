@@ -0,0 +1,71 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Kooperatif toplu kaydında TKGM parsel sorgusunun paketli eşzamanlı yol ile tek tek sorguya göre verimini ölçmek.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.tkgm_megsis_wfs_adapter import TKGMMegsisWFSAdapter
+from tests.fixtures.wfs_stub import StubWFS, make_parcel_refs
+
+PARCELS = 2_000
+BASELINE_PARCELS = 60
+LATENCY_S = 0.02  # Sunucu tarafı istek süresi
+
+
+def _adapter(stub: StubWFS) -> TKGMMegsisWFSAdapter:
+    settings = Settings(tkgm_wfs_base_url="http://tkgm.test", tkgm_requests_per_second=20)
+    return TKGMMegsisWFSAdapter(settings, transport=httpx.ASGITransport(app=stub))
+
+
+def test_batched_fetch_of_2k_parcels_against_one_by_one(record_property) -> None:
+    refs = make_parcel_refs(PARCELS)
+
+    async def one_by_one() -> float:
+        adapter = _adapter(StubWFS(known=refs, latency_s=LATENCY_S))
+        started = time.perf_counter()
+        try:
+            for ref in refs[:BASELINE_PARCELS]:
+                await adapter.get_geometry(ref)
+        finally:
+            await adapter.aclose()
+        return time.perf_counter() - started
+
+    async def batched(stub: StubWFS) -> tuple[float, int]:
+        adapter = _adapter(stub)
+        started = time.perf_counter()
+        try:
+            result = await adapter.get_geometries_batch(refs)
+        finally:
+            await adapter.aclose()
+        return time.perf_counter() - started, len(result)
+
+    baseline_s = asyncio.run(one_by_one())
+    stub = StubWFS(known=refs, latency_s=LATENCY_S)
+    batched_s, found = asyncio.run(batched(stub))
+
+    baseline_rate = BASELINE_PARCELS / baseline_s
+    batched_rate = PARCELS / batched_s
+    record_property("one_by_one_parcels_per_s", round(baseline_rate, 1))
+    record_property("batched_parcels_per_s", round(batched_rate, 1))
+    record_property("batched_requests", stub.requests)
+    record_property("max_url_length", max(stub.url_lengths))
+
+    assert found == PARCELS
+    assert max(stub.url_lengths) <= Settings().tkgm_batch_max_url_length
+    assert stub.requests <= PARCELS // 20
+    assert batched_rate >= 10 * baseline_rate
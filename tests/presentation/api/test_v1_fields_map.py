@@ -0,0 +1,68 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.presentation.api.v1.endpoints.fields import get_field_map_service
+from src.presentation.api.v1.endpoints.fields import router as fields_router
+
+
+class StubFieldMapService:
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[float, float, float, float], int]] = []
+        self.scopes: list[tuple[str, frozenset[str]]] = []
+
+    def feature_collection(self, *, bbox, zoom, subject, roles):
+        self.calls.append((bbox, zoom))
+        self.scopes.append((subject, frozenset(roles)))
+        if zoom == 3:
+            raise ValueError("zoom must be within 0..22")
+        return '{"type":"FeatureCollection","features":[]}'
+
+
+def _build_app(service: StubFieldMapService, *, authenticated: bool = True, roles: tuple[str, ...] = ()) -> FastAPI:
+    app = FastAPI()
+    app.include_router(fields_router)
+    app.dependency_overrides[get_field_map_service] = lambda: service
+
+    @app.middleware("http")
+    async def add_state(request: Request, call_next):
+        request.state.user = type("User", (), {"subject": "u-1"})() if authenticated else None
+        request.state.roles = list(roles)
+        return await call_next(request)
+
+    return app
+
+
+def test_map_returns_geojson_for_bbox_and_zoom() -> None:
+    service = StubFieldMapService()
+    client = TestClient(_build_app(service))
+
+    response = client.get("/fields/map", params={"bbox": "32.1,38.1,32.2,38.2", "zoom": 14})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/geo+json"
+    assert response.json()["type"] == "FeatureCollection"
+    assert service.calls == [((32.1, 38.1, 32.2, 38.2), 14)]
+    assert service.scopes == [("u-1", frozenset())]
+
+
+def test_map_passes_caller_subject_and_roles_for_scoping() -> None:
+    service = StubFieldMapService()
+    client = TestClient(_build_app(service, roles=("admin",)))
+
+    assert client.get("/fields/map", params={"bbox": "32.1,38.1,32.2,38.2"}).status_code == 200
+    assert service.scopes == [("u-1", frozenset({"admin"}))]
+
+
+def test_map_rejects_bad_bbox_zoom_and_anonymous_requests() -> None:
+    service = StubFieldMapService()
+    client = TestClient(_build_app(service))
+
+    assert client.get("/fields/map", params={"bbox": "32.1,38.1,32.2"}).status_code == 422
+    assert client.get("/fields/map", params={"bbox": "32.2,38.1,32.1,38.2"}).status_code == 422
+    assert client.get("/fields/map", params={"bbox": "32.1,38.1,32.2,38.2", "zoom": 23}).status_code == 422
+    assert client.get("/fields/map", params={"bbox": "32.1,38.1,32.2,38.2", "zoom": 3}).status_code == 422
+    anonymous = TestClient(_build_app(service, authenticated=False))
+    assert anonymous.get("/fields/map", params={"bbox": "32.1,38.1,32.2,38.2"}).status_code == 401
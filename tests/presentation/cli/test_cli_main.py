@@ -15,8 +15,24 @@ def test_cli_unknown_command_returns_non_zero() -> None:
     assert exit_code != 0
 
 
-def test_weekly_planner_dry_run_graceful_when_service_missing(capsys) -> None:
+def test_weekly_planner_dry_run_graceful_without_service_or_database(capsys, monkeypatch) -> None:
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("DB_URL", raising=False)
     exit_code = main(["weekly-planner", "--dry-run", "--week", "2026-10"])
     captured = capsys.readouterr()
     assert exit_code == 1
-    assert "weekly_planner_service" in captured.err
+    assert "DATABASE_URL/DB_URL is required" in captured.err
+
+
+def test_weekly_planner_rejects_non_positive_workers(capsys) -> None:
+    exit_code = main(["weekly-planner", "--dry-run", "--week", "2026-10", "--workers", "0"])
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "--workers" in captured.err
+
+
+def test_forecast_demand_rejects_malformed_week(capsys) -> None:
+    exit_code = main(["forecast-demand", "--season", "2026", "--from-week", "2026-W10"])
+    captured = capsys.readouterr()
+    assert exit_code == 2
+    assert "--from-week" in captured.err
@@ -0,0 +1,115 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import uuid
+
+import numpy as np
+import pytest
+from shapely.geometry import box
+
+from src.core.domain.services.coverage_calculator import CoverageCalculator
+from src.core.domain.value_objects.geometry import Geometry
+from tests.fixtures.geometry_fixtures import make_field_rings, make_footprints
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.batch_coverage")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _kr016_class(ratio: float) -> int:
+    # Geometry.coverage_ratio docstring'indeki KR-016 eşikleri.
+    if ratio >= 0.95:
+        return 2
+    if ratio >= 0.80:
+        return 1
+    return 0
+
+
+def test_classification_matches_per_mission_geometry_path() -> None:
+    module = _load_module()
+    rng = np.random.default_rng(15)
+    rings = make_field_rings(rng, 400)
+    fields = [Geometry.from_polygon_coords([ring.tolist()]) for ring in rings]
+    footprints = [Geometry.from_shapely(shape) for shape in make_footprints(rng, rings)]
+
+    evaluated = module.BatchCoverageEvaluator().evaluate(fields, footprints)
+
+    expected = np.array([field.coverage_ratio(fp) for field, fp in zip(fields, footprints, strict=True)])
+    np.testing.assert_allclose(evaluated["coverage_ratio"], expected, rtol=1e-9, atol=1e-12)
+    assert evaluated["coverage_class"].tolist() == [_kr016_class(r) for r in expected]
+    # Üç sınıf da örneklemde bulunur; eşik iki yanı birlikte sınanır.
+    assert all(count > 0 for count in module.class_counts(evaluated).values())
+
+
+def test_results_match_coverage_calculator() -> None:
+    module = _load_module()
+    rng = np.random.default_rng(16)
+    rings = make_field_rings(rng, 120)
+    fields = list(make_footprints(rng, rings, max_shift=0.0))  # Footprint değil, ölçeklenmiş tarla
+    footprints = list(make_footprints(rng, rings))
+    evaluator = module.BatchCoverageEvaluator(minimum_coverage_ratio=0.9)
+    calculator = CoverageCalculator(minimum_coverage_ratio=0.9)
+    mission_ids = [uuid.uuid4() for _ in fields]
+    field_ids = [uuid.uuid4() for _ in fields]
+
+    results = evaluator.to_results(evaluator.evaluate(fields, footprints), mission_ids=mission_ids, field_ids=field_ids)
+
+    for result in results:
+        single = calculator.evaluate_coverage(
+            mission_id=result.mission_id,
+            field_id=result.field_id,
+            field_area_m2=result.field_area_m2,
+            footprint_area_m2=result.footprint_area_m2,
+            intersection_area_m2=min(result.intersection_area_m2, result.field_area_m2),
+        )
+        assert single.is_sufficient == result.is_sufficient
+        assert single.coverage_ratio == pytest.approx(result.coverage_ratio, rel=1e-12)
+
+
+def test_covered_disjoint_and_missing_footprints() -> None:
+    module = _load_module()
+    field = box(32.0, 39.0, 32.01, 39.01)
+    half = box(32.0, 39.0, 32.005, 39.01)
+
+    evaluated = module.BatchCoverageEvaluator().evaluate(
+        [field, field, field, field],
+        [box(31.9, 38.9, 32.1, 39.1), box(33.0, 40.0, 33.1, 40.1), None, half],
+    )
+
+    assert evaluated["coverage_ratio"].tolist() == pytest.approx([1.0, 0.0, 0.0, 0.5])
+    assert evaluated["coverage_class"].tolist() == [
+        module.CoverageClass.FULL,
+        module.CoverageClass.REFLIGHT,
+        module.CoverageClass.REFLIGHT,
+        module.CoverageClass.REFLIGHT,
+    ]
+    assert evaluated["is_sufficient"].tolist() == [True, False, False, False]
+    # ~1.1 km × ~0.86 km (39°K): ~95 ha.
+    assert evaluated["field_area_m2"][0] == pytest.approx(950_000, rel=0.02)
+    assert evaluated["footprint_area_m2"][1] == pytest.approx(100 * evaluated["field_area_m2"][0], rel=0.02)
+
+
+def test_length_mismatch_and_invalid_threshold_are_rejected() -> None:
+    module = _load_module()
+
+    with pytest.raises(module.BatchCoverageError):
+        module.BatchCoverageEvaluator().evaluate([box(0, 0, 1, 1)], [])
+    with pytest.raises(Exception, match="minimum_coverage_ratio"):
+        module.BatchCoverageEvaluator(minimum_coverage_ratio=1.5)
+    assert module.BatchCoverageEvaluator().evaluate([], []).dtype == module.COVERAGE_DTYPE
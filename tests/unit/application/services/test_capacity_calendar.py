@@ -0,0 +1,134 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+import uuid
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from src.core.domain.entities.pilot import Pilot
+from src.core.domain.services.capacity_manager import CapacityManager, PilotAssignment, PilotCapacity
+from src.core.domain.value_objects.pilot_schedule import PilotSchedule
+from tests.fixtures.planning_fixtures import WEEK_START, make_pilot_slots
+
+DAYS = 28
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.capacity_calendar")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _pilot(rng: random.Random, province: str) -> Pilot:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return Pilot(
+        pilot_id=uuid.uuid4(),
+        user_id=uuid.uuid4(),
+        province=province,
+        district="Merkez",
+        full_name="Test Pilot",
+        phone_number="+905550000000",
+        drone_model="DJI Mavic 3M",
+        drone_serial_number="SN-1",
+        created_at=now,
+        updated_at=now,
+        work_days=sorted(rng.sample(range(7), k=rng.randint(1, 6))),
+        daily_capacity_donum=rng.randint(2500, 3000),
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_calendar_queries_match_scalar_reference(seed: int) -> None:
+    module = _load_module()
+    rng = random.Random(seed)
+    pilots = [_pilot(rng, rng.choice(["06", "42", "35"])) for _ in range(12)]
+    calendar = module.FleetCapacityCalendar.from_pilots(pilots, start=WEEK_START, days=DAYS)
+
+    bookings = [
+        (rng.choice(pilots).pilot_id, WEEK_START + timedelta(days=rng.randrange(DAYS)), rng.randint(100, 2000))
+        for _ in range(150)
+    ]
+    pilot_ids, days, amounts = zip(*bookings, strict=True)
+    calendar.book_many(pilot_ids, days, amounts)
+
+    booked: dict[tuple[uuid.UUID, date], int] = {}
+    for pid, day, amount in bookings:
+        booked[(pid, day)] = booked.get((pid, day), 0) + amount
+
+    utilization = calendar.utilization()
+    first = calendar.first_free_days(3, min_free=500)
+    rollup = calendar.province_rollup()
+    for i, pilot in enumerate(pilots):
+        used = capacity = 0
+        free_days: list[int] = []
+        for d in range(DAYS):
+            day = WEEK_START + timedelta(days=d)
+            cap = pilot.daily_capacity_donum if day.weekday() in pilot.work_days else 0
+            load = booked.get((pilot.pilot_id, day), 0)
+            capacity += cap
+            used += min(load, cap)
+            if cap - load >= 500 and len(free_days) < 3:
+                free_days.append(d)
+        assert utilization[i] == pytest.approx(used / capacity if capacity else 0.0)
+        assert first[i].tolist() == free_days + [-1] * (3 - len(free_days))
+
+    for r, code in enumerate(rollup.province_codes):
+        rows = [i for i, p in enumerate(pilots) if p.province == code]
+        assert rollup.free[r].tolist() == calendar.free()[rows].sum(axis=0).tolist()
+        assert rollup.capacity[r].sum() == calendar.capacity[rows].sum()
+
+
+def test_calendar_utilization_matches_capacity_manager() -> None:
+    module = _load_module()
+    rng = random.Random(11)
+    schedule = PilotSchedule(work_days=frozenset({0, 1, 2, 3, 4}), daily_capacity_donum=2500)
+    pid = uuid.uuid4()
+    calendar = module.FleetCapacityCalendar.from_schedules({pid: schedule}, {pid: "42"}, start=WEEK_START, days=DAYS)
+    assignments = [
+        PilotAssignment(
+            pilot_id=pid, mission_id=uuid.uuid4(), scheduled_date=WEEK_START + timedelta(days=rng.randrange(DAYS))
+        )
+        for _ in range(60)
+    ]
+    for a in assignments:
+        calendar.book(pid, a.scheduled_date, 1)
+    calendar.capacity[calendar.capacity > 0] = 3  # görev sayısı birimine indir
+
+    capacity = PilotCapacity(pilot_id=pid, work_days=schedule.work_days, daily_capacity=3, province_code="42")
+    end = WEEK_START + timedelta(days=DAYS - 1)
+    expected = CapacityManager().calculate_utilization(capacity, WEEK_START, end, assignments)
+
+    assert calendar.utilization(WEEK_START, end)[0] == pytest.approx(expected)
+    assert calendar.fleet_utilization() == pytest.approx(expected)
+
+
+def test_calendar_adapts_pilot_slots_and_rejects_unknown_cells() -> None:
+    module = _load_module()
+    rng = random.Random(3)
+    slots = make_pilot_slots(rng, pilots=5, provinces=["42"])
+    calendar = module.FleetCapacityCalendar.from_pilot_slots(slots, start=WEEK_START, days=7)
+
+    for slot in slots:
+        row = calendar.pilot_ids.index(slot.pilot_id)
+        col = (slot.date - WEEK_START).days
+        assert calendar.free()[row, col] == slot.remaining_capacity
+    with pytest.raises(module.CapacityCalendarError, match="date_outside_calendar"):
+        calendar.book(slots[0].pilot_id, WEEK_START + timedelta(days=7), 1)
+    with pytest.raises(module.CapacityCalendarError, match="unknown_pilot"):
+        calendar.book(uuid.uuid4(), WEEK_START, 1)
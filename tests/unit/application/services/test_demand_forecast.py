@@ -0,0 +1,193 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import csv
+import importlib
+import io
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+CROPS = ("PAMUK", "BUGDAY", "MISIR", "ANTEP_FISTIGI", "ZEYTIN", "UZUM")
+PROVINCES = ("06", "21", "27", "42", "63")
+SEASON_START = date(2025, 12, 29)  # 2026-W01 Pazartesi
+SEASONAL_CONFIG = Path(__file__).resolve().parents[4] / "seasonal_config.yaml"
+
+
+def _modules():
+    try:
+        forecast = importlib.import_module("src.application.services.demand_forecast")
+        season = importlib.import_module("src.application.services.season_schedule_generator")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+    return forecast, season
+
+
+def _policy(season):
+    return season.SeasonalScanPolicy.from_mapping(yaml.safe_load(SEASONAL_CONFIG.read_text(encoding="utf-8")))
+
+
+def _subscriptions(module, rng: random.Random, count: int) -> list:
+    rows = []
+    for _ in range(count):
+        start = SEASON_START - timedelta(days=30) + timedelta(days=rng.randrange(400))
+        rows.append(
+            module.ForecastSubscription(
+                province_code=rng.choice(PROVINCES),
+                crop_type=rng.choice(CROPS),
+                area_donum=rng.uniform(5.0, 400.0),
+                interval_days=rng.choice((7, 10, 14, 21)),
+                start_date=start,
+                end_date=start + timedelta(days=rng.randrange(1, 200)),
+            )
+        )
+    return rows
+
+
+def _reference(policy, subscriptions, weeks: int) -> tuple[np.ndarray, np.ndarray]:
+    """Skaler referans: abonelik × hafta döngüsü."""
+    scans = np.zeros((len(PROVINCES), weeks))
+    area = np.zeros((len(PROVINCES), weeks))
+    for sub in subscriptions:
+        p = PROVINCES.index(sub.province_code)
+        for w in range(weeks):
+            monday = SEASON_START + timedelta(weeks=w)
+            overlap = (min(sub.end_date, monday + timedelta(days=6)) - max(sub.start_date, monday)).days + 1
+            if overlap <= 0:
+                continue
+            phase = policy.phase_for(sub.crop_type, (monday + timedelta(days=3)).month)
+            if phase is None:
+                rate = 7.0 / sub.interval_days
+            elif phase.interval_days is None:
+                rate = 0.0
+            else:
+                rate = 7.0 / phase.interval_days * phase.rate_multiplier
+            scans[p, w] += overlap / 7.0 * rate
+            area[p, w] += overlap / 7.0 * rate * sub.area_donum
+    return scans, area
+
+
+def test_forecast_matches_scalar_reference() -> None:
+    module, season = _modules()
+    policy = _policy(season)
+    subscriptions = _subscriptions(module, random.Random(14), 600)
+
+    table = module.DemandForecastEngine(policy).forecast(
+        subscriptions, first_week=SEASON_START, weeks=53, pilot_days={}, province_codes=PROVINCES
+    )
+    scans, area = _reference(policy, subscriptions, 53)
+
+    assert table.demand_donum.shape == (len(PROVINCES), 53)
+    np.testing.assert_allclose(table.expected_scans, scans, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(table.demand_donum, area, rtol=1e-9, atol=1e-6)
+
+
+def test_dormant_phase_has_no_demand_and_unknown_crop_uses_own_interval() -> None:
+    module, season = _modules()
+    subscriptions = [
+        # Pamuk Ocak ayında dinlenmede (scanning_frequency_days: null).
+        module.ForecastSubscription("06", "PAMUK", 100.0, 7, date(2026, 1, 5), date(2026, 1, 25)),
+        # Üzüm politikada yok: kendi aralığı, çarpan 1.
+        module.ForecastSubscription("06", "UZUM", 70.0, 14, date(2026, 1, 5), date(2026, 1, 11)),
+    ]
+
+    table = module.DemandForecastEngine(_policy(season)).forecast(
+        subscriptions, first_week=date(2026, 1, 5), weeks=3, pilot_days={"06": 0}
+    )
+
+    assert table.expected_scans[0].tolist() == pytest.approx([0.5, 0.0, 0.0])
+    assert table.demand_donum[0].tolist() == pytest.approx([35.0, 0.0, 0.0])
+
+
+def test_shortfall_and_required_pilots_follow_planning_capacity_service() -> None:
+    module, season = _modules()
+    capacity = importlib.import_module("src.application.services.planning_capacity")
+    service = capacity.PlanningCapacityService(effort_per_donum=1.5, max_daily_effort_per_pilot=300.0)
+    subscriptions = _subscriptions(module, random.Random(7), 400)
+
+    table = module.DemandForecastEngine(_policy(season), service, work_days=6).forecast(
+        subscriptions, first_week=SEASON_START, weeks=53, pilot_days={"06": 12, "42": 6}, province_codes=PROVINCES
+    )
+
+    # Haftalık kapasite = pilot-gün × günlük efor / dönüm başı efor.
+    assert table.capacity_donum[PROVINCES.index("06")].tolist() == pytest.approx([2400.0] * 53)
+    assert table.capacity_donum[PROVINCES.index("27")].tolist() == [0.0] * 53
+    np.testing.assert_allclose(table.shortfall_donum, np.maximum(table.demand_donum - table.capacity_donum, 0.0))
+    for p, w in zip(*np.nonzero(table.demand_donum > 0), strict=True):
+        plan = service.calculate(area_donum=float(table.demand_donum[p, w]) / 6)
+        assert table.required_pilots[p, w] == plan.required_pilots
+    assert (table.required_pilots[table.demand_donum == 0] == 0).all()
+
+    cells = table.shortfall_cells()
+    assert cells and all(cells[i][2] >= cells[i + 1][2] for i in range(len(cells) - 1))
+
+
+def test_columnar_and_row_inputs_agree_and_csv_is_long_format() -> None:
+    module, season = _modules()
+    rows = _subscriptions(module, random.Random(3), 200)
+    engine = module.DemandForecastEngine(_policy(season))
+
+    from_rows = engine.forecast(rows, first_week=SEASON_START, weeks=10, pilot_days={"06": 6})
+    from_columns = engine.forecast(
+        module.SubscriptionColumns.from_rows(rows), first_week=SEASON_START, weeks=10, pilot_days={"06": 6}
+    )
+    np.testing.assert_array_equal(from_rows.demand_donum, from_columns.demand_donum)
+
+    stream = io.StringIO()
+    from_rows.write_csv(stream)
+    lines = list(csv.reader(io.StringIO(stream.getvalue())))
+    assert tuple(lines[0]) == module.TABLE_COLUMNS
+    assert len(lines) == 1 + len(from_rows.province_codes) * 10
+    assert lines[1][:3] == [from_rows.province_codes[0], "2026-01", "2025-12-29"]
+
+
+def test_run_writes_season_table_from_source(tmp_path: Path) -> None:
+    module, _ = _modules()
+
+    class _Source:
+        def subscription_columns(self, first_day, last_day):
+            assert (first_day, last_day) == (date(2026, 3, 2), date(2026, 3, 22))
+            return module.SubscriptionColumns.from_rows(
+                [module.ForecastSubscription("63", "MISIR", 1000.0, 21, date(2026, 3, 1), date(2026, 6, 1))]
+            )
+
+        def pilot_days(self, max_work_days):
+            return {"63": 0.0}
+
+    target = tmp_path / "forecast.csv"
+    table = module.run(
+        season=2026, from_week="2026-10", to_week="2026-12", output=str(target), config_path=str(SEASONAL_CONFIG),
+        source=_Source(),
+    )
+
+    assert table.weeks == 3
+    assert target.read_text(encoding="utf-8").count("\n") == 4
+    with pytest.raises(ValueError, match="format"):
+        module.run(season=2026, output="-", fmt="parquet", source=_Source())
+
+
+def test_invalid_window_is_rejected() -> None:
+    module, _ = _modules()
+    engine = module.DemandForecastEngine()
+
+    with pytest.raises(module.ForecastError):
+        engine.forecast([], first_week=date(2026, 1, 6), weeks=2, pilot_days={})
+    with pytest.raises(module.ForecastError):
+        engine.forecast([], first_week=SEASON_START, weeks=0, pilot_days={})
+    assert module.season_window(2026) == (SEASON_START, 53)
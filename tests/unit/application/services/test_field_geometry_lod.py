@@ -0,0 +1,115 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+
+import numpy as np
+import pytest
+import shapely
+
+from src.core.domain.value_objects.geometry import Geometry
+from tests.fixtures.geometry_fixtures import make_boundary_fields
+
+BOUNDS = (32.0, 38.0, 32.5, 38.5)
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.field_geometry_lod")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def test_zoom_maps_to_the_coarsest_sufficient_level() -> None:
+    module = _load_module()
+    cache = module.FieldGeometryLodCache((8, 11, 14, 17))
+
+    assert [cache.level_for(z) for z in (0, 8, 9, 11, 14, 15, 17, 18, 22)] == [0, 0, 1, 1, 2, 3, 3, 4, 4]
+    with pytest.raises(module.FieldGeometryLodError):
+        cache.level_for(23)
+    with pytest.raises(module.FieldGeometryLodError):
+        module.FieldGeometryLodCache((11, 8))
+
+
+def test_levels_stay_valid_within_tolerance_and_shrink() -> None:
+    module = _load_module()
+    fields = make_boundary_fields(np.random.default_rng(20), 200, bounds=BOUNDS)
+    cache = module.FieldGeometryLodCache()
+    digests = cache.store(list(fields))
+
+    sizes = []
+    for zoom in (*cache.zooms, 20):
+        texts = cache.get(digests, zoom)
+        simplified = shapely.from_geojson(texts)
+        assert shapely.is_valid(simplified).all()
+        if zoom <= cache.zooms[-1]:
+            distance = shapely.hausdorff_distance(simplified, fields).max()
+            assert distance <= 1.2 * module.zoom_tolerance(zoom)
+        else:
+            assert shapely.hausdorff_distance(simplified, fields).max() < 1e-6
+        sizes.append(sum(map(len, texts)))
+    assert sizes == sorted(sizes) and sizes[0] * 3 < sizes[-1]
+
+
+def test_identical_geometries_share_entries() -> None:
+    module = _load_module()
+    field = make_boundary_fields(np.random.default_rng(21), 1, bounds=BOUNDS)[0]
+    cache = module.FieldGeometryLodCache((10, 14))
+
+    first = cache.store([field, Geometry.from_shapely(field)])
+    again = cache.store([shapely.from_wkb(shapely.to_wkb(field))])
+
+    assert first[0] == first[1] == again[0]
+    assert len(cache) == 3  # İki LOD + tam çözünürlük
+    with pytest.raises(module.FieldGeometryLodError):
+        cache.get([b"missing"], 12)
+
+
+def test_map_layer_returns_bbox_features_at_requested_zoom() -> None:
+    module = _load_module()
+    fields = make_boundary_fields(np.random.default_rng(22), 400, bounds=BOUNDS)
+    layer = module.FieldMapLayer()
+    layer.add([f"fld-{i}" for i in range(len(fields))], list(fields))
+    window = (32.1, 38.1, 32.2, 38.2)
+
+    collection = json.loads(layer.feature_collection(bbox=window, zoom=12, subject="u-admin", roles={"admin"}))
+
+    expected = np.flatnonzero(shapely.intersects(fields, shapely.box(*window)))
+    assert [feature["id"] for feature in collection["features"]] == [f"fld-{i}" for i in expected]
+    assert len(collection["features"]) > 0
+    first = shapely.geometry.shape(collection["features"][0]["geometry"])
+    assert shapely.get_num_coordinates(first) < shapely.get_num_coordinates(fields[expected[0]])
+    with pytest.raises(module.FieldGeometryLodError):
+        layer.feature_collection(bbox=(32.2, 38.1, 32.1, 38.2), zoom=12, subject="u-admin", roles={"admin"})
+
+
+def test_map_layer_scopes_features_to_owner_unless_admin() -> None:
+    module = _load_module()
+    fields = make_boundary_fields(np.random.default_rng(23), 200, bounds=BOUNDS)
+    owners = [f"u-{i % 3}" for i in range(len(fields))]
+    layer = module.FieldMapLayer()
+    layer.add([f"fld-{i}" for i in range(len(fields))], list(fields), owners)
+
+    def ids(**scope) -> list[str]:
+        collection = json.loads(layer.feature_collection(bbox=BOUNDS, zoom=12, **scope))
+        return [feature["id"] for feature in collection["features"]]
+
+    assert ids(subject="u-1", roles=()) == [f"fld-{i}" for i in range(len(fields)) if owners[i] == "u-1"]
+    assert ids(subject="u-1", roles={"COOP_VIEWER"}) == ids(subject="u-1")
+    assert ids(subject="u-9") == []
+    assert len(ids(subject="u-admin", roles={"admin"})) == len(fields)
+    with pytest.raises(module.FieldGeometryLodError):
+        layer.add(["fld-x"], [fields[0]], owners=[])
@@ -0,0 +1,114 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import box
+
+from src.core.domain.services.coverage_calculator import CoverageCalculator, Polygon
+from src.core.domain.value_objects.geometry import Geometry
+from tests.fixtures.geometry_fixtures import make_field_rings, make_footprints
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.field_spatial_index")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _fields(count: int, seed: int = 16):
+    rng = np.random.default_rng(seed)
+    rings = make_field_rings(rng, count, bounds=(32.0, 38.0, 33.0, 39.0))
+    return rng, rings, shapely.polygons(rings)
+
+
+def test_point_lookup_matches_ray_casting_scan() -> None:
+    module = _load_module()
+    rng, rings, fields = _fields(300)
+    index = module.FieldSpatialIndex([f"f{i}" for i in range(len(fields))], list(fields))
+    lon = rng.uniform(32.0, 33.0, 2000)
+    lat = rng.uniform(38.0, 39.0, 2000)
+
+    located = index.locate_points(lon, lat)
+
+    polygons = [Polygon(coordinates=tuple(map(tuple, ring.tolist()))) for ring in rings]
+    for x, y, found in zip(lon.tolist(), lat.tolist(), located.tolist(), strict=True):
+        expected = next(
+            (i for i, poly in enumerate(polygons) if CoverageCalculator.point_in_polygon((x, y), poly)), -1
+        )
+        assert found == expected
+    assert (located >= 0).any() and (located == -1).any()
+
+
+def test_footprint_join_matches_pairwise_intersects() -> None:
+    module = _load_module()
+    rng, rings, fields = _fields(200)
+    footprints = shapely.buffer(make_footprints(rng, rings[:50]), 0.01)
+    index = module.FieldSpatialIndex(list(range(len(fields))), [Geometry.from_shapely(f) for f in fields])
+
+    pairs = index.touching(list(footprints))
+
+    expected = [(i, j) for i, fp in enumerate(footprints) for j, field in enumerate(fields) if fp.intersects(field)]
+    assert list(zip(pairs[0].tolist(), pairs[1].tolist(), strict=True)) == expected
+    assert index.fields_touching(footprints[0]) == [j for i, j in expected if i == 0]
+
+
+def test_incremental_adds_are_batched_and_queryable_before_rebuild() -> None:
+    module = _load_module()
+    _, _, fields = _fields(100)
+    index = module.FieldSpatialIndex(rebuild_threshold=40, rebuild_ratio=0.0)
+
+    for i, field in enumerate(fields[:39]):
+        index.add([i], [field])
+    assert index.rebuilds == 0 and index.pending == 39
+
+    centroid = shapely.centroid(fields[10])
+    assert index.locate_points([centroid.x], [centroid.y]).tolist() == [10]
+
+    index.add([39], [fields[39]])
+    assert index.rebuilds == 1 and index.pending == 0
+    index.add(list(range(40, 100)), list(fields[40:]))
+    assert index.rebuilds == 2 and len(index) == 100
+
+    centroids = shapely.centroid(fields)
+    located = index.locate_points(shapely.get_x(centroids), shapely.get_y(centroids))
+    assert located.tolist() == list(range(100))
+
+
+def test_overlap_and_duplicate_detection() -> None:
+    module = _load_module()
+    base = box(32.0, 38.0, 32.01, 38.01)
+    fields = [
+        base,
+        box(32.005, 38.0, 32.015, 38.01),  # %50 çakışma
+        box(32.01, 38.0, 32.02, 38.01),  # 0 ile yalnızca kenar teması
+        box(32.0, 38.0, 32.01, 38.0100001),  # 0'ın tekrarı
+        box(33.0, 39.0, 33.01, 39.01),
+    ]
+    index = module.FieldSpatialIndex(["a", "b", "c"], fields[:3])
+    index.add(["d", "e"], fields[3:])  # Bekleyen tarlalar da taranır
+
+    overlaps = index.overlaps()
+    ratios = dict(zip(zip(overlaps.left.tolist(), overlaps.right.tolist()), overlaps.ratio.tolist(), strict=True))
+    assert set(ratios) == {(0, 1), (0, 3), (1, 2), (1, 3)}
+    assert ratios[(0, 1)] == pytest.approx(0.5)
+
+    duplicates = index.duplicates()
+    assert list(zip(duplicates.left.tolist(), duplicates.right.tolist(), strict=True)) == [(0, 3)]
+    assert [index.field_ids[i] for i in (duplicates.left[0], duplicates.right[0])] == ["a", "d"]
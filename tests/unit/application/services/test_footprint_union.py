@@ -0,0 +1,99 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import math
+import uuid
+
+import numpy as np
+import pytest
+import shapely
+from shapely.geometry import box
+
+from src.core.domain.value_objects.geometry import Geometry
+from tests.fixtures.geometry_fixtures import make_field_rings, make_image_footprints
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.footprint_union")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _mission(count: int, *, flown_share: float = 0.9, seed: int = 19):
+    rng = np.random.default_rng(seed)
+    field = shapely.polygons(make_field_rings(rng, 1, bounds=(32.0, 38.0, 32.01, 38.01))[0])
+    footprints = make_image_footprints(rng, (32.0, 38.0, 32.01, 38.0 + 0.01 * flown_share), count, gap_share=0.3)
+    return field, footprints
+
+
+def test_streamed_union_matches_single_union_all() -> None:
+    module = _load_module()
+    field, footprints = _mission(400, flown_share=0.6)
+    accumulator = module.FootprintUnionAccumulator(Geometry.from_shapely(field), chunk_size=8, fan_in=3)
+
+    running = []
+    for start in range(0, len(footprints), 25):
+        accumulator.extend(footprints[start : start + 25])
+        running.append(accumulator.coverage_ratio())
+    accumulator.add(None)
+    accumulator.add(box(40.0, 40.0, 40.1, 40.1))  # Tarla dışında
+
+    expected = shapely.intersection(shapely.union_all(footprints), field)
+    assert accumulator.image_count == 402
+    assert accumulator.union().symmetric_difference(expected).area < 1e-12 * field.area
+    assert running[-1] == pytest.approx(expected.area / field.area, rel=1e-9)
+    assert running == sorted(running) and 0.5 < running[-1] < 0.95
+
+
+def test_retained_geometries_stay_bounded() -> None:
+    module = _load_module()
+    field, footprints = _mission(2000, flown_share=1.0)
+    accumulator = module.FootprintUnionAccumulator(field, chunk_size=16, fan_in=4)
+
+    peak = 0
+    for footprint in footprints:
+        accumulator.add(footprint)
+        peak = max(peak, accumulator.retained_geometries)
+
+    depth = math.ceil(math.log(len(footprints) / 16, 4))
+    assert peak <= 16 + 4 * depth
+    assert accumulator.retained_coordinates < shapely.get_num_coordinates(footprints).sum() / 10
+
+
+def test_covering_footprint_saturates_and_evaluates_with_calculator() -> None:
+    module = _load_module()
+    field, footprints = _mission(50)
+    accumulator = module.FootprintUnionAccumulator(field, minimum_coverage_ratio=0.9)
+    accumulator.extend(footprints)
+
+    partial = accumulator.evaluate(mission_id=uuid.uuid4(), field_id=uuid.uuid4())
+    assert not partial.is_sufficient and partial.intersection_area_m2 < partial.field_area_m2
+
+    accumulator.add(shapely.buffer(field, 0.001))
+    accumulator.add(footprints[0])
+    full = accumulator.evaluate(mission_id=uuid.uuid4(), field_id=uuid.uuid4())
+    assert accumulator.coverage_ratio() == 1.0 and full.is_sufficient
+    assert full.field_area_m2 == pytest.approx(Geometry.from_shapely(field).area_m2)
+    assert accumulator.retained_geometries == 1 and accumulator.image_count == 52
+
+
+def test_rejects_empty_field_and_bad_parameters() -> None:
+    module = _load_module()
+    with pytest.raises(module.FootprintUnionError):
+        module.FootprintUnionAccumulator(shapely.Polygon())
+    with pytest.raises(module.FootprintUnionError):
+        module.FootprintUnionAccumulator(box(0, 0, 1, 1), chunk_size=1)
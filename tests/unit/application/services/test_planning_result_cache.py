@@ -0,0 +1,169 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import importlib
+import random
+
+import pytest
+
+from src.core.domain.services.min_cost_flow import FlowCostWeights
+from src.core.domain.services.planning_engine import PlanningEngine, PlanningStrategy
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, make_demands, make_pilot_slots
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.planning_result_cache")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _inputs(seed: int = 3, count: int = 150):
+    rng = random.Random(seed)
+    provinces = PROVINCE_CODES[:4]
+    return make_demands(rng, count=count, provinces=provinces), make_pilot_slots(rng, pilots=20, provinces=provinces)
+
+
+class _CountingEngine(PlanningEngine):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def optimize_schedule(self, demands, pilot_slots):
+        self.calls += 1
+        return super().optimize_schedule(demands, pilot_slots)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_key_is_insensitive_to_input_order(seed: int) -> None:
+    module = _load_module()
+    demands, slots = _inputs()
+    engine = PlanningEngine(PlanningStrategy.GREEDY_INDEXED)
+    rng = random.Random(seed)
+    shuffled_demands, shuffled_slots = demands[:], slots[:]
+    rng.shuffle(shuffled_demands)
+    rng.shuffle(shuffled_slots)
+
+    assert module.canonical_key(demands, slots, engine, code_version="v") == module.canonical_key(
+        shuffled_demands, shuffled_slots, engine, code_version="v"
+    )
+
+
+def test_key_changes_with_content_parameters_and_code_version() -> None:
+    module = _load_module()
+    demands, slots = _inputs()
+    engine = PlanningEngine(PlanningStrategy.GREEDY_INDEXED)
+    base = module.canonical_key(demands, slots, engine, code_version="v")
+
+    changed = [dataclasses.replace(demands[0], priority=demands[0].priority + 1), *demands[1:]]
+    assert module.canonical_key(changed, slots, engine, code_version="v") != base
+    assert module.canonical_key(demands[1:], slots, engine, code_version="v") != base
+    assert module.canonical_key(demands, slots, PlanningEngine(PlanningStrategy.GREEDY), code_version="v") != base
+    weighted = PlanningEngine(PlanningStrategy.MIN_COST_FLOW, cost_weights=FlowCostWeights(slack_day=1))
+    assert module.canonical_key(demands, slots, weighted, code_version="v") != module.canonical_key(
+        demands, slots, PlanningEngine(PlanningStrategy.MIN_COST_FLOW), code_version="v"
+    )
+    assert module.canonical_key(demands, slots, engine, code_version="w") != base
+
+
+def test_hits_are_served_without_solving_and_match_for_any_order() -> None:
+    module = _load_module()
+    demands, slots = _inputs()
+    engine = _CountingEngine(PlanningStrategy.GREEDY_INDEXED)
+    cached = module.CachedPlanningEngine(engine, module.PlanningResultCache())
+
+    first = cached.optimize_schedule(demands, slots)
+    second = cached.optimize_schedule(list(reversed(demands)), list(reversed(slots)))
+
+    assert engine.calls == 1
+    assert first is second
+    assert first == PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(
+        sorted(demands, key=lambda d: d.demand_id), sorted(slots, key=lambda s: (s.pilot_id, s.date))
+    )
+    assert (cached.cache.stats.misses, cached.cache.stats.memory_hits) == (1, 1)
+
+
+def test_memory_lru_is_bounded() -> None:
+    module = _load_module()
+    cache = module.PlanningResultCache(max_memory_entries=2)
+    result = PlanningEngine().optimize_schedule(*_inputs(count=5))
+
+    for key in ("a", "b", "c"):
+        cache.put(key, result)
+    cache.get("b")  # b en yeni
+    cache.put("d", result)
+
+    assert cache.get("a") is None and cache.get("c") is None
+    assert cache.get("b") is result and cache.get("d") is result
+    assert cache.stats.memory_evictions == 2
+
+
+def test_disk_layer_survives_process_and_evicts_oldest(tmp_path) -> None:
+    module = _load_module()
+    demands, slots = _inputs()
+    engine = _CountingEngine(PlanningStrategy.GREEDY_INDEXED)
+    module.CachedPlanningEngine(engine, module.PlanningResultCache(tmp_path)).optimize_schedule(demands, slots)
+
+    reopened = module.CachedPlanningEngine(engine, module.PlanningResultCache(tmp_path))
+    result = reopened.optimize_schedule(demands, slots)
+
+    assert engine.calls == 1
+    assert reopened.cache.stats.disk_hits == 1
+    assert result == PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(
+        sorted(demands, key=lambda d: d.demand_id), sorted(slots, key=lambda s: (s.pilot_id, s.date))
+    )
+
+    small = module.PlanningResultCache(tmp_path, max_disk_entries=2)
+    for key in ("k1", "k2", "k3"):
+        small.put(key, result)
+    assert small.stats.disk_evictions == 2
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["k2", "k3"]
+
+
+def test_code_version_change_invalidates_disk_cache(tmp_path) -> None:
+    module = _load_module()
+    result = PlanningEngine().optimize_schedule(*_inputs(count=5))
+    module.PlanningResultCache(tmp_path, code_version="old").put("k", result)
+
+    same = module.PlanningResultCache(tmp_path, code_version="old")
+    assert same.get("k") == result
+
+    upgraded = module.PlanningResultCache(tmp_path, code_version="new")
+    assert upgraded.get("k") is None
+    assert upgraded.stats.invalidations == 1
+    assert not list(tmp_path.glob("*.json"))
+
+    upgraded.put("k", result)
+    upgraded.invalidate()
+    assert upgraded.get("k") is None
+    assert upgraded.stats.invalidations == 2
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path) -> None:
+    module = _load_module()
+    cache = module.PlanningResultCache(tmp_path, code_version="v")
+    cache.put("k", PlanningEngine().optimize_schedule(*_inputs(count=5)))
+    (tmp_path / "k.json").write_text("{not json", encoding="utf-8")
+
+    reopened = module.PlanningResultCache(tmp_path, code_version="v")
+    assert reopened.get("k") is None
+    assert not (tmp_path / "k.json").exists()
+
+
+def test_default_code_version_tracks_engine_source() -> None:
+    module = _load_module()
+    assert len(module.planning_code_version()) == 16
+    assert module.PlanningResultCache().code_version == module.planning_code_version()
@@ -0,0 +1,169 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.core.domain.services.subscription_planner import (
+    SubscriptionConfig,
+    SubscriptionPlanner,
+    SubscriptionPlanningError,
+)
+
+CROPS = ("PAMUK", "BUGDAY", "MISIR", "ANTEP_FISTIGI", "ZEYTIN", "UZUM")
+SEASONAL_CONFIG = Path(__file__).resolve().parents[4] / "seasonal_config.yaml"
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.season_schedule_generator")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+def _configs(rng: random.Random, count: int) -> list[SubscriptionConfig]:
+    configs = []
+    for _ in range(count):
+        start = date(2026, 1, 1) + timedelta(days=rng.randrange(365))
+        interval = rng.choice((7, 10, 14, 21))
+        total = rng.randint(1, 12)
+        end = start + timedelta(days=(total - 1) * interval + rng.randrange(0, 30))
+        configs.append(
+            SubscriptionConfig(
+                subscription_id=uuid.UUID(int=rng.getrandbits(128)),
+                field_id=uuid.UUID(int=rng.getrandbits(128)),
+                crop_type=rng.choice(CROPS),
+                start_date=start,
+                end_date=end,
+                interval_days=interval,
+                total_analyses=total,
+                reschedule_tokens=rng.randint(0, 3),
+            )
+        )
+    return configs
+
+
+def test_bulk_generation_matches_per_item_schedule() -> None:
+    module = _load_module()
+    configs = _configs(random.Random(5), 3_000)
+    generator = module.BulkScheduleGenerator(chunk_size=128)
+
+    chunks = list(generator.generate(iter(configs)))
+
+    planner = SubscriptionPlanner()
+    assert [s for chunk in chunks for s in chunk] == [planner.generate_schedule(c) for c in configs]
+    assert all(len(chunk) == 128 for chunk in chunks[:-1])
+    assert generator.lattice_count == len({(c.start_date, c.interval_days, c.total_analyses) for c in configs})
+
+
+def test_policy_intervals_come_from_seasonal_config() -> None:
+    module = _load_module()
+    policy = module.SeasonalScanPolicy.from_mapping(yaml.safe_load(SEASONAL_CONFIG.read_text(encoding="utf-8")))
+
+    assert policy.interval_for("PAMUK", date(2026, 7, 1)) == 14
+    assert policy.interval_for("COTTON", date(2026, 9, 15)) == 7
+    assert policy.interval_for("MISIR", date(2026, 6, 1)) == 10
+    assert policy.interval_for("PAMUK", date(2026, 12, 1)) is None  # Dinlenme dönemi
+    assert policy.interval_for("KIRMIZI_MERCIMEK", date(2026, 6, 1)) is None
+
+    configs = [c for c in _configs(random.Random(9), 1_000) if c.total_analyses <= 3]
+    generator = module.BulkScheduleGenerator(policy)
+    planner = SubscriptionPlanner()
+    expected, rejected = [], 0
+    for config in configs:
+        try:
+            expected.append(planner.generate_schedule(generator.resolve(config)))
+        except SubscriptionPlanningError:
+            rejected += 1
+
+    errors = []
+    produced = [s for chunk in generator.generate(configs, on_error=lambda c, e: errors.append(c)) for s in chunk]
+
+    assert produced == expected
+    assert len(errors) == rejected
+    resolved = generator.resolve(next(c for c in configs if c.crop_type == "PAMUK" and c.start_date.month == 7))
+    assert resolved.interval_days == 14
+
+
+def test_invalid_config_raises_without_error_handler() -> None:
+    module = _load_module()
+    config = _configs(random.Random(1), 1)[0]
+    bad = SubscriptionConfig(**{**config.__dict__, "reschedule_tokens": -1})
+
+    with pytest.raises(SubscriptionPlanningError):
+        list(module.BulkScheduleGenerator().generate([config, bad]))
+
+
+def test_lattice_ts_ms_matches_cursor_loop() -> None:
+    module = _load_module()
+    day_ms = 86_400_000
+    start, end = 1_767_225_600_000, 1_767_225_600_000 + 100 * day_ms + 5
+
+    expected, cursor = [], start
+    while cursor <= end:
+        expected.append(cursor)
+        cursor += 14 * day_ms
+
+    assert module.lattice_ts_ms(start, end, 14).tolist() == expected
+    assert module.lattice_ts_ms(start, end, 14, limit=3).tolist() == expected[:3]
+    assert module.lattice_ts_ms(end, start, 14).tolist() == []
+
+
+def test_policy_interval_longer_than_subscription_caps_analyses_to_window() -> None:
+    module = _load_module()
+    policy = module.SeasonalScanPolicy(
+        crops={"COTTON": (module.ScanPhase(name="early", months=frozenset({4, 5, 6}), interval_days=21),)}
+    )
+    config = SubscriptionConfig(
+        subscription_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        crop_type="PAMUK",
+        start_date=date(2026, 4, 1),
+        end_date=date(2026, 6, 15),
+        interval_days=7,
+        total_analyses=10,
+        reschedule_tokens=1,
+    )
+    generator = module.BulkScheduleGenerator(policy)
+
+    [[schedule]] = list(generator.generate([config]))
+
+    assert SubscriptionPlanner().generate_schedule(config).analyses[-1].scheduled_date <= config.end_date
+    assert [a.scheduled_date for a in schedule.analyses] == [
+        date(2026, 4, 1),
+        date(2026, 4, 22),
+        date(2026, 5, 13),
+        date(2026, 6, 3),
+    ]
+    assert schedule == SubscriptionPlanner().generate_schedule(generator.resolve(config))
+
+
+def test_lattice_cache_is_bounded_and_results_survive_eviction() -> None:
+    module = _load_module()
+    configs = _configs(random.Random(11), 2_000)
+    generator = module.BulkScheduleGenerator(chunk_size=256, max_lattices=16)
+
+    schedules = [s for chunk in generator.generate(iter(configs)) for s in chunk]
+
+    planner = SubscriptionPlanner()
+    assert schedules == [planner.generate_schedule(c) for c in configs]
+    assert generator.lattice_count == 16
+    assert generator.lattice_evictions > 0
@@ -0,0 +1,111 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import importlib
+import random
+import uuid
+from datetime import date
+
+import pytest
+
+from src.core.domain.services.capacity_manager import PilotCapacity
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, make_demands, make_pilot_slots
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.sharded_weekly_planner")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_sharded_planner_matches_single_greedy_for_province_local_pilots(workers: int) -> None:
+    module = _load_module()
+    rng = random.Random(workers)
+    provinces = PROVINCE_CODES[:6]
+    slots = make_pilot_slots(rng, pilots=30, provinces=provinces)
+    demands = make_demands(rng, count=200, provinces=provinces)
+
+    sharded = module.ShardedWeeklyPlanner(workers=workers).plan(demands, slots)
+
+    assert sharded.result == PlanningEngine().optimize_schedule(demands, slots)
+    assert [t.province_code for t in sharded.shard_timings] == sorted({d.province_code for d in demands})
+    assert sum(t.demand_count for t in sharded.shard_timings) == len(demands)
+    assert sharded.reconciled == ()
+
+
+def test_sharded_planner_reconciles_with_cross_province_authorized_pilot() -> None:
+    module = _load_module()
+    day = date(2026, 4, 6)
+    pilot = uuid.uuid4()
+    slots = [PilotSlot(pilot_id=pilot, date=day, province_code="06", remaining_capacity=2, daily_capacity=2)]
+    demand = MissionDemand(
+        demand_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        province_code="42",
+        crop_type="WHEAT",
+        area_m2=500_000,
+        priority=0,
+        earliest_date=day,
+        latest_date=day,
+        estimated_duration_minutes=45,
+    )
+    capacities = {
+        pilot: PilotCapacity(
+            pilot_id=pilot,
+            work_days=frozenset(range(6)),
+            daily_capacity=2,
+            province_code="06",
+            authorized_provinces=frozenset({"42"}),
+        )
+    }
+
+    planner = module.ShardedWeeklyPlanner()
+    without = planner.plan([demand], slots)
+    with_reconcile = planner.plan([demand], slots, pilot_capacities=capacities)
+
+    assert without.result.unscheduled == (demand.demand_id,)
+    assert with_reconcile.reconciled == (demand.demand_id,)
+    assert with_reconcile.result.scheduled[0].pilot_id == pilot
+    assert with_reconcile.result.warnings == ()
+    assert with_reconcile.result.pilot_utilization[pilot] == 0.5
+
+
+def test_sharded_planner_rejects_non_positive_workers() -> None:
+    module = _load_module()
+    with pytest.raises(ValueError, match="workers"):
+        module.ShardedWeeklyPlanner(workers=0)
+
+
+def test_sharded_planner_keeps_shard_warnings_regardless_of_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_module()
+    rng = random.Random(7)
+    demands = make_demands(rng, count=5, provinces=PROVINCE_CODES[:1])
+    note = "MIN_COST_FLOW zaman bütçesi aşıldı; GREEDY sonucu kullanıldı."
+
+    def solve(shard):
+        # Shard'a özgü uyarı, talep bazlı uyarılardan önce gelir.
+        warnings = (note, *(PlanningEngine.unscheduled_warning(d) for d in shard.demands))
+        unscheduled = tuple(d.demand_id for d in shard.demands)
+        return shard.province_code, module.ScheduleResult((), unscheduled, {}, warnings), 0.0
+
+    monkeypatch.setattr(module, "_solve_shard", solve)
+    result = module.ShardedWeeklyPlanner().plan(demands, []).result
+
+    assert result.warnings.count(note) == 1
+    assert len(result.warnings) == len(demands) + 1
+    assert set(result.warnings[:-1]) == {PlanningEngine.unscheduled_warning(d) for d in demands}
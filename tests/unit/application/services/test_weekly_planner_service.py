@@ -0,0 +1,246 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import random
+import uuid
+from datetime import date
+
+import pytest
+
+from src.core.domain.services.capacity_manager import PilotCapacity
+from src.core.domain.services.planning_engine import MissionDemand, PilotSlot, PlanningEngine, PlanningStrategy
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, WEEK_START, make_demands, make_pilot_slots
+
+
+def _load_module():
+    try:
+        return importlib.import_module("src.application.services.weekly_planner_service")
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+class _InMemorySource:
+    def __init__(self, demands: list[MissionDemand], slots: list[PilotSlot]) -> None:
+        self.demands = demands
+        self.slots = slots
+        self.batches: list[tuple[str, ...]] = []
+
+    def province_codes(self, params) -> list[str]:
+        return sorted({d.province_code for d in self.demands})
+
+    def load_batch(self, province_codes, params):
+        self.batches.append(tuple(province_codes))
+        wanted = set(province_codes)
+        return (
+            [d for d in self.demands if d.province_code in wanted],
+            [s for s in self.slots if s.province_code in wanted],
+        )
+
+
+class _ListSink:
+    def __init__(self) -> None:
+        self.chunks: list[list] = []
+
+    def write_many(self, rows, *, week_start: date) -> None:
+        assert week_start == WEEK_START
+        self.chunks.append(list(rows))
+
+    @property
+    def rows(self) -> list:
+        return [row for chunk in self.chunks for row in chunk]
+
+
+def _inputs(seed: int, *, provinces: int = 10, demands: int = 400):
+    rng = random.Random(seed)
+    codes = PROVINCE_CODES[:provinces]
+    return make_demands(rng, count=demands, provinces=codes), make_pilot_slots(rng, pilots=60, provinces=codes)
+
+
+def test_batched_plan_matches_single_pass_plan() -> None:
+    module = _load_module()
+    demands, slots = _inputs(7)
+    source, sink = _InMemorySource(demands, slots), _ListSink()
+
+    summary = module.WeeklyPlannerService(source, sink, province_batch_size=3, chunk_size=25).plan(
+        week_start=WEEK_START, correlation_id="corr-1"
+    )
+
+    expected = PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(demands, slots)
+    assert {(r.mission_id, r.pilot_id, r.scheduled_date) for r in sink.rows} == {
+        (s.demand_id, s.pilot_id, s.scheduled_date) for s in expected.scheduled
+    }
+    assert summary.planned == len(sink.rows) == len(expected.scheduled)
+    assert summary.unscheduled == len(expected.unscheduled)
+    assert summary.batches == len(source.batches) == 4
+    assert all(len(batch) <= 3 for batch in source.batches)
+
+
+def test_rows_are_written_in_bounded_chunks_with_slot_order() -> None:
+    module = _load_module()
+    demands, slots = _inputs(11)
+    sink = _ListSink()
+
+    module.WeeklyPlannerService(_InMemorySource(demands, slots), sink, province_batch_size=2, chunk_size=16).plan(
+        week_start=WEEK_START, correlation_id="corr-2"
+    )
+
+    assert sink.chunks and all(1 <= len(chunk) <= 16 for chunk in sink.chunks)
+    by_pilot_day: dict = {}
+    for row in sink.rows:
+        by_pilot_day.setdefault((row.pilot_id, row.scheduled_date), []).append(row.slot_order)
+    assert all(orders == list(range(1, len(orders) + 1)) for orders in by_pilot_day.values())
+    area = {d.demand_id: d.area_m2 / 1000.0 for d in demands}
+    assert all(row.estimated_area_donum == pytest.approx(area[row.mission_id]) for row in sink.rows)
+
+
+def test_plan_week_port_returns_planned_count() -> None:
+    module = _load_module()
+    demands, slots = _inputs(3, provinces=4, demands=120)
+    sink = _ListSink()
+    service = module.WeeklyPlannerService(_InMemorySource(demands, slots), sink)
+
+    planned = asyncio.run(service.plan_week(week_start=WEEK_START, correlation_id="corr-3"))
+
+    assert planned == len(sink.rows) > 0
+
+
+def test_plan_rejects_non_monday_week_start() -> None:
+    module = _load_module()
+    service = module.WeeklyPlannerService(_InMemorySource([], []), _ListSink())
+
+    with pytest.raises(ValueError, match="Monday"):
+        service.plan(week_start=date(2026, 4, 7), correlation_id="corr-4")
+
+
+def test_run_dry_run_streams_ndjson_to_file(tmp_path) -> None:
+    module = _load_module()
+    demands, slots = _inputs(5, provinces=3, demands=90)
+    output = tmp_path / "plan.ndjson"
+
+    summary = module.run(
+        week="2026-15",
+        dry_run=True,
+        corr_id="corr-5",
+        output=str(output),
+        source=_InMemorySource(demands, slots),
+    )
+
+    lines = output.read_text(encoding="utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert summary.week_start == WEEK_START
+    assert len(records) == summary.planned > 0
+    assert set(records[0]) == {
+        "province",
+        "mission_id",
+        "pilot_id",
+        "scheduled_date",
+        "estimated_area_donum",
+        "slot_order",
+    }
+    assert all(WEEK_START.isoformat() <= r["scheduled_date"] <= "2026-04-12" for r in records)
+
+
+@pytest.mark.parametrize("week", ["2026-4", "2026W15", "2026-54", "2025-53"])
+def test_parse_iso_week_rejects_invalid_weeks(week: str) -> None:
+    module = _load_module()
+    with pytest.raises(ValueError):
+        module.parse_iso_week(week)
+
+
+def test_repeated_plan_is_served_from_result_cache(tmp_path) -> None:
+    module = _load_module()
+    cache_module = importlib.import_module("src.application.services.planning_result_cache")
+    demands, slots = _inputs(13, provinces=6, demands=200)
+    cache = cache_module.PlanningResultCache(tmp_path)
+    runs = []
+    for _ in range(2):
+        sink = _ListSink()
+        module.WeeklyPlannerService(_InMemorySource(demands, slots), sink, province_batch_size=2, cache=cache).plan(
+            week_start=WEEK_START, correlation_id="corr-6"
+        )
+        runs.append(sink.rows)
+
+    assert runs[0] == runs[1]
+    assert (cache.stats.misses, cache.stats.memory_hits) == (3, 3)
+
+
+def test_parallel_plan_reuses_result_cache_per_shard(tmp_path) -> None:
+    module = _load_module()
+    cache_module = importlib.import_module("src.application.services.planning_result_cache")
+    demands, slots = _inputs(13, provinces=6, demands=200)
+    cache = cache_module.PlanningResultCache(tmp_path)
+    runs = []
+    for _ in range(2):
+        sink = _ListSink()
+        module.WeeklyPlannerService(_InMemorySource(demands, slots), sink, province_batch_size=2, cache=cache).plan(
+            week_start=WEEK_START, correlation_id="corr-7", workers=2
+        )
+        runs.append(sink.rows)
+
+    assert runs[0] == runs[1]
+    assert (cache.stats.misses, cache.stats.memory_hits) == (6, 6)
+
+
+class _CapacitySource(_InMemorySource):
+    def __init__(self, demands, slots, authorized: dict) -> None:
+        super().__init__(demands, slots)
+        self.authorized = authorized
+
+    def pilot_capacities(self, pilot_slots):
+        return {
+            slot.pilot_id: PilotCapacity(
+                pilot_id=slot.pilot_id,
+                work_days=frozenset(range(6)),
+                daily_capacity=slot.daily_capacity,
+                province_code=slot.province_code,
+                authorized_provinces=self.authorized.get(slot.pilot_id, frozenset()),
+            )
+            for slot in pilot_slots
+        }
+
+
+def test_unplaced_demand_goes_to_authorized_pilot_from_another_province() -> None:
+    module = _load_module()
+    pilot = uuid.uuid4()
+    slots = [PilotSlot(pilot_id=pilot, date=WEEK_START, province_code="06", remaining_capacity=2, daily_capacity=2)]
+    demands = [
+        MissionDemand(
+            demand_id=uuid.uuid4(),
+            field_id=uuid.uuid4(),
+            province_code=code,
+            crop_type="WHEAT",
+            area_m2=400_000,
+            priority=0,
+            earliest_date=WEEK_START,
+            latest_date=WEEK_START,
+            estimated_duration_minutes=45,
+        )
+        for code in ("06", "42")
+    ]
+    unauthorized, authorized = _ListSink(), _ListSink()
+
+    without = module.WeeklyPlannerService(_CapacitySource(demands, slots, {}), unauthorized).plan(
+        week_start=WEEK_START, correlation_id="corr-7"
+    )
+    summary = module.WeeklyPlannerService(
+        _CapacitySource(demands, slots, {pilot: frozenset({"42"})}), authorized
+    ).plan(week_start=WEEK_START, correlation_id="corr-7")
+
+    assert (without.planned, without.unscheduled) == (1, 1)
+    assert (summary.planned, summary.unscheduled) == (2, 0)
+    assert {(row.province_code, row.pilot_id) for row in authorized.rows} == {("06", pilot), ("42", pilot)}
@@ -0,0 +1,255 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+import time
+from collections import deque
+
+import pytest
+
+
+def _load_modules():
+    try:
+        return (
+            importlib.import_module("src.application.workers.replan_queue_worker"),
+            importlib.import_module("src.application.workers.replan_worker_pool"),
+        )
+    except SyntaxError as exc:
+        pytest.skip(f"application package import edilemiyor: {exc}")
+
+
+class _Queue:
+    def __init__(self, tasks=()) -> None:
+        self.pending = deque(tasks)
+        self.acked: list[str] = []
+        self.nacked: list[tuple[str, bool]] = []
+        self.pops = 0
+        self._lock = threading.Lock()
+
+    def push(self, task) -> None:
+        with self._lock:
+            self.pending.append(task)
+
+    def pop(self, queue_name: str):
+        with self._lock:
+            self.pops += 1
+            return self.pending.popleft() if self.pending else None
+
+    def ack(self, queue_name: str, task_id: str) -> None:
+        self.acked.append(task_id)
+
+    def nack(self, queue_name: str, task_id: str, *, requeue: bool) -> None:
+        self.nacked.append((task_id, requeue))
+
+
+class _BatchQueue(_Queue):
+    def pop_many(self, queue_name: str, max_items: int):
+        with self._lock:
+            self.pops += 1
+            return [self.pending.popleft() for _ in range(min(max_items, len(self.pending)))]
+
+
+class _BatchReplanner:
+    def __init__(self, *, fail_province: str = "", delay_s: float = 0.0) -> None:
+        self.batches = []
+        self.fail_province = fail_province
+        self.delay_s = delay_s
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def replan_batch(self, batch) -> None:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay_s)
+            if batch.province_code == self.fail_province:
+                raise RuntimeError("planner unavailable")
+            self.batches.append(batch)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def _tasks(worker_module, *, provinces: int, missions: int, repeats: int):
+    return [
+        worker_module.ReplanTask(
+            task_id=f"t-{r}-{p}-{m}",
+            mission_id=f"m-{p}-{m}",
+            reason=f"weather-{r}",
+            correlation_id=f"c-{r}",
+            province_code=f"{p + 1:02d}",
+        )
+        for r in range(repeats)
+        for p in range(provinces)
+        for m in range(missions)
+    ]
+
+
+def test_pool_coalesces_tasks_per_mission_and_province() -> None:
+    worker_module, pool_module = _load_modules()
+    tasks = _tasks(worker_module, provinces=3, missions=5, repeats=4)
+    queue, replanner = _BatchQueue(tasks), _BatchReplanner()
+    pool = pool_module.ReplanWorkerPool(queue=queue, replanner=replanner, coalesce_window_s=0.0)
+
+    stats = asyncio.run(pool.run_until_idle())
+
+    assert sorted(b.province_code for b in replanner.batches) == ["01", "02", "03"]
+    assert all(len(b.mission_ids) == len(set(b.mission_ids)) == 5 for b in replanner.batches)
+    assert all(b.reasons == ("weather-3",) * 5 for b in replanner.batches)
+    assert sorted(queue.acked) == sorted(t.task_id for t in tasks)
+    assert stats.tasks_received == 60
+    assert stats.tasks_coalesced == 45
+    assert stats.batches == 3
+    assert queue.pops == 2  # Bir toplu boşaltma + boş kuyruk kontrolü
+
+
+def test_pool_falls_back_to_per_mission_replan_and_splits_large_provinces() -> None:
+    worker_module, pool_module = _load_modules()
+    tasks = _tasks(worker_module, provinces=1, missions=7, repeats=2)
+    calls: list[str] = []
+
+    class _Replanner:
+        def replan(self, *, mission_id: str, reason: str, correlation_id: str) -> None:
+            calls.append(mission_id)
+
+    seen = []
+    pool = pool_module.ReplanWorkerPool(
+        queue=_Queue(tasks),
+        replanner=_Replanner(),
+        max_missions_per_batch=3,
+        coalesce_window_s=0.0,
+        on_batch=seen.append,
+    )
+
+    asyncio.run(pool.run_until_idle())
+
+    assert sorted(calls) == sorted({t.mission_id for t in tasks})
+    assert [m.mission_count for m in seen] == [3, 3, 1]
+    assert [m.task_count for m in seen] == [6, 6, 2]
+
+
+def test_failed_batch_is_nacked_with_requeue_and_counted() -> None:
+    worker_module, pool_module = _load_modules()
+    tasks = _tasks(worker_module, provinces=2, missions=3, repeats=1)
+    queue = _BatchQueue(tasks)
+    pool = pool_module.ReplanWorkerPool(
+        queue=queue, replanner=_BatchReplanner(fail_province="02"), coalesce_window_s=0.0
+    )
+
+    stats = asyncio.run(pool.run_until_idle())
+
+    assert sorted(task_id for task_id, _ in queue.nacked) == sorted(t.task_id for t in tasks if t.province_code == "02")
+    assert all(requeue for _, requeue in queue.nacked)
+    assert len(queue.acked) == 3
+    assert stats.batches_failed == 1
+    assert [m.succeeded for m in stats.last_batches if m.province_code == "02"] == [False]
+
+
+def test_concurrency_is_bounded() -> None:
+    worker_module, pool_module = _load_modules()
+    replanner = _BatchReplanner(delay_s=0.02)
+    pool = pool_module.ReplanWorkerPool(
+        queue=_BatchQueue(_tasks(worker_module, provinces=8, missions=1, repeats=1)),
+        replanner=replanner,
+        concurrency=3,
+        coalesce_window_s=0.0,
+    )
+
+    asyncio.run(pool.run_until_idle())
+
+    assert len(replanner.batches) == 8
+    assert 1 < replanner.max_active <= 3
+
+
+def test_coalesce_window_collects_late_duplicates_into_one_cycle() -> None:
+    worker_module, pool_module = _load_modules()
+    first, late = _tasks(worker_module, provinces=1, missions=1, repeats=2)
+    queue, replanner = _BatchQueue([first]), _BatchReplanner()
+    pool = pool_module.ReplanWorkerPool(queue=queue, replanner=replanner, coalesce_window_s=0.2)
+
+    async def scenario():
+        cycle = asyncio.create_task(pool.run_cycle())
+        await asyncio.sleep(0.05)
+        queue.push(late)
+        return await cycle
+
+    assert asyncio.run(scenario()) == 2
+    assert len(replanner.batches) == 1
+    assert replanner.batches[0].task_ids == (first.task_id, late.task_id)
+
+
+def test_request_stop_finishes_in_flight_batches() -> None:
+    worker_module, pool_module = _load_modules()
+    tasks = _tasks(worker_module, provinces=2, missions=2, repeats=1)
+    queue = _BatchQueue(tasks)
+    pool = pool_module.ReplanWorkerPool(
+        queue=queue, replanner=_BatchReplanner(delay_s=0.05), coalesce_window_s=0.0, poll_interval_s=5.0
+    )
+
+    async def scenario():
+        runner = asyncio.create_task(pool.run())
+        await asyncio.sleep(0.01)
+        pool.request_stop()
+        return await asyncio.wait_for(runner, timeout=2.0)
+
+    stats = asyncio.run(scenario())
+
+    assert stats.tasks_received == 4
+    assert sorted(queue.acked) == sorted(t.task_id for t in tasks)
+
+
+def test_settle_failure_is_counted_and_does_not_stop_other_batches() -> None:
+    worker_module, pool_module = _load_modules()
+    tasks = _tasks(worker_module, provinces=3, missions=2, repeats=1)
+
+    class _FlakyAckQueue(_BatchQueue):
+        def ack(self, queue_name: str, task_id: str) -> None:
+            if task_id.endswith("-1-0"):
+                raise ConnectionError("broker down")
+            super().ack(queue_name, task_id)
+
+    queue = _FlakyAckQueue(tasks)
+    pool = pool_module.ReplanWorkerPool(queue=queue, replanner=_BatchReplanner(), coalesce_window_s=0.0)
+
+    stats = asyncio.run(pool.run_until_idle())
+
+    assert stats.batches == 3 and stats.batches_failed == 1
+    assert [m.succeeded for m in stats.last_batches if m.province_code == "02"] == [False]
+    assert sorted(queue.acked) == sorted(t.task_id for t in tasks if t.province_code != "02")
+
+
+def test_mission_with_and_without_province_lands_in_one_batch() -> None:
+    worker_module, pool_module = _load_modules()
+    task = worker_module.ReplanTask
+    tasks = [
+        task(task_id="t-1", mission_id="m-1", reason="weather", correlation_id="c-1", province_code="06"),
+        task(task_id="t-2", mission_id="m-1", reason="pilot", correlation_id="c-2", province_code=""),
+        task(task_id="t-3", mission_id="m-2", reason="pilot", correlation_id="c-3", province_code=""),
+    ]
+    queue, replanner = _BatchQueue(tasks), _BatchReplanner(fail_province="--")
+    pool = pool_module.ReplanWorkerPool(queue=queue, replanner=replanner, coalesce_window_s=0.0)
+
+    asyncio.run(pool.run_until_idle())
+
+    by_mission = {mission_id: batch for batch in replanner.batches for mission_id in batch.mission_ids}
+    assert len(replanner.batches) == 2
+    assert by_mission["m-1"].province_code == "06"
+    assert by_mission["m-1"].task_ids == ("t-1", "t-2")
+    assert by_mission["m-1"].reasons == ("pilot",)
+    assert by_mission["m-2"].province_code == ""
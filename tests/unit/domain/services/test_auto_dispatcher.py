@@ -0,0 +1,133 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.domain.services.auto_dispatcher import AutoDispatcher
+
+MONDAY = date(2026, 4, 6)
+
+
+@dataclass(frozen=True)
+class _Mission:
+    id: str
+    territory_id: str
+    scheduled_date: str
+    area_donum: int
+    sla_deadline: str | None = None
+
+
+@dataclass(frozen=True)
+class _Pilot:
+    id: str
+    territory_id: str
+    reliability_score: float = 1.0
+    daily_capacity_donum: int = 2500
+    work_days: frozenset[int] = field(default_factory=lambda: frozenset(range(6)))
+
+    def max_capacity_with_emergency(self) -> int:
+        return int(self.daily_capacity_donum * 1.1)
+
+
+def _day(offset: int) -> str:
+    return (MONDAY + timedelta(days=offset)).isoformat()
+
+
+def test_dispatcher_skips_pilots_off_work_day() -> None:
+    pilots = [_Pilot(id="p1", territory_id="42")]  # Pazar çalışmıyor
+    result = AutoDispatcher().dispatch_many([_Mission("m1", "42", _day(6), 500)], pilots)
+
+    assert result.decisions == []
+    assert result.unassigned == ["m1"]
+
+
+def test_dispatcher_spreads_load_by_remaining_capacity_then_reliability() -> None:
+    pilots = [
+        _Pilot(id="p1", territory_id="42", reliability_score=0.9),
+        _Pilot(id="p2", territory_id="42", reliability_score=0.7),
+    ]
+    missions = [_Mission(f"m{i}", "42", _day(0), 1000) for i in range(4)]
+
+    decisions = AutoDispatcher().dispatch(missions, pilots)
+
+    assert [(d.mission_id, d.pilot_id) for d in decisions] == [
+        ("m0", "p1"),
+        ("m1", "p2"),
+        ("m2", "p1"),
+        ("m3", "p2"),
+    ]
+
+
+def test_dispatcher_uses_emergency_tolerance_only_for_due_missions() -> None:
+    pilots = [_Pilot(id="p1", territory_id="42")]
+    booked = {("p1", _day(0)): 2400}
+    missions = [
+        _Mission("later", "42", _day(0), 300, sla_deadline=_day(2)),
+        _Mission("due", "42", _day(0), 300, sla_deadline=_day(0)),
+    ]
+
+    result = AutoDispatcher().dispatch_many(missions, pilots, booked)
+
+    assert [(d.mission_id, d.emergency) for d in result.decisions] == [("due", True)]
+    assert result.unassigned == ["later"]
+    assert result.booked_donum[("p1", _day(0))] == 2700
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_dispatcher_respects_constraints_and_is_order_independent(seed: int) -> None:
+    rng = random.Random(seed)
+    territories = ["06", "35", "42"]
+    pilots = [
+        _Pilot(
+            id=f"p{i:03d}",
+            territory_id=rng.choice(territories),
+            reliability_score=rng.choice([0.6, 0.8, 1.0]),
+            daily_capacity_donum=rng.randint(2500, 3000),
+            work_days=frozenset(rng.sample(range(7), k=rng.randint(1, 6))),
+        )
+        for i in range(15)
+    ]
+    missions = [
+        _Mission(
+            id=f"m{i:04d}",
+            territory_id=rng.choice(territories),
+            scheduled_date=_day(rng.randrange(7)),
+            area_donum=rng.randint(100, 1500),
+            sla_deadline=_day(rng.randrange(7, 10)) if rng.random() < 0.8 else _day(0),
+        )
+        for i in range(200)
+    ]
+
+    result = AutoDispatcher().dispatch_many(missions, pilots)
+    shuffled = list(missions)
+    rng.shuffle(shuffled)
+
+    assert AutoDispatcher().dispatch_many(shuffled, list(reversed(pilots))).decisions == result.decisions
+    by_pilot = {p.id: p for p in pilots}
+    by_mission = {m.id: m for m in missions}
+    load: dict[tuple[str, str], int] = {}
+    for d in result.decisions:
+        mission, pilot = by_mission[d.mission_id], by_pilot[d.pilot_id]
+        assert pilot.territory_id == mission.territory_id
+        assert date.fromisoformat(mission.scheduled_date).weekday() in pilot.work_days
+        load[(pilot.id, mission.scheduled_date)] = load.get((pilot.id, mission.scheduled_date), 0) + mission.area_donum
+    for (pilot_id, _), donum in load.items():
+        assert donum <= by_pilot[pilot_id].max_capacity_with_emergency()
+    assert load == result.booked_donum
+    assert len(result.decisions) + len(result.unassigned) == len(missions)
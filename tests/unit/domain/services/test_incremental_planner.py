@@ -0,0 +1,144 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from dataclasses import replace
+
+import pytest
+
+from src.core.domain.services.incremental_planner import IncrementalPlanner, PlanningDelta
+from src.core.domain.services.planning_engine import PilotSlot, PlanningEngine, PlanningEngineError
+from tests.fixtures.planning_fixtures import PROVINCE_CODES, make_demands, make_pilot_slots
+
+
+def _week(seed: int, *, pilots: int = 20, demands: int = 150):
+    rng = random.Random(seed)
+    provinces = PROVINCE_CODES[:5]
+    return rng, provinces, make_pilot_slots(rng, pilots=pilots, provinces=provinces), make_demands(
+        rng, count=demands, provinces=provinces
+    )
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_pure_removals_match_full_replan(seed: int) -> None:
+    rng, _, slots, demands = _week(seed)
+    previous = PlanningEngine().optimize_schedule(demands, slots)
+    planner = IncrementalPlanner(demands, slots, previous)
+
+    removed_demands = {d.demand_id for d in rng.sample(demands, k=rng.randint(1, 10))}
+    removed_slots = {(s.pilot_id, s.date) for s in rng.sample(slots, k=rng.randint(0, 5))}
+    result = planner.apply(
+        PlanningDelta(removed_demand_ids=tuple(removed_demands), removed_slots=tuple(removed_slots))
+    )
+
+    full = PlanningEngine().optimize_schedule(
+        [d for d in demands if d.demand_id not in removed_demands],
+        [s for s in slots if (s.pilot_id, s.date) not in removed_slots],
+    )
+    assert result == full
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_mixed_deltas_match_full_replan_on_current_inputs(seed: int) -> None:
+    rng, provinces, slots, demands = _week(100 + seed)
+    planner = IncrementalPlanner(demands, slots)
+
+    for _ in range(3):
+        current_demands, current_slots = planner.demands, planner.pilot_slots
+        touched = rng.sample(current_demands, k=5)
+        changed = [
+            replace(d, priority=rng.randint(0, 5), province_code=rng.choice(provinces)) for d in touched[:3]
+        ]
+        changed_slots = [
+            replace(s, remaining_capacity=rng.randint(0, s.daily_capacity)) for s in rng.sample(current_slots, k=3)
+        ]
+        delta = PlanningDelta(
+            added_demands=tuple(make_demands(rng, count=5, provinces=provinces)),
+            removed_demand_ids=tuple(d.demand_id for d in touched[3:]),
+            changed_demands=tuple(changed),
+            added_slots=tuple(make_pilot_slots(rng, pilots=2, provinces=provinces)),
+            changed_slots=tuple(changed_slots),
+        )
+
+        result = planner.apply(delta)
+
+        assert result == PlanningEngine().optimize_schedule(planner.demands, planner.pilot_slots)
+
+
+def test_incremental_replan_leaves_other_provinces_untouched() -> None:
+    _, _, slots, demands = _week(7, pilots=40, demands=300)
+    planner = IncrementalPlanner(demands, slots)
+    before = {s.demand_id: s for s in planner.result().scheduled}
+    cancelled = next(d for d in demands if d.demand_id in before)
+
+    result = planner.apply(PlanningDelta(removed_demand_ids=(cancelled.demand_id,)))
+
+    by_id = {d.demand_id: d for d in demands}
+    for item in result.scheduled:
+        if by_id[item.demand_id].province_code != cancelled.province_code:
+            assert item is before[item.demand_id]
+    assert planner.last_replanned < len(demands)
+
+
+def test_incremental_planner_rejects_unknown_references_without_partial_update() -> None:
+    _, _, slots, demands = _week(3, pilots=2, demands=5)
+    planner = IncrementalPlanner(demands, slots)
+    before = planner.result()
+
+    with pytest.raises(PlanningEngineError, match="Bilinmeyen talep"):
+        planner.apply(PlanningDelta(removed_demand_ids=(demands[0].demand_id, uuid.uuid4())))
+    assert planner.result() == before
+    with pytest.raises(PlanningEngineError, match="Bilinmeyen slot"):
+        planner.apply(
+            PlanningDelta(
+                changed_slots=(
+                    PilotSlot(
+                        pilot_id=uuid.uuid4(),
+                        date=demands[0].earliest_date,
+                        province_code="42",
+                        remaining_capacity=1,
+                        daily_capacity=1,
+                    ),
+                )
+            )
+        )
+    assert planner.result() == before
+
+
+@pytest.mark.parametrize(
+    "make_delta",
+    [
+        lambda demands, slots: PlanningDelta(removed_demand_ids=(demands[0].demand_id, demands[0].demand_id)),
+        lambda demands, slots: PlanningDelta(changed_demands=(demands[1], replace(demands[1], priority=0))),
+        lambda demands, slots: PlanningDelta(
+            added_demands=(replace(demands[2], demand_id=uuid.UUID(int=7)),) * 2
+        ),
+        lambda demands, slots: PlanningDelta(
+            removed_slots=((slots[0].pilot_id, slots[0].date),), changed_slots=(slots[0],)
+        ),
+    ],
+    ids=["removed", "changed", "added", "slot"],
+)
+def test_incremental_planner_rejects_duplicate_keys_without_partial_update(make_delta) -> None:
+    _, _, slots, demands = _week(3, pilots=2, demands=5)
+    planner = IncrementalPlanner(demands, slots)
+    before = planner.result()
+
+    with pytest.raises(PlanningEngineError, match="tekrarlanan"):
+        planner.apply(make_delta(demands, slots))
+    assert planner.result() == before
+    assert planner.demands == demands
+    assert planner.pilot_slots == slots
@@ -0,0 +1,117 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.domain.services.capacity_manager import CapacityManager, PilotAssignment, PilotCapacity
+from src.core.domain.services.pilot_load_index import PilotLoadIndex
+
+START = date(2026, 4, 6)
+
+
+def _fleet(seed: int, *, pilots: int = 6, days: int = 30, assignments: int = 120):
+    rng = random.Random(seed)
+    capacities = [
+        PilotCapacity(
+            pilot_id=uuid.uuid4(),
+            work_days=frozenset(rng.sample(range(7), k=rng.randint(1, 7))),
+            daily_capacity=rng.randint(1, 4),
+            province_code="42",
+        )
+        for _ in range(pilots)
+    ]
+    booked = [
+        PilotAssignment(
+            pilot_id=rng.choice(capacities).pilot_id,
+            mission_id=uuid.uuid4(),
+            scheduled_date=START + timedelta(days=rng.randrange(days)),
+            area_donum=float(rng.randint(10, 500)),
+        )
+        for _ in range(assignments)
+    ]
+    return rng, capacities, booked
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_capacity_queries_match_between_list_and_index(seed: int) -> None:
+    rng, capacities, booked = _fleet(seed)
+    index = PilotLoadIndex.from_assignments(booked)
+    manager = CapacityManager()
+
+    for pilot in capacities:
+        start = START + timedelta(days=rng.randrange(10))
+        end = start + timedelta(days=rng.randrange(25))
+        assert manager.find_available_slots(pilot, start, end, index) == manager.find_available_slots(
+            pilot, start, end, booked
+        )
+        assert manager.calculate_utilization(pilot, start, end, index) == pytest.approx(
+            _reference_utilization(pilot, start, end, booked)
+        )
+        day = START + timedelta(days=rng.randrange(30))
+        assert manager.check_availability(pilot, day, index) == manager.check_availability(pilot, day, booked)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_range_sums_and_incremental_hooks_match_rebuilt_index(seed: int) -> None:
+    rng, capacities, booked = _fleet(100 + seed)
+    index = PilotLoadIndex.from_assignments(booked[:60])
+    live = list(booked[:60])
+
+    for assignment in booked[60:]:
+        index.on_assignment_created(assignment)
+        live.append(assignment)
+    for assignment in rng.sample(live, k=40):
+        index.on_assignment_cancelled(assignment)
+        live.remove(assignment)
+
+    for pilot in capacities:
+        start = START + timedelta(days=rng.randrange(30))
+        end = start + timedelta(days=rng.randrange(-3, 15))
+        mine = [a for a in live if a.pilot_id == pilot.pilot_id and start <= a.scheduled_date <= end]
+        assert index.load_between(pilot.pilot_id, start, end) == len(mine)
+        assert index.booked_area_between(pilot.pilot_id, start, end) == pytest.approx(
+            sum(a.area_donum for a in mine)
+        )
+        day = START + timedelta(days=rng.randrange(30))
+        on_day = [a for a in live if a.pilot_id == pilot.pilot_id and a.scheduled_date == day]
+        assert index.load(pilot.pilot_id, day) == len(on_day)
+        assert index.booked_area(pilot.pilot_id, day) == pytest.approx(sum(a.area_donum for a in on_day))
+
+
+def test_cancelling_unknown_assignment_is_ignored() -> None:
+    pid = uuid.uuid4()
+    index = PilotLoadIndex()
+    index.on_assignment_cancelled(PilotAssignment(pilot_id=pid, mission_id=uuid.uuid4(), scheduled_date=START))
+
+    assert index.load(pid, START) == 0
+    assert index.load_between(pid, START, START + timedelta(days=7)) == 0
+
+
+def _reference_utilization(
+    pilot: PilotCapacity, start: date, end: date, booked: list[PilotAssignment]
+) -> float:
+    total_capacity = total_used = 0
+    current = start
+    while current <= end:
+        if current.weekday() in pilot.work_days:
+            total_capacity += pilot.daily_capacity
+            load = sum(1 for a in booked if a.pilot_id == pilot.pilot_id and a.scheduled_date == current)
+            total_used += min(load, pilot.daily_capacity)
+        current += timedelta(days=1)
+    return total_used / total_capacity if total_capacity else 0.0
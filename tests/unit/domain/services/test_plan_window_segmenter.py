@@ -0,0 +1,99 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+from shapely.geometry import Polygon
+from shapely.ops import unary_union
+
+from src.core.domain.services.plan_window_segmenter import PlanWindowSegmenter
+from src.core.domain.value_objects.geometry import Geometry, GeometryError
+
+LAT0 = 38.0
+M_PER_DEG_LON = 111_320.0 * math.cos(math.radians(LAT0))
+M_PER_DEG_LAT = 110_574.0
+
+
+def _field(width_m: float, height_m: float, *, holes: int = 0) -> Geometry:
+    """(32.5, 38.0) köşeli dikdörtgen tarla; istenirse ortada kare delikler."""
+
+    def lonlat(x: float, y: float) -> tuple[float, float]:
+        return (32.5 + x / M_PER_DEG_LON, LAT0 + y / M_PER_DEG_LAT)
+
+    shell = [lonlat(0, 0), lonlat(width_m, 0), lonlat(width_m, height_m), lonlat(0, height_m)]
+    interiors = []
+    for i in range(holes):
+        cx = width_m * (i + 1) / (holes + 1)
+        cy = height_m / 2
+        corners = [(-100, -100), (100, -100), (100, 100), (-100, 100)]
+        interiors.append([lonlat(cx + dx, cy + dy) for dx, dy in corners])
+    return Geometry.from_shapely(Polygon(shell, interiors))
+
+
+def test_arithmetic_segment_is_unchanged() -> None:
+    segments = PlanWindowSegmenter().segment(12_000)
+
+    assert [s.area_donum for s in segments] == [2500, 2500, 2500, 2500, 2000]
+    assert all(s.geometry is None for s in segments)
+
+
+def test_geometry_below_threshold_returns_single_segment() -> None:
+    field = _field(2_000, 2_000)  # 4.000 dönüm
+
+    segments = PlanWindowSegmenter().segment_geometry(field)
+
+    assert len(segments) == 1
+    assert segments[0].area_donum == 4_000
+    assert segments[0].geometry == field
+
+
+@pytest.mark.parametrize(("width_m", "height_m", "holes"), [(4_000, 3_000, 0), (9_000, 2_000, 3), (3_500, 5_000, 2)])
+def test_geometry_segments_conserve_area_and_stay_under_segment_size(
+    width_m: float, height_m: float, holes: int
+) -> None:
+    field = _field(width_m, height_m, holes=holes)
+    segmenter = PlanWindowSegmenter()
+
+    segments = segmenter.segment_geometry(field)
+
+    total_m2 = width_m * height_m - holes * 200 * 200
+    assert sum(s.area_m2 for s in segments) == pytest.approx(total_m2, rel=1e-3)
+    assert len(segments) == math.ceil(total_m2 / 1000 / segmenter.segment_size_donum)
+    areas = [s.area_m2 for s in segments]
+    assert max(areas) / 1000 <= segmenter.segment_size_donum * 1.001
+    assert max(areas) / min(areas) < 1.01
+    union = unary_union([s.geometry.shape for s in segments])
+    assert union.symmetric_difference(field.shape).area < field.area * 1e-6
+    for s in segments:
+        minx, miny, maxx, maxy = s.bbox
+        assert minx <= s.centroid[0] <= maxx
+        assert miny <= s.centroid[1] <= maxy
+        assert s.bbox == s.geometry.bounds
+
+
+def test_geometry_segments_are_compact_for_square_field() -> None:
+    segments = PlanWindowSegmenter(segment_size_donum=1_000).segment_geometry(_field(4_000, 4_000))
+
+    assert len(segments) == 16
+    for s in segments:
+        minx, miny, maxx, maxy = s.bbox
+        width, height = (maxx - minx) * M_PER_DEG_LON, (maxy - miny) * M_PER_DEG_LAT
+        assert max(width, height) / min(width, height) < 2.5
+
+
+def test_geometry_mode_rejects_point() -> None:
+    with pytest.raises(GeometryError, match="Polygon"):
+        PlanWindowSegmenter().segment_geometry(Geometry.from_point(32.5, 38.0))
@@ -0,0 +1,155 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import uuid
+from datetime import date, timedelta
+
+import pytest
+
+from src.core.domain.services.planning_engine import (
+    MissionDemand,
+    PilotSlot,
+    PlanningEngine,
+    PlanningStrategy,
+    ScheduleResult,
+)
+from tests.fixtures.planning_fixtures import make_demands, make_pilot_slots
+
+_DAY1 = date(2026, 4, 6)
+_DAY2 = date(2026, 4, 7)
+
+
+def _demand(priority: int, earliest: date, latest: date, province_code: str = "42") -> MissionDemand:
+    return MissionDemand(
+        demand_id=uuid.uuid4(),
+        field_id=uuid.uuid4(),
+        province_code=province_code,
+        crop_type="WHEAT",
+        area_m2=1_000_000,
+        priority=priority,
+        earliest_date=earliest,
+        latest_date=latest,
+        estimated_duration_minutes=60,
+    )
+
+
+def _assert_feasible(result: ScheduleResult, demands: list[MissionDemand], slots: list[PilotSlot]) -> None:
+    capacity = {(s.pilot_id, s.date): s.remaining_capacity for s in slots}
+    province = {(s.pilot_id, s.date): s.province_code for s in slots}
+    by_id = {d.demand_id: d for d in demands}
+    used: dict[tuple[uuid.UUID, date], int] = {}
+    for item in result.scheduled:
+        demand = by_id[item.demand_id]
+        key = (item.pilot_id, item.scheduled_date)
+        assert demand.earliest_date <= item.scheduled_date <= demand.latest_date
+        assert province[key] == demand.province_code
+        used[key] = used.get(key, 0) + 1
+        assert used[key] <= capacity[key]
+    assert len(result.scheduled) + len(result.unscheduled) == len(demands)
+
+
+def _max_placeable(demands: list[MissionDemand], slots: list[PilotSlot]) -> int:
+    """Küçük örnekler için kaba kuvvetle yerleştirilebilecek en fazla talep sayısı."""
+    day_capacity: dict[tuple[str, date], int] = {}
+    for s in {(s.pilot_id, s.date): s for s in slots}.values():
+        key = (s.province_code, s.date)
+        day_capacity[key] = day_capacity.get(key, 0) + max(0, s.remaining_capacity)
+
+    options = [
+        [None, *[key for key in day_capacity if key[0] == d.province_code and d.earliest_date <= key[1] <= d.latest_date]]
+        for d in demands
+    ]
+    best = 0
+    for choice in itertools.product(*options):
+        used: dict[tuple[str, date], int] = {}
+        for key in choice:
+            if key is not None:
+                used[key] = used.get(key, 0) + 1
+        if all(count <= day_capacity[key] for key, count in used.items()):
+            best = max(best, sum(key is not None for key in choice))
+    return best
+
+
+def test_min_cost_flow_places_demand_stranded_by_greedy() -> None:
+    flexible = _demand(priority=0, earliest=_DAY1, latest=_DAY2)
+    fixed = _demand(priority=1, earliest=_DAY1, latest=_DAY1)
+    pilot = uuid.uuid4()
+    slots = [
+        PilotSlot(pilot_id=pilot, date=_DAY1, province_code="42", remaining_capacity=1, daily_capacity=1),
+        PilotSlot(pilot_id=pilot, date=_DAY2, province_code="42", remaining_capacity=1, daily_capacity=1),
+    ]
+
+    greedy = PlanningEngine().optimize_schedule([flexible, fixed], slots)
+    flow = PlanningEngine(PlanningStrategy.MIN_COST_FLOW).optimize_schedule([flexible, fixed], slots)
+
+    assert greedy.unscheduled == (fixed.demand_id,)
+    assert flow.unscheduled == ()
+    assert {(s.demand_id, s.scheduled_date) for s in flow.scheduled} == {
+        (flexible.demand_id, _DAY2),
+        (fixed.demand_id, _DAY1),
+    }
+    assert flow.pilot_utilization[pilot] == 1.0
+
+
+def test_min_cost_flow_prefers_higher_priority_when_capacity_is_short() -> None:
+    low = _demand(priority=3, earliest=_DAY1, latest=_DAY1)
+    high = _demand(priority=0, earliest=_DAY1, latest=_DAY1)
+    slots = [PilotSlot(pilot_id=uuid.uuid4(), date=_DAY1, province_code="42", remaining_capacity=1, daily_capacity=1)]
+
+    result = PlanningEngine(PlanningStrategy.MIN_COST_FLOW).optimize_schedule([low, high], slots)
+
+    assert [s.demand_id for s in result.scheduled] == [high.demand_id]
+    assert result.unscheduled == (low.demand_id,)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_min_cost_flow_is_feasible_and_places_maximum_on_small_weeks(seed: int) -> None:
+    rng = random.Random(seed)
+    provinces = ("06", "42")
+    slots = make_pilot_slots(rng, pilots=rng.randint(1, 3), provinces=provinces, days=3, max_capacity=2)
+    demands = make_demands(rng, count=rng.randint(1, 6), provinces=provinces, days=3)
+
+    greedy = PlanningEngine().optimize_schedule(demands, slots)
+    flow = PlanningEngine(PlanningStrategy.MIN_COST_FLOW).optimize_schedule(demands, slots)
+
+    _assert_feasible(flow, demands, slots)
+    assert len(flow.scheduled) == _max_placeable(demands, slots)
+    assert len(flow.scheduled) >= len(greedy.scheduled)
+
+
+def test_min_cost_flow_falls_back_to_greedy_when_budget_exhausted() -> None:
+    rng = random.Random(7)
+    slots = make_pilot_slots(rng, pilots=10, provinces=("42",))
+    demands = make_demands(rng, count=40, provinces=("42",))
+
+    greedy = PlanningEngine().optimize_schedule(demands, slots)
+    result = PlanningEngine(PlanningStrategy.MIN_COST_FLOW, time_budget_s=0.0).optimize_schedule(demands, slots)
+
+    assert result.scheduled == greedy.scheduled
+    assert result.unscheduled == greedy.unscheduled
+    assert "zaman bütçesi" in result.warnings[-1]
+
+
+def test_min_cost_flow_handles_demands_without_matching_province() -> None:
+    demand = _demand(priority=0, earliest=_DAY1, latest=_DAY1 + timedelta(days=2), province_code="06")
+    slots = [PilotSlot(pilot_id=uuid.uuid4(), date=_DAY1, province_code="42", remaining_capacity=2, daily_capacity=2)]
+
+    result = PlanningEngine(PlanningStrategy.MIN_COST_FLOW).optimize_schedule([demand], slots)
+
+    assert result.scheduled == ()
+    assert result.unscheduled == (demand.demand_id,)
+    assert "bölge: 06" in result.warnings[0]
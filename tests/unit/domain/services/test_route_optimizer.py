@@ -0,0 +1,133 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import uuid
+from datetime import date
+
+import pytest
+
+from src.core.domain.services.planning_engine import ScheduledSlot, ScheduleResult
+from src.core.domain.services.route_optimizer import (
+    DistanceMatrix,
+    RouteOptimizationError,
+    RouteOptimizer,
+    TimeWindow,
+    haversine_km,
+)
+
+DAY = date(2026, 4, 6)
+
+
+def _stops(rng: random.Random, n: int, *, pilot_id: uuid.UUID | None = None):
+    pilot_id = pilot_id or uuid.UUID(int=rng.getrandbits(128))
+    stops = [
+        ScheduledSlot(
+            demand_id=uuid.UUID(int=rng.getrandbits(128)),
+            field_id=uuid.UUID(int=rng.getrandbits(128)),
+            pilot_id=pilot_id,
+            scheduled_date=DAY,
+            estimated_duration_minutes=30,
+        )
+        for _ in range(n)
+    ]
+    centroids = {s.field_id: (32.5 + rng.uniform(0, 0.5), 37.8 + rng.uniform(0, 0.5)) for s in stops}
+    return stops, centroids
+
+
+def _path_km(points: list[tuple[float, float]], start: tuple[float, float]) -> float:
+    total, prev = 0.0, start
+    for p in points:
+        total += haversine_km(prev, p)
+        prev = p
+    return total
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_route_is_near_optimal_for_small_days(seed: int) -> None:
+    rng = random.Random(seed)
+    stops, centroids = _stops(rng, 7)
+    start = (32.4, 37.7)
+
+    route = RouteOptimizer(time_budget_s=1.0).optimize_route(stops, centroids, start=start)
+
+    optimum = min(
+        _path_km([centroids[s.field_id] for s in perm], start) for perm in itertools.permutations(stops)
+    )
+    assert [s.sequence for s in route.stops] == list(range(1, 8))
+    assert {s.demand_id for s in route.stops} == {s.demand_id for s in stops}
+    assert route.distance_km <= route.initial_distance_km + 1e-9
+    assert route.distance_km <= optimum * 1.05
+    assert route.distance_km == pytest.approx(
+        _path_km([centroids[s.field_id] for s in route.stops], start)
+    )
+
+
+def test_route_respects_time_windows_when_feasible() -> None:
+    rng = random.Random(1)
+    stops, centroids = _stops(rng, 6)
+    # En uzak tarla günün ilk saatinde uçulmalı; NN turu bunu en sona bırakır.
+    start = (32.4, 37.7)
+    far = max(stops, key=lambda s: haversine_km(start, centroids[s.field_id]))
+    windows = {far.demand_id: TimeWindow(earliest_minute=0, latest_minute=90)}
+
+    route = RouteOptimizer(time_budget_s=1.0).optimize_route(stops, centroids, windows=windows, start=start)
+
+    assert route.lateness_minutes == 0.0
+    assert route.stops[0].demand_id == far.demand_id
+    assert all(s.lateness_minutes == 0.0 for s in route.stops)
+
+
+def test_order_schedule_keeps_assignments_and_sets_sequences() -> None:
+    rng = random.Random(2)
+    pilot_a, pilot_b = uuid.uuid4(), uuid.uuid4()
+    stops_a, centroids_a = _stops(rng, 5, pilot_id=pilot_a)
+    stops_b, centroids_b = _stops(rng, 4, pilot_id=pilot_b)
+    mixed = stops_a[:2] + stops_b + stops_a[2:]
+    result = ScheduleResult(scheduled=tuple(mixed), unscheduled=(), pilot_utilization={}, warnings=())
+    late = stops_b[0]
+    windows = {late.demand_id: TimeWindow(earliest_minute=0, latest_minute=-10)}
+
+    ordered = RouteOptimizer().order_schedule(result, {**centroids_a, **centroids_b}, windows=windows)
+
+    assert {s.demand_id for s in ordered.scheduled} == {s.demand_id for s in mixed}
+    assert [s.pilot_id for s in ordered.scheduled] == [pilot_a] * 5 + [pilot_b] * 4
+    assert [s.route_sequence for s in ordered.scheduled] == [1, 2, 3, 4, 5, 1, 2, 3, 4]
+    assert len(ordered.warnings) == 1
+    assert "zaman penceresi" in ordered.warnings[0]
+
+
+def test_distance_matrix_is_cached_and_reused() -> None:
+    matrix = DistanceMatrix({"a": (32.5, 37.8), "b": (32.6, 37.9), "c": (32.7, 38.0)})
+
+    first = matrix.matrix(["a", "b", "c"])
+    second = matrix.matrix(["c", "b", "a"])
+
+    assert matrix.cached_pairs == 3
+    assert first[0][2] == second[2][0] == pytest.approx(haversine_km((32.5, 37.8), (32.7, 38.0)))
+    matrix.add("a", (33.0, 38.0))
+    assert matrix.cached_pairs == 1
+
+
+def test_route_rejects_missing_centroid_and_mixed_days() -> None:
+    rng = random.Random(3)
+    stops, centroids = _stops(rng, 2)
+    optimizer = RouteOptimizer()
+
+    with pytest.raises(RouteOptimizationError, match="Tarla konumu"):
+        optimizer.optimize_route(stops, {})
+    with pytest.raises(RouteOptimizationError, match="tek pilot"):
+        optimizer.optimize_route(stops + _stops(rng, 1)[0], centroids)
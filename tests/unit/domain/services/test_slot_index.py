@@ -0,0 +1,90 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import date
+
+import pytest
+
+from src.core.domain.services.planning_engine import PilotSlot, PlanningEngine, PlanningStrategy
+from src.core.domain.services.slot_index import SlotIndex
+from tests.fixtures.planning_fixtures import WEEK_START, make_demands, make_pilot_slots
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_indexed_strategy_matches_greedy_on_random_weeks(seed: int) -> None:
+    rng = random.Random(seed)
+    provinces = tuple(f"{code:02d}" for code in range(1, rng.randint(2, 6)))
+    slots = make_pilot_slots(rng, pilots=rng.randint(1, 25), provinces=provinces)
+    demands = make_demands(rng, count=rng.randint(0, 120), provinces=provinces)
+
+    greedy = PlanningEngine().optimize_schedule(demands, slots)
+    indexed = PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(demands, slots)
+
+    assert indexed == greedy
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_indexed_strategy_matches_greedy_with_duplicate_and_cross_province_slots(seed: int) -> None:
+    rng = random.Random(1000 + seed)
+    provinces = ("06", "42")
+    slots = make_pilot_slots(rng, pilots=8, provinces=provinces)
+    # Aynı (pilot, tarih) anahtarı tekrar gelirse son kayıt geçerlidir.
+    for slot in rng.sample(slots, k=min(5, len(slots))):
+        slots.append(
+            PilotSlot(
+                pilot_id=slot.pilot_id,
+                date=slot.date,
+                province_code=rng.choice(provinces),
+                remaining_capacity=rng.randint(0, 3),
+                daily_capacity=slot.daily_capacity,
+            )
+        )
+    demands = make_demands(rng, count=60, provinces=provinces)
+
+    greedy = PlanningEngine().optimize_schedule(demands, slots)
+    indexed = PlanningEngine(PlanningStrategy.GREEDY_INDEXED).optimize_schedule(demands, slots)
+
+    assert indexed == greedy
+
+
+def test_slot_index_prefers_least_loaded_pilot_then_earliest_date() -> None:
+    busy, idle = uuid.uuid4(), uuid.uuid4()
+    day1, day2 = date(2026, 4, 6), date(2026, 4, 7)
+    index = SlotIndex(
+        [
+            PilotSlot(pilot_id=busy, date=day1, province_code="42", remaining_capacity=3, daily_capacity=3),
+            PilotSlot(pilot_id=idle, date=day2, province_code="42", remaining_capacity=1, daily_capacity=1),
+        ]
+    )
+
+    assert index.take("42", day1, day2) == (busy, day1)
+    assert index.take("42", day1, day2) == (idle, day2)
+    assert index.take("42", day1, day2) == (busy, day1)
+    assert index.remaining(busy, day1) == 1
+    assert index.remaining(idle, day2) == 0
+
+
+def test_slot_index_respects_window_and_province() -> None:
+    pilot = uuid.uuid4()
+    index = SlotIndex(
+        [PilotSlot(pilot_id=pilot, date=WEEK_START, province_code="42", remaining_capacity=1, daily_capacity=1)]
+    )
+
+    assert index.take("06", WEEK_START, WEEK_START) is None
+    assert index.take("42", date(2026, 4, 7), date(2026, 4, 9)) is None
+    assert index.take("42", WEEK_START, WEEK_START) == (pilot, WEEK_START)
+    assert index.take("42", WEEK_START, WEEK_START) is None
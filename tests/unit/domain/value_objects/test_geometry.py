@@ -13,9 +13,19 @@ Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez
 
 from __future__ import annotations
 
+import copy
+import gc
+import math
+import pickle
+
+import numpy as np
 import pytest
+from shapely import segmentize
+from shapely.geometry import MultiPolygon, box
 
-from src.core.domain.value_objects.geometry import Geometry, GeometryError
+from src.core.domain.value_objects import equal_area
+from src.core.domain.value_objects.equal_area import quadrangle_area_m2
+from src.core.domain.value_objects.geometry import Geometry, GeometryError, prepared_geometry_count
 
 
 def test_geometry_from_geojson_polygon_and_to_geojson() -> None:
@@ -33,3 +43,113 @@ def test_geometry_from_geojson_polygon_and_to_geojson() -> None:
 def test_geometry_rejects_invalid_payload() -> None:
     with pytest.raises(GeometryError, match="type"):
         Geometry.from_geojson({"coordinates": []})
+
+
+def _metric_square(lon: float, lat: float, side_m: float) -> Geometry:
+    """Eğrilik yarıçaplarıyla (WGS84) kurulmuş, kenarı side_m metre olan parsel."""
+    a, e2 = 6_378_137.0, 0.0066943799901413165
+    phi = math.radians(lat)
+    w = 1.0 - e2 * math.sin(phi) ** 2
+    dlat = math.degrees(side_m / (a * (1.0 - e2) / w**1.5))
+    dlon = math.degrees(side_m / (a / math.sqrt(w) * math.cos(phi)))
+    return Geometry.from_shapely(box(lon, lat, lon + dlon, lat + dlat))
+
+
+@pytest.mark.parametrize(
+    ("lon", "lat", "side_m"),
+    [(26.5, 41.7, 100.0), (32.85, 39.93, 250.0), (35.3, 36.99, 40.0), (44.0, 37.6, 1000.0), (42.0, 42.0, 3.0)],
+)
+def test_area_m2_matches_known_parcels_within_tenth_percent(lon: float, lat: float, side_m: float) -> None:
+    parcel = _metric_square(lon, lat, side_m)
+
+    assert parcel.area_m2 == pytest.approx(side_m * side_m, rel=1e-3)
+    assert parcel.area_donum == pytest.approx(side_m * side_m / 1000.0, rel=1e-3)
+    assert parcel.length_m == pytest.approx(4 * side_m, rel=1e-3)
+
+
+def test_area_m2_matches_exact_ellipsoidal_quadrangles_across_zones() -> None:
+    for west, south in [(26.0, 36.0), (29.5, 38.9), (35.99, 40.5), (41.0, 41.99)]:
+        east, north = west + 0.05, south + 0.05
+        geom = Geometry.from_shapely(segmentize(box(west, south, east, north), 0.001))
+
+        assert geom.area_m2 == pytest.approx(quadrangle_area_m2(west, south, east, north), rel=1e-6)
+
+
+def test_area_m2_is_memoized_per_instance(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+    original = equal_area.areas_m2
+
+    def counting(geometries):  # type: ignore[no-untyped-def]
+        calls.append(len(geometries))
+        return original(geometries)
+
+    monkeypatch.setattr(equal_area, "areas_m2", counting)
+    parcel = _metric_square(32.85, 39.93, 100.0)
+
+    first = parcel.area_m2
+    assert parcel.area_donum == pytest.approx(first / 1000.0)
+    assert parcel.area_m2 == first
+    assert calls == [1]
+
+
+def test_batch_areas_match_single_geometry_areas() -> None:
+    parcels = [_metric_square(26.0 + i * 0.9, 36.2 + (i % 6), 50.0 + i) for i in range(20)]
+    parcels.append(Geometry.from_shapely(MultiPolygon([parcels[0].shape, parcels[1].shape])))
+    equal_area.albers_zone.cache_clear()
+
+    batch = Geometry.areas_m2(parcels)
+
+    assert batch.dtype == np.float64
+    assert batch.tolist() == pytest.approx([p.area_m2 for p in parcels], rel=1e-12)
+    assert batch[-1] == pytest.approx(batch[0] + batch[1], rel=1e-3)
+    assert equal_area.albers_zone.cache_info().hits > 0
+
+
+def test_hash_is_computed_once_from_wkb_and_matches_equal_instances() -> None:
+    first = _metric_square(32.85, 39.93, 100.0)
+    second = Geometry.from_geojson(first.to_geojson())
+
+    assert hash(first) == hash(second) and first == second
+    assert "_wkb_key" in first.__dict__
+    assert {first: "a"}[second] == "a"
+    assert first != _metric_square(32.85, 39.93, 101.0)
+
+
+def test_prepared_geometry_is_shared_and_released_with_last_instance() -> None:
+    gc.collect()
+    baseline = prepared_geometry_count()
+    field = _metric_square(35.3, 36.99, 500.0)
+    twin = Geometry.from_geojson(field.to_geojson())
+    inside = Geometry.from_point(*field.centroid)
+
+    assert field.contains(inside) and twin.intersects(inside) and field.covers(twin)
+    assert field._prepared is twin._prepared
+    assert prepared_geometry_count() == baseline + 1
+
+    del field, twin
+    gc.collect()
+    assert prepared_geometry_count() == baseline
+
+
+def test_prepared_predicates_match_shapely() -> None:
+    field = _metric_square(32.0, 38.0, 1000.0)
+    rng = np.random.default_rng(18)
+    west, south, east, north = field.bounds
+    for lon, lat in rng.uniform((west - 0.002, south - 0.002), (east + 0.002, north + 0.002), (200, 2)).tolist():
+        probe = Geometry.from_shapely(box(lon, lat, lon + 0.001, lat + 0.001))
+        assert field.contains(probe) == field.shape.contains(probe.shape)
+        assert field.intersects(probe) == field.shape.intersects(probe.shape)
+        assert probe.coverage_ratio(field) == pytest.approx(
+            probe.shape.intersection(field.shape).area / probe.shape.area
+        )
+
+
+def test_pickle_and_deepcopy_round_trip_after_predicate_call() -> None:
+    field = _metric_square(32.0, 38.0, 1000.0)
+    probe = _metric_square(32.001, 38.001, 100.0)
+    assert field.contains(probe) and field.area_m2 > 0
+
+    for clone in (pickle.loads(pickle.dumps(field)), copy.deepcopy(field)):
+        assert clone == field and hash(clone) == hash(field)
+        assert clone.contains(probe)
+        assert clone.area_m2 == field.area_m2
@@ -0,0 +1,100 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from pydantic import SecretStr
+
+from src.infrastructure.config.settings import Settings
+from src.infrastructure.external.http_clients import HttpClientRegistry, client_config
+from src.infrastructure.external.sms_gateway_adapter import SMSGatewayAdapter
+from src.infrastructure.external.tkgm_megsis_wfs_adapter import TKGMMegsisWFSAdapter
+from src.infrastructure.external.weather_api_adapter import WeatherAPIAdapter
+from src.infrastructure.integrations.sms.twilio import TwilioSMSAdapter
+
+
+def test_borrowed_clients_are_shared_per_config_and_closed_by_registry() -> None:
+    settings = Settings(http_max_connections_per_host=7, http2_enabled=True)
+    config = client_config(settings, name="weather", base_url="https://weather.test", timeout_seconds=5)
+
+    async def run():
+        registry = HttpClientRegistry()
+        async with registry.borrow(config) as first:
+            pass
+        async with registry.borrow(config) as second:
+            pass
+        other = registry.client(client_config(settings, name="sms", base_url="https://sms.test", timeout_seconds=5))
+        open_after_borrow = not first.is_closed
+        count = len(registry)
+        await registry.aclose()
+        closed = first.is_closed and other.is_closed
+        reopened = registry.client(config)
+        await registry.aclose()
+        return first, second, open_after_borrow, count, closed, reopened
+
+    first, second, open_after_borrow, count, closed, reopened = asyncio.run(run())
+
+    assert first is second and open_after_borrow
+    assert count == 2 and closed
+    assert reopened is not first
+    assert config.max_connections == 7 and config.max_keepalive_connections == 7
+
+
+def test_adapters_borrow_from_one_registry_without_leaking_secrets() -> None:
+    settings = Settings(
+        weather_api_url="https://weather.test",
+        sms_api_url="https://sms.test",
+        sms_api_key=SecretStr("AC123:secret-token"),
+    )
+    registry = HttpClientRegistry()
+    weather_a = WeatherAPIAdapter(settings, clients=registry)
+    weather_b = WeatherAPIAdapter(settings, clients=registry)
+    sms = SMSGatewayAdapter(settings, clients=registry)
+    twilio = TwilioSMSAdapter(settings, clients=registry)
+
+    async def run():
+        clients = []
+        for adapter in (weather_a, weather_b, sms, twilio):
+            async with adapter._get_client() as client:
+                clients.append(client)
+        await registry.aclose()
+        return clients
+
+    clients = asyncio.run(run())
+
+    assert clients[0] is clients[1]
+    assert len({id(client) for client in clients}) == 3
+    assert clients[2].headers["Authorization"] == "Bearer AC123:secret-token"
+    assert "secret-token" not in repr(twilio._client_config)
+
+
+def test_release_keeps_shared_client_open_until_last_owner() -> None:
+    settings = Settings(tkgm_wfs_base_url="https://tkgm.test")
+    registry = HttpClientRegistry()
+    first = TKGMMegsisWFSAdapter(settings, clients=registry)
+    second = TKGMMegsisWFSAdapter(settings, clients=registry)
+
+    async def run():
+        client = first._get_client()
+        await first.aclose()
+        await first.aclose()  # Tekrar kapatma diğer sahibin referansını düşürmez.
+        open_while_shared = not client.is_closed and second._get_client() is client
+        await second.aclose()
+        return client, open_while_shared, len(registry)
+
+    client, open_while_shared, remaining = asyncio.run(run())
+
+    assert open_while_shared
+    assert client.is_closed and remaining == 0
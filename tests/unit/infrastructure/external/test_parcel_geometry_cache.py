@@ -0,0 +1,140 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+
+from src.core.domain.value_objects.parcel_ref import ParcelRef
+from src.core.ports.external.parcel_geometry_provider import ParcelGeometry
+from src.infrastructure.external.parcel_geometry_cache import ParcelGeometryCache
+from src.infrastructure.persistence.local_cache import SQLiteCacheStore
+from tests.fixtures.wfs_stub import make_parcel_refs
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Loader:
+    """Bilinen parseller için alanı version'a göre değişen geometri döner; çağrıları kaydeder."""
+
+    def __init__(self, known: list[ParcelRef]) -> None:
+        self.known = {ref.unique_hash for ref in known}
+        self.calls: list[list[ParcelRef]] = []
+        self.version = 1
+
+    async def __call__(self, refs: list[ParcelRef]) -> dict[str, ParcelGeometry]:
+        self.calls.append(list(refs))
+        return {
+            ref.unique_hash: ParcelGeometry(
+                parcel_ref=ref,
+                geometry={"type": "Polygon", "coordinates": [[[32.0, 38.0], [32.01, 38.0], [32.01, 38.01], [32.0, 38.0]]]},
+                area_m2=Decimal(1000 * self.version),
+            )
+            for ref in refs
+            if ref.unique_hash in self.known
+        }
+
+
+def test_l1_is_bounded_by_bytes_and_counts_hits_and_evictions() -> None:
+    refs = make_parcel_refs(200)
+    loader = _Loader(refs)
+    cache = ParcelGeometryCache(max_bytes=20_000)
+
+    async def run():
+        await cache.get_many(refs, loader)
+        return await cache.get_many(refs[-10:], loader)
+
+    again = asyncio.run(run())
+
+    stats = cache.stats
+    assert stats.bytes == cache.nbytes <= 20_000
+    assert 0 < stats.entries < 200 and stats.evictions == 200 - stats.entries
+    assert stats.misses == 200 and stats.l1_hits == 10
+    assert len(loader.calls) == 1
+    assert [again[r.unique_hash].parcel_ref for r in refs[-10:]] == refs[-10:]
+
+
+def test_workers_share_entries_through_l2_store(tmp_path) -> None:
+    refs = make_parcel_refs(50)
+    loader = _Loader(refs[:40])
+    path = str(tmp_path / "parcels.sqlite")
+    worker_a = ParcelGeometryCache(store=SQLiteCacheStore(path))
+    worker_b = ParcelGeometryCache(store=SQLiteCacheStore(path))
+
+    async def run():
+        first = await worker_a.get_many(refs, loader)
+        second = await worker_b.get_many(refs, loader)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert len(loader.calls) == 1
+    assert first == second
+    assert sum(value is None for value in second.values()) == 10
+    assert worker_b.stats.l2_hits == 50 and worker_b.stats.negative_hits == 10 and worker_b.stats.misses == 0
+
+
+def test_stale_entries_are_served_while_refreshing_and_negatives_expire() -> None:
+    refs = make_parcel_refs(5)
+    clock = _Clock()
+    loader = _Loader(refs[:4])
+    cache = ParcelGeometryCache(ttl_seconds=100, stale_seconds=50, negative_ttl_seconds=30, clock=clock)
+
+    async def run():
+        await cache.get_many(refs, loader)
+        clock.now += 120  # Taze değil, bayat penceresinde; negatif girdi süresi dolmuş.
+        loader.version = 2
+        served = await cache.get_many(refs, loader)
+        await cache.drain()
+        refreshed = await cache.get_many(refs, loader)
+        clock.now += 200  # Yenilenen girdinin de taze + bayat süresi doldu.
+        later = await cache.get_many(refs[:1], loader)
+        return served, refreshed, later
+
+    served, refreshed, later = asyncio.run(run())
+
+    key = refs[0].unique_hash
+    assert served[key].area_m2 == Decimal(1000)
+    assert refreshed[key].area_m2 == Decimal(2000)
+    assert later[key].area_m2 == Decimal(2000)
+    # İlk yükleme, süresi dolan negatif için senkron yükleme, bayatlar için tek arka plan yenilemesi, süresi dolan taze.
+    assert [len(call) for call in loader.calls] == [5, 1, 4, 1]
+    assert cache.stats.stale_hits == 4 and cache.stats.refreshes == 4
+
+
+def test_l2_failures_degrade_to_loader() -> None:
+    class _BrokenStore:
+        async def get_many(self, keys):
+            raise ConnectionError("redis down")
+
+        async def set_many(self, items, *, ttl_seconds):
+            raise ConnectionError("redis down")
+
+        async def delete(self, keys):
+            raise ConnectionError("redis down")
+
+    refs = make_parcel_refs(3)
+    loader = _Loader(refs)
+    cache = ParcelGeometryCache(store=_BrokenStore())
+
+    found = asyncio.run(cache.get_many(refs, loader))
+
+    assert all(found[ref.unique_hash] is not None for ref in refs)
+    assert cache.stats.l2_errors == 2
@@ -0,0 +1,82 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.external.single_flight import SingleFlight
+
+
+def test_concurrent_callers_share_one_call_per_key() -> None:
+    calls: list[str] = []
+
+    async def fetch(key: str) -> str:
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def run():
+        flight: SingleFlight[str] = SingleFlight()
+        keys = ["a"] * 500 + ["b"] * 500
+        results = await asyncio.gather(*(flight.do(k, lambda k=k: fetch(k)) for k in keys))
+        return flight, results
+
+    flight, results = asyncio.run(run())
+
+    assert sorted(calls) == ["a", "b"]
+    assert results == ["A"] * 500 + ["B"] * 500
+    assert flight.coalesced == 998 and len(flight) == 0
+
+
+def test_errors_reach_every_waiter_and_are_not_remembered() -> None:
+    attempts = 0
+
+    async def flaky() -> int:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise ConnectionError("upstream down")
+        return attempts
+
+    async def run():
+        flight: SingleFlight[int] = SingleFlight()
+        first = await asyncio.gather(*(flight.do("k", flaky) for _ in range(50)), return_exceptions=True)
+        second = await flight.do("k", flaky)
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert len(first) == 50 and all(isinstance(result, ConnectionError) for result in first)
+    assert second == 2 and attempts == 2
+
+
+def test_cancelling_one_waiter_leaves_the_call_running_for_others() -> None:
+    async def slow() -> str:
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        flight: SingleFlight[str] = SingleFlight()
+        leader = asyncio.create_task(flight.do("k", slow))
+        follower = asyncio.create_task(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == "done"
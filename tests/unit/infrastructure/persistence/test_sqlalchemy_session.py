@@ -0,0 +1,47 @@
+# BOUND: TARLAANALIZ_SSOT_v1_0_0.txt – canonical rules are referenced, not duplicated.
+"""
+Amaç: Test modülü; davranış doğrulama ve regresyon engeli.
+Sorumluluk: Bağlamına göre beklenen sorumlulukları yerine getirir; SSOT v1.0.0 ile uyumlu kalır.
+Girdi/Çıktı (Contract/DTO/Event): N/A
+Güvenlik (RBAC/PII/Audit): N/A
+Hata Modları (idempotency/retry/rate limit): N/A
+Observability (log fields/metrics/traces): N/A
+Testler: N/A
+Bağımlılıklar: N/A
+Notlar/SSOT: Tek referans: SSOT v1.0.0. Aynı kavram başka yerde tekrar edilmez.
+"""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from src.infrastructure.persistence.sqlalchemy.session import open_sync_session, sync_database_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("postgresql+asyncpg://u:p@db:5432/tarla", "postgresql://u:p@db:5432/tarla"),
+        ("sqlite+aiosqlite:///tmp/x.db", "sqlite:///tmp/x.db"),
+        ("postgresql+psycopg://u@db/tarla", "postgresql+psycopg://u@db/tarla"),
+    ],
+)
+def test_sync_database_url_rewrites_async_drivers(url: str, expected: str) -> None:
+    assert sync_database_url(url) == expected
+
+
+def test_open_sync_session_uses_sync_driver_for_async_env_url(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{tmp_path / 'planner.db'}")
+    session = open_sync_session()
+    try:
+        assert session.execute(text("SELECT 1")).scalar() == 1
+    finally:
+        session.close()
+
+
+def test_open_sync_session_requires_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.delenv("DB_URL", raising=False)
+    with pytest.raises(RuntimeError, match="DATABASE_URL"):
+        open_sync_session()